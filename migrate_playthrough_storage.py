@@ -0,0 +1,31 @@
+import argparse
+
+from src.base.enums import StorageBackend
+from src.filesystem.playthrough_storage_migrator import PlaythroughStorageMigrator
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Moves the documents of a playthrough between JSON files and a SQLite database. "
+        "Stop the server before migrating a playthrough."
+    )
+    parser.add_argument("playthrough_name", help="The name of the playthrough.")
+    parser.add_argument(
+        "storage_backend",
+        choices=[storage_backend.value for storage_backend in StorageBackend],
+        help="Where the documents of the playthrough should end up.",
+    )
+
+    arguments = parser.parse_args()
+
+    PlaythroughStorageMigrator().migrate(
+        arguments.playthrough_name, StorageBackend(arguments.storage_backend)
+    )
+
+    print(
+        f"Playthrough '{arguments.playthrough_name}' is now stored as {arguments.storage_backend}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -29,8 +29,7 @@ class StoreActionResolutionAlgorithm:
         )
 
     def do_algorithm(self, product: ActionResolutionProduct):
-        for participant_identifier in self._participants.get_participant_keys():
-            self._store_character_memory_command_factory.create_store_character_memory_command(
-                participant_identifier, product.get_outcome()
-            ).execute()
+        self._store_character_memory_command_factory.create_store_characters_memory_command(
+            self._participants.get_participant_keys(), product.get_outcome()
+        ).execute()
         self._playthrough_manager.add_to_adventure(product.get_outcome() + "\n")
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import Optional
 
 from src.services.web_service import WebService
@@ -17,8 +16,8 @@ class ActionResolutionProduct:
         self._outcome = outcome
         self._is_valid = is_valid
         self._error = error
-        self._narrative_voice_line_file_name = None
-        self._outcome_voice_line_file_name = None
+        self._narrative_voice_line_job_id = None
+        self._outcome_voice_line_job_id = None
 
     def get_narrative(self) -> str:
         return self._narrative
@@ -32,18 +31,14 @@ class ActionResolutionProduct:
     def get_error(self) -> str:
         return self._error
 
-    def set_narrative_voice_line_file_name(self, file_name) -> None:
-        self._narrative_voice_line_file_name = file_name
+    def set_narrative_voice_line_job_id(self, job_id: Optional[str]) -> None:
+        self._narrative_voice_line_job_id = job_id
 
-    def set_outcome_voice_line_file_name(self, file_name) -> None:
-        self._outcome_voice_line_file_name = file_name
+    def set_outcome_voice_line_job_id(self, job_id: Optional[str]) -> None:
+        self._outcome_voice_line_job_id = job_id
 
     def get_narrative_voice_line_url(self):
-        return WebService.get_file_url(
-            Path("voice_lines"), self._narrative_voice_line_file_name
-        )
+        return WebService.get_voice_line_job_url(self._narrative_voice_line_job_id)
 
     def get_outcome_voice_line_url(self):
-        return WebService.get_file_url(
-            Path("voice_lines"), self._outcome_voice_line_file_name
-        )
+        return WebService.get_voice_line_job_url(self._outcome_voice_line_job_id)
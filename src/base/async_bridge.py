@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Coroutine, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def gather_with_concurrency_limit(
+    awaitables: List[Awaitable[T]], concurrency_limit: int
+) -> List[T]:
+    """Awaits every awaitable, with at most 'concurrency_limit' of them in
+    flight at once. The results keep the order of the awaitables; the first
+    exception raised propagates, as with asyncio.gather."""
+    if concurrency_limit < 1:
+        raise ValueError("concurrency_limit must be at least 1.")
+
+    semaphore = asyncio.Semaphore(concurrency_limit)
+
+    async def await_with_limit(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(await_with_limit(awaitable) for awaitable in awaitables)
+    )
+
+
+class AsyncBridge:
+    """Runs coroutines from sync code on one long-lived event loop."""
+
+    _shared_instance: Optional["AsyncBridge"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_shared_instance(cls) -> "AsyncBridge":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="async-bridge", daemon=True
+                )
+                self._thread.start()
+
+            return self._loop
+
+    def is_bridge_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs the coroutine on the loop of the bridge, and blocks until it
+        finishes. Must not be called from a coroutine running on that loop,
+        which would never finish."""
+        if self.is_bridge_thread():
+            coroutine.close()
+
+            raise RuntimeError(
+                "Can't block the event loop of the bridge waiting for itself."
+            )
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+            self._loop = None
+            self._thread = None
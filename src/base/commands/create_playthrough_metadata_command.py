@@ -9,16 +9,16 @@ from src.base.constants import (
     DEFAULT_CURRENT_PLACE,
     DEFAULT_IDENTIFIER,
 )
-from src.base.enums import TemplateType
+from src.base.enums import TemplateType, StorageBackend
 from src.base.exceptions import (
     StoryUniverseTemplateNotFoundError,
 )
 from src.base.validators import validate_non_empty_string
-from src.filesystem.file_operations import (
-    write_json_file,
-    create_directories,
-)
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.document_storage import DocumentStorageRegistry
+from src.filesystem.file_operations import create_directories
 from src.filesystem.filesystem_manager import FilesystemManager
+from src.filesystem.json_file_cache import JsonFileCache
 from src.filesystem.path_manager import PathManager
 from src.maps.map_repository import MapRepository
 from src.maps.templates_repository import TemplatesRepository
@@ -36,6 +36,9 @@ class CreatePlaythroughMetadataCommand(Command):
         templates_repository: Optional[TemplatesRepository] = None,
         map_repository: Optional[MapRepository] = None,
         path_manager: Optional[PathManager] = None,
+        config_loader: Optional[ConfigLoader] = None,
+        document_storage_registry: Optional[DocumentStorageRegistry] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
         validate_non_empty_string(story_universe_template, "story_universe_template")
@@ -47,6 +50,11 @@ class CreatePlaythroughMetadataCommand(Command):
         self._templates_repository = templates_repository or TemplatesRepository()
         self._map_repository = map_repository or MapRepository(self._playthrough_name)
         self._path_manager = path_manager or PathManager()
+        self._config_loader = config_loader or ConfigLoader()
+        self._document_storage_registry = (
+            document_storage_registry or DocumentStorageRegistry.get_shared_instance()
+        )
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
 
     def _validate_playthrough_does_not_exist(self) -> None:
         # First ensure that the playthroughs dir exists.
@@ -95,7 +103,7 @@ class CreatePlaythroughMetadataCommand(Command):
             self._playthrough_name
         )
 
-        write_json_file(metadata_path, playthrough_metadata)
+        self._json_file_cache.write(metadata_path, playthrough_metadata)
 
     def _log_playthrough_creation_success(self) -> None:
         playthrough_path = self._path_manager.get_playthrough_path(
@@ -114,6 +122,14 @@ class CreatePlaythroughMetadataCommand(Command):
             self._path_manager.get_playthrough_path(self._playthrough_name)
         )
 
+        # The documents of a playthrough are stored wherever they were when it
+        # was created, unless it gets migrated.
+        if (
+            self._config_loader.get_playthrough_storage_backend()
+            == StorageBackend.SQLITE
+        ):
+            self._document_storage_registry.create_database(self._playthrough_name)
+
         try:
             self._build_and_save_playthrough_metadata()
             self._map_repository.initialize_map_data()
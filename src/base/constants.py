@@ -15,6 +15,29 @@ PAYMENT_REQUIRED: int = 402
 INVALID_SSL_CERTIFICATE: int = 526
 MAXIMUM_CONTENT_LENGTH_REACHED: int = 400
 
+MINIMUM_IDLE_SECONDS_BEFORE_DATABASE_EVICTION: int = 60
+
+# The model that ChromaDB's default embedding function runs.
+DEFAULT_EMBEDDING_MODEL_ID: str = "all-MiniLM-L6-v2"
+
+RECIPROCAL_RANK_FUSION_CONSTANT: int = 60
+
+MAX_CACHED_SPEECH_TURN_CLASSES: int = 128
+MAX_CACHED_RESPONSE_MODEL_SCHEMAS: int = 256
+
+FINISHED_VOICE_LINE_JOB_RETENTION_SECONDS: int = 24 * 60 * 60
+
+JSON_JOURNAL_COMPACTION_THRESHOLD: int = 200
+MAX_CACHED_JSON_JOURNALS: int = 16
+
+SQLITE_BUSY_TIMEOUT_SECONDS: float = 30.0
+
+LLM_RATE_LIMIT_BACKOFF_BASE_SECONDS: float = 1.0
+LLM_RATE_LIMIT_BACKOFF_MAX_SECONDS: float = 60.0
+LLM_CONCURRENCY_DECREASE_FACTOR: float = 0.5
+LLM_RETRY_WAIT_INITIAL_SECONDS: float = 0.5
+LLM_RETRY_WAIT_MAX_SECONDS: float = 8.0
+
 PARENT_TEMPLATE_TYPE: Dict[TemplateType, TemplateType] = {
     TemplateType.WORLD: TemplateType.STORY_UNIVERSE,
     TemplateType.REGION: TemplateType.WORLD,
@@ -0,0 +1,199 @@
+import atexit
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.filesystem.config_loader import ConfigLoader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ContextTask:
+    """A step of a prompt's context, given its dependencies' values as kwargs."""
+
+    name: str
+    function: Callable[..., Any]
+    dependencies: Tuple[str, ...] = ()
+
+
+@dataclass
+class ContextAssembly:
+    values: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class ContextAssembler:
+    """Runs the independent steps of assembling a prompt's context concurrently."""
+
+    _shared_instance: Optional["ContextAssembler"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers or ConfigLoader().get_context_assembly_workers()
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._worker_state = threading.local()
+
+    @classmethod
+    def get_shared_instance(cls) -> "ContextAssembler":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+                atexit.register(cls._shared_instance.close)
+
+            return cls._shared_instance
+
+    @staticmethod
+    def _validate_tasks(tasks: List[ContextTask]) -> None:
+        names = [task.name for task in tasks]
+
+        if len(set(names)) != len(names):
+            raise ValueError(f"Context tasks must have unique names: {names}.")
+
+        for task in tasks:
+            unknown_dependencies = set(task.dependencies) - set(names)
+
+            if unknown_dependencies:
+                raise ValueError(
+                    f"Context task '{task.name}' depends on unknown tasks: {sorted(unknown_dependencies)}."
+                )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="context-assembly",
+                    initializer=self._mark_as_worker,
+                )
+
+            return self._executor
+
+    def _mark_as_worker(self) -> None:
+        self._worker_state.is_worker = True
+
+    def _run_task(self, task: ContextTask, values: Dict[str, Any]) -> Tuple[Any, float]:
+        start = time.perf_counter()
+
+        value = task.function(
+            **{dependency: values[dependency] for dependency in task.dependencies}
+        )
+
+        return value, time.perf_counter() - start
+
+    def _assemble_inline(self, tasks: List[ContextTask]) -> ContextAssembly:
+        assembly = ContextAssembly()
+        pending = list(tasks)
+
+        while pending:
+            ready = [
+                task
+                for task in pending
+                if all(
+                    dependency in assembly.values for dependency in task.dependencies
+                )
+            ]
+
+            if not ready:
+                raise ValueError(
+                    f"Context tasks have circular dependencies: {[task.name for task in pending]}."
+                )
+
+            for task in ready:
+                (
+                    assembly.values[task.name],
+                    assembly.timings[task.name],
+                ) = self._run_task(task, assembly.values)
+
+                pending.remove(task)
+
+        return assembly
+
+    def assemble(self, tasks: List[ContextTask]) -> ContextAssembly:
+        self._validate_tasks(tasks)
+
+        if getattr(self._worker_state, "is_worker", False) or self._max_workers <= 1:
+            assembly = self._assemble_inline(tasks)
+        else:
+            assembly = self._assemble_concurrently(tasks)
+
+        logger.debug(
+            "Context assembly timings: %s",
+            ", ".join(
+                f"{name}={seconds * 1000:.1f}ms"
+                for name, seconds in assembly.timings.items()
+            ),
+        )
+
+        return assembly
+
+    def _assemble_concurrently(self, tasks: List[ContextTask]) -> ContextAssembly:
+        executor = self._get_executor()
+
+        assembly = ContextAssembly()
+        pending = list(tasks)
+        running: Dict[Future, ContextTask] = {}
+
+        try:
+            while pending or running:
+                ready = [
+                    task
+                    for task in pending
+                    if all(
+                        dependency in assembly.values
+                        for dependency in task.dependencies
+                    )
+                ]
+
+                for task in ready:
+                    pending.remove(task)
+
+                    # Hand the task its own snapshot of the values, as other
+                    # tasks may complete while it runs. The task also runs in
+                    # the caller's context, so that it sees the unit of work of
+                    # the request.
+                    running[
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self._run_task,
+                            task,
+                            dict(assembly.values),
+                        )
+                    ] = task
+
+                if not running:
+                    raise ValueError(
+                        f"Context tasks have circular dependencies: {[task.name for task in pending]}."
+                    )
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    task = running.pop(future)
+
+                    (
+                        assembly.values[task.name],
+                        assembly.timings[task.name],
+                    ) = future.result()
+        finally:
+            for future in running:
+                future.cancel()
+
+        # Keep the values in the order the tasks were declared in.
+        assembly.values = {task.name: assembly.values[task.name] for task in tasks}
+        assembly.timings = {task.name: assembly.timings[task.name] for task in tasks}
+
+        return assembly
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -15,6 +15,22 @@ class TemplateType(Enum):
     STORY_UNIVERSE = "story_universe"
 
 
+class StorageBackend(Enum):
+    JSON = "json"
+    SQLITE = "sqlite"
+
+
+class LlmResponseCacheMode(Enum):
+    # Every request goes to the LLM.
+    OFF = "off"
+    # Cacheable action types reuse the responses to identical requests.
+    ON = "on"
+    # Every request goes to the LLM, and every response gets stored.
+    RECORD = "record"
+    # Every response comes from the cache; nothing goes to the LLM.
+    REPLAY = "replay"
+
+
 class AiCompletionErrorType(Enum):
     TOO_MANY_REQUESTS = "too_many_requests"
     UNAUTHORIZED = "unauthorized"
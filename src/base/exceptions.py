@@ -16,3 +16,11 @@ class StoryUniverseGenerationError(Exception):
 
 class NoEligibleWorldsError(Exception):
     pass
+
+
+class PromptTemplateError(Exception):
+    pass
+
+
+class PlaythroughStorageMigrationError(Exception):
+    pass
@@ -2,8 +2,9 @@ import logging.config
 from typing import Optional
 
 from src.base.enums import IdentifierType
-from src.filesystem.file_operations import read_json_file
-from src.filesystem.path_manager import PathManager
+from src.base.repositories.playthrough_metadata_repository import (
+    PlaythroughMetadataRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -11,11 +12,16 @@ logger = logging.getLogger(__name__)
 class IdentifiersManager:
 
     def __init__(
-        self, playthrough_name: str, path_manager: Optional[PathManager] = None
+        self,
+        playthrough_name: str,
+        playthrough_metadata_repository: Optional[PlaythroughMetadataRepository] = None,
     ):
         self._playthrough_name = playthrough_name
 
-        self._path_manager = path_manager or PathManager()
+        self._playthrough_metadata_repository = (
+            playthrough_metadata_repository
+            or PlaythroughMetadataRepository(self._playthrough_name)
+        )
 
     @staticmethod
     def get_highest_identifier(data: dict) -> str:
@@ -24,9 +30,7 @@ class IdentifiersManager:
         return str(max_id)
 
     def determine_next_identifier(self, identifier_type: IdentifierType) -> int:
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
 
         try:
             current_value = int(
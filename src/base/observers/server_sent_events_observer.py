@@ -0,0 +1,38 @@
+import queue
+from abc import ABC
+from typing import Iterator, Optional, Tuple
+
+from src.base.abstracts.observer import Observer
+from src.services.web_service import WebService
+
+
+class ServerSentEventsObserver(Observer, ABC):
+    """Queues the updates it receives as server-sent events."""
+
+    def __init__(self, keep_alive_seconds: float = 15.0):
+        self._keep_alive_seconds = keep_alive_seconds
+
+        self._events: "queue.Queue[Optional[Tuple[str, dict]]]" = queue.Queue()
+
+    def send(self, event: str, data: dict) -> None:
+        self._events.put((event, data))
+
+    def finish(self, event: str, data: dict) -> None:
+        """Sends the last event, and ends the stream."""
+        self.send(event, data)
+        self._events.put(None)
+
+    def stream(self) -> Iterator[str]:
+        while True:
+            try:
+                event = self._events.get(timeout=self._keep_alive_seconds)
+            except queue.Empty:
+                # Keeps proxies from closing the connection while nothing is
+                # ready to be sent, such as while a prompt gets assembled.
+                yield ": keep-alive\n\n"
+                continue
+
+            if event is None:
+                return
+
+            yield WebService.format_server_sent_event(*event)
@@ -2,14 +2,16 @@ import logging.config
 from pathlib import Path
 from typing import List, Optional
 
+from src.base.repositories.playthrough_metadata_repository import (
+    PlaythroughMetadataRepository,
+)
 from src.base.validators import validate_non_empty_string
+from src.databases.chroma_db_client_registry import ChromaDbClientRegistry
 from src.dialogues.repositories.ongoing_dialogue_repository import (
     OngoingDialogueRepository,
 )
 from src.filesystem.file_operations import (
     append_to_file,
-    read_json_file,
-    write_json_file,
     remove_folder,
 )
 from src.filesystem.filesystem_manager import FilesystemManager
@@ -26,6 +28,8 @@ class PlaythroughManager:
         filesystem_manager: Optional[FilesystemManager] = None,
         path_manager: Optional[PathManager] = None,
         ongoing_dialogue_repository: Optional[OngoingDialogueRepository] = None,
+        playthrough_metadata_repository: Optional[PlaythroughMetadataRepository] = None,
+        chroma_db_client_registry: Optional[ChromaDbClientRegistry] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
@@ -36,18 +40,20 @@ class PlaythroughManager:
             ongoing_dialogue_repository
             or OngoingDialogueRepository(self._playthrough_name)
         )
+        self._playthrough_metadata_repository = (
+            playthrough_metadata_repository
+            or PlaythroughMetadataRepository(self._playthrough_name, self._path_manager)
+        )
+        self._chroma_db_client_registry = (
+            chroma_db_client_registry or ChromaDbClientRegistry.get_shared_instance()
+        )
 
     def _update_playthrough_metadata_identifier(self, key: str, new_value: str):
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
 
         playthrough_metadata[key] = new_value
 
-        write_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name),
-            playthrough_metadata,
-        )
+        self._playthrough_metadata_repository.save_metadata(playthrough_metadata)
 
     def has_ongoing_dialogue(self):
         return self._ongoing_dialogue_repository.dialogue_exists()
@@ -58,55 +64,41 @@ class PlaythroughManager:
         )
 
     def get_player_identifier(self) -> str:
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
         return playthrough_metadata["player_identifier"]
 
     def get_story_universe_template(self) -> str:
-        playthrough_metadata_file = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
+        playthrough_metadata_file = (
+            self._playthrough_metadata_repository.load_metadata()
         )
 
         return playthrough_metadata_file["story_universe_template"]
 
     def get_hour(self) -> int:
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
         return playthrough_metadata["time"]["hour"]
 
     def update_hour(self, hour: int):
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
         playthrough_metadata["time"]["hour"] = hour
 
-        write_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name),
-            playthrough_metadata,
-        )
+        self._playthrough_metadata_repository.save_metadata(playthrough_metadata)
 
     def get_followers(self) -> List[str]:
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
         return [follower for follower in playthrough_metadata["followers"]]
 
     def add_follower(self, character_identifier):
-        playthrough_metadata: dict = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
+        playthrough_metadata: dict = (
+            self._playthrough_metadata_repository.load_metadata()
         )
         playthrough_metadata["followers"].append(character_identifier)
 
-        write_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name),
-            playthrough_metadata,
-        )
+        self._playthrough_metadata_repository.save_metadata(playthrough_metadata)
 
     def remove_follower(self, character_identifier):
-        playthrough_metadata: dict = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
+        playthrough_metadata: dict = (
+            self._playthrough_metadata_repository.load_metadata()
         )
 
         playthrough_metadata["followers"] = [
@@ -115,15 +107,10 @@ class PlaythroughManager:
             if follower != character_identifier
         ]
 
-        write_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name),
-            playthrough_metadata,
-        )
+        self._playthrough_metadata_repository.save_metadata(playthrough_metadata)
 
     def get_current_place_identifier(self) -> str:
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
         return playthrough_metadata["current_place"]
 
     def update_current_place(self, new_current_place_identifier: str):
@@ -147,4 +134,9 @@ class PlaythroughManager:
         """
         folder_path = self._path_manager.get_playthrough_path(playthrough_name)
 
+        # An open database would keep its files in use, or get written back.
+        self._chroma_db_client_registry.close(
+            self._path_manager.get_database_path(playthrough_name)
+        )
+
         remove_folder(folder_path)
@@ -0,0 +1,34 @@
+import logging
+from typing import Optional, Dict, Any
+
+from src.base.validators import validate_non_empty_string
+from src.filesystem.json_file_cache import JsonFileCache
+from src.filesystem.path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+
+class PlaythroughMetadataRepository:
+
+    def __init__(
+        self,
+        playthrough_name: str,
+        path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
+    ):
+        validate_non_empty_string(playthrough_name, "playthrough_name")
+
+        self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
+
+        self._playthrough_metadata_path = (
+            self._path_manager.get_playthrough_metadata_path(playthrough_name)
+        )
+
+    def load_metadata(self) -> Dict[str, Any]:
+        return self._json_file_cache.read(self._playthrough_metadata_path)
+
+    def save_metadata(self, playthrough_metadata: Dict[str, Any]) -> None:
+        self._json_file_cache.write(
+            self._playthrough_metadata_path, playthrough_metadata
+        )
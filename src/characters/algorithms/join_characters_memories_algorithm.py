@@ -1,9 +1,15 @@
-from typing import List
+from typing import List, Optional
 
 from src.base.validators import validate_non_empty_string
 from src.characters.factories.retrieve_memories_algorithm_factory import (
     RetrieveMemoriesAlgorithmFactory,
 )
+from src.databases.abstracts.database import Database
+from src.databases.retrieval_query_builder import (
+    RetrievalQueryBuilder,
+    fuse_with_reciprocal_rank,
+)
+from src.filesystem.config_loader import ConfigLoader
 
 
 class JoinCharactersMemoriesAlgorithm:
@@ -12,6 +18,9 @@ class JoinCharactersMemoriesAlgorithm:
         character_identifiers: List[str],
         query_text: str,
         retrieve_memories_algorithm_factories: RetrieveMemoriesAlgorithmFactory,
+        database: Optional[Database] = None,
+        config_loader: Optional[ConfigLoader] = None,
+        retrieval_query_builder: Optional[RetrievalQueryBuilder] = None,
     ):
         validate_non_empty_string(query_text, "query_text")
 
@@ -20,17 +29,54 @@ class JoinCharactersMemoriesAlgorithm:
         self._retrieve_memories_algorithm_factories = (
             retrieve_memories_algorithm_factories
         )
+        self._database = database
+        self._config_loader = config_loader
+        self._retrieval_query_builder = retrieval_query_builder
+
+    def _retrieve_memories_in_batch(
+        self, character_identifiers: List[str]
+    ) -> List[str]:
+        config_loader = self._config_loader or ConfigLoader()
+
+        top_k = config_loader.get_memories_to_retrieve_from_database()
+
+        queries = (
+            self._retrieval_query_builder.build_queries(self._query_text)
+            if self._retrieval_query_builder
+            else [self._query_text]
+        )
+
+        # A single embedding of each query and a single query per embedding serve
+        # all the characters.
+        batches = [
+            self._database.retrieve_facts_and_memories_batch(
+                None, query, character_identifiers, memories_top_k=top_k
+            )
+            for query in queries
+        ]
+
+        return [
+            entry["document"]
+            for character_identifier in character_identifiers
+            for entry in fuse_with_reciprocal_rank(
+                [batch.memories.get(character_identifier, []) for batch in batches],
+                top_k,
+            )
+        ]
 
     def do_algorithm(self) -> List[str]:
         processed_identifiers = []
-        joined_memories = []
 
         for character_identifier in self._character_identifiers:
             if character_identifier not in processed_identifiers:
                 processed_identifiers.append(character_identifier)
-            else:
-                continue
 
+        if self._database and processed_identifiers:
+            return self._retrieve_memories_in_batch(processed_identifiers)
+
+        joined_memories = []
+
+        for character_identifier in processed_identifiers:
             joined_memories.extend(
                 self._retrieve_memories_algorithm_factories.create_algorithm(
                     character_identifier, self._query_text
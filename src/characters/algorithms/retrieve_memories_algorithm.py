@@ -2,6 +2,10 @@ from typing import Optional, List
 
 from src.base.validators import validate_non_empty_string
 from src.databases.abstracts.database import Database
+from src.databases.retrieval_query_builder import (
+    RetrievalQueryBuilder,
+    fuse_with_reciprocal_rank,
+)
 from src.filesystem.config_loader import ConfigLoader
 
 
@@ -13,6 +17,7 @@ class RetrieveMemoriesAlgorithm:
         query_text: str,
         database: Database,
         config_loader: Optional[ConfigLoader] = None,
+        retrieval_query_builder: Optional[RetrievalQueryBuilder] = None,
     ):
         validate_non_empty_string(character_identifier, "character_identifier")
         validate_non_empty_string(query_text, "query_text")
@@ -22,12 +27,26 @@ class RetrieveMemoriesAlgorithm:
         self._database = database
 
         self._config_loader = config_loader or ConfigLoader()
+        self._retrieval_query_builder = retrieval_query_builder
 
     def do_algorithm(self) -> List[str]:
-        results = self._database.retrieve_memories(
-            self._character_identifier,
-            self._query_text,
-            self._config_loader.get_memories_to_retrieve_from_database(),
-        )
+        top_k = self._config_loader.get_memories_to_retrieve_from_database()
+
+        if self._retrieval_query_builder:
+            results = fuse_with_reciprocal_rank(
+                [
+                    self._database.retrieve_memories(
+                        self._character_identifier, query, top_k
+                    )
+                    for query in self._retrieval_query_builder.build_queries(
+                        self._query_text
+                    )
+                ],
+                top_k,
+            )
+        else:
+            results = self._database.retrieve_memories(
+                self._character_identifier, self._query_text, top_k
+            )
 
         return [entry["document"] for entry in results]
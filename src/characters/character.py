@@ -2,8 +2,8 @@ import logging
 from typing import Dict, Optional
 
 from src.base.validators import validate_non_empty_string
-from src.filesystem.file_operations import read_json_file, write_json_file
 from src.filesystem.filesystem_manager import FilesystemManager
+from src.filesystem.json_file_cache import JsonFileCache
 from src.filesystem.path_manager import PathManager
 
 logger = logging.getLogger(__name__)
@@ -43,25 +43,35 @@ class Character:
         identifier: str,
         filesystem_manager: Optional[FilesystemManager] = None,
         path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
+        character_data: Optional[Dict[str, str]] = None,
     ):
         self._playthrough_name = playthrough_name
         self._identifier = identifier
 
         self._filesystem_manager = filesystem_manager or FilesystemManager()
         self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
 
-        self._data = self._load_character_data()
+        # The character store hands out the data of many characters at once.
+        self._data = (
+            character_data
+            if character_data is not None
+            else self._load_character_data()
+        )
         self._validate_required_attributes()
 
     def _load_character_data(self) -> Dict[str, str]:
-        characters_file = read_json_file(
-            self._path_manager.get_characters_file_path(self._playthrough_name)
+        # Only this character's entry gets copied out of the parsed file.
+        character_entries = self._json_file_cache.read_entries(
+            self._path_manager.get_characters_file_path(self._playthrough_name),
+            [self._identifier],
         )
 
-        if self._identifier not in characters_file:
+        if self._identifier not in character_entries:
             raise KeyError(f"Character with identifier '{self._identifier}' not found.")
 
-        return characters_file[self._identifier]
+        return character_entries[self._identifier]
 
     def _validate_required_attributes(self):
         missing_attributes = [
@@ -73,13 +83,13 @@ class Character:
             )
 
     def save(self):
-        characters_file = read_json_file(
+        characters_file = self._json_file_cache.read(
             self._path_manager.get_characters_file_path(self._playthrough_name)
         )
 
         characters_file[self._identifier] = self._data
 
-        write_json_file(
+        self._json_file_cache.write(
             self._path_manager.get_characters_file_path(self._playthrough_name),
             characters_file,
         )
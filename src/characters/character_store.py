@@ -0,0 +1,55 @@
+from typing import List, Optional
+
+from src.base.validators import validate_non_empty_string
+from src.characters.character import Character
+from src.filesystem.filesystem_manager import FilesystemManager
+from src.filesystem.json_file_cache import JsonFileCache
+from src.filesystem.path_manager import PathManager
+
+
+class CharacterStore:
+    """Hands out the characters of a playthrough, parsing their file once."""
+
+    def __init__(
+        self,
+        playthrough_name: str,
+        filesystem_manager: Optional[FilesystemManager] = None,
+        path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
+    ):
+        validate_non_empty_string(playthrough_name, "playthrough_name")
+
+        self._playthrough_name = playthrough_name
+
+        self._filesystem_manager = filesystem_manager or FilesystemManager()
+        self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
+
+    def get(self, character_identifier: str) -> Character:
+        return self.get_many([character_identifier])[0]
+
+    def get_many(self, character_identifiers: List[str]) -> List[Character]:
+        character_entries = self._json_file_cache.read_entries(
+            self._path_manager.get_characters_file_path(self._playthrough_name),
+            character_identifiers,
+        )
+
+        characters = []
+
+        for identifier in character_identifiers:
+            if identifier not in character_entries:
+                raise KeyError(f"Character with identifier '{identifier}' not found.")
+
+            characters.append(
+                Character(
+                    self._playthrough_name,
+                    identifier,
+                    self._filesystem_manager,
+                    self._path_manager,
+                    self._json_file_cache,
+                    # Repeated identifiers mustn't share their data.
+                    dict(character_entries[identifier]),
+                )
+            )
+
+        return characters
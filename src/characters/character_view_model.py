@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CharacterViewModel:
+    """What the pages need to display a character."""
+
+    identifier: str
+    name: str
+    description: str
+    image_url: str
@@ -4,11 +4,13 @@ from src.base.identifiers_manager import IdentifiersManager
 from src.base.playthrough_manager import PlaythroughManager
 from src.base.validators import validate_non_empty_string
 from src.characters.character import Character
+from src.characters.character_store import CharacterStore
+from src.characters.character_view_model import CharacterViewModel
 from src.filesystem.file_operations import (
-    read_json_file,
     create_directories,
-    create_empty_json_file_if_not_exists,
 )
+from src.filesystem.filesystem_manager import FilesystemManager
+from src.filesystem.json_file_cache import JsonFileCache
 from src.filesystem.path_manager import PathManager
 from src.maps.map_repository import MapRepository
 
@@ -22,6 +24,9 @@ class CharactersManager:
         playthrough_manager: Optional[PlaythroughManager] = None,
         map_repository: Optional[MapRepository] = None,
         path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
+        filesystem_manager: Optional[FilesystemManager] = None,
+        character_store: Optional[CharacterStore] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_manager")
 
@@ -35,6 +40,11 @@ class CharactersManager:
         )
         self._map_repository = map_repository or MapRepository(self._playthrough_name)
         self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
+        self._filesystem_manager = filesystem_manager or FilesystemManager()
+        self._character_store = character_store or CharacterStore(
+            self._playthrough_name
+        )
 
     def _load_characters_file(self) -> Dict[str, Dict]:
         # It could be that the characters directory doesn't yet exist.
@@ -46,9 +56,10 @@ class CharactersManager:
             self._playthrough_name
         )
 
-        create_empty_json_file_if_not_exists(characters_file_path)
+        if not self._json_file_cache.exists(characters_file_path):
+            self._json_file_cache.write(characters_file_path, {})
 
-        return read_json_file(characters_file_path)
+        return self._json_file_cache.read(characters_file_path)
 
     def get_latest_character_identifier(self) -> str:
         characters_file = self._load_characters_file()
@@ -56,27 +67,59 @@ class CharactersManager:
         return self._identifiers_manager.get_highest_identifier(characters_file)
 
     def get_characters(self, character_identifiers: List[str]) -> List[Character]:
-        return [
-            Character(self._playthrough_name, identifier)
-            for identifier in character_identifiers
-        ]
+        return self._character_store.get_many(character_identifiers)
+
+    def get_character_view_models(
+        self, character_identifiers: List[str]
+    ) -> List[CharacterViewModel]:
+        """Projects the characters for display from a single read of the
+        characters file."""
+        characters_file = self._load_characters_file()
+
+        view_models = []
+
+        for identifier in character_identifiers:
+            if identifier not in characters_file:
+                raise KeyError(f"Character with identifier '{identifier}' not found.")
+
+            character_data = characters_file[identifier]
+
+            view_models.append(
+                CharacterViewModel(
+                    identifier=identifier,
+                    name=character_data["name"],
+                    description=character_data.get("description", ""),
+                    image_url=self._filesystem_manager.get_file_path_to_character_image_for_web(
+                        self._playthrough_name, identifier
+                    ),
+                )
+            )
+
+        return view_models
 
     def get_followers(self) -> List[Character]:
         return self.get_characters(self._playthrough_manager.get_followers())
 
-    def get_characters_at_current_place(self) -> List[Character]:
+    def get_follower_view_models(self) -> List[CharacterViewModel]:
+        return self.get_character_view_models(self._playthrough_manager.get_followers())
+
+    def _get_identifiers_of_characters_at_current_place(self) -> List[str]:
         current_place = self._playthrough_manager.get_current_place_identifier()
-        map_file = self._map_repository.load_map_data()
 
-        current_place_data = map_file.get(current_place, {})
-        character_ids = current_place_data.get("characters", [])
+        return self._map_repository.get_characters_at_place(current_place)
 
-        return self.get_characters(character_ids)
+    def get_character_view_models_at_current_place(self) -> List[CharacterViewModel]:
+        return self.get_character_view_models(
+            self._get_identifiers_of_characters_at_current_place()
+        )
 
-    def get_characters_at_current_place_plus_followers(self) -> List[Character]:
-        characters = self.get_characters_at_current_place()
-        characters.extend(self.get_followers())
-        return characters
+    def get_character_view_models_at_current_place_plus_followers(
+        self,
+    ) -> List[CharacterViewModel]:
+        return self.get_character_view_models(
+            self._get_identifiers_of_characters_at_current_place()
+            + self._playthrough_manager.get_followers()
+        )
 
     def get_all_characters(self) -> List[dict]:
         characters_file = self._load_characters_file()
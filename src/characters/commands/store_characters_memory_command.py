@@ -0,0 +1,36 @@
+import logging
+from typing import List
+
+from src.base.abstracts.command import Command
+from src.databases.abstracts.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class StoreCharactersMemoryCommand(Command):
+    """Stores the same memory for several characters through a single insert."""
+
+    def __init__(
+        self,
+        character_identifiers: List[str],
+        memory: str,
+        database: Database,
+    ):
+        self._character_identifiers = character_identifiers
+        self._memory = memory
+        self._database = database
+
+    def execute(self) -> None:
+        if not self._character_identifiers:
+            return
+
+        self._database.insert_memories(
+            [
+                (character_identifier, self._memory)
+                for character_identifier in self._character_identifiers
+            ]
+        )
+
+        logger.info(
+            f"Saved memory for characters {', '.join(self._character_identifiers)}."
+        )
@@ -6,7 +6,7 @@ from src.base.algorithms.produce_and_update_next_identifier_algorithm import (
     ProduceAndUpdateNextIdentifierAlgorithm,
 )
 from src.characters.character_data import CharacterDataForStorage
-from src.filesystem.file_operations import read_json_file, write_json_file
+from src.filesystem.json_file_cache import JsonFileCache
 from src.filesystem.path_manager import PathManager
 from src.voices.algorithms.match_voice_data_to_voice_model_algorithm import (
     MatchVoiceDataToVoiceModelAlgorithm,
@@ -25,6 +25,7 @@ class StoreGeneratedCharacterCommand(Command):
         match_voice_data_to_voice_model_algorithm: MatchVoiceDataToVoiceModelAlgorithm,
         produce_and_update_next_identifier_algorithm: ProduceAndUpdateNextIdentifierAlgorithm,
         path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
     ):
         if not character_data:
             raise ValueError("character_data can't be empty.")
@@ -40,6 +41,7 @@ class StoreGeneratedCharacterCommand(Command):
         )
 
         self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
 
         try:
             self._character_data = CharacterDataForStorage(
@@ -68,7 +70,7 @@ class StoreGeneratedCharacterCommand(Command):
             raise ValueError(f"Invalid character_data: {e}")
 
     def execute(self) -> None:
-        characters_file = read_json_file(
+        characters_file = self._json_file_cache.read(
             self._path_manager.get_characters_file_path(self._playthrough_name)
         )
 
@@ -117,7 +119,7 @@ class StoreGeneratedCharacterCommand(Command):
             self._playthrough_name
         )
 
-        write_json_file(
+        self._json_file_cache.write(
             characters_file_path,
             characters_file,
         )
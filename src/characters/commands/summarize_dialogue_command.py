@@ -51,7 +51,6 @@ class SummarizeDialogueCommand(Command):
                 f"Failed to create a summary for the dialogue: {summary_product.get_error()}"
             )
 
-        for participant_identifier in self._character_identifiers:
-            self._store_character_memory_command_factory.create_store_character_memory_command(
-                participant_identifier, summary_product.get()
-            ).execute()
+        self._store_character_memory_command_factory.create_store_characters_memory_command(
+            list(self._character_identifiers), summary_product.get()
+        ).execute()
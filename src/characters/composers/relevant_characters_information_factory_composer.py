@@ -55,7 +55,9 @@ class RelevantCharactersInformationFactoryComposer:
         combine_memories_algorithm_factory = CombineMemoriesAlgorithmFactory()
 
         join_characters_memories_algorithm_factory = (
-            JoinCharactersMemoriesAlgorithmFactory(retrieve_memories_algorithm_factory)
+            JoinCharactersMemoriesAlgorithmFactory(
+                retrieve_memories_algorithm_factory, database
+            )
         )
 
         prettified_memories_factory = PrettifiedMemoriesFactory(
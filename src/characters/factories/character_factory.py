@@ -1,10 +1,19 @@
+from typing import Optional
+
 from src.characters.character import Character
+from src.characters.character_store import CharacterStore
 
 
 class CharacterFactory:
 
-    def __init__(self, playthrough_name: str):
+    def __init__(
+        self, playthrough_name: str, character_store: Optional[CharacterStore] = None
+    ):
         self._playthrough_name = playthrough_name
 
-    def create_character(self, character_identifier: str):
-        return Character(self._playthrough_name, character_identifier)
+        self._character_store = character_store or CharacterStore(
+            self._playthrough_name
+        )
+
+    def create_character(self, character_identifier: str) -> Character:
+        return self._character_store.get(character_identifier)
@@ -10,7 +10,6 @@ from src.characters.products.character_generation_guidelines_product import (
 from src.concepts.algorithms.format_known_facts_algorithm import (
     FormatKnownFactsAlgorithm,
 )
-from src.filesystem.file_operations import read_file
 from src.filesystem.path_manager import PathManager
 from src.maps.factories.map_manager_factory import MapManagerFactory
 from src.maps.factories.place_manager_factory import PlaceManagerFactory
@@ -66,10 +65,6 @@ class CharacterGenerationGuidelinesProvider(BaseToolResponseProvider):
 
         return prompt_data
 
-    def _read_tool_instructions(self) -> str:
-        """Reads the tool instructions from the filesystem."""
-        return read_file(self._path_manager.get_tool_instructions_for_instructor_path())
-
     def get_user_content(self) -> str:
         return "Write three entries that are guidelines for creating interesting characters based on the above combination of places. Follow the provided instructions."
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from src.characters.algorithms.join_characters_memories_algorithm import (
     JoinCharactersMemoriesAlgorithm,
@@ -6,14 +6,23 @@ from src.characters.algorithms.join_characters_memories_algorithm import (
 from src.characters.factories.retrieve_memories_algorithm_factory import (
     RetrieveMemoriesAlgorithmFactory,
 )
+from src.databases.abstracts.database import Database
+from src.databases.retrieval_query_builder import RetrievalQueryBuilder
 
 
 class JoinCharactersMemoriesAlgorithmFactory:
 
     def __init__(
-        self, retrieve_memories_algorithm_factory: RetrieveMemoriesAlgorithmFactory
+        self,
+        retrieve_memories_algorithm_factory: RetrieveMemoriesAlgorithmFactory,
+        database: Optional[Database] = None,
+        retrieval_query_builder: Optional[RetrievalQueryBuilder] = None,
     ):
         self._retrieve_memories_algorithm_factory = retrieve_memories_algorithm_factory
+        self._database = database
+        self._retrieval_query_builder = (
+            retrieval_query_builder or RetrievalQueryBuilder()
+        )
 
     def create_algorithm(
         self, character_identifiers: List[str], query_text: str
@@ -22,4 +31,6 @@ class JoinCharactersMemoriesAlgorithmFactory:
             character_identifiers,
             query_text,
             self._retrieve_memories_algorithm_factory,
+            self._database,
+            retrieval_query_builder=self._retrieval_query_builder,
         )
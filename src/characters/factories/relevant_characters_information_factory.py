@@ -4,8 +4,10 @@ from src.base.validators import validate_non_empty_string
 from src.characters.factories.party_data_for_prompt_factory import (
     PartyDataForPromptFactory,
 )
-from src.filesystem.file_operations import read_file
 from src.filesystem.path_manager import PathManager
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
 
 
 class RelevantCharactersInformationFactory:
@@ -14,19 +16,22 @@ class RelevantCharactersInformationFactory:
         self,
         party_data_for_prompt_factory: PartyDataForPromptFactory,
         path_manager: Optional[PathManager] = None,
+        prompt_template_repository: Optional[PromptTemplateRepository] = None,
     ):
         self._party_data_for_prompt_factory = party_data_for_prompt_factory
 
         self._path_manager = path_manager or PathManager()
+        self._prompt_template_repository = (
+            prompt_template_repository or PromptTemplateRepository.get_shared_instance()
+        )
 
     def get_information(self, query_text: str) -> str:
         validate_non_empty_string(query_text, "query_text")
 
-        relevant_characters_information = read_file(
-            self._path_manager.get_players_and_followers_information_path()
-        )
         party_data_for_prompt = (
             self._party_data_for_prompt_factory.get_party_data_for_prompt(query_text)
         )
 
-        return relevant_characters_information.format(**party_data_for_prompt)
+        return self._prompt_template_repository.get_template(
+            self._path_manager.get_players_and_followers_information_path()
+        ).format(**party_data_for_prompt)
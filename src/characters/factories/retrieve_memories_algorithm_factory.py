@@ -1,12 +1,22 @@
+from typing import Optional
+
 from src.characters.algorithms.retrieve_memories_algorithm import (
     RetrieveMemoriesAlgorithm,
 )
 from src.databases.abstracts.database import Database
+from src.databases.retrieval_query_builder import RetrievalQueryBuilder
 
 
 class RetrieveMemoriesAlgorithmFactory:
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        retrieval_query_builder: Optional[RetrievalQueryBuilder] = None,
+    ):
         self._database = database
+        self._retrieval_query_builder = (
+            retrieval_query_builder or RetrievalQueryBuilder()
+        )
 
     def create_algorithm(
         self,
@@ -14,5 +24,8 @@ class RetrieveMemoriesAlgorithmFactory:
         query_text: str,
     ) -> RetrieveMemoriesAlgorithm:
         return RetrieveMemoriesAlgorithm(
-            character_identifier, query_text, self._database
+            character_identifier,
+            query_text,
+            self._database,
+            retrieval_query_builder=self._retrieval_query_builder,
         )
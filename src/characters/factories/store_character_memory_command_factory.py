@@ -1,7 +1,12 @@
+from typing import List
+
 from src.base.validators import validate_non_empty_string
 from src.characters.commands.store_character_memory_command import (
     StoreCharacterMemoryCommand,
 )
+from src.characters.commands.store_characters_memory_command import (
+    StoreCharactersMemoryCommand,
+)
 from src.databases.abstracts.database import Database
 
 
@@ -19,3 +24,10 @@ class StoreCharacterMemoryCommandFactory:
         return StoreCharacterMemoryCommand(
             self._playthrough_name, participant_identifier, memory, self._database
         )
+
+    def create_store_characters_memory_command(
+        self, participant_identifiers: List[str], memory: str
+    ) -> StoreCharactersMemoryCommand:
+        return StoreCharactersMemoryCommand(
+            participant_identifiers, memory, self._database
+        )
@@ -4,9 +4,11 @@ from typing import Optional
 from pydantic import BaseModel
 
 from src.base.enums import TemplateType
+from src.base.repositories.playthrough_metadata_repository import (
+    PlaythroughMetadataRepository,
+)
 from src.base.tools import capture_traceback
 from src.characters.models.base_character_data import BaseCharacterData
-from src.filesystem.file_operations import read_file, read_json_file
 from src.filesystem.path_manager import PathManager
 from src.maps.templates_repository import TemplatesRepository
 from src.prompting.abstracts.abstract_factories import (
@@ -38,6 +40,7 @@ class BaseCharacterDataGenerationToolResponseProvider(
         character_generation_instructions_formatter_factory: CharacterGenerationInstructionsFormatterFactory,
         templates_repository: Optional[TemplatesRepository] = None,
         path_manager: Optional[PathManager] = None,
+        playthrough_metadata_repository: Optional[PlaythroughMetadataRepository] = None,
     ):
         super().__init__(produce_tool_response_strategy_factory, path_manager)
 
@@ -50,6 +53,10 @@ class BaseCharacterDataGenerationToolResponseProvider(
         )
 
         self._templates_repository = templates_repository or TemplatesRepository()
+        self._playthrough_metadata_repository = (
+            playthrough_metadata_repository
+            or PlaythroughMetadataRepository(self._playthrough_name)
+        )
 
     def get_formatted_prompt(self) -> str:
         templates = self._load_templates()
@@ -104,9 +111,7 @@ class BaseCharacterDataGenerationToolResponseProvider(
 
     def _load_templates(self) -> dict:
         """Loads all necessary templates and metadata from the filesystem."""
-        playthrough_metadata = read_json_file(
-            self._path_manager.get_playthrough_metadata_path(self._playthrough_name)
-        )
+        playthrough_metadata = self._playthrough_metadata_repository.load_metadata()
         worlds_templates = self._templates_repository.load_templates(TemplateType.WORLD)
         regions_templates = self._templates_repository.load_templates(
             TemplateType.REGION
@@ -116,7 +121,7 @@ class BaseCharacterDataGenerationToolResponseProvider(
             TemplateType.LOCATION
         )
 
-        character_generation_instructions = read_file(
+        character_generation_instructions = self._read_prompt_file(
             self._path_manager.get_base_character_data_generation_prompt_path()
         )
 
@@ -5,9 +5,11 @@ from src.characters.factories.character_factory import CharacterFactory
 from src.characters.factories.retrieve_memories_algorithm_factory import (
     RetrieveMemoriesAlgorithmFactory,
 )
-from src.filesystem.file_operations import read_file
 from src.filesystem.path_manager import PathManager
 from src.interviews.repositories.interview_repository import InterviewRepository
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
 
 
 class CharacterInformationProvider:
@@ -23,6 +25,7 @@ class CharacterInformationProvider:
         character_factory: CharacterFactory,
         path_manager: Optional[PathManager] = None,
         interview_repository: Optional[InterviewRepository] = None,
+        prompt_template_repository: Optional[PromptTemplateRepository] = None,
     ):
         validate_non_empty_string(character_identifier, "character_identifier")
         validate_non_empty_string(query_text, "query_text")
@@ -39,6 +42,9 @@ class CharacterInformationProvider:
         )
 
         self._path_manager = path_manager or PathManager()
+        self._prompt_template_repository = (
+            prompt_template_repository or PromptTemplateRepository.get_shared_instance()
+        )
         self._interview_repository = interview_repository or InterviewRepository(
             playthrough_name, character_identifier, self._character.name
         )
@@ -74,11 +80,9 @@ class CharacterInformationProvider:
         if self._use_interview and interview:
             return self._format_interview_output(interview, memories)
 
-        character_information = read_file(
+        character_information = self._prompt_template_repository.get_template(
             self._path_manager.get_character_information_path()
-        )
-
-        character_information = character_information.format(
+        ).format(
             **{
                 "name": self._character.name,
                 "description": self._character.description,
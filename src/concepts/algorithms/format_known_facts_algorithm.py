@@ -1,12 +1,19 @@
 from typing import Optional
 
 from src.databases.abstracts.database import Database
+from src.databases.retrieval_query_builder import (
+    RetrievalQueryBuilder,
+    fuse_with_reciprocal_rank,
+)
 from src.filesystem.config_loader import ConfigLoader
 
 
 class FormatKnownFactsAlgorithm:
     def __init__(
-        self, database: Database, config_loader: Optional[ConfigLoader] = None
+        self,
+        database: Database,
+        config_loader: Optional[ConfigLoader] = None,
+        retrieval_query_builder: Optional[RetrievalQueryBuilder] = None,
     ):
         if isinstance(database, str):
             raise TypeError(
@@ -16,11 +23,21 @@ class FormatKnownFactsAlgorithm:
         self._database = database
 
         self._config_loader = config_loader or ConfigLoader()
+        self._retrieval_query_builder = retrieval_query_builder
 
     def do_algorithm(self, query_text: str) -> str:
-        facts = self._database.retrieve_facts(
-            query_text, self._config_loader.get_facts_to_retrieve_from_database()
-        )
+        top_k = self._config_loader.get_facts_to_retrieve_from_database()
+
+        if self._retrieval_query_builder:
+            facts = fuse_with_reciprocal_rank(
+                [
+                    self._database.retrieve_facts(query, top_k)
+                    for query in self._retrieval_query_builder.build_queries(query_text)
+                ],
+                top_k,
+            )
+        else:
+            facts = self._database.retrieve_facts(query_text, top_k)
 
         known_facts = ""
 
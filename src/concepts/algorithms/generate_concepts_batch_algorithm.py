@@ -0,0 +1,123 @@
+import logging
+from typing import Dict, List, Optional
+
+from src.base.abstracts.observer import Observer
+from src.base.async_bridge import AsyncBridge, gather_with_concurrency_limit
+from src.base.validators import validate_non_empty_string
+from src.concepts.algorithms.base_concept_algorithm import BaseConceptAlgorithm
+from src.concepts.algorithms.get_concepts_prompt_data_algorithm import (
+    GetConceptsPromptDataAlgorithm,
+)
+from src.concepts.enums import ConceptType
+from src.concepts.factories.base_concept_factory import BaseConceptFactory
+from src.concepts.repositories.concepts_repository import ConceptsRepository
+from src.filesystem.config_loader import ConfigLoader
+
+logger = logging.getLogger(__name__)
+
+
+class GenerateConceptsBatchAlgorithm:
+    """Generates the concepts of several types concurrently, saving them once."""
+
+    def __init__(
+        self,
+        playthrough_name: str,
+        concept_factories: Dict[ConceptType, BaseConceptFactory],
+        get_concepts_prompt_data_algorithm: GetConceptsPromptDataAlgorithm,
+        progress_observer: Optional[Observer] = None,
+        concepts_repository: Optional[ConceptsRepository] = None,
+        config_loader: Optional[ConfigLoader] = None,
+        async_bridge: Optional[AsyncBridge] = None,
+    ):
+        validate_non_empty_string(playthrough_name, "playthrough_name")
+
+        self._concept_factories = concept_factories
+        self._get_concepts_prompt_data_algorithm = get_concepts_prompt_data_algorithm
+        self._progress_observer = progress_observer
+        self._concepts_repository = concepts_repository or ConceptsRepository(
+            playthrough_name
+        )
+        self._config_loader = config_loader or ConfigLoader()
+        self._async_bridge = async_bridge or AsyncBridge.get_shared_instance()
+
+    def _notify_progress(self, concept_type: ConceptType, status: str, **data) -> None:
+        if self._progress_observer:
+            self._progress_observer.update(
+                {"concept_type": concept_type.value, "status": status, **data}
+            )
+
+    async def _generate_concepts(self, concept_type: ConceptType) -> List[str]:
+        factory = self._concept_factories[concept_type]
+
+        self._notify_progress(concept_type, "generating")
+
+        # A failed concept type shouldn't discard the ones that did generate.
+        try:
+            product = await factory.generate_product_async(
+                BaseConceptAlgorithm.ACTION_CLASS_MAPPING[concept_type.value]
+            )
+
+            if not product.is_valid():
+                raise ValueError(
+                    f"Failed to generate product from {factory.__class__.__name__}. "
+                    f"Error: {product.get_error()}"
+                )
+
+            generated_items = product.get()
+
+            if not generated_items:
+                raise ValueError(
+                    f"No items were generated by {factory.__class__.__name__}."
+                )
+        except Exception as e:
+            logger.error("Failed to generate %s: %s", concept_type.value, e)
+            self._notify_progress(concept_type, "failed", error=str(e))
+            return []
+
+        self._notify_progress(concept_type, "generated", items=generated_items)
+
+        return generated_items
+
+    def do_algorithm(
+        self, concept_types: List[ConceptType]
+    ) -> Dict[ConceptType, List[str]]:
+        if not concept_types:
+            raise ValueError("There weren't concept types to generate.")
+
+        concept_types = list(dict.fromkeys(concept_types))
+
+        for concept_type in concept_types:
+            if concept_type not in self._concept_factories:
+                raise NotImplementedError(
+                    f"There's no factory for the concept type '{concept_type.value}'."
+                )
+
+        # Assembled here rather than by the first factory to need it, so the
+        # event loop of the bridge doesn't wait on the databases.
+        self._get_concepts_prompt_data_algorithm.do_algorithm()
+
+        generated_items = self._async_bridge.run(
+            gather_with_concurrency_limit(
+                [
+                    self._generate_concepts(concept_type)
+                    for concept_type in concept_types
+                ],
+                self._config_loader.get_max_concurrent_concept_generations(),
+            )
+        )
+
+        generated_concepts = {
+            concept_type: items
+            for concept_type, items in zip(concept_types, generated_items)
+            if items
+        }
+
+        if generated_concepts:
+            self._concepts_repository.add_concepts_by_key(
+                {
+                    concept_type.value: items
+                    for concept_type, items in generated_concepts.items()
+                }
+            )
+
+        return generated_concepts
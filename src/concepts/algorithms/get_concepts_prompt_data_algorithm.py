@@ -1,4 +1,5 @@
-from typing import Dict
+import threading
+from typing import Dict, Optional
 
 from src.base.tools import join_with_newline
 from src.base.validators import validate_non_empty_string
@@ -12,6 +13,10 @@ from src.maps.providers.places_descriptions_provider import PlacesDescriptionsPr
 
 
 class GetConceptsPromptDataAlgorithm:
+    """Assembles the context shared by the prompts of every concept. It's
+    assembled once per instance, so the factories that share an instance also
+    share the work."""
+
     def __init__(
         self,
         playthrough_name: str,
@@ -27,7 +32,10 @@ class GetConceptsPromptDataAlgorithm:
             player_and_followers_information_factory
         )
 
-    def do_algorithm(self) -> Dict[str, str]:
+        self._lock = threading.Lock()
+        self._prompt_data: Optional[Dict[str, str]] = None
+
+    def _assemble_prompt_data(self) -> Dict[str, str]:
         places_descriptions = self._places_descriptions_factory.get_information()
 
         known_facts = self._format_known_facts_algorithm.do_algorithm(
@@ -47,3 +55,10 @@ class GetConceptsPromptDataAlgorithm:
         prompt_data.update({"known_facts": known_facts})
 
         return prompt_data
+
+    def do_algorithm(self) -> Dict[str, str]:
+        with self._lock:
+            if self._prompt_data is None:
+                self._prompt_data = self._assemble_prompt_data()
+
+            return dict(self._prompt_data)
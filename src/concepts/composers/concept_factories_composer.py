@@ -0,0 +1,99 @@
+from typing import Dict
+
+from src.base.validators import validate_non_empty_string
+from src.characters.composers.relevant_characters_information_factory_composer import (
+    RelevantCharactersInformationFactoryComposer,
+)
+from src.characters.strategies.followers_identifiers_strategy import (
+    FollowersIdentifiersStrategy,
+)
+from src.concepts.algorithms.get_concepts_prompt_data_algorithm import (
+    GetConceptsPromptDataAlgorithm,
+)
+from src.concepts.composers.format_known_facts_algorithm_composer import (
+    FormatKnownFactsAlgorithmComposer,
+)
+from src.concepts.enums import ConceptType
+from src.concepts.factories.antagonists_factory import AntagonistsFactory
+from src.concepts.factories.artifacts_factory import ArtifactsFactory
+from src.concepts.factories.base_concept_factory import BaseConceptFactory
+from src.concepts.factories.dilemmas_factory import DilemmasFactory
+from src.concepts.factories.foreshadowing_factory import ForeshadowingFactory
+from src.concepts.factories.goals_factory import GoalsFactory
+from src.concepts.factories.lore_and_legends_factory import LoreAndLegendsFactory
+from src.concepts.factories.mysteries_factory import MysteriesFactory
+from src.concepts.factories.plot_blueprints_factory import PlotBlueprintsFactory
+from src.concepts.factories.plot_twists_factory import PlotTwistsFactory
+from src.concepts.factories.scenarios_factory import ScenariosFactory
+from src.maps.composers.places_descriptions_provider_composer import (
+    PlacesDescriptionsProviderComposer,
+)
+from src.prompting.composers.produce_tool_response_strategy_factory_composer import (
+    ProduceToolResponseStrategyFactoryComposer,
+)
+from src.prompting.llms import Llms
+
+CONCEPT_FACTORY_CLASSES = {
+    ConceptType.PLOT_BLUEPRINTS: PlotBlueprintsFactory,
+    ConceptType.SCENARIOS: ScenariosFactory,
+    ConceptType.DILEMMAS: DilemmasFactory,
+    ConceptType.GOALS: GoalsFactory,
+    ConceptType.PLOT_TWISTS: PlotTwistsFactory,
+    ConceptType.ANTAGONISTS: AntagonistsFactory,
+    ConceptType.LORE_AND_LEGENDS: LoreAndLegendsFactory,
+    ConceptType.ARTIFACTS: ArtifactsFactory,
+    ConceptType.MYSTERIES: MysteriesFactory,
+    ConceptType.FORESHADOWING: ForeshadowingFactory,
+}
+
+
+class ConceptFactoriesComposer:
+    """Composes a factory for every concept type, sharing their prompt data."""
+
+    def __init__(self, playthrough_name: str):
+        validate_non_empty_string(playthrough_name, "playthrough_name")
+
+        self._playthrough_name = playthrough_name
+
+    def compose_get_concepts_prompt_data_algorithm(
+        self,
+    ) -> GetConceptsPromptDataAlgorithm:
+        player_and_followers_information_factory = (
+            RelevantCharactersInformationFactoryComposer(
+                self._playthrough_name,
+                "Follower",
+                FollowersIdentifiersStrategy(self._playthrough_name),
+            ).compose_factory()
+        )
+
+        places_descriptions_provider = PlacesDescriptionsProviderComposer(
+            self._playthrough_name
+        ).compose_provider()
+
+        format_known_facts_algorithm = FormatKnownFactsAlgorithmComposer(
+            self._playthrough_name
+        ).compose_algorithm()
+
+        return GetConceptsPromptDataAlgorithm(
+            self._playthrough_name,
+            format_known_facts_algorithm,
+            places_descriptions_provider,
+            player_and_followers_information_factory,
+        )
+
+    def compose_factories(
+        self, get_concepts_prompt_data_algorithm: GetConceptsPromptDataAlgorithm
+    ) -> Dict[ConceptType, BaseConceptFactory]:
+        produce_tool_response_strategy_factory = (
+            ProduceToolResponseStrategyFactoryComposer(
+                Llms().for_concept_generation(),
+            ).compose_factory()
+        )
+
+        return {
+            concept_type: factory_class(
+                get_concepts_prompt_data_algorithm,
+                produce_tool_response_strategy_factory,
+            )
+            for concept_type, factory_class in CONCEPT_FACTORY_CLASSES.items()
+        }
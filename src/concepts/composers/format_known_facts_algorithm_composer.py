@@ -3,6 +3,7 @@ from src.concepts.algorithms.format_known_facts_algorithm import (
     FormatKnownFactsAlgorithm,
 )
 from src.databases.chroma_db_database import ChromaDbDatabase
+from src.databases.retrieval_query_builder import RetrievalQueryBuilder
 from src.filesystem.config_loader import ConfigLoader
 
 
@@ -17,4 +18,6 @@ class FormatKnownFactsAlgorithmComposer:
 
         config_loader = ConfigLoader()
 
-        return FormatKnownFactsAlgorithm(database, config_loader)
+        return FormatKnownFactsAlgorithm(
+            database, config_loader, RetrievalQueryBuilder(config_loader)
+        )
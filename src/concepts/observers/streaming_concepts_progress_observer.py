@@ -0,0 +1,8 @@
+from src.base.observers.server_sent_events_observer import ServerSentEventsObserver
+
+
+class StreamingConceptsProgressObserver(ServerSentEventsObserver):
+    """Streams the progress of a batch of concept generations."""
+
+    def update(self, message: dict) -> None:
+        self.send("concept_progress", message)
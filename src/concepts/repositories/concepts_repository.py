@@ -2,7 +2,7 @@ import logging
 from typing import Optional, Dict, List
 
 from src.base.validators import validate_non_empty_string
-from src.filesystem.file_operations import read_json_file, write_json_file
+from src.filesystem.json_file_cache import JsonFileCache
 from src.filesystem.path_manager import PathManager
 
 logger = logging.getLogger(__name__)
@@ -11,35 +11,65 @@ logger = logging.getLogger(__name__)
 class ConceptsRepository:
 
     def __init__(
-        self, playthrough_name: str, path_manager: Optional[PathManager] = None
+        self,
+        playthrough_name: str,
+        path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
         self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
 
         self._concepts_file_path = self._path_manager.get_concepts_file_path(
             playthrough_name
         )
 
     def _load_concepts_file(self) -> Dict[str, List[str]]:
-        return read_json_file(self._concepts_file_path)
+        return self._json_file_cache.read(self._concepts_file_path)
 
-    def _has_concept(self, concept_key: str) -> bool:
-        return concept_key in self._load_concepts_file()
+    def _save_concepts_file(self, concepts_file: Dict[str, List[str]]) -> None:
+        self._json_file_cache.write(self._concepts_file_path, concepts_file)
+
+    def load_concepts(self) -> Dict[str, List[str]]:
+        # It could be that the concepts file doesn't yet exist.
+        if not self._json_file_cache.exists(self._concepts_file_path):
+            self._save_concepts_file({})
+
+        return self._load_concepts_file()
 
     def add_concepts(self, concept_key: str, concepts: List[str]) -> None:
+        self.add_concepts_by_key({concept_key: concepts})
+
+    def add_concepts_by_key(self, concepts_by_key: Dict[str, List[str]]) -> None:
+        """Adds the concepts of several kinds, writing the concepts file once."""
         concepts_file = self._load_concepts_file()
 
-        if not self._has_concept(concept_key):
-            concepts_file[concept_key] = []
+        for concept_key, concepts in concepts_by_key.items():
+            if concept_key not in concepts_file:
+                concepts_file[concept_key] = []
 
-        for concept in concepts:
-            if not concept:
-                raise ValueError(
-                    f"Received a list with at least an invalid concept: {concepts}"
-                )
-            concepts_file[concept_key].append(concept)
+            for concept in concepts:
+                if not concept:
+                    raise ValueError(
+                        f"Received a list with at least an invalid concept: {concepts}"
+                    )
+                concepts_file[concept_key].append(concept)
 
-        write_json_file(self._concepts_file_path, concepts_file)
+        self._save_concepts_file(concepts_file)
 
         logger.info(f"Saved generated concepts to '{self._concepts_file_path}'.")
+
+    def remove_concept(self, concept_key: str, index: int) -> bool:
+        """Removes a single concept. Returns False if there were no concepts of
+        that kind."""
+        concepts_file = self._load_concepts_file()
+
+        if concept_key not in concepts_file:
+            return False
+
+        concepts_file[concept_key].pop(index)
+
+        self._save_concepts_file(concepts_file)
+
+        return True
@@ -1,4 +1,12 @@
-from typing import Protocol, List, Dict
+from dataclasses import dataclass, field
+from typing import Protocol, List, Dict, Optional, Tuple
+
+
+@dataclass
+class FactsAndMemories:
+    facts: List[Dict[str, str]] = field(default_factory=list)
+    # The retrieved memories, grouped by character identifier.
+    memories: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
 
 
 class Database(Protocol):
@@ -8,6 +16,13 @@ class Database(Protocol):
     def insert_memory(self, character_identifier: str, memory: str) -> None:
         pass
 
+    def insert_facts(self, facts: List[str]) -> None:
+        pass
+
+    def insert_memories(self, memories: List[Tuple[str, str]]) -> None:
+        """Inserts memories given as (character identifier, memory) pairs."""
+        pass
+
     def retrieve_facts(self, query_text: str, top_k: int = 5) -> List[Dict[str, str]]:
         pass
 
@@ -15,3 +30,13 @@ class Database(Protocol):
         self, character_identifier: str, query_text: str, top_k: int = 5
     ) -> List[Dict[str, str]]:
         pass
+
+    def retrieve_facts_and_memories_batch(
+        self,
+        facts_query_text: Optional[str],
+        memories_query_text: Optional[str],
+        character_identifiers: List[str],
+        facts_top_k: int = 5,
+        memories_top_k: int = 5,
+    ) -> FactsAndMemories:
+        pass
@@ -0,0 +1,238 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+logger = logging.getLogger(__name__)
+
+# (model id, sha256 of the text)
+EmbeddingCacheKey = Tuple[str, str]
+
+
+@dataclass
+class EmbeddingCacheStatistics:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.disk_hits + self.misses
+
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embedding function that remembers the embeddings it has computed."""
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction[Documents],
+        model_id: str,
+        max_entries: int,
+        cache_directory: Optional[Path] = None,
+        max_disk_bytes: int = 0,
+    ):
+        if max_entries < 0:
+            raise ValueError("max_entries can't be negative.")
+        if not model_id:
+            raise ValueError("model_id can't be empty.")
+        if cache_directory is not None and max_disk_bytes < 1:
+            raise ValueError("Storing embeddings on disk requires max_disk_bytes.")
+
+        self._embedding_function = embedding_function
+        self._model_id = model_id
+        self._max_entries = max_entries
+        self._cache_directory = cache_directory
+        self._max_disk_bytes = max_disk_bytes
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[EmbeddingCacheKey, np.ndarray] = OrderedDict()
+        self._statistics = EmbeddingCacheStatistics()
+
+        # The files on disk and their sizes, from the least recently used. Built
+        # from their modification times on first use, which hits refresh.
+        self._disk_lock = threading.Lock()
+        self._disk_entries: Optional[OrderedDict[Path, int]] = None
+        self._disk_bytes = 0
+
+    def _get_key(self, text: str) -> EmbeddingCacheKey:
+        return self._model_id, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _get_disk_path(self, key: EmbeddingCacheKey) -> Path:
+        model_id, text_hash = key
+
+        return self._cache_directory / model_id / text_hash[:2] / f"{text_hash}.npy"
+
+    def _get_disk_entries(self) -> OrderedDict[Path, int]:
+        if self._disk_entries is None:
+            disk_files = []
+
+            for disk_path in self._cache_directory.glob("*/*/*.npy"):
+                try:
+                    stat = disk_path.stat()
+                except OSError:
+                    continue
+
+                disk_files.append((stat.st_mtime, disk_path, stat.st_size))
+
+            self._disk_entries = OrderedDict(
+                (disk_path, size) for _, disk_path, size in sorted(disk_files)
+            )
+            self._disk_bytes = sum(self._disk_entries.values())
+
+        return self._disk_entries
+
+    def _touch_on_disk(self, disk_path: Path) -> None:
+        with self._disk_lock:
+            disk_entries = self._get_disk_entries()
+
+            if disk_path in disk_entries:
+                disk_entries.move_to_end(disk_path)
+
+        try:
+            os.utime(disk_path)
+        except OSError:
+            pass
+
+    def _add_on_disk(self, disk_path: Path) -> None:
+        with self._disk_lock:
+            disk_entries = self._get_disk_entries()
+
+            self._disk_bytes -= disk_entries.pop(disk_path, 0)
+            disk_entries[disk_path] = disk_path.stat().st_size
+            self._disk_bytes += disk_entries[disk_path]
+
+            evicted = 0
+
+            while self._disk_bytes > self._max_disk_bytes and len(disk_entries) > 1:
+                evicted_path, size = disk_entries.popitem(last=False)
+                self._disk_bytes -= size
+                evicted_path.unlink(missing_ok=True)
+                evicted += 1
+
+        if evicted:
+            logger.info(f"Evicted {evicted} embeddings from the disk cache.")
+
+    def _load_from_disk(self, key: EmbeddingCacheKey) -> Optional[np.ndarray]:
+        if self._cache_directory is None:
+            return None
+
+        disk_path = self._get_disk_path(key)
+
+        if not disk_path.exists():
+            return None
+
+        try:
+            embedding = np.load(disk_path)
+        except (OSError, ValueError) as exception:
+            logger.warning(
+                f"Couldn't load the cached embedding at '{disk_path}': {exception}"
+            )
+            return None
+
+        self._touch_on_disk(disk_path)
+
+        return embedding
+
+    def _store_on_disk(self, key: EmbeddingCacheKey, embedding: np.ndarray) -> None:
+        if self._cache_directory is None:
+            return
+
+        disk_path = self._get_disk_path(key)
+
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first, so that a concurrent reader never
+            # sees a half-written embedding.
+            temporary_path = disk_path.with_suffix(f".{threading.get_ident()}.tmp")
+
+            with temporary_path.open("wb") as file:
+                np.save(file, embedding)
+
+            temporary_path.replace(disk_path)
+
+            self._add_on_disk(disk_path)
+        except OSError as exception:
+            logger.warning(
+                f"Couldn't store the embedding at '{disk_path}': {exception}"
+            )
+
+    def _remember(self, key: EmbeddingCacheKey, embedding: np.ndarray) -> None:
+        if self._max_entries == 0:
+            return
+
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __call__(self, input: Documents) -> Embeddings:  # noqa
+        keys = [self._get_key(text) for text in input]
+
+        embeddings: Dict[EmbeddingCacheKey, np.ndarray] = {}
+        missing_texts: Dict[EmbeddingCacheKey, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, input):
+                if key in embeddings or key in missing_texts:
+                    continue
+
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    embeddings[key] = self._entries[key]
+                    self._statistics.hits += 1
+                else:
+                    missing_texts[key] = text
+
+        for key in list(missing_texts):
+            embedding = self._load_from_disk(key)
+
+            if embedding is not None:
+                embeddings[key] = embedding
+                missing_texts.pop(key)
+
+                with self._lock:
+                    self._remember(key, embedding)
+                    self._statistics.disk_hits += 1
+
+        if missing_texts:
+            new_embeddings = self._embedding_function(list(missing_texts.values()))
+
+            for key, embedding in zip(missing_texts, new_embeddings):
+                embedding = np.asarray(embedding, dtype=np.float32)
+                embeddings[key] = embedding
+
+                self._store_on_disk(key, embedding)
+
+            with self._lock:
+                for key in missing_texts:
+                    self._remember(key, embeddings[key])
+
+                self._statistics.misses += len(missing_texts)
+
+        # Callers may modify what they get, so they must never receive the cached
+        # arrays themselves.
+        return [embeddings[key].copy() for key in keys]
+
+    def get_statistics(self) -> EmbeddingCacheStatistics:
+        with self._lock:
+            return EmbeddingCacheStatistics(
+                self._statistics.hits,
+                self._statistics.disk_hits,
+                self._statistics.misses,
+            )
+
+    def clear(self) -> None:
+        """Forgets the embeddings kept in memory. The ones on disk remain."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List
+
+from chromadb import ClientAPI, Collection
+from chromadb.api import ServerAPI
+from chromadb.api.client import Client
+from chromadb.api.shared_system_client import SharedSystemClient
+from chromadb.config import Settings, System
+from chromadb.utils import embedding_functions
+
+from src.base.constants import (
+    DEFAULT_EMBEDDING_MODEL_ID,
+    MINIMUM_IDLE_SECONDS_BEFORE_DATABASE_EVICTION,
+)
+from src.databases.cached_embedding_function import CachedEmbeddingFunction
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChromaDbHandle:
+    client: ClientAPI
+    collection: Collection
+    last_used: float
+    next_identifier: Optional[int] = None
+    identifiers_lock: threading.Lock = field(default_factory=threading.Lock)
+    system: Optional[System] = None
+
+    def _determine_first_free_identifier(self) -> int:
+        existing_identifiers = [
+            int(identifier)
+            for identifier in self.collection.get(include=[])["ids"]
+            if identifier.isdigit()
+        ]
+
+        return max(existing_identifiers) + 1 if existing_identifiers else 0
+
+    def reserve_identifiers(self, amount: int) -> List[str]:
+        """Hands out consecutive identifiers that no other insert of the process
+        will get, even if the inserts happen concurrently."""
+        with self.identifiers_lock:
+            if self.next_identifier is None:
+                self.next_identifier = self._determine_first_free_identifier()
+
+            first_identifier = self.next_identifier
+            self.next_identifier += amount
+
+        return [
+            str(identifier)
+            for identifier in range(first_identifier, first_identifier + amount)
+        ]
+
+
+class ChromaDbClientRegistry:
+    """Process-wide registry of the ChromaDB clients of every playthrough."""
+
+    _shared_instance: Optional["ChromaDbClientRegistry"] = None
+    _shared_instance_lock = threading.Lock()
+
+    COLLECTION_NAME = "playthrough_data"
+
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        path_manager: Optional[PathManager] = None,
+    ):
+        self._config_loader = config_loader or ConfigLoader()
+        self._path_manager = path_manager or PathManager()
+
+        self._lock = threading.Lock()
+        self._handles: OrderedDict[Path, ChromaDbHandle] = OrderedDict()
+        self._embedding_function: Optional[CachedEmbeddingFunction] = None
+
+    @classmethod
+    def get_shared_instance(cls) -> "ChromaDbClientRegistry":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def get_embedding_function(self) -> CachedEmbeddingFunction:
+        """Returns the embedding function shared by every playthrough. The ONNX
+        session behind it gets loaded on first use and then stays warm, and the
+        texts it has already embedded don't get embedded again."""
+        with self._lock:
+            if self._embedding_function is None:
+                store_on_disk = self._config_loader.get_store_embeddings_on_disk()
+
+                self._embedding_function = CachedEmbeddingFunction(
+                    embedding_functions.DefaultEmbeddingFunction(),
+                    DEFAULT_EMBEDDING_MODEL_ID,
+                    self._config_loader.get_max_cached_embeddings(),
+                    (
+                        self._path_manager.get_embeddings_cache_path()
+                        if store_on_disk
+                        else None
+                    ),
+                    (
+                        self._config_loader.get_max_embeddings_cache_megabytes()
+                        * 1024
+                        * 1024
+                        if store_on_disk
+                        else 0
+                    ),
+                )
+
+            return self._embedding_function
+
+    @staticmethod
+    def _start_system(database_path: Path) -> System:
+        system = System(
+            Settings(
+                anonymized_telemetry=False,
+                allow_reset=True,
+                is_persistent=True,
+                persist_directory=database_path.as_posix(),
+            )
+        )
+
+        system.instance(ServerAPI)
+        system.start()
+
+        return system
+
+    def get_handle(self, database_path: Path) -> ChromaDbHandle:
+        with self._lock:
+            handle = self._handles.get(database_path)
+
+            if handle is None:
+                system = self._start_system(database_path)
+                client = Client.from_system(system)
+
+                # ChromaDB caches a system per persistent path, which would keep
+                # the SQLite database open after the handle gets closed. The
+                # handle owns its system instead.
+                SharedSystemClient.clear_system_cache()
+
+                handle = ChromaDbHandle(
+                    client,
+                    client.get_or_create_collection(name=self.COLLECTION_NAME),
+                    time.monotonic(),
+                    system=system,
+                )
+
+                self._handles[database_path] = handle
+
+                logger.info(f"Opened database at '{database_path}'.")
+
+            handle.last_used = time.monotonic()
+            self._handles.move_to_end(database_path)
+
+            self._evict_idle_handles()
+
+            return handle
+
+    def _evict_idle_handles(self) -> None:
+        max_databases = self._config_loader.get_max_cached_playthrough_databases()
+
+        now = time.monotonic()
+
+        for database_path, handle in list(self._handles.items()):
+            if len(self._handles) <= max_databases:
+                break
+
+            if now - handle.last_used < MINIMUM_IDLE_SECONDS_BEFORE_DATABASE_EVICTION:
+                # The handles are ordered by last use, so the rest aren't idle either.
+                break
+
+            self._close_handle(database_path)
+
+    def _close_handle(self, database_path: Path) -> None:
+        handle = self._handles.pop(database_path, None)
+
+        if handle is None:
+            return
+
+        # Stopping the system releases the SQLite database of the playthrough.
+        if handle.system is not None:
+            handle.system.stop()
+
+        logger.info(f"Closed database at '{database_path}'.")
+
+    def close(self, database_path: Path) -> None:
+        """Releases the database of a playthrough, for example before deleting it."""
+        with self._lock:
+            self._close_handle(database_path)
@@ -1,14 +1,12 @@
 import logging
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-import chromadb
 from chromadb.api.types import IncludeEnum  # noqa
-from chromadb.config import Settings
-from chromadb.utils import embedding_functions
 
 from src.base.validators import validate_non_empty_string
-from src.databases.abstracts.database import Database
+from src.databases.abstracts.database import Database, FactsAndMemories
+from src.databases.chroma_db_client_registry import ChromaDbClientRegistry
 from src.filesystem.path_manager import PathManager
 
 logger = logging.getLogger(__name__)
@@ -22,24 +20,31 @@ class ChromaDbDatabase(Database):
         MEMORY = "memory"
 
     def __init__(
-        self, playthrough_name: str, path_manager: Optional[PathManager] = None
+        self,
+        playthrough_name: str,
+        path_manager: Optional[PathManager] = None,
+        chroma_db_client_registry: Optional[ChromaDbClientRegistry] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
         self._path_manager = path_manager or PathManager()
 
-        # Initialize Chroma client with per-playthrough persistent storage.
-        self._chroma_client = chromadb.PersistentClient(
-            path=self._path_manager.get_database_path(playthrough_name).as_posix(),
-            settings=Settings(anonymized_telemetry=False, allow_reset=True),
+        chroma_db_client_registry = (
+            chroma_db_client_registry or ChromaDbClientRegistry.get_shared_instance()
         )
 
-        # Use a single collection for all data types within the playthrough
-        self._collection = self._chroma_client.get_or_create_collection(
-            name="playthrough_data"
+        # The Chroma client with per-playthrough persistent storage is shared
+        # across the process. A single collection holds all data types within
+        # the playthrough.
+        handle = chroma_db_client_registry.get_handle(
+            self._path_manager.get_database_path(playthrough_name)
         )
 
-        self._embedding_function = embedding_functions.DefaultEmbeddingFunction()
+        self._handle = handle
+        self._chroma_client = handle.client
+        self._collection = handle.collection
+
+        self._embedding_function = chroma_db_client_registry.get_embedding_function()
 
     def _determine_where_clause(
         self, data_type: str, character_identifier: Optional[str] = None
@@ -58,40 +63,63 @@ class ChromaDbDatabase(Database):
 
     def _insert_data(
         self,
-        text: str,
+        texts: List[str],
         data_type: str,
-        character_identifier: Optional[str] = None,
-        data_id: Optional[str] = None,
+        character_identifiers: Optional[List[Optional[str]]] = None,
+        data_ids: Optional[List[str]] = None,
     ):
-        if not data_id:
-            data_id = str(self._collection.count())
+        if not texts:
+            return
 
-        metadata = {"type": data_type}
-        if character_identifier:
-            metadata[self.DataType.CHARACTER_IDENTIFIER.value] = character_identifier
+        if not data_ids:
+            data_ids = self._handle.reserve_identifiers(len(texts))
+
+        if not character_identifiers:
+            character_identifiers = [None] * len(texts)
+
+        metadatas = []
+        for character_identifier in character_identifiers:
+            metadata = {"type": data_type}
+            if character_identifier:
+                metadata[self.DataType.CHARACTER_IDENTIFIER.value] = (
+                    character_identifier
+                )
+            metadatas.append(metadata)
+
+        # All the texts get embedded in a single forward pass.
+        embeddings = self._embedding_function(texts)
+
+        chunk_size = self._chroma_client.get_max_batch_size()
 
         # Upsert updates existing items, or adds them if they don't exist.
         # If an id is not present in the collection, the corresponding items will
         # be created as per add. Items with existing ids will be updated as per update.
-        self._collection.upsert(
-            ids=[data_id],
-            documents=[text],
-            embeddings=self._embedding_function([text]),
-            metadatas=[metadata],
-        )
+        for start in range(0, len(texts), chunk_size):
+            end = start + chunk_size
 
-    def _retrieve_data(
+            self._collection.upsert(
+                ids=data_ids[start:end],
+                documents=texts[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+            )
+
+    def _query_data(
         self,
-        query_text: str,
-        data_type: str,
-        character_identifier: Optional[str] = None,
-        top_k: int = 5,
-    ) -> List[Dict[str, str]]:
+        query_embedding,
+        where_clause: Dict[str, Any],
+        top_k: int,
+        include_metadatas: bool = False,
+    ) -> List[Dict[str, Any]]:
+        include = [IncludeEnum.documents]
+        if include_metadatas:
+            include.append(IncludeEnum.metadatas)
+
         results = self._collection.query(
-            query_embeddings=self._embedding_function([query_text]),
+            query_embeddings=[query_embedding],
             n_results=top_k,
-            where=self._determine_where_clause(data_type, character_identifier),
-            include=[IncludeEnum.documents],
+            where=where_clause,
+            include=include,
         )
 
         # Safely extract ids and documents, defaulting to empty lists if not present
@@ -110,19 +138,110 @@ class ChromaDbDatabase(Database):
             {"id": id_, "document": doc} for id_, doc in zip(ids, documents)
         ]
 
+        if include_metadatas:
+            for paired_result, metadata in zip(
+                paired_results, (results.get("metadatas") or [[]])[0]
+            ):
+                paired_result["metadata"] = metadata
+
         return paired_results
 
+    def _retrieve_data(
+        self,
+        query_text: str,
+        data_type: str,
+        character_identifier: Optional[str] = None,
+        top_k: int = 5,
+    ) -> List[Dict[str, str]]:
+        return self._query_data(
+            self._embedding_function([query_text])[0],
+            self._determine_where_clause(data_type, character_identifier),
+            top_k,
+        )
+
+    def _retrieve_memories_of_characters(
+        self, query_embedding, character_identifiers: List[str], top_k: int
+    ) -> Dict[str, List[Dict[str, str]]]:
+        memories = {
+            character_identifier: [] for character_identifier in character_identifiers
+        }
+
+        if not character_identifiers or top_k <= 0:
+            return memories
+
+        # A single query filtered by all the characters at once. Given that the
+        # top results may concentrate on a few characters, ask for enough of them
+        # so that everyone could get their share.
+        n_results = top_k * len(character_identifiers)
+
+        results = self._query_data(
+            query_embedding,
+            {
+                "$and": [
+                    {"type": self.DataType.MEMORY.value},
+                    {
+                        self.DataType.CHARACTER_IDENTIFIER.value: {
+                            "$in": character_identifiers
+                        }
+                    },
+                ]
+            },
+            n_results,
+            include_metadatas=True,
+        )
+
+        for result in results:
+            character_identifier = result.pop("metadata", {}).get(
+                self.DataType.CHARACTER_IDENTIFIER.value
+            )
+
+            if (
+                character_identifier in memories
+                and len(memories[character_identifier]) < top_k
+            ):
+                memories[character_identifier].append(result)
+
+        if len(results) < n_results:
+            # Every matching memory was returned, so no character is missing any.
+            return memories
+
+        # Some characters may have been crowded out by others. Those get their own
+        # query, which still reuses the embedding of the query text.
+        for character_identifier, character_memories in memories.items():
+            if len(character_memories) < top_k:
+                memories[character_identifier] = self._query_data(
+                    query_embedding,
+                    self._determine_where_clause(
+                        self.DataType.MEMORY.value, character_identifier
+                    ),
+                    top_k,
+                )
+
+        return memories
+
     def insert_fact(self, fact: str) -> None:
-        self._insert_data(fact, data_type=self.DataType.FACT.value)
+        self.insert_facts([fact])
+
+    def insert_facts(self, facts: List[str]) -> None:
+        self._insert_data(facts, data_type=self.DataType.FACT.value)
 
     def insert_memory(
         self, character_identifier: str, memory: str, data_id: Optional[str] = None
     ) -> None:
         self._insert_data(
-            memory,
+            [memory],
             data_type=self.DataType.MEMORY.value,
-            character_identifier=character_identifier,
-            data_id=data_id,
+            character_identifiers=[character_identifier],
+            data_ids=[data_id] if data_id else None,
+        )
+
+    def insert_memories(self, memories: List[Tuple[str, str]]) -> None:
+        self._insert_data(
+            [memory for _, memory in memories],
+            data_type=self.DataType.MEMORY.value,
+            character_identifiers=[
+                character_identifier for character_identifier, _ in memories
+            ],
         )
 
     def retrieve_facts(self, query_text: str, top_k: int = 5) -> List[Dict[str, str]]:
@@ -139,3 +258,43 @@ class ChromaDbDatabase(Database):
             character_identifier=character_identifier,
             top_k=top_k,
         )
+
+    def retrieve_facts_and_memories_batch(
+        self,
+        facts_query_text: Optional[str],
+        memories_query_text: Optional[str],
+        character_identifiers: List[str],
+        facts_top_k: int = 5,
+        memories_top_k: int = 5,
+    ) -> FactsAndMemories:
+        # Each distinct query text gets embedded only once, in a single pass.
+        query_texts = list(
+            dict.fromkeys(
+                query_text
+                for query_text in (facts_query_text, memories_query_text)
+                if query_text
+            )
+        )
+
+        if not query_texts:
+            return FactsAndMemories()
+
+        embeddings = dict(zip(query_texts, self._embedding_function(query_texts)))
+
+        facts_and_memories = FactsAndMemories()
+
+        if facts_query_text and facts_top_k > 0:
+            facts_and_memories.facts = self._query_data(
+                embeddings[facts_query_text],
+                self._determine_where_clause(self.DataType.FACT.value),
+                facts_top_k,
+            )
+
+        if memories_query_text:
+            facts_and_memories.memories = self._retrieve_memories_of_characters(
+                embeddings[memories_query_text],
+                list(dict.fromkeys(character_identifiers)),
+                memories_top_k,
+            )
+
+        return facts_and_memories
@@ -0,0 +1,190 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+from src.base.constants import RECIPROCAL_RANK_FUSION_CONSTANT
+from src.filesystem.config_loader import ConfigLoader
+
+WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+ENTITY_PATTERN = re.compile(r"\b[A-Z][\w'-]+(?:\s+[A-Z][\w'-]+)*")
+
+# Capitalized words that merely start sentences, rather than name anything.
+NON_ENTITY_WORDS = {
+    "A",
+    "An",
+    "And",
+    "As",
+    "At",
+    "But",
+    "For",
+    "He",
+    "Her",
+    "His",
+    "I",
+    "If",
+    "In",
+    "It",
+    "My",
+    "No",
+    "Oh",
+    "She",
+    "So",
+    "That",
+    "The",
+    "Then",
+    "There",
+    "They",
+    "This",
+    "We",
+    "What",
+    "When",
+    "Yes",
+    "You",
+}
+
+
+def estimate_token_count(text: str) -> int:
+    """Estimates how many WordPiece tokens the embedding model will see. Long
+    words get split into several pieces, so they count for more than one."""
+    return sum(
+        max(1, (len(piece) + 5) // 6) for piece in WORD_PATTERN.findall(text or "")
+    )
+
+
+def fuse_with_reciprocal_rank(
+    ranked_results: List[List[Dict[str, str]]], top_k: int
+) -> List[Dict[str, str]]:
+    """Merges several ranked lists of retrieved entries (identified by their 'id')
+    into one, scoring each entry by the sum of 1 / (k + rank) over the lists."""
+    scores: Dict[str, float] = {}
+    entries: Dict[str, Dict[str, str]] = {}
+
+    for results in ranked_results:
+        for rank, entry in enumerate(results, start=1):
+            scores[entry["id"]] = scores.get(entry["id"], 0.0) + 1.0 / (
+                RECIPROCAL_RANK_FUSION_CONSTANT + rank
+            )
+            entries.setdefault(entry["id"], entry)
+
+    # Sorting is stable, so ties keep the order of first appearance.
+    ranked_identifiers = sorted(scores, key=lambda identifier: -scores[identifier])
+
+    return [entries[identifier] for identifier in ranked_identifiers[:top_k]]
+
+
+class RetrievalQueryBuilder:
+    """Turns the context of a prompt into queries that fit the embedding model."""
+
+    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+        self._config_loader = config_loader or ConfigLoader()
+
+    @staticmethod
+    def _split_into_lines(text: str, token_budget: int) -> List[str]:
+        lines = []
+
+        for line in text.splitlines():
+            line = line.strip()
+
+            if not line:
+                continue
+
+            if estimate_token_count(line) <= token_budget:
+                lines.append(line)
+                continue
+
+            # A single line that doesn't fit gets cut at word boundaries.
+            current_words = []
+
+            for word in line.split():
+                if current_words and (
+                    estimate_token_count(" ".join(current_words + [word]))
+                    > token_budget
+                ):
+                    lines.append(" ".join(current_words))
+                    current_words = []
+
+                current_words.append(word)
+
+            if current_words:
+                lines.append(" ".join(current_words))
+
+        return lines
+
+    @staticmethod
+    def _extract_key_entities(text: str, token_budget: int) -> str:
+        counts = Counter(
+            entity
+            for entity in ENTITY_PATTERN.findall(text)
+            if entity not in NON_ENTITY_WORDS
+        )
+
+        entities = []
+
+        for entity, _ in counts.most_common():
+            if estimate_token_count(", ".join(entities + [entity])) > token_budget:
+                break
+
+            entities.append(entity)
+
+        return ", ".join(entities)
+
+    @staticmethod
+    def _group_into_windows(lines: List[str], token_budget: int) -> List[str]:
+        windows = []
+        current_lines = []
+        current_tokens = 0
+
+        for line in lines:
+            line_tokens = estimate_token_count(line)
+
+            if current_lines and current_tokens + line_tokens > token_budget:
+                windows.append("\n".join(current_lines))
+                current_lines = []
+                current_tokens = 0
+
+            current_lines.append(line)
+            current_tokens += line_tokens
+
+        if current_lines:
+            windows.append("\n".join(current_lines))
+
+        return windows
+
+    def build_queries(self, query_text: str) -> List[str]:
+        """Returns the main query first, followed by the sub-queries (if any)."""
+        token_budget = self._config_loader.get_retrieval_query_token_budget()
+
+        if estimate_token_count(query_text) <= token_budget:
+            return [query_text]
+
+        key_entities = self._extract_key_entities(query_text, token_budget // 4)
+
+        remaining_budget = token_budget - estimate_token_count(key_entities)
+
+        # No line may be longer than what's left, so the main query always gets
+        # at least the most recent one.
+        lines = self._split_into_lines(query_text, remaining_budget)
+
+        recent_lines = []
+
+        for line in reversed(lines):
+            line_tokens = estimate_token_count(line)
+
+            if line_tokens > remaining_budget:
+                break
+
+            recent_lines.insert(0, line)
+            remaining_budget -= line_tokens
+
+        main_query = "\n".join(([key_entities] if key_entities else []) + recent_lines)
+
+        older_lines = lines[: len(lines) - len(recent_lines)]
+
+        max_sub_queries = self._config_loader.get_max_retrieval_sub_queries()
+
+        if not older_lines or max_sub_queries <= 0:
+            return [main_query]
+
+        return [main_query] + self._group_into_windows(older_lines, token_budget)[
+            -max_sub_queries:
+        ]
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from src.base.validators import validate_list_of_str, validate_non_empty_string
-from src.characters.character import Character
+from src.characters.character_view_model import CharacterViewModel
 from src.characters.characters_manager import CharactersManager
 
 
@@ -21,9 +21,9 @@ class GetAvailableCharactersAlgorithm:
             playthrough_name
         )
 
-    def do_algorithm(self) -> List[Character]:
+    def do_algorithm(self) -> List[CharacterViewModel]:
         all_characters = (
-            self._characters_manager.get_characters_at_current_place_plus_followers()
+            self._characters_manager.get_character_view_models_at_current_place_plus_followers()
         )
 
         return [
@@ -2,7 +2,7 @@ from typing import List, Optional
 
 from src.base.playthrough_manager import PlaythroughManager
 from src.base.validators import validate_non_empty_string, validate_list_of_str
-from src.characters.character import Character
+from src.characters.character_view_model import CharacterViewModel
 from src.characters.characters_manager import CharactersManager
 
 
@@ -26,7 +26,7 @@ class GetParticipantCharactersOtherThanPlayerAlgorithm:
             playthrough_name
         )
 
-    def do_algorithm(self) -> List[Character]:
+    def do_algorithm(self) -> List[CharacterViewModel]:
         protagonist_identifier = self._playthrough_manager.get_player_identifier()
 
         # Participants excluding protagonist
@@ -37,4 +37,6 @@ class GetParticipantCharactersOtherThanPlayerAlgorithm:
         ]
 
         # Get participant characters
-        return self._characters_manager.get_characters(participant_identifiers)
+        return self._characters_manager.get_character_view_models(
+            participant_identifiers
+        )
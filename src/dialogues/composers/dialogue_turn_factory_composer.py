@@ -59,6 +59,7 @@ class DialogueTurnFactoryComposer:
         dialogue_observer: Observer,
         player_input_factory: PlayerInputFactory,
         playthrough_manager: Optional[PlaythroughManager] = None,
+        partial_response_observer: Optional[Observer] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
@@ -68,6 +69,7 @@ class DialogueTurnFactoryComposer:
         self._purpose = purpose
         self._dialogue_observer = dialogue_observer
         self._player_input_factory = player_input_factory
+        self._partial_response_observer = partial_response_observer
 
         self._playthrough_manager = playthrough_manager or PlaythroughManager(
             self._playthrough_name
@@ -117,7 +119,10 @@ class DialogueTurnFactoryComposer:
         ).execute()
 
         llm_speech_data_provider_factory = LlmSpeechDataProviderFactoryComposer(
-            self._playthrough_name, self._participants, self._purpose
+            self._playthrough_name,
+            self._participants,
+            self._purpose,
+            self._partial_response_observer,
         ).compose()
 
         message_data_producer_for_speech_turn_strategy = (
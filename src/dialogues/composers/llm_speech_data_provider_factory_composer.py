@@ -1,5 +1,6 @@
 from typing import Optional
 
+from src.base.abstracts.observer import Observer
 from src.base.validators import validate_non_empty_string
 from src.characters.composers.character_information_provider_factory_composer import (
     CharacterInformationProviderFactoryComposer,
@@ -26,18 +27,23 @@ from src.prompting.llms import Llms
 class LlmSpeechDataProviderFactoryComposer:
 
     def __init__(
-        self, playthrough_name: str, participants: Participants, purpose: Optional[str]
+        self,
+        playthrough_name: str,
+        participants: Participants,
+        purpose: Optional[str],
+        partial_response_observer: Optional[Observer] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
         self._playthrough_name = playthrough_name
         self._participants = participants
         self._purpose = purpose
+        self._partial_response_observer = partial_response_observer
 
     def compose(self) -> LlmSpeechDataProviderFactory:
         produce_tool_response_strategy_factory = (
             ProduceToolResponseStrategyFactoryComposer(
-                Llms().for_speech_turn(),
+                Llms().for_speech_turn(), self._partial_response_observer
             ).compose_factory()
         )
 
@@ -31,6 +31,7 @@ class ProduceDialogueCommandComposer:
         purpose: Optional[str],
         dialogue_observer: Observer,
         player_input_factory: PlayerInputFactory,
+        partial_response_observer: Optional[Observer] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
@@ -40,6 +41,7 @@ class ProduceDialogueCommandComposer:
         self._purpose = purpose
         self._dialogue_observer = dialogue_observer
         self._player_input_factory = player_input_factory
+        self._partial_response_observer = partial_response_observer
 
     def compose_command(self) -> ProduceDialogueCommand:
 
@@ -54,6 +56,7 @@ class ProduceDialogueCommandComposer:
             self._purpose,
             self._dialogue_observer,
             self._player_input_factory,
+            partial_response_observer=self._partial_response_observer,
         ).compose()
 
         summarize_dialogue_command_factory = SummarizeDialogueCommandFactoryComposer(
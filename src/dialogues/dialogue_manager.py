@@ -1,6 +1,6 @@
 from typing import Optional, List
 
-from src.characters.character import Character
+from src.characters.character_store import CharacterStore
 from src.characters.characters_manager import CharactersManager
 from src.dialogues.participants import Participants
 from src.dialogues.repositories.ongoing_dialogue_repository import (
@@ -18,6 +18,7 @@ class DialogueManager:
         characters_manager: Optional[CharactersManager] = None,
         path_manager: Optional[PathManager] = None,
         ongoing_dialogue_repository: Optional[OngoingDialogueRepository] = None,
+        character_store: Optional[CharacterStore] = None,
     ):
         self._playthrough_name = playthrough_name
 
@@ -29,6 +30,9 @@ class DialogueManager:
             ongoing_dialogue_repository
             or OngoingDialogueRepository(self._playthrough_name)
         )
+        self._character_store = character_store or CharacterStore(
+            self._playthrough_name
+        )
 
     def gather_participants_data(
         self,
@@ -37,19 +41,12 @@ class DialogueManager:
         participants: Participants,
     ):
         """Gathers the data of the participants into the Participants instance."""
-        for participant_identifier in participant_identifiers:
-            character = Character(self._playthrough_name, participant_identifier)
-            participants.add_participant(
-                character.identifier,
-                character.name,
-                character.description,
-                character.personality,
-                character.equipment,
-                character.health,
-                character.voice_model,
-            )
+        character_identifiers = list(participant_identifiers)
+
         if player_identifier:
-            character = Character(self._playthrough_name, player_identifier)
+            character_identifiers.append(player_identifier)
+
+        for character in self._character_store.get_many(character_identifiers):
             participants.add_participant(
                 character.identifier,
                 character.name,
@@ -1,8 +1,14 @@
+import functools
 from typing import Type, Optional
 
 from pydantic import BaseModel, Field
 
+from src.base.constants import MAX_CACHED_SPEECH_TURN_CLASSES
 
+
+# Building a pydantic model class (and its validator) is expensive, so each
+# speaker gets a single class that's reused across speech turns.
+@functools.lru_cache(maxsize=MAX_CACHED_SPEECH_TURN_CLASSES)
 def get_custom_speech_turn_class(speaker_name: str) -> Type[BaseModel]:
     class SpeechTurn(BaseModel):
         name: str = Field(
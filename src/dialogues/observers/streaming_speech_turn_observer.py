@@ -0,0 +1,41 @@
+from typing import Optional
+
+from src.base.observers.server_sent_events_observer import ServerSentEventsObserver
+
+STREAMED_SPEECH_TURN_FIELDS = ("name", "narration_text", "speech", "thoughts")
+
+
+class StreamingSpeechTurnObserver(ServerSentEventsObserver):
+    """Streams the partial speech turns of the LLM as server-sent events."""
+
+    def __init__(self, keep_alive_seconds: float = 15.0):
+        super().__init__(keep_alive_seconds)
+
+        self._latest_partial_speech_turn: Optional[dict] = None
+
+    def update(self, message: dict) -> None:
+        # A new attempt at the speech turn starts.
+        if not message:
+            if self._latest_partial_speech_turn is not None:
+                self._latest_partial_speech_turn = None
+
+                self.send("speech_turn_reset", {})
+
+            return
+
+        partial_speech_turn = {
+            field: message[field]
+            for field in STREAMED_SPEECH_TURN_FIELDS
+            if message.get(field)
+        }
+
+        # Many chunks don't complete any token of the streamed fields.
+        if (
+            not partial_speech_turn
+            or partial_speech_turn == self._latest_partial_speech_turn
+        ):
+            return
+
+        self._latest_partial_speech_turn = partial_speech_turn
+
+        self.send("speech_turn_partial", partial_speech_turn)
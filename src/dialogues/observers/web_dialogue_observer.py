@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List, Optional
 
 from flask import session
@@ -7,40 +6,45 @@ from src.base.abstracts.observer import Observer
 from src.characters.characters_manager import CharactersManager
 from src.filesystem.config_loader import ConfigLoader
 from src.services.web_service import WebService
-from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
-    DirectVoiceLineGenerationAlgorithmFactory,
-)
+from src.voices.voice_line_job_queue import VoiceLineJobQueue
 
 
 class WebDialogueObserver(Observer):
 
-    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        voice_line_job_queue: Optional[VoiceLineJobQueue] = None,
+    ):
         self._messages = []
         self._characters_manager = CharactersManager(session.get("playthrough_name"))
 
         self._config_loader = config_loader or ConfigLoader()
+        self._voice_line_job_queue = (
+            voice_line_job_queue or VoiceLineJobQueue.get_shared_instance()
+        )
 
-    def _determine_filename(self, message: dict):
+    def _enqueue_voice_line(self, message: dict) -> Optional[str]:
         alignment = message["alignment"]
 
-        filename = None
+        job_id = None
 
         if (
             self._config_loader.get_produce_player_voice_lines()
             and alignment == "right"
         ) or alignment == "left":
-            filename = DirectVoiceLineGenerationAlgorithmFactory.create_algorithm(
+            job_id = self._voice_line_job_queue.enqueue(
                 message["sender_name"], message["message_text"], message["voice_model"]
-            ).direct_voice_line_generation()
+            )
 
-        return filename
+        return job_id
 
     @staticmethod
-    def _determine_file_url(filename: Optional[Path]):
+    def _determine_file_url(job_id: Optional[str]):
         file_url = None
 
-        if filename:
-            file_url = WebService.get_file_url(Path("voice_lines"), filename)
+        if job_id:
+            file_url = WebService.get_voice_line_job_url(job_id)
 
         return file_url
 
@@ -57,7 +61,7 @@ class WebDialogueObserver(Observer):
         return f"\n\n{desired_action}" if desired_action else ""
 
     def update(self, message: dict) -> None:
-        filename = self._determine_filename(message)
+        job_id = self._enqueue_voice_line(message)
 
         self._messages.append(
             {
@@ -68,7 +72,7 @@ class WebDialogueObserver(Observer):
                 "message_text": message["message_text"],
                 "thoughts": self._format_thoughts(message),
                 "desired_action": self._format_desired_action(message),
-                "file_url": self._determine_file_url(filename),
+                "file_url": self._determine_file_url(job_id),
             }
         )
 
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List, Optional
 
 from flask import session
@@ -7,18 +6,23 @@ from src.base.abstracts.observer import Observer
 from src.characters.characters_manager import CharactersManager
 from src.filesystem.config_loader import ConfigLoader
 from src.services.web_service import WebService
-from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
-    DirectVoiceLineGenerationAlgorithmFactory,
-)
+from src.voices.voice_line_job_queue import VoiceLineJobQueue
 
 
 class WebNarrationObserver(Observer):
 
-    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        voice_line_job_queue: Optional[VoiceLineJobQueue] = None,
+    ):
         self._messages = []
         self._characters_manager = CharactersManager(session.get("playthrough_name"))
 
         self._config_loader = config_loader or ConfigLoader()
+        self._voice_line_job_queue = (
+            voice_line_job_queue or VoiceLineJobQueue.get_shared_instance()
+        )
 
     def update(self, message: dict) -> None:
         if not "alignment" in message:
@@ -34,16 +38,16 @@ class WebNarrationObserver(Observer):
                 f"Expected 'message_type' to be in message, but was: {message}"
             )
 
-        file_name = DirectVoiceLineGenerationAlgorithmFactory.create_algorithm(
+        job_id = self._voice_line_job_queue.enqueue(
             "narrator",
             message["message_text"],
             self._config_loader.get_narrator_voice_model(),
-        ).direct_voice_line_generation()
+        )
 
         file_url = None
 
-        if file_name:
-            file_url = WebService.get_file_url(Path("voice_lines"), file_name)
+        if job_id:
+            file_url = WebService.get_voice_line_job_url(job_id)
 
         self._messages.append(
             {
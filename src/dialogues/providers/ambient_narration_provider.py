@@ -2,6 +2,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.base.context_assembler import ContextAssembler, ContextTask
 from src.base.playthrough_manager import PlaythroughManager
 from src.characters.character import Character
 from src.dialogues.products.ambient_narration_product import AmbientNarrationProduct
@@ -24,6 +25,7 @@ class AmbientNarrationProvider(BaseToolResponseProvider):
         local_information_factory: LocalInformationFactory,
         path_manager: Optional[PathManager] = None,
         playthrough_manager: Optional[PlaythroughManager] = None,
+        context_assembler: Optional[ContextAssembler] = None,
     ):
         super().__init__(produce_tool_response_strategy_factory, path_manager)
 
@@ -33,6 +35,9 @@ class AmbientNarrationProvider(BaseToolResponseProvider):
         self._playthrough_manager = playthrough_manager or PlaythroughManager(
             self._playthrough_name
         )
+        self._context_assembler = (
+            context_assembler or ContextAssembler.get_shared_instance()
+        )
 
     def get_prompt_file(self) -> str:
         return self._path_manager.get_ambient_narration_generation_prompt_path()
@@ -43,13 +48,21 @@ class AmbientNarrationProvider(BaseToolResponseProvider):
     def create_product_from_base_model(self, response_model: BaseModel):
         return AmbientNarrationProduct(response_model.ambient_narration, is_valid=True)
 
-    def get_prompt_kwargs(self) -> dict:
-        personality = Character(
+    def _get_player_personality(self) -> str:
+        return Character(
             self._playthrough_name, self._playthrough_manager.get_player_identifier()
         ).personality
 
-        return {
-            "local_information": self._local_information_factory.get_information(),
-            "personality": personality,
-            "transcription": self._transcription.get_transcription_excerpt(),
-        }
+    def get_prompt_kwargs(self) -> dict:
+        return self._context_assembler.assemble(
+            [
+                ContextTask(
+                    "local_information",
+                    self._local_information_factory.get_information,
+                ),
+                ContextTask("personality", self._get_player_personality),
+                ContextTask(
+                    "transcription", self._transcription.get_transcription_excerpt
+                ),
+            ]
+        ).values
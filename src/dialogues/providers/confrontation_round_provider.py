@@ -4,6 +4,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.base.context_assembler import ContextAssembler, ContextTask
 from src.base.products.text_product import TextProduct
 from src.base.tools import join_with_newline
 from src.base.validators import validate_non_empty_string
@@ -37,6 +38,7 @@ class ConfrontationRoundProvider(BaseToolResponseProvider):
         relevant_characters_information_factory: RelevantCharactersInformationFactory,
         path_manager: Optional[PathManager] = None,
         time_manager: Optional[TimeManager] = None,
+        context_assembler: Optional[ContextAssembler] = None,
     ):
         super().__init__(produce_tool_response_strategy_factory, path_manager)
 
@@ -52,6 +54,9 @@ class ConfrontationRoundProvider(BaseToolResponseProvider):
         )
 
         self._time_manager = time_manager or TimeManager(playthrough_name)
+        self._context_assembler = (
+            context_assembler or ContextAssembler.get_shared_instance()
+        )
 
     def get_prompt_file(self) -> Path:
         return self._path_manager.get_confrontation_round_generation_prompt_path()
@@ -69,29 +74,45 @@ class ConfrontationRoundProvider(BaseToolResponseProvider):
         return TextProduct(response_model.confrontation_round.narration, is_valid=True)
 
     def get_prompt_kwargs(self) -> dict:
-        local_information = self._local_information_factory.get_information()
-
-        transcription = self._transcription.get_prettified_transcription()
-
-        known_facts = self._format_known_facts_algorithm.do_algorithm(
-            join_with_newline(
-                self._confrontation_context,
-                local_information,
-                transcription,
-            )
-        )
-
-        relevant_characters_information = (
-            self._relevant_characters_information_factory.get_information(
-                join_with_newline(local_information, transcription, known_facts)
-            )
-        )
+        context = self._context_assembler.assemble(
+            [
+                ContextTask(
+                    "local_information",
+                    self._local_information_factory.get_information,
+                ),
+                ContextTask(
+                    "transcription", self._transcription.get_prettified_transcription
+                ),
+                ContextTask(
+                    "known_facts",
+                    lambda local_information, transcription: self._format_known_facts_algorithm.do_algorithm(
+                        join_with_newline(
+                            self._confrontation_context,
+                            local_information,
+                            transcription,
+                        )
+                    ),
+                    ("local_information", "transcription"),
+                ),
+                ContextTask(
+                    "relevant_characters_information",
+                    lambda local_information, transcription, known_facts: self._relevant_characters_information_factory.get_information(
+                        join_with_newline(local_information, transcription, known_facts)
+                    ),
+                    ("local_information", "transcription", "known_facts"),
+                ),
+                ContextTask("hour", self._time_manager.get_hour),
+                ContextTask("time_of_day", self._time_manager.get_time_of_the_day),
+            ]
+        ).values
 
         return {
-            "hour": self._time_manager.get_hour(),
-            "time_of_day": self._time_manager.get_time_of_the_day(),
-            "local_information": local_information,
-            "known_facts": known_facts,
-            "relevant_characters_information": relevant_characters_information,
-            "transcription": transcription,
+            "hour": context["hour"],
+            "time_of_day": context["time_of_day"],
+            "local_information": context["local_information"],
+            "known_facts": context["known_facts"],
+            "relevant_characters_information": context[
+                "relevant_characters_information"
+            ],
+            "transcription": context["transcription"],
         }
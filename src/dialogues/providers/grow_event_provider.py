@@ -4,6 +4,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.base.context_assembler import ContextAssembler, ContextTask
 from src.base.products.text_product import TextProduct
 from src.base.tools import join_with_newline
 from src.base.validators import validate_non_empty_string
@@ -34,6 +35,7 @@ class GrowEventProvider(BaseToolResponseProvider):
         local_information_factory: LocalInformationFactory,
         relevant_characters_information_factory: RelevantCharactersInformationFactory,
         path_manager: Optional[PathManager] = None,
+        context_assembler: Optional[ContextAssembler] = None,
     ):
         super().__init__(produce_tool_response_strategy_factory, path_manager)
 
@@ -46,6 +48,9 @@ class GrowEventProvider(BaseToolResponseProvider):
         self._relevant_characters_information_factory = (
             relevant_characters_information_factory
         )
+        self._context_assembler = (
+            context_assembler or ContextAssembler.get_shared_instance()
+        )
 
     def get_prompt_file(self) -> Path:
         return self._path_manager.get_grow_event_prompt_path()
@@ -63,25 +68,44 @@ class GrowEventProvider(BaseToolResponseProvider):
         return TextProduct(response_model.grow_event.event, is_valid=True)
 
     def get_prompt_kwargs(self) -> dict:
-        local_information = self._local_information_factory.get_information()
-
-        transcription = self._transcription.get_prettified_transcription()
-
-        known_facts = self._format_known_facts_algorithm.do_algorithm(
-            join_with_newline(self._suggested_event, local_information, transcription)
-        )
-
-        relevant_characters_information = (
-            self._relevant_characters_information_factory.get_information(
-                join_with_newline(
-                    self._suggested_event, local_information, transcription, known_facts
-                )
-            )
-        )
+        context = self._context_assembler.assemble(
+            [
+                ContextTask(
+                    "local_information",
+                    self._local_information_factory.get_information,
+                ),
+                ContextTask(
+                    "transcription", self._transcription.get_prettified_transcription
+                ),
+                ContextTask(
+                    "known_facts",
+                    lambda local_information, transcription: self._format_known_facts_algorithm.do_algorithm(
+                        join_with_newline(
+                            self._suggested_event, local_information, transcription
+                        )
+                    ),
+                    ("local_information", "transcription"),
+                ),
+                ContextTask(
+                    "relevant_characters_information",
+                    lambda local_information, transcription, known_facts: self._relevant_characters_information_factory.get_information(
+                        join_with_newline(
+                            self._suggested_event,
+                            local_information,
+                            transcription,
+                            known_facts,
+                        )
+                    ),
+                    ("local_information", "transcription", "known_facts"),
+                ),
+            ]
+        ).values
 
         return {
-            "local_information": local_information,
-            "relevant_characters_information": relevant_characters_information,
-            "known_facts": known_facts,
-            "transcription": transcription,
+            "local_information": context["local_information"],
+            "relevant_characters_information": context[
+                "relevant_characters_information"
+            ],
+            "known_facts": context["known_facts"],
+            "transcription": context["transcription"],
         }
@@ -5,6 +5,7 @@ from typing import Optional
 from pydantic import BaseModel
 
 from src.augmentation.augment_text import augment_text
+from src.base.context_assembler import ContextAssembler, ContextTask
 from src.base.tools import join_with_newline
 from src.base.validators import validate_non_empty_string
 from src.dialogues.configs.llm_speech_data_provider_algorithms_config import (
@@ -36,6 +37,7 @@ class LlmSpeechDataProvider(BaseToolResponseProvider):
         time_manager: Optional[TimeManager] = None,
         path_manager: Optional[PathManager] = None,
         config_loader: Optional[ConfigLoader] = None,
+        context_assembler: Optional[ContextAssembler] = None,
     ):
         super().__init__(
             factories_config.produce_tool_response_strategy_factory,
@@ -51,6 +53,9 @@ class LlmSpeechDataProvider(BaseToolResponseProvider):
 
         self._time_manager = time_manager or TimeManager(self._config.playthrough_name)
         self._config_loader = config_loader or ConfigLoader()
+        self._context_assembler = (
+            context_assembler or ContextAssembler.get_shared_instance()
+        )
 
     def _format_participant_details(self) -> str:
         return "\n".join(
@@ -93,22 +98,15 @@ class LlmSpeechDataProvider(BaseToolResponseProvider):
 
         return ConcreteSpeechDataProduct(speech_data, is_valid=True)
 
-    def get_prompt_kwargs(self) -> dict:
-        places_descriptions = (
-            self._factories_config.places_descriptions_provider.get_information()
-        )
-
-        participant_details = self._format_participant_details()
-
-        dialogue_purpose = self._format_dialogue_purpose()
-
-        character_dialogue_purpose = (
-            self._algorithms_config.format_character_dialogue_purpose_algorithm.do_algorithm()
-        )
-
-        transcription = self._config.transcription.get_prettified_transcription()
-
-        known_facts = self._algorithms_config.format_known_facts_algorithm.do_algorithm(
+    def _format_known_facts(
+        self,
+        places_descriptions: str,
+        participant_details: str,
+        dialogue_purpose: str,
+        character_dialogue_purpose: str,
+        transcription: str,
+    ) -> str:
+        return self._algorithms_config.format_known_facts_algorithm.do_algorithm(
             join_with_newline(
                 places_descriptions,
                 participant_details,
@@ -118,7 +116,16 @@ class LlmSpeechDataProvider(BaseToolResponseProvider):
             )
         )
 
-        character_information = self._factories_config.character_information_provider_factory.create_provider(
+    def _get_character_information(
+        self,
+        places_descriptions: str,
+        participant_details: str,
+        dialogue_purpose: str,
+        character_dialogue_purpose: str,
+        transcription: str,
+        known_facts: str,
+    ) -> str:
+        return self._factories_config.character_information_provider_factory.create_provider(
             join_with_newline(
                 places_descriptions,
                 participant_details,
@@ -130,10 +137,7 @@ class LlmSpeechDataProvider(BaseToolResponseProvider):
             use_interview=True,
         ).get_information()
 
-        # Format latest thoughts:
-        latest_thoughts = self._format_latest_thoughts()
-        latest_desired_actions = self._format_latest_desired_actions()
-
+    def _get_transcription_excerpt(self) -> str:
         transcription_excerpt = self._config.transcription.get_transcription_excerpt()
 
         if self._config_loader.get_augment_context_for_speech():
@@ -146,17 +150,62 @@ class LlmSpeechDataProvider(BaseToolResponseProvider):
                 True,
             )
 
+        return transcription_excerpt
+
+    def get_prompt_kwargs(self) -> dict:
+        query_dependencies = (
+            "places_descriptions",
+            "participant_details",
+            "dialogue_purpose",
+            "character_dialogue_purpose",
+            "transcription",
+        )
+
+        context = self._context_assembler.assemble(
+            [
+                ContextTask(
+                    "places_descriptions",
+                    self._factories_config.places_descriptions_provider.get_information,
+                ),
+                ContextTask("participant_details", self._format_participant_details),
+                ContextTask("dialogue_purpose", self._format_dialogue_purpose),
+                ContextTask(
+                    "character_dialogue_purpose",
+                    self._algorithms_config.format_character_dialogue_purpose_algorithm.do_algorithm,
+                ),
+                ContextTask(
+                    "transcription",
+                    self._config.transcription.get_prettified_transcription,
+                ),
+                ContextTask(
+                    "known_facts", self._format_known_facts, query_dependencies
+                ),
+                ContextTask(
+                    "character_information",
+                    self._get_character_information,
+                    query_dependencies + ("known_facts",),
+                ),
+                ContextTask("latest_thoughts", self._format_latest_thoughts),
+                ContextTask(
+                    "latest_desired_actions", self._format_latest_desired_actions
+                ),
+                ContextTask("transcription_excerpt", self._get_transcription_excerpt),
+                ContextTask("hour", self._time_manager.get_hour),
+                ContextTask("time_group", self._time_manager.get_time_of_the_day),
+            ]
+        ).values
+
         return {
-            "places_descriptions": places_descriptions,
-            "hour": self._time_manager.get_hour(),
-            "time_group": self._time_manager.get_time_of_the_day(),
+            "places_descriptions": context["places_descriptions"],
+            "hour": context["hour"],
+            "time_group": context["time_group"],
             "name": self._config.speaker_name,
-            "participant_details": participant_details,
-            "character_information": character_information,
-            "known_facts": known_facts,
-            "dialogue_purpose": dialogue_purpose,
-            "latest_thoughts": latest_thoughts,
-            "latest_desired_actions": latest_desired_actions,
-            "character_dialogue_purpose": character_dialogue_purpose,
-            "transcription_excerpt": transcription_excerpt,
+            "participant_details": context["participant_details"],
+            "character_information": context["character_information"],
+            "known_facts": context["known_facts"],
+            "dialogue_purpose": context["dialogue_purpose"],
+            "latest_thoughts": context["latest_thoughts"],
+            "latest_desired_actions": context["latest_desired_actions"],
+            "character_dialogue_purpose": context["character_dialogue_purpose"],
+            "transcription_excerpt": context["transcription_excerpt"],
         }
@@ -4,6 +4,7 @@ from typing import Optional
 
 from openai import BaseModel
 
+from src.base.context_assembler import ContextAssembler, ContextTask
 from src.base.products.text_product import TextProduct
 from src.base.tools import join_with_newline
 from src.characters.factories.relevant_characters_information_factory import (
@@ -32,6 +33,7 @@ class NarrativeBeatProvider(BaseToolResponseProvider):
         local_information_factory: LocalInformationFactory,
         relevant_characters_information_factory: RelevantCharactersInformationFactory,
         path_manager: Optional[PathManager] = None,
+        context_assembler: Optional[ContextAssembler] = None,
     ):
         super().__init__(produce_tool_response_strategy_factory, path_manager)
 
@@ -41,6 +43,9 @@ class NarrativeBeatProvider(BaseToolResponseProvider):
         self._relevant_characters_information_factory = (
             relevant_characters_information_factory
         )
+        self._context_assembler = (
+            context_assembler or ContextAssembler.get_shared_instance()
+        )
 
     def get_prompt_file(self) -> Path:
         return self._path_manager.get_narrative_beat_generation_prompt_path()
@@ -58,23 +63,37 @@ class NarrativeBeatProvider(BaseToolResponseProvider):
         return TextProduct(response_model.narrative_beat.narrative_beat, is_valid=True)
 
     def get_prompt_kwargs(self) -> dict:
-        local_information = self._local_information_factory.get_information()
-
-        transcription = self._transcription.get_transcription_excerpt()
-
-        known_facts = self._format_known_facts_algorithm.do_algorithm(
-            join_with_newline(local_information, transcription)
-        )
-
-        player_and_followers_information = (
-            self._relevant_characters_information_factory.get_information(
-                join_with_newline(local_information, transcription, known_facts)
-            )
-        )
+        context = self._context_assembler.assemble(
+            [
+                ContextTask(
+                    "local_information",
+                    self._local_information_factory.get_information,
+                ),
+                ContextTask(
+                    "transcription", self._transcription.get_transcription_excerpt
+                ),
+                ContextTask(
+                    "known_facts",
+                    lambda local_information, transcription: self._format_known_facts_algorithm.do_algorithm(
+                        join_with_newline(local_information, transcription)
+                    ),
+                    ("local_information", "transcription"),
+                ),
+                ContextTask(
+                    "player_and_followers_information",
+                    lambda local_information, transcription, known_facts: self._relevant_characters_information_factory.get_information(
+                        join_with_newline(local_information, transcription, known_facts)
+                    ),
+                    ("local_information", "transcription", "known_facts"),
+                ),
+            ]
+        ).values
 
         return {
-            "local_information": local_information,
-            "player_and_followers_information": player_and_followers_information,
-            "known_facts": known_facts,
-            "transcription": transcription,
+            "local_information": context["local_information"],
+            "player_and_followers_information": context[
+                "player_and_followers_information"
+            ],
+            "known_facts": context["known_facts"],
+            "transcription": context["transcription"],
         }
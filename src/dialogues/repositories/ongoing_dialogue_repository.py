@@ -1,21 +1,18 @@
 import logging
-import os
 from enum import Enum
 from typing import Optional, Dict, Any, List
 
 from src.base.validators import validate_non_empty_string
-from src.filesystem.file_operations import (
-    read_json_file,
-    create_empty_json_file_if_not_exists,
-    write_json_file,
-    remove_file,
-)
+from src.filesystem.json_journal import JsonJournalRegistry
 from src.filesystem.path_manager import PathManager
 
 logger = logging.getLogger(__name__)
 
 
 class OngoingDialogueRepository:
+    """Stores the dialogue in progress as an append-only journal of events, so
+    that every change appends a line instead of rewriting the whole dialogue."""
+
     class OngoingDialogueEntryType(Enum):
         MESSAGES = "messages"
         PARTICIPANTS = "participants"
@@ -24,8 +21,21 @@ class OngoingDialogueRepository:
         LATEST_THOUGHTS = "latest_thoughts"
         LATEST_DESIRED_ACTIONS = "latest_desired_actions"
 
+    class OngoingDialogueEventType(Enum):
+        MESSAGES_ADDED = "messages_added"
+        PARTICIPANTS_SET = "participants_set"
+        PARTICIPANTS_REMOVED = "participants_removed"
+        PURPOSE_SET = "purpose_set"
+        TRANSCRIPTION_SET = "transcription_set"
+        TRANSCRIPTION_LINES_ADDED = "transcription_lines_added"
+        LATEST_THOUGHTS_SET = "latest_thoughts_set"
+        LATEST_DESIRED_ACTION_SET = "latest_desired_action_set"
+
     def __init__(
-        self, playthrough_name: str, path_manager: Optional[PathManager] = None
+        self,
+        playthrough_name: str,
+        path_manager: Optional[PathManager] = None,
+        json_journal_registry: Optional[JsonJournalRegistry] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
 
@@ -33,49 +43,69 @@ class OngoingDialogueRepository:
 
         self._path_manager = path_manager or PathManager()
 
-        self._ongoing_dialogue_path = self._path_manager.get_ongoing_dialogue_path(
-            self._playthrough_name
+        json_journal_registry = (
+            json_journal_registry or JsonJournalRegistry.get_shared_instance()
         )
 
-    def _load_ongoing_dialogue_data(self) -> Dict[str, Any]:
-        create_empty_json_file_if_not_exists(self._ongoing_dialogue_path)
+        self._journal = json_journal_registry.get_journal(
+            self._path_manager.get_ongoing_dialogue_path(self._playthrough_name),
+            self._path_manager.get_ongoing_dialogue_journal_path(
+                self._playthrough_name
+            ),
+            self._apply_event,
+        )
 
-        return read_json_file(self._ongoing_dialogue_path)
+    @classmethod
+    def _apply_event(
+        cls, ongoing_dialogue_data: Dict[str, Any], event_type: str, payload: Any
+    ) -> None:
+        entry_type = cls.OngoingDialogueEntryType
+        event = cls.OngoingDialogueEventType(event_type)
 
-    def _save_ongoing_dialogue_data(
-        self, ongoing_dialogue_data: Dict[str, Any]
+        if event == cls.OngoingDialogueEventType.MESSAGES_ADDED:
+            ongoing_dialogue_data.setdefault(entry_type.MESSAGES.value, []).extend(
+                payload
+            )
+        elif event == cls.OngoingDialogueEventType.PARTICIPANTS_SET:
+            ongoing_dialogue_data[entry_type.PARTICIPANTS.value] = payload
+        elif event == cls.OngoingDialogueEventType.PARTICIPANTS_REMOVED:
+            participants = ongoing_dialogue_data.get(entry_type.PARTICIPANTS.value, {})
+
+            for participant in payload:
+                participants.pop(participant, None)
+        elif event == cls.OngoingDialogueEventType.PURPOSE_SET:
+            ongoing_dialogue_data[entry_type.PURPOSE.value] = payload
+        elif event == cls.OngoingDialogueEventType.TRANSCRIPTION_SET:
+            ongoing_dialogue_data[entry_type.TRANSCRIPTION.value] = payload
+        elif event == cls.OngoingDialogueEventType.TRANSCRIPTION_LINES_ADDED:
+            ongoing_dialogue_data.setdefault(entry_type.TRANSCRIPTION.value, []).extend(
+                payload
+            )
+        elif event == cls.OngoingDialogueEventType.LATEST_THOUGHTS_SET:
+            ongoing_dialogue_data.setdefault(entry_type.LATEST_THOUGHTS.value, {})[
+                payload["character_identifier"]
+            ] = payload["thoughts"]
+        elif event == cls.OngoingDialogueEventType.LATEST_DESIRED_ACTION_SET:
+            ongoing_dialogue_data.setdefault(
+                entry_type.LATEST_DESIRED_ACTIONS.value, {}
+            )[payload["character_identifier"]] = payload["action"]
+
+    def _append_event(
+        self, event_type: "OngoingDialogueRepository.OngoingDialogueEventType", payload
     ) -> None:
-        write_json_file(self._ongoing_dialogue_path, ongoing_dialogue_data)
+        self._journal.append([(event_type.value, payload)])
 
     def dialogue_exists(self) -> bool:
-        return os.path.exists(self._ongoing_dialogue_path)
-
-    def _initialize_messages(self) -> None:
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        if not self.OngoingDialogueEntryType.MESSAGES.value in ongoing_dialogue_file:
-            ongoing_dialogue_file[self.OngoingDialogueEntryType.MESSAGES.value] = []
-
-            self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        return self._journal.exists()
 
     def get_messages(self) -> List[Dict[str, Any]]:
-        return self._load_ongoing_dialogue_data().get(
-            self.OngoingDialogueEntryType.MESSAGES.value, []
-        )
+        return self._journal.get(self.OngoingDialogueEntryType.MESSAGES.value, [])
 
     def add_messages(self, messages: List[Dict[str, Any]]):
-        self._initialize_messages()
-
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        ongoing_dialogue_file[self.OngoingDialogueEntryType.MESSAGES.value].extend(
-            messages
-        )
-
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        self._append_event(self.OngoingDialogueEventType.MESSAGES_ADDED, messages)
 
     def validate_dialogue_is_not_malformed(self) -> None:
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
+        ongoing_dialogue_file = self._journal.read()
 
         if (
             not self.OngoingDialogueEntryType.PARTICIPANTS.value
@@ -84,69 +114,69 @@ class OngoingDialogueRepository:
         ):
             logger.error(f"Malformed ongoing dialogue file: %s", ongoing_dialogue_file)
             # If it's malformed, we can do nothing with its information. Better remove the file.
-            remove_file(self._ongoing_dialogue_path)
+            self._journal.remove()
 
     def has_participants(self) -> bool:
-        return (
-            self.OngoingDialogueEntryType.PARTICIPANTS.value
-            in self._load_ongoing_dialogue_data()
-        )
+        return self._journal.contains(self.OngoingDialogueEntryType.PARTICIPANTS.value)
 
     def get_participants(self) -> Dict[str, Dict[str, str]]:
-        return self._load_ongoing_dialogue_data().get(
-            self.OngoingDialogueEntryType.PARTICIPANTS.value
-        )
+        return self._journal.get(self.OngoingDialogueEntryType.PARTICIPANTS.value)
 
     def set_participants(self, participants: Dict[str, Dict[str, str]]) -> None:
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        ongoing_dialogue_file[self.OngoingDialogueEntryType.PARTICIPANTS.value] = (
-            participants
-        )
+        # The participants get stored again after every speech turn.
+        if self.has_participants() and self.get_participants() == participants:
+            return
 
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        self._append_event(self.OngoingDialogueEventType.PARTICIPANTS_SET, participants)
 
     def remove_participants(self, participants: List[str]) -> None:
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        for participant in participants:
-            ongoing_dialogue_file[self.OngoingDialogueEntryType.PARTICIPANTS.value].pop(
-                participant, None
-            )
-
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        self._append_event(
+            self.OngoingDialogueEventType.PARTICIPANTS_REMOVED, participants
+        )
 
     def get_purpose(self) -> str:
-        return self._load_ongoing_dialogue_data().get(
-            self.OngoingDialogueEntryType.PURPOSE.value
-        )
+        return self._journal.get(self.OngoingDialogueEntryType.PURPOSE.value)
 
     def set_purpose(self, purpose: str) -> None:
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        ongoing_dialogue_file[self.OngoingDialogueEntryType.PURPOSE.value] = purpose
+        if (
+            self._journal.contains(self.OngoingDialogueEntryType.PURPOSE.value)
+            and self.get_purpose() == purpose
+        ):
+            return
 
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        self._append_event(self.OngoingDialogueEventType.PURPOSE_SET, purpose)
 
     def get_transcription(self) -> List[str]:
-        return self._load_ongoing_dialogue_data().get(
-            self.OngoingDialogueEntryType.TRANSCRIPTION.value, []
-        )
+        return self._journal.get(self.OngoingDialogueEntryType.TRANSCRIPTION.value, [])
 
     def set_transcription(self, transcription: List[str]) -> None:
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        ongoing_dialogue_file[self.OngoingDialogueEntryType.TRANSCRIPTION.value] = (
-            transcription
+        stored_transcription = self._journal.get(
+            self.OngoingDialogueEntryType.TRANSCRIPTION.value
         )
 
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        # The transcription usually only grows, so only its new lines get
+        # journaled.
+        if (
+            stored_transcription is not None
+            and transcription[: len(stored_transcription)] == stored_transcription
+        ):
+            new_lines = transcription[len(stored_transcription) :]
+
+            if new_lines:
+                self._append_event(
+                    self.OngoingDialogueEventType.TRANSCRIPTION_LINES_ADDED,
+                    new_lines,
+                )
+            return
+
+        self._append_event(
+            self.OngoingDialogueEventType.TRANSCRIPTION_SET, transcription
+        )
 
     def get_latest_thoughts(self, character_identifier: str) -> Optional[str]:
         validate_non_empty_string(character_identifier, "character_identifier")
 
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-        latest_thoughts = ongoing_dialogue_file.get(
+        latest_thoughts = self._journal.get(
             self.OngoingDialogueEntryType.LATEST_THOUGHTS.value
         )
 
@@ -158,27 +188,15 @@ class OngoingDialogueRepository:
     def set_latest_thoughts(self, character_identifier: str, thoughts: str) -> None:
         validate_non_empty_string(character_identifier, "character_identifier")
 
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        if (
-            self.OngoingDialogueEntryType.LATEST_THOUGHTS.value
-            not in ongoing_dialogue_file
-        ):
-            ongoing_dialogue_file[
-                self.OngoingDialogueEntryType.LATEST_THOUGHTS.value
-            ] = {}
-
-        ongoing_dialogue_file[self.OngoingDialogueEntryType.LATEST_THOUGHTS.value][
-            character_identifier
-        ] = thoughts
-
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        self._append_event(
+            self.OngoingDialogueEventType.LATEST_THOUGHTS_SET,
+            {"character_identifier": character_identifier, "thoughts": thoughts},
+        )
 
     def get_latest_desired_action(self, character_identifier: str) -> Optional[str]:
         validate_non_empty_string(character_identifier, "character_identifier")
 
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-        latest_desired_action = ongoing_dialogue_file.get(
+        latest_desired_action = self._journal.get(
             self.OngoingDialogueEntryType.LATEST_DESIRED_ACTIONS.value
         )
 
@@ -190,22 +208,11 @@ class OngoingDialogueRepository:
     def set_latest_desired_action(self, character_identifier: str, action: str) -> None:
         validate_non_empty_string(character_identifier, "character_identifier")
 
-        ongoing_dialogue_file = self._load_ongoing_dialogue_data()
-
-        if (
-            self.OngoingDialogueEntryType.LATEST_DESIRED_ACTIONS.value
-            not in ongoing_dialogue_file
-        ):
-            ongoing_dialogue_file[
-                self.OngoingDialogueEntryType.LATEST_DESIRED_ACTIONS.value
-            ] = {}
-
-        ongoing_dialogue_file[
-            self.OngoingDialogueEntryType.LATEST_DESIRED_ACTIONS.value
-        ][character_identifier] = action
-
-        self._save_ongoing_dialogue_data(ongoing_dialogue_file)
+        self._append_event(
+            self.OngoingDialogueEventType.LATEST_DESIRED_ACTION_SET,
+            {"character_identifier": character_identifier, "action": action},
+        )
 
     def remove_dialogue(self) -> None:
         if self.dialogue_exists():
-            remove_file(self._ongoing_dialogue_path)
+            self._journal.remove()
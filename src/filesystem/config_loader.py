@@ -1,8 +1,10 @@
 # src.filesystem.config_loader.py
 
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+from src.base.enums import LlmResponseCacheMode, StorageBackend
 from src.filesystem.file_operations import read_file, read_json_file
 from src.filesystem.path_manager import PathManager
 
@@ -16,6 +18,7 @@ class ConfigLoader:
         self._config = read_json_file(self._path_manager.get_config_path())
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _load_secret_key(file_path: Path) -> str:
         try:
             return read_file(file_path)
@@ -86,6 +89,75 @@ class ConfigLoader:
     def get_number_of_characters_to_retrieve_from_interview(self) -> int:
         return self._get_config_key("number_of_characters_to_retrieve_from_interview")
 
+    def get_llm_max_connections(self) -> int:
+        return self._get_config_key("llm_max_connections")
+
+    def get_llm_max_keepalive_connections(self) -> int:
+        return self._get_config_key("llm_max_keepalive_connections")
+
+    def get_llm_keepalive_expiry(self) -> float:
+        return self._get_config_key("llm_keepalive_expiry")
+
+    def get_max_cached_playthrough_databases(self) -> int:
+        return self._get_config_key("max_cached_playthrough_databases")
+
+    def get_max_cached_embeddings(self) -> int:
+        return self._get_config_key("max_cached_embeddings")
+
+    def get_store_embeddings_on_disk(self) -> bool:
+        return self._get_config_key("store_embeddings_on_disk")
+
+    def get_max_embeddings_cache_megabytes(self) -> int:
+        return self._get_config_key("max_embeddings_cache_megabytes")
+
+    def get_retrieval_query_token_budget(self) -> int:
+        return self._get_config_key("retrieval_query_token_budget")
+
+    def get_max_retrieval_sub_queries(self) -> int:
+        return self._get_config_key("max_retrieval_sub_queries")
+
+    def get_hot_reload_prompt_templates(self) -> bool:
+        return self._get_config_key("hot_reload_prompt_templates")
+
+    def get_context_assembly_workers(self) -> int:
+        return self._get_config_key("context_assembly_workers")
+
+    def get_xtts_max_in_flight_requests(self) -> int:
+        return self._get_config_key("xtts_max_in_flight_requests")
+
+    def get_xtts_endpoint_ttl_seconds(self) -> float:
+        return self._get_config_key("xtts_endpoint_ttl_seconds")
+
+    def get_xtts_static_endpoint(self) -> str:
+        return self._get_config_key("xtts_static_endpoint")
+
+    def get_voice_line_job_workers(self) -> int:
+        return self._get_config_key("voice_line_job_workers")
+
+    def get_stream_speech_turns(self) -> bool:
+        return self._get_config_key("stream_speech_turns")
+
+    def get_playthrough_storage_backend(self) -> StorageBackend:
+        return StorageBackend(self._get_config_key("playthrough_storage_backend"))
+
+    def get_max_concurrent_concept_generations(self) -> int:
+        return self._get_config_key("max_concurrent_concept_generations")
+
+    def get_llm_response_cache_mode(self) -> LlmResponseCacheMode:
+        return LlmResponseCacheMode(self._get_config_key("llm_response_cache_mode"))
+
+    def get_llm_response_cache_max_megabytes(self) -> int:
+        return self._get_config_key("llm_response_cache_max_megabytes")
+
+    def get_cached_llm_action_types(self) -> List[str]:
+        return self._get_config_key("cached_llm_action_types")
+
+    def get_llm_max_concurrent_requests_per_model(self) -> int:
+        return self._get_config_key("llm_max_concurrent_requests_per_model")
+
+    def get_llm_rate_limit_max_retries(self) -> int:
+        return self._get_config_key("llm_rate_limit_max_retries")
+
     def load_openai_project_key(self) -> str:
         return self._load_secret_key(self._path_manager.get_openai_project_key_path())
 
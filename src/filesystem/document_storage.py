@@ -0,0 +1,595 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Protocol
+
+from src.base.constants import SQLITE_BUSY_TIMEOUT_SECONDS
+from src.filesystem.file_operations import (
+    read_json_file,
+    remove_file,
+    write_json_file,
+)
+from src.filesystem.path_manager import PathManager
+from src.maps.map_index import MapIndex
+
+logger = logging.getLogger(__name__)
+
+DocumentSignature = Hashable
+
+
+@dataclass
+class PreparedDocumentWrite:
+    """A new version of a document, ready to replace the current one. Applying
+    it takes the same 'previous_data' as 'DocumentStorage.write'."""
+
+    apply: Callable[[Optional[Any]], None]
+    discard: Callable[[], None]
+
+
+class DocumentStorage(Protocol):
+    """Where the documents of playthroughs, addressed by file path, are stored."""
+
+    def exists(self, file_path: Path) -> bool:
+        pass
+
+    def get_signature(self, file_path: Path) -> Optional[DocumentSignature]:
+        """Returns a value that changes whenever the document does, or None if
+        the document doesn't exist."""
+        pass
+
+    def read(self, file_path: Path) -> Any:
+        pass
+
+    def write(
+        self, file_path: Path, data: Any, previous_data: Optional[Any] = None
+    ) -> None:
+        """Replaces the contents of the document. If given, 'previous_data'
+        must be what the document currently holds, so that only what changed
+        needs to be written."""
+        pass
+
+    def prepare_write(self, file_path: Path, data: Any) -> PreparedDocumentWrite:
+        """Does whatever could fail when writing the document, without
+        changing it yet."""
+        pass
+
+    def remove(self, file_path: Path) -> None:
+        pass
+
+    def read_lines(self, file_path: Path) -> List[str]:
+        pass
+
+    def append_lines(self, file_path: Path, lines: List[str]) -> None:
+        pass
+
+
+class JsonFileDocumentStorage:
+    """Stores every document in its own JSON file."""
+
+    def exists(self, file_path: Path) -> bool:
+        return os.path.exists(file_path)
+
+    def get_signature(self, file_path: Path) -> Optional[DocumentSignature]:
+        try:
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+
+        return stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_size
+
+    def read(self, file_path: Path) -> Any:
+        return read_json_file(Path(file_path))
+
+    def write(
+        self, file_path: Path, data: Any, previous_data: Optional[Any] = None
+    ) -> None:
+        self.prepare_write(file_path, data).apply(previous_data)
+
+    def prepare_write(self, file_path: Path, data: Any) -> PreparedDocumentWrite:
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Readers must never come across a half-written file.
+        temporary_path = file_path.with_name(
+            f"{file_path.name}.{threading.get_ident()}.tmp"
+        )
+
+        def discard() -> None:
+            if os.path.exists(temporary_path):
+                remove_file(temporary_path)
+
+        try:
+            write_json_file(temporary_path, data)
+        except BaseException:
+            discard()
+            raise
+
+        return PreparedDocumentWrite(
+            lambda _previous_data: os.replace(temporary_path, file_path), discard
+        )
+
+    def remove(self, file_path: Path) -> None:
+        if os.path.exists(file_path):
+            remove_file(file_path)
+
+    def read_lines(self, file_path: Path) -> List[str]:
+        if not os.path.exists(file_path):
+            return []
+
+        with Path(file_path).open("r", encoding="utf-8") as file:
+            return [line.rstrip("\n") for line in file if line.strip()]
+
+    def append_lines(self, file_path: Path, lines: List[str]) -> None:
+        if not lines:
+            return
+
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with file_path.open("a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    data TEXT
+);
+
+CREATE TABLE IF NOT EXISTS places (
+    identifier TEXT PRIMARY KEY,
+    type TEXT,
+    parent TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS places_by_type ON places (type);
+CREATE INDEX IF NOT EXISTS places_by_parent ON places (parent);
+
+CREATE TABLE IF NOT EXISTS place_characters (
+    place_identifier TEXT NOT NULL,
+    character_identifier TEXT NOT NULL,
+    PRIMARY KEY (place_identifier, character_identifier)
+);
+
+CREATE INDEX IF NOT EXISTS place_characters_by_character
+    ON place_characters (character_identifier);
+
+CREATE TABLE IF NOT EXISTS characters (
+    identifier TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS journal_lines (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    line TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS journal_lines_by_name ON journal_lines (name);
+"""
+
+
+def _dump(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False)
+
+
+class SqliteDocumentStorage:
+    """Stores the documents of a single playthrough in a SQLite database."""
+
+    def __init__(
+        self,
+        playthrough_name: str,
+        path_manager: Optional[PathManager] = None,
+        database_path: Optional[Path] = None,
+    ):
+        self._path_manager = path_manager or PathManager()
+
+        self._playthrough_path = Path(
+            self._path_manager.get_playthrough_path(playthrough_name)
+        ).resolve()
+        self._database_path = database_path or (
+            self._path_manager.get_playthrough_documents_database_path(playthrough_name)
+        )
+
+        self._map_name = self._get_name(
+            self._path_manager.get_map_path(playthrough_name)
+        )
+        self._characters_name = self._get_name(
+            self._path_manager.get_characters_file_path(playthrough_name)
+        )
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            # Transactions get started explicitly.
+            connection = sqlite3.connect(
+                self._database_path,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.executescript(_SCHEMA)
+
+            self._local.connection = connection
+
+            with self._connections_lock:
+                self._connections.append(connection)
+
+        return connection
+
+    def initialize(self) -> None:
+        """Creates the database, if it doesn't exist yet."""
+        self._get_connection()
+
+    def _get_name(self, file_path: Path) -> str:
+        return Path(file_path).resolve().relative_to(self._playthrough_path).as_posix()
+
+    def _run_in_transaction(
+        self, operation: Callable[[sqlite3.Connection], Any], write: bool = False
+    ) -> Any:
+        connection = self._get_connection()
+
+        # Taking the write lock upfront avoids deadlocking with another writer
+        # halfway through the transaction.
+        connection.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+
+        try:
+            result = operation(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+
+        return result
+
+    @staticmethod
+    def _get_version(connection: sqlite3.Connection, name: str) -> Optional[int]:
+        row = connection.execute(
+            "SELECT version FROM documents WHERE name = ?", (name,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    @staticmethod
+    def _touch(
+        connection: sqlite3.Connection, name: str, data: Optional[str] = None
+    ) -> None:
+        connection.execute(
+            "INSERT INTO documents (name, version, data) VALUES (?, 1, ?) "
+            "ON CONFLICT (name) DO UPDATE SET version = version + 1, data = excluded.data",
+            (name, data),
+        )
+
+    def exists(self, file_path: Path) -> bool:
+        return self.get_signature(file_path) is not None
+
+    def get_signature(self, file_path: Path) -> Optional[DocumentSignature]:
+        version = self._get_version(self._get_connection(), self._get_name(file_path))
+
+        return ("sqlite", version) if version is not None else None
+
+    @staticmethod
+    def _read_entries(connection: sqlite3.Connection, table: str) -> Dict[str, Any]:
+        return {
+            identifier: json.loads(data)
+            for identifier, data in connection.execute(
+                f"SELECT identifier, data FROM {table} ORDER BY rowid"
+            )
+        }
+
+    def read(self, file_path: Path) -> Any:
+        name = self._get_name(file_path)
+
+        def read_document(connection: sqlite3.Connection) -> Any:
+            row = connection.execute(
+                "SELECT data FROM documents WHERE name = ?", (name,)
+            ).fetchone()
+
+            if row is None:
+                raise FileNotFoundError(
+                    f"There is no document '{name}' in '{self._database_path}'."
+                )
+
+            if name == self._map_name:
+                return self._read_entries(connection, "places")
+
+            if name == self._characters_name:
+                return self._read_entries(connection, "characters")
+
+            return json.loads(row[0])
+
+        return self._run_in_transaction(read_document)
+
+    @staticmethod
+    def _upsert_place(
+        connection: sqlite3.Connection, identifier: str, place: Dict[str, Any]
+    ) -> None:
+        connection.execute(
+            "INSERT INTO places (identifier, type, parent, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (identifier) DO UPDATE SET "
+            "type = excluded.type, parent = excluded.parent, data = excluded.data",
+            (
+                identifier,
+                place.get("type"),
+                MapIndex.get_parent_identifier(place),
+                _dump(place),
+            ),
+        )
+        connection.execute(
+            "DELETE FROM place_characters WHERE place_identifier = ?", (identifier,)
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO place_characters "
+            "(place_identifier, character_identifier) VALUES (?, ?)",
+            [
+                (identifier, character_identifier)
+                for character_identifier in place.get("characters", [])
+            ],
+        )
+
+    @staticmethod
+    def _delete_place(connection: sqlite3.Connection, identifier: str) -> None:
+        connection.execute("DELETE FROM places WHERE identifier = ?", (identifier,))
+        connection.execute(
+            "DELETE FROM place_characters WHERE place_identifier = ?", (identifier,)
+        )
+
+    @staticmethod
+    def _upsert_character(
+        connection: sqlite3.Connection, identifier: str, character: Dict[str, Any]
+    ) -> None:
+        connection.execute(
+            "INSERT INTO characters (identifier, data) VALUES (?, ?) "
+            "ON CONFLICT (identifier) DO UPDATE SET data = excluded.data",
+            (identifier, _dump(character)),
+        )
+
+    @staticmethod
+    def _delete_character(connection: sqlite3.Connection, identifier: str) -> None:
+        connection.execute("DELETE FROM characters WHERE identifier = ?", (identifier,))
+
+    @staticmethod
+    def _write_entries(
+        connection: sqlite3.Connection,
+        table: str,
+        data: Dict[str, Any],
+        previous_data: Optional[Dict[str, Any]],
+        upsert: Callable[[sqlite3.Connection, str, Any], None],
+        delete: Callable[[sqlite3.Connection, str], None],
+    ) -> None:
+        if previous_data is None:
+            # Without knowing what changed, every entry has to be rewritten.
+            previous_identifiers = [
+                row[0] for row in connection.execute(f"SELECT identifier FROM {table}")
+            ]
+            changed_identifiers = list(data.keys())
+        else:
+            previous_identifiers = list(previous_data.keys())
+            changed_identifiers = [
+                identifier
+                for identifier, entry in data.items()
+                if previous_data.get(identifier) != entry
+            ]
+
+        for identifier in previous_identifiers:
+            if identifier not in data:
+                delete(connection, identifier)
+
+        for identifier in changed_identifiers:
+            upsert(connection, identifier, data[identifier])
+
+    def write(
+        self, file_path: Path, data: Any, previous_data: Optional[Any] = None
+    ) -> None:
+        name = self._get_name(file_path)
+
+        def write_document(connection: sqlite3.Connection) -> None:
+            if name == self._map_name:
+                self._write_entries(
+                    connection,
+                    "places",
+                    data,
+                    previous_data,
+                    self._upsert_place,
+                    self._delete_place,
+                )
+                self._touch(connection, name)
+            elif name == self._characters_name:
+                self._write_entries(
+                    connection,
+                    "characters",
+                    data,
+                    previous_data,
+                    self._upsert_character,
+                    self._delete_character,
+                )
+                self._touch(connection, name)
+            else:
+                self._touch(connection, name, _dump(data))
+
+        self._run_in_transaction(write_document, write=True)
+
+    def prepare_write(self, file_path: Path, data: Any) -> PreparedDocumentWrite:
+        # The transaction of the write already makes it all or nothing.
+        return PreparedDocumentWrite(
+            lambda previous_data: self.write(file_path, data, previous_data),
+            lambda: None,
+        )
+
+    def remove(self, file_path: Path) -> None:
+        name = self._get_name(file_path)
+
+        def remove_document(connection: sqlite3.Connection) -> None:
+            connection.execute("DELETE FROM documents WHERE name = ?", (name,))
+            connection.execute("DELETE FROM journal_lines WHERE name = ?", (name,))
+
+            if name == self._map_name:
+                connection.execute("DELETE FROM places")
+                connection.execute("DELETE FROM place_characters")
+            elif name == self._characters_name:
+                connection.execute("DELETE FROM characters")
+
+        self._run_in_transaction(remove_document, write=True)
+
+    def _read_places(self, condition: str, parameters: tuple) -> Dict[str, Any]:
+        return {
+            identifier: json.loads(data)
+            for identifier, data in self._get_connection().execute(
+                f"SELECT identifier, data FROM places WHERE {condition} ORDER BY rowid",
+                parameters,
+            )
+        }
+
+    def read_places_of_type(self, place_type: str) -> Dict[str, Any]:
+        """Returns the places of the map that are of the given type, in the
+        order of the map."""
+        return self._read_places("type = ?", (place_type,))
+
+    def read_child_places(
+        self, parent_identifier: str, place_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Returns the places of the map whose parent is the given one, in the
+        order of the map. If given a type, only the places of that type."""
+        if place_type is None:
+            return self._read_places("parent = ?", (parent_identifier,))
+
+        return self._read_places(
+            "parent = ? AND type = ?", (parent_identifier, place_type)
+        )
+
+    def read_characters_at_place(self, place_identifier: str) -> List[str]:
+        return [
+            row[0]
+            for row in self._get_connection().execute(
+                "SELECT character_identifier FROM place_characters "
+                "WHERE place_identifier = ? ORDER BY rowid",
+                (place_identifier,),
+            )
+        ]
+
+    def read_lines(self, file_path: Path) -> List[str]:
+        return [
+            row[0]
+            for row in self._get_connection().execute(
+                "SELECT line FROM journal_lines WHERE name = ? ORDER BY position",
+                (self._get_name(file_path),),
+            )
+        ]
+
+    def append_lines(self, file_path: Path, lines: List[str]) -> None:
+        if not lines:
+            return
+
+        name = self._get_name(file_path)
+
+        def append(connection: sqlite3.Connection) -> None:
+            connection.executemany(
+                "INSERT INTO journal_lines (name, line) VALUES (?, ?)",
+                [(name, line) for line in lines],
+            )
+            self._touch(connection, name)
+
+        self._run_in_transaction(append, write=True)
+
+    def close(self) -> None:
+        """Closes the connections of every thread. The storage must not be
+        used afterwards."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+
+            self._connections.clear()
+
+
+class DocumentStorageRegistry:
+    """Decides whether a playthrough's documents are in SQLite or JSON files."""
+
+    _shared_instance: Optional["DocumentStorageRegistry"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self, path_manager: Optional[PathManager] = None):
+        self._path_manager = path_manager or PathManager()
+
+        self._json_file_storage = JsonFileDocumentStorage()
+        self._sqlite_storages: Dict[str, SqliteDocumentStorage] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared_instance(cls) -> "DocumentStorageRegistry":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def _get_playthrough_name(self, file_path: Path) -> Optional[str]:
+        try:
+            relative_path = (
+                Path(file_path)
+                .resolve()
+                .relative_to(Path(self._path_manager.get_playthroughs_path()).resolve())
+            )
+        except ValueError:
+            return None
+
+        # Only the files inside a playthrough folder belong to it.
+        return relative_path.parts[0] if len(relative_path.parts) > 1 else None
+
+    def get_storage(self, file_path: Path) -> DocumentStorage:
+        playthrough_name = self._get_playthrough_name(file_path)
+
+        if playthrough_name is None:
+            return self._json_file_storage
+
+        database_exists = os.path.exists(
+            self._path_manager.get_playthrough_documents_database_path(playthrough_name)
+        )
+
+        with self._lock:
+            if not database_exists:
+                # The playthrough may have been migrated back to JSON files.
+                storage = self._sqlite_storages.pop(playthrough_name, None)
+
+                if storage is not None:
+                    storage.close()
+
+                return self._json_file_storage
+
+            if playthrough_name not in self._sqlite_storages:
+                self._sqlite_storages[playthrough_name] = SqliteDocumentStorage(
+                    playthrough_name, self._path_manager
+                )
+
+            return self._sqlite_storages[playthrough_name]
+
+    def create_database(self, playthrough_name: str) -> None:
+        """From now on, the documents of the playthrough will be stored in
+        its SQLite database."""
+        with self._lock:
+            if playthrough_name not in self._sqlite_storages:
+                self._sqlite_storages[playthrough_name] = SqliteDocumentStorage(
+                    playthrough_name, self._path_manager
+                )
+
+            self._sqlite_storages[playthrough_name].initialize()
+
+    def clear(self) -> None:
+        with self._lock:
+            for storage in self._sqlite_storages.values():
+                storage.close()
+
+            self._sqlite_storages.clear()
@@ -0,0 +1,216 @@
+# src.filesystem.json_file_cache.py
+import copy
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.filesystem.document_storage import (
+    DocumentSignature,
+    DocumentStorage,
+    DocumentStorageRegistry,
+)
+from src.filesystem.unit_of_work import PreparedWrite, StagedWrite, UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+FileSignature = DocumentSignature
+
+
+@dataclass
+class JsonFileCacheStatistics:
+    disk_reads: int = 0
+    reads_avoided: int = 0
+    writes: int = 0
+
+
+@dataclass
+class _CachedJsonFile:
+    signature: FileSignature
+    data: Any
+
+
+class JsonFileCache:
+    """Process-wide, write-through cache of parsed JSON files."""
+
+    _shared_instance: Optional["JsonFileCache"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(
+        self, document_storage_registry: Optional[DocumentStorageRegistry] = None
+    ):
+        self._document_storage_registry = (
+            document_storage_registry or DocumentStorageRegistry.get_shared_instance()
+        )
+
+        # The lock only guards the dicts and the statistics. Reads, writes and
+        # copies happen outside of it, so readers of different files, or of
+        # cached ones, don't wait on each other.
+        self._entries: Dict[Path, _CachedJsonFile] = {}
+        self._write_locks: Dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._statistics = JsonFileCacheStatistics()
+
+    @classmethod
+    def get_shared_instance(cls) -> "JsonFileCache":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def _get_storage(self, file_path: Path) -> DocumentStorage:
+        return self._document_storage_registry.get_storage(file_path)
+
+    def _get_signature(self, file_path: Path) -> FileSignature:
+        signature = self._get_storage(file_path).get_signature(file_path)
+
+        if signature is None:
+            raise FileNotFoundError(f"There is no document at '{file_path}'.")
+
+        return signature
+
+    @staticmethod
+    def _get_key(file_path: Path) -> Path:
+        return Path(file_path).resolve()
+
+    def get_signature(self, file_path: Path) -> FileSignature:
+        """Returns the signature of the file as it currently exists on disk.
+        Callers can use it as a version number of the document."""
+        return self._get_signature(self._get_key(file_path))
+
+    def exists(self, file_path: Path) -> bool:
+        key = self._get_key(file_path)
+
+        return self.has_pending_write(key) or self._get_storage(key).exists(key)
+
+    def get_pending_write(self, file_path: Path) -> Optional[StagedWrite]:
+        """Returns the changes to the file that the active unit of work holds,
+        and that haven't reached the disk yet. Each staging replaces them, so
+        callers can tell staged versions apart by identity. The staged data
+        must not be modified."""
+        unit_of_work = UnitOfWork.get_active()
+
+        if unit_of_work is None:
+            return None
+
+        return unit_of_work.get_staged(self._get_key(file_path))
+
+    def has_pending_write(self, file_path: Path) -> bool:
+        """Whether the active unit of work holds changes to the file that
+        haven't reached the disk yet."""
+        return self.get_pending_write(file_path) is not None
+
+    def _get_shared_data(self, key: Path) -> Any:
+        """Returns the contents shared by every reader. Callers must not modify
+        them, nor hand them out without copying them."""
+        unit_of_work = UnitOfWork.get_active()
+
+        if unit_of_work is not None:
+            staged_write = unit_of_work.get_staged(key)
+
+            if staged_write is not None:
+                with self._lock:
+                    self._statistics.reads_avoided += 1
+
+                return staged_write.data
+
+        signature = self._get_signature(key)
+
+        with self._lock:
+            cached_file = self._entries.get(key)
+
+            if cached_file and cached_file.signature == signature:
+                self._statistics.reads_avoided += 1
+                return cached_file.data
+
+        # If the document changes in the meantime, the data is newer than its
+        # signature, and the next reader will just read it again.
+        data = self._get_storage(key).read(key)
+
+        with self._lock:
+            self._entries[key] = _CachedJsonFile(signature, data)
+            self._statistics.disk_reads += 1
+
+        return data
+
+    def read(self, file_path: Path) -> Any:
+        """Returns a private copy of the parsed JSON contents of the file."""
+        return copy.deepcopy(self._get_shared_data(self._get_key(file_path)))
+
+    def read_entries(self, file_path: Path, entry_keys: List[str]) -> Dict[str, Any]:
+        """Returns private copies of some entries of a file that contains a
+        JSON object, without copying the rest of it. Missing entries are left
+        out."""
+        data = self._get_shared_data(self._get_key(file_path))
+
+        return {
+            entry_key: copy.deepcopy(data[entry_key])
+            for entry_key in entry_keys
+            if entry_key in data
+        }
+
+    def write(self, file_path: Path, data: Any) -> None:
+        key = self._get_key(file_path)
+
+        unit_of_work = UnitOfWork.get_active()
+
+        if unit_of_work is not None and unit_of_work.stage(
+            key,
+            copy.deepcopy(data),
+            lambda staged_data: self._prepare_write(key, staged_data),
+        ):
+            return
+
+        self._prepare_write(key, data).apply()
+
+    def _get_write_lock(self, key: Path) -> threading.Lock:
+        with self._lock:
+            return self._write_locks.setdefault(key, threading.Lock())
+
+    def _prepare_write(self, key: Path, data: Any) -> PreparedWrite:
+        data = copy.deepcopy(data)
+
+        storage = self._get_storage(key)
+        prepared_document_write = storage.prepare_write(key, data)
+
+        def apply() -> None:
+            # Writers of the same file take turns, given that each one tells
+            # the storage what changed since the version the previous one
+            # cached.
+            with self._get_write_lock(key):
+                with self._lock:
+                    cached_file = self._entries.get(key)
+
+                # The storage only needs to write what changed since the
+                # version that's cached, as long as that's still the current
+                # one.
+                previous_data = (
+                    cached_file.data
+                    if cached_file
+                    and cached_file.signature == storage.get_signature(key)
+                    else None
+                )
+
+                prepared_document_write.apply(previous_data)
+
+                signature = self._get_signature(key)
+
+                with self._lock:
+                    self._entries[key] = _CachedJsonFile(signature, data)
+                    self._statistics.writes += 1
+
+        return PreparedWrite(apply, prepared_document_write.discard)
+
+    def invalidate(self, file_path: Path) -> None:
+        with self._lock:
+            self._entries.pop(self._get_key(file_path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> JsonFileCacheStatistics:
+        with self._lock:
+            return copy.copy(self._statistics)
@@ -0,0 +1,333 @@
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.base.constants import (
+    JSON_JOURNAL_COMPACTION_THRESHOLD,
+    MAX_CACHED_JSON_JOURNALS,
+)
+from src.filesystem.document_storage import (
+    DocumentSignature,
+    DocumentStorage,
+    DocumentStorageRegistry,
+)
+from src.filesystem.unit_of_work import PreparedWrite, UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+EventApplier = Callable[[Dict[str, Any], str, Any], None]
+
+JOURNAL_SEQUENCE_KEY = "journal_sequence"
+
+JournalSignature = Tuple[Optional[DocumentSignature], Optional[DocumentSignature]]
+
+
+@dataclass
+class _StagedJournal:
+    data: Dict[str, Any]
+    events: List[Tuple[str, Any]] = field(default_factory=list)
+    removed: bool = False
+
+
+class JsonJournal:
+    """JSON document stored as a snapshot plus an append-only log of events."""
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        journal_path: Path,
+        apply_event: EventApplier,
+        compaction_threshold: int = JSON_JOURNAL_COMPACTION_THRESHOLD,
+        document_storage_registry: Optional[DocumentStorageRegistry] = None,
+    ):
+        self._snapshot_path = Path(snapshot_path)
+        self._journal_path = Path(journal_path)
+        self._apply_event = apply_event
+        self._compaction_threshold = compaction_threshold
+        self._document_storage_registry = (
+            document_storage_registry or DocumentStorageRegistry.get_shared_instance()
+        )
+
+        self._lock = threading.RLock()
+
+        self._data: Optional[Dict[str, Any]] = None
+        self._sequence = 0
+        self._journaled_events = 0
+        self._signature: Optional[JournalSignature] = None
+
+    def _get_storage(self) -> DocumentStorage:
+        # The snapshot and the log always live in the same storage.
+        return self._document_storage_registry.get_storage(self._snapshot_path)
+
+    def _get_signature(self) -> JournalSignature:
+        storage = self._get_storage()
+
+        return (
+            storage.get_signature(self._snapshot_path),
+            storage.get_signature(self._journal_path),
+        )
+
+    def _replay(self) -> None:
+        storage = self._get_storage()
+
+        data: Dict[str, Any] = {}
+
+        if storage.exists(self._snapshot_path):
+            data = storage.read(self._snapshot_path) or {}
+
+        sequence = data.pop(JOURNAL_SEQUENCE_KEY, 0)
+        journaled_events = 0
+
+        for line in storage.read_lines(self._journal_path):
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # Only the last line can be torn, if the process died while
+                # appending it.
+                logger.warning(
+                    f"Skipped a malformed line of journal '{self._journal_path}'."
+                )
+                continue
+
+            journaled_events += 1
+
+            if event["sequence"] <= sequence:
+                continue
+
+            self._apply_event(data, event["type"], event["data"])
+            sequence = event["sequence"]
+
+        self._data = data
+        self._sequence = sequence
+        self._journaled_events = journaled_events
+        self._signature = self._get_signature()
+
+    def _get_data(self) -> Dict[str, Any]:
+        # Something other than this journal may have changed the files.
+        if self._data is None or self._signature != self._get_signature():
+            self._replay()
+
+        return self._data
+
+    def _get_unit_of_work_key(self) -> Tuple[str, Path]:
+        return "json_journal", self._snapshot_path
+
+    def _get_staged_journal(self) -> Optional[_StagedJournal]:
+        unit_of_work = UnitOfWork.get_active()
+
+        if unit_of_work is None:
+            return None
+
+        staged_write = unit_of_work.get_staged(self._get_unit_of_work_key())
+
+        return staged_write.data if staged_write else None
+
+    def _get_visible_data(self) -> Dict[str, Any]:
+        staged_journal = self._get_staged_journal()
+
+        return staged_journal.data if staged_journal else self._get_data()
+
+    def exists(self) -> bool:
+        staged_journal = self._get_staged_journal()
+
+        if staged_journal is not None:
+            return not staged_journal.removed or bool(staged_journal.events)
+
+        storage = self._get_storage()
+
+        return storage.exists(self._snapshot_path) or storage.exists(self._journal_path)
+
+    def read(self) -> Dict[str, Any]:
+        """Returns a private copy of the whole document."""
+        with self._lock:
+            return copy.deepcopy(self._get_visible_data())
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._get_visible_data()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns a private copy of a single entry of the document."""
+        with self._lock:
+            return copy.deepcopy(self._get_visible_data().get(key, default))
+
+    def append(self, events: List[Tuple[str, Any]]) -> None:
+        if not events:
+            return
+
+        events = copy.deepcopy(events)
+
+        unit_of_work = UnitOfWork.get_active()
+
+        with self._lock:
+            if unit_of_work is not None:
+                staged_journal = self._get_staged_journal() or _StagedJournal(
+                    copy.deepcopy(self._get_data())
+                )
+
+                for event_type, payload in events:
+                    self._apply_event(
+                        staged_journal.data, event_type, copy.deepcopy(payload)
+                    )
+
+                staged_journal.events.extend(events)
+
+                if unit_of_work.stage(
+                    self._get_unit_of_work_key(), staged_journal, self._prepare_flush
+                ):
+                    return
+
+            self._append(events)
+
+    def _append(self, events: List[Tuple[str, Any]]) -> None:
+        if not events:
+            return
+
+        with self._lock:
+            data = self._get_data()
+
+            lines = []
+
+            for event_type, payload in events:
+                self._sequence += 1
+
+                lines.append(
+                    json.dumps(
+                        {
+                            "sequence": self._sequence,
+                            "type": event_type,
+                            "data": payload,
+                        },
+                        ensure_ascii=False,
+                    )
+                )
+
+                self._apply_event(data, event_type, copy.deepcopy(payload))
+
+            self._get_storage().append_lines(self._journal_path, lines)
+
+            self._journaled_events += len(lines)
+            self._signature = self._get_signature()
+
+            if self._journaled_events >= self._compaction_threshold:
+                self.compact()
+
+    def _prepare_flush(self, staged_journal: _StagedJournal) -> PreparedWrite:
+        # Appending to the log can't be done aside, and only happens once the
+        # other documents of the unit of work are ready.
+        return PreparedWrite(lambda: self._flush(staged_journal))
+
+    def _flush(self, staged_journal: _StagedJournal) -> None:
+        with self._lock:
+            if staged_journal.removed:
+                self._remove()
+
+            self._append(staged_journal.events)
+
+    def compact(self) -> None:
+        """Folds the events of the log into a new snapshot."""
+        with self._lock:
+            data = self._get_data()
+
+            snapshot = dict(data)
+            snapshot[JOURNAL_SEQUENCE_KEY] = self._sequence
+
+            storage = self._get_storage()
+
+            # The new snapshot must be complete before the log gets truncated.
+            storage.write(self._snapshot_path, snapshot)
+            storage.remove(self._journal_path)
+
+            self._journaled_events = 0
+            self._signature = self._get_signature()
+
+    def remove(self) -> None:
+        unit_of_work = UnitOfWork.get_active()
+
+        if unit_of_work is not None and unit_of_work.stage(
+            self._get_unit_of_work_key(),
+            _StagedJournal({}, removed=True),
+            self._prepare_flush,
+        ):
+            return
+
+        self._remove()
+
+    def _remove(self) -> None:
+        with self._lock:
+            storage = self._get_storage()
+
+            for path in (self._snapshot_path, self._journal_path):
+                storage.remove(path)
+
+            self._data = None
+            self._sequence = 0
+            self._journaled_events = 0
+            self._signature = None
+
+
+class JsonJournalRegistry:
+    """Process-wide registry of journals, which share their contents."""
+
+    _shared_instance: Optional["JsonJournalRegistry"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        compaction_threshold: int = JSON_JOURNAL_COMPACTION_THRESHOLD,
+        document_storage_registry: Optional[DocumentStorageRegistry] = None,
+        max_journals: int = MAX_CACHED_JSON_JOURNALS,
+    ):
+        self._compaction_threshold = compaction_threshold
+        self._document_storage_registry = (
+            document_storage_registry or DocumentStorageRegistry.get_shared_instance()
+        )
+        self._max_journals = max_journals
+
+        self._lock = threading.Lock()
+        # The least recently used journals get dropped first. Whoever still
+        # holds one can keep using it, as journals notice changes made by others.
+        self._journals: OrderedDict[Path, JsonJournal] = OrderedDict()
+
+    @classmethod
+    def get_shared_instance(cls) -> "JsonJournalRegistry":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def get_journal(
+        self, snapshot_path: Path, journal_path: Path, apply_event: EventApplier
+    ) -> JsonJournal:
+        key = Path(snapshot_path).resolve()
+
+        with self._lock:
+            journal = self._journals.get(key)
+
+            if journal is not None:
+                self._journals.move_to_end(key)
+                return journal
+
+            journal = JsonJournal(
+                snapshot_path,
+                journal_path,
+                apply_event,
+                self._compaction_threshold,
+                self._document_storage_registry,
+            )
+            self._journals[key] = journal
+
+            while len(self._journals) > self._max_journals:
+                self._journals.popitem(last=False)
+
+            return journal
+
+    def clear(self) -> None:
+        with self._lock:
+            self._journals.clear()
@@ -19,6 +19,9 @@ class PathManager:
     DATA_DIR = BASE_DIR / "data"
     PLAYTHROUGHS_DIR = BASE_DIR / "playthroughs"
     ERRORS_DIR = BASE_DIR / "errors"
+    EMBEDDINGS_CACHE_DIR = BASE_DIR / "embeddings_cache"
+    VOICE_LINE_JOBS_DIR = BASE_DIR / "voice_line_jobs"
+    LLM_RESPONSE_CACHE_DIR = BASE_DIR / "llm_response_cache"
 
     TEMPLATES_DIR = DATA_DIR / "templates"
     PLACES_DIR = DATA_DIR / "places"
@@ -102,6 +105,22 @@ class PathManager:
     def get_errors_path(cls) -> Path:
         return cls.ERRORS_DIR
 
+    @classmethod
+    def get_embeddings_cache_path(cls) -> Path:
+        return cls.EMBEDDINGS_CACHE_DIR
+
+    @classmethod
+    def get_voice_line_jobs_path(cls) -> Path:
+        return cls.VOICE_LINE_JOBS_DIR
+
+    @classmethod
+    def get_voice_lines_path(cls) -> Path:
+        return cls.VOICE_LINES_DIR
+
+    @classmethod
+    def get_llm_response_cache_database_path(cls) -> Path:
+        return cls.LLM_RESPONSE_CACHE_DIR / "responses.sqlite3"
+
     @classmethod
     def get_empty_content_context_path(cls) -> Path:
         return cls.ERRORS_DIR / "empty_content_context.txt"
@@ -363,6 +382,10 @@ class PathManager:
     def get_database_path(cls, playthrough_name: str) -> Path:
         return cls.get_playthrough_path(playthrough_name) / "database"
 
+    @classmethod
+    def get_playthrough_documents_database_path(cls, playthrough_name: str) -> Path:
+        return cls.get_playthrough_path(playthrough_name) / "documents.sqlite3"
+
     @classmethod
     def get_static_playthrough_path(cls, playthrough_name: str) -> Path:
         return cls.STATIC_PLAYTHROUGHS_DIR / f"{playthrough_name}"
@@ -492,6 +515,13 @@ class PathManager:
     def get_ongoing_dialogue_path(cls, playthrough_name: str) -> Path:
         return cls.get_playthrough_path(playthrough_name) / "ongoing_dialogue.json"
 
+    @classmethod
+    def get_ongoing_dialogue_journal_path(cls, playthrough_name: str) -> Path:
+        return (
+            cls.get_playthrough_path(playthrough_name)
+            / "ongoing_dialogue.journal.jsonl"
+        )
+
     @classmethod
     def get_voice_line_path(cls, character_name: str, voice_model: str) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -0,0 +1,138 @@
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from src.base.enums import StorageBackend
+from src.base.exceptions import PlaythroughStorageMigrationError
+from src.base.validators import validate_non_empty_string
+from src.filesystem.document_storage import (
+    JsonFileDocumentStorage,
+    SqliteDocumentStorage,
+)
+from src.filesystem.path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+
+class PlaythroughStorageMigrator:
+    """Moves a playthrough's documents between JSON files and SQLite."""
+
+    def __init__(self, path_manager: Optional[PathManager] = None):
+        self._path_manager = path_manager or PathManager()
+
+        self._json_file_storage = JsonFileDocumentStorage()
+
+    def _get_document_paths(self, playthrough_name: str) -> List[Path]:
+        return [
+            self._path_manager.get_playthrough_metadata_path(playthrough_name),
+            self._path_manager.get_map_path(playthrough_name),
+            self._path_manager.get_characters_file_path(playthrough_name),
+            self._path_manager.get_concepts_file_path(playthrough_name),
+            self._path_manager.get_ongoing_dialogue_path(playthrough_name),
+        ]
+
+    def _get_journal_paths(self, playthrough_name: str) -> List[Path]:
+        return [self._path_manager.get_ongoing_dialogue_journal_path(playthrough_name)]
+
+    @staticmethod
+    def _remove_database_files(database_path: Path) -> None:
+        for suffix in ("", "-wal", "-shm"):
+            path = database_path.with_name(database_path.name + suffix)
+
+            if path.exists():
+                os.remove(path)
+
+    def _validate_playthrough_exists(self, playthrough_name: str) -> None:
+        if not self._path_manager.get_playthrough_path(playthrough_name).exists():
+            raise PlaythroughStorageMigrationError(
+                f"There is no playthrough named '{playthrough_name}'."
+            )
+
+    def migrate_to_sqlite(self, playthrough_name: str) -> None:
+        validate_non_empty_string(playthrough_name, "playthrough_name")
+
+        self._validate_playthrough_exists(playthrough_name)
+
+        database_path = self._path_manager.get_playthrough_documents_database_path(
+            playthrough_name
+        )
+
+        if database_path.exists():
+            raise PlaythroughStorageMigrationError(
+                f"The playthrough '{playthrough_name}' is already stored in '{database_path}'."
+            )
+
+        # The playthrough only switches to the database once it's complete.
+        temporary_database_path = database_path.with_name(f"{database_path.name}.tmp")
+        self._remove_database_files(temporary_database_path)
+
+        sqlite_storage = SqliteDocumentStorage(
+            playthrough_name, self._path_manager, temporary_database_path
+        )
+
+        try:
+            sqlite_storage.initialize()
+
+            for document_path in self._get_document_paths(playthrough_name):
+                if self._json_file_storage.exists(document_path):
+                    sqlite_storage.write(
+                        document_path, self._json_file_storage.read(document_path)
+                    )
+
+            for journal_path in self._get_journal_paths(playthrough_name):
+                sqlite_storage.append_lines(
+                    journal_path, self._json_file_storage.read_lines(journal_path)
+                )
+        finally:
+            sqlite_storage.close()
+
+        os.replace(temporary_database_path, database_path)
+
+        for path in self._get_document_paths(
+            playthrough_name
+        ) + self._get_journal_paths(playthrough_name):
+            self._json_file_storage.remove(path)
+
+        logger.info(f"Migrated playthrough '{playthrough_name}' to '{database_path}'.")
+
+    def migrate_to_json(self, playthrough_name: str) -> None:
+        validate_non_empty_string(playthrough_name, "playthrough_name")
+
+        self._validate_playthrough_exists(playthrough_name)
+
+        database_path = self._path_manager.get_playthrough_documents_database_path(
+            playthrough_name
+        )
+
+        if not database_path.exists():
+            raise PlaythroughStorageMigrationError(
+                f"The playthrough '{playthrough_name}' is already stored in JSON files."
+            )
+
+        sqlite_storage = SqliteDocumentStorage(playthrough_name, self._path_manager)
+
+        try:
+            for document_path in self._get_document_paths(playthrough_name):
+                if sqlite_storage.exists(document_path):
+                    self._json_file_storage.write(
+                        document_path, sqlite_storage.read(document_path)
+                    )
+
+            for journal_path in self._get_journal_paths(playthrough_name):
+                self._json_file_storage.remove(journal_path)
+                self._json_file_storage.append_lines(
+                    journal_path, sqlite_storage.read_lines(journal_path)
+                )
+        finally:
+            sqlite_storage.close()
+
+        self._remove_database_files(database_path)
+
+        logger.info(f"Migrated playthrough '{playthrough_name}' to JSON files.")
+
+    def migrate(self, playthrough_name: str, storage_backend: StorageBackend) -> None:
+        if storage_backend == StorageBackend.SQLITE:
+            self.migrate_to_sqlite(playthrough_name)
+        else:
+            self.migrate_to_json(playthrough_name)
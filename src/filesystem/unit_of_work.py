@@ -0,0 +1,142 @@
+import contextvars
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_active_unit_of_work: contextvars.ContextVar[Optional["UnitOfWork"]] = (
+    contextvars.ContextVar("active_unit_of_work", default=None)
+)
+
+
+def _do_nothing() -> None:
+    pass
+
+
+@dataclass
+class PreparedWrite:
+    """A write to a document that has done all the work that could fail, and
+    only needs to be applied."""
+
+    apply: Callable[[], None]
+    discard: Callable[[], None] = _do_nothing
+
+
+@dataclass
+class StagedWrite:
+    data: Any
+    prepare: Callable[[Any], PreparedWrite]
+
+
+class UnitOfWork:
+    """Buffers the writes to documents made while handling a single request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._staged_writes: Dict[Hashable, StagedWrite] = {}
+        self._is_open = True
+        self._token: Optional[contextvars.Token] = None
+
+    @classmethod
+    def begin(cls) -> "UnitOfWork":
+        unit_of_work = cls()
+        unit_of_work._token = _active_unit_of_work.set(unit_of_work)
+
+        return unit_of_work
+
+    @staticmethod
+    def get_active() -> Optional["UnitOfWork"]:
+        unit_of_work = _active_unit_of_work.get()
+
+        if unit_of_work is None or not unit_of_work.is_open():
+            return None
+
+        return unit_of_work
+
+    def __enter__(self) -> "UnitOfWork":
+        self._token = _active_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, exception_type, exception, traceback) -> None:
+        try:
+            if exception_type is None:
+                self.commit()
+        finally:
+            self.close()
+
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def get_staged(self, key: Hashable) -> Optional[StagedWrite]:
+        with self._lock:
+            return self._staged_writes.get(key)
+
+    def stage(
+        self, key: Hashable, data: Any, prepare: Callable[[Any], PreparedWrite]
+    ) -> bool:
+        """Stages the latest contents of a document, along with how to write
+        them. Returns False if the unit of work is already finished, in which
+        case the caller must write the document itself."""
+        with self._lock:
+            if not self._is_open:
+                return False
+
+            self._staged_writes[key] = StagedWrite(data, prepare)
+
+            return True
+
+    def commit(self) -> None:
+        with self._lock:
+            if not self._is_open:
+                return
+
+            # From now on, writes from other threads of the request go to disk.
+            self._is_open = False
+
+            staged_writes = list(self._staged_writes.values())
+            self._staged_writes.clear()
+
+        # Every document gets written aside before any of them is replaced, so
+        # that a failure leaves them all as they were.
+        prepared_writes = []
+
+        try:
+            for staged_write in staged_writes:
+                prepared_writes.append(staged_write.prepare(staged_write.data))
+        except BaseException:
+            for prepared_write in prepared_writes:
+                prepared_write.discard()
+
+            raise
+
+        for prepared_write in prepared_writes:
+            prepared_write.apply()
+
+        if staged_writes:
+            logger.debug("Flushed %s documents.", len(staged_writes))
+
+    def rollback(self) -> None:
+        with self._lock:
+            if self._staged_writes:
+                logger.warning(
+                    "Discarded the changes to %s documents.", len(self._staged_writes)
+                )
+
+            self._is_open = False
+            self._staged_writes.clear()
+
+    def close(self) -> None:
+        """Ends the unit of work, dropping whatever wasn't committed."""
+        self.rollback()
+
+        if self._token is not None:
+            try:
+                _active_unit_of_work.reset(self._token)
+            except ValueError:
+                # Closed from another context than the one that began it. The
+                # unit of work is no longer open anyway.
+                pass
+
+            self._token = None
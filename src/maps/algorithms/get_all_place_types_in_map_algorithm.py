@@ -26,13 +26,13 @@ class GetAllPlaceTypesInMapAlgorithm:
         Returns:
             List[Dict[str, str]]: A list of dictionaries with 'identifier' and 'place_template' keys.
         """
-        map_data = self._map_repository.load_map_data()
         places = []
-        for identifier, data in map_data.items():
-            if data.get("type") == self._place_type.value:
-                place_info = {
-                    "identifier": identifier,
-                    "place_template": data.get("place_template"),
-                }
-                places.append(place_info)
+        for identifier, place in self._map_repository.get_places_of_type(
+            self._place_type
+        ).items():
+            place_info = {
+                "identifier": identifier,
+                "place_template": place.get("place_template"),
+            }
+            places.append(place_info)
         return places
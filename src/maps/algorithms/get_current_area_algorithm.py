@@ -1,6 +1,5 @@
 from typing import Optional, Dict, Any
 
-from src.base.constants import PARENT_KEYS
 from src.base.enums import TemplateType
 from src.base.playthrough_manager import PlaythroughManager
 from src.base.validators import validate_non_empty_string
@@ -26,7 +25,7 @@ class GetCurrentAreaAlgorithm:
         self._map_repository = map_repository or MapRepository(playthrough_name)
 
     def do_algorithm(self) -> Dict[str, Any]:
-        map_file = self._map_repository.load_map_data()
+        map_index = self._map_repository.load_map_index()
 
         place_manager = self._place_manager_factory.create_place_manager()
 
@@ -37,24 +36,19 @@ class GetCurrentAreaAlgorithm:
         )
 
         if current_place_type == TemplateType.AREA:
-            return map_file[current_place_identifier]
-
-        if current_place_type == TemplateType.LOCATION:
-            current_area_identifier = map_file[current_place_identifier][
-                PARENT_KEYS.get(current_place_type)
-            ]
-
-            return map_file[current_area_identifier]
-
-        if current_place_type == TemplateType.ROOM:
-            current_location_identifier = map_file[current_place_identifier][
-                PARENT_KEYS.get(current_place_type)
-            ]
-
-            current_area_identifier = map_file[current_location_identifier][
-                PARENT_KEYS.get(TemplateType.LOCATION)
-            ]
-
-            return map_file[current_area_identifier]
-
-        raise ValueError(f"Not handled for current place type '{current_place_type}'.")
+            current_area_identifier = current_place_identifier
+        elif current_place_type in (TemplateType.LOCATION, TemplateType.ROOM):
+            current_area_identifier = map_index.get_ancestor_identifier_of_type(
+                current_place_identifier, TemplateType.AREA
+            )
+        else:
+            raise ValueError(
+                f"Not handled for current place type '{current_place_type}'."
+            )
+
+        current_area = map_index.get_place(current_area_identifier)
+
+        if current_area is None:
+            raise KeyError(current_area_identifier)
+
+        return current_area
@@ -1,6 +1,5 @@
 from typing import Optional
 
-from src.base.constants import PARENT_KEYS
 from src.base.enums import TemplateType
 from src.base.playthrough_manager import PlaythroughManager
 from src.base.validators import validate_non_empty_string
@@ -38,22 +37,11 @@ class GetCurrentAreaIdentifierAlgorithm:
         if current_place_type == TemplateType.AREA:
             return current_place_identifier
 
-        map_data = self._map_repository.load_map_data()
-
-        if current_place_type == TemplateType.LOCATION:
-            current_area_identifier = map_data[current_place_identifier][
-                PARENT_KEYS.get(current_place_type)
-            ]
-            return current_area_identifier
-
-        if current_place_type == TemplateType.ROOM:
-            # We must traverse to the containing location, then grab its area.
-            map_data = self._map_repository.load_map_data()
-            current_location_identifier = map_data[current_place_identifier][
-                PARENT_KEYS.get(current_place_type)
-            ]
-            return map_data[current_location_identifier][
-                PARENT_KEYS.get(TemplateType.LOCATION)
-            ]
+        map_index = self._map_repository.load_map_index()
+
+        if current_place_type in (TemplateType.LOCATION, TemplateType.ROOM):
+            return map_index.get_ancestor_identifier_of_type(
+                current_place_identifier, TemplateType.AREA
+            )
 
         raise ValueError(f"Not handled for current place type '{current_place_type}'.")
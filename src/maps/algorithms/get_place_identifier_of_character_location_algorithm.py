@@ -20,12 +20,14 @@ class GetPlaceIdentifierOfCharacterLocationAlgorithm:
         self._map_repository = map_repository or MapRepository(playthrough_name)
 
     def do_algorithm(self) -> str:
-        map_file = self._map_repository.load_map_data()
+        place_identifier = (
+            self._map_repository.load_map_index().get_place_identifier_of_character(
+                self._character_identifier
+            )
+        )
 
-        for identifier, data in map_file.items():
-            if "characters" in data:
-                if self._character_identifier in data["characters"]:
-                    return identifier
+        if place_identifier:
+            return place_identifier
 
         raise CharacterNotFoundError(
             f"Couldn't find character '{self._character_identifier}' in the map. Maybe it's the protagonist?"
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Dict, Any, Optional
 
+from src.base.constants import PARENT_KEYS
 from src.base.enums import TemplateType
 from src.base.validators import validate_non_empty_string
 from src.maps.map_repository import MapRepository
@@ -29,11 +30,21 @@ class GetPlacesInPlaceAlgorithm:
         self._map_repository = map_repository or MapRepository(playthrough_name)
 
     def do_algorithm(self) -> List[Dict[str, Any]]:
-        map_file = self._map_repository.load_map_data()
-
         contained_places = []
 
-        for identifier, data in map_file.items():
+        if (
+            PARENT_KEYS.get(self._contained_place_type)
+            == self._containing_place_type.value
+        ):
+            candidate_places = self._map_repository.get_child_places(
+                self._containing_place_identifier, self._contained_place_type
+            )
+        else:
+            candidate_places = self._map_repository.get_places_of_type(
+                self._contained_place_type
+            )
+
+        for identifier, data in candidate_places.items():
             if not data:
                 raise ValueError(f"Found no data for place identifier '{identifier}'.")
 
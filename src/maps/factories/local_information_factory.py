@@ -1,13 +1,15 @@
 from typing import Optional
 
 from src.base.playthrough_manager import PlaythroughManager
-from src.filesystem.file_operations import read_file
 from src.filesystem.path_manager import PathManager
 from src.maps.algorithms.get_current_weather_identifier_algorithm import (
     GetCurrentWeatherIdentifierAlgorithm,
 )
 from src.maps.place_description_manager import PlaceDescriptionManager
 from src.maps.weathers_manager import WeathersManager
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
 from src.time.time_manager import TimeManager
 
 
@@ -22,6 +24,7 @@ class LocalInformationFactory:
         time_manager: Optional[TimeManager] = None,
         playthrough_manager: Optional[PlaythroughManager] = None,
         path_manager: Optional[PathManager] = None,
+        prompt_template_repository: Optional[PromptTemplateRepository] = None,
     ):
         self._playthrough_name = playthrough_name
         self._get_current_weather_identifier_algorithm = (
@@ -35,14 +38,15 @@ class LocalInformationFactory:
             self._playthrough_name
         )
         self._path_manager = path_manager or PathManager()
+        self._prompt_template_repository = (
+            prompt_template_repository or PromptTemplateRepository.get_shared_instance()
+        )
 
     def get_information(self) -> str:
         setting_description = self._place_description_manager.get_place_description(
             self._playthrough_manager.get_current_place_identifier()
         )
 
-        local_information = read_file(self._path_manager.get_local_information_path())
-
         party_data_for_prompt = {
             "setting_description": setting_description,
             "hour": self._time_manager.get_hour(),
@@ -52,4 +56,6 @@ class LocalInformationFactory:
             ),
         }
 
-        return local_information.format(**party_data_for_prompt)
+        return self._prompt_template_repository.get_template(
+            self._path_manager.get_local_information_path()
+        ).format(**party_data_for_prompt)
@@ -21,12 +21,9 @@ class HierarchyManager:
             "room": None,
         }
 
-        current_place_id = place_identifier
-
-        while current_place_id:
-            place = self._place_manager.get_place(current_place_id)
-            place_type = self._place_manager.determine_place_type(current_place_id)
-
+        for place_type, place in self._place_manager.get_place_lineage(
+            place_identifier
+        ):
             if place_type == TemplateType.WORLD:
                 hierarchy[place_type.value] = place
                 break
@@ -37,11 +34,6 @@ class HierarchyManager:
                 or place_type == TemplateType.LOCATION
                 or place_type == TemplateType.ROOM
             ):
-                if not place:
-                    raise ValueError(
-                        f"Didn't have a 'place' for place type '{place_type}'."
-                    )
-
                 hierarchy[place_type.value] = place
 
                 parent_key = PARENT_KEYS.get(place_type)
@@ -50,8 +42,6 @@ class HierarchyManager:
                     raise KeyError(
                         f"The parent key '{parent_key}' wasn't present in the place data: {place}"
                     )
-
-                current_place_id = place.get(parent_key)
             else:
                 raise ValueError(f"Unhandled place type '{place_type.value}'.")
 
@@ -0,0 +1,306 @@
+import copy
+import logging
+from typing import Dict, List, Optional, Any, Iterable
+
+from src.base.constants import PARENT_KEYS
+from src.base.enums import TemplateType
+from src.maps.enums import CardinalDirection
+
+logger = logging.getLogger(__name__)
+
+
+class MapIndex:
+    """Read-only indexes over the contents of a map.json document."""
+
+    def __init__(self, map_data: Dict[str, Dict[str, Any]]):
+        self._places: Dict[str, Dict[str, Any]] = map_data
+
+        self._children_by_parent: Dict[str, List[str]] = {}
+        self._identifiers_by_type: Dict[str, List[str]] = {}
+        self._cardinal_connections: Dict[str, Dict[str, str]] = {}
+        self._place_of_character: Dict[str, str] = {}
+        self._ancestors: Dict[str, List[str]] = {}
+
+        for place_identifier, place in self._places.items():
+            self._index_place(place_identifier, place)
+
+        self._compute_ancestors(self._places.keys())
+
+    @staticmethod
+    def get_parent_identifier(place: Dict[str, Any]) -> Optional[str]:
+        parent_key = MapIndex._get_parent_key(place)
+
+        return place.get(parent_key) if parent_key else None
+
+    @staticmethod
+    def _append_to_index(
+        index: Dict[str, List[str]], key: str, value: str, copy_on_write: bool
+    ) -> None:
+        if copy_on_write:
+            # The lists may still be shared with the index this one derives from.
+            index[key] = index.get(key, []) + [value]
+        else:
+            index.setdefault(key, []).append(value)
+
+    def _index_place(
+        self,
+        place_identifier: str,
+        place: Dict[str, Any],
+        copy_on_write: bool = False,
+        index_position: bool = True,
+    ) -> None:
+        # Whoever looks the place up gets to fail on it, rather than everyone
+        # who needs the index.
+        if not place:
+            logger.warning(
+                f"Found no data for place identifier '{place_identifier}'. Leaving it out of the index."
+            )
+            return
+
+        # The lists of places by type and by parent keep the order of the map.
+        if index_position:
+            self._append_to_index(
+                self._identifiers_by_type,
+                place.get("type"),
+                place_identifier,
+                copy_on_write,
+            )
+
+            parent_identifier = self.get_parent_identifier(place)
+
+            if parent_identifier:
+                self._append_to_index(
+                    self._children_by_parent,
+                    parent_identifier,
+                    place_identifier,
+                    copy_on_write,
+                )
+
+        connections = {
+            direction.value: place[direction.value]
+            for direction in CardinalDirection
+            if direction.value in place
+        }
+
+        if connections:
+            self._cardinal_connections[place_identifier] = connections
+
+        for character_identifier in place.get("characters", []):
+            self._place_of_character[character_identifier] = place_identifier
+
+    def _unindex_place(
+        self,
+        place_identifier: str,
+        place: Dict[str, Any],
+        unindex_position: bool = True,
+    ) -> None:
+        if unindex_position:
+            place_type = place.get("type")
+
+            self._identifiers_by_type[place_type] = [
+                identifier
+                for identifier in self._identifiers_by_type.get(place_type, [])
+                if identifier != place_identifier
+            ]
+
+            parent_identifier = self.get_parent_identifier(place)
+
+            if parent_identifier:
+                self._children_by_parent[parent_identifier] = [
+                    identifier
+                    for identifier in self._children_by_parent.get(
+                        parent_identifier, []
+                    )
+                    if identifier != place_identifier
+                ]
+
+        self._cardinal_connections.pop(place_identifier, None)
+
+        for character_identifier in place.get("characters", []):
+            if self._place_of_character.get(character_identifier) == place_identifier:
+                self._place_of_character.pop(character_identifier)
+
+    def _compute_ancestors(self, place_identifiers: Iterable[str]) -> None:
+        for place_identifier in place_identifiers:
+            ancestors = []
+            visited = {place_identifier}
+
+            parent_identifier = self.get_parent_identifier(
+                self._places[place_identifier]
+            )
+
+            while parent_identifier and parent_identifier not in visited:
+                ancestors.append(parent_identifier)
+                visited.add(parent_identifier)
+
+                parent = self._places.get(parent_identifier)
+
+                if not parent:
+                    logger.warning(
+                        f"Place '{place_identifier}' has an ancestor '{parent_identifier}' that isn't in the map."
+                    )
+                    break
+
+                parent_identifier = self.get_parent_identifier(parent)
+
+            self._ancestors[place_identifier] = ancestors
+
+    def with_changes(self, map_data: Dict[str, Dict[str, Any]]) -> "MapIndex":
+        """Returns a new index for the given map data, reindexing only the places
+        that differ from the ones in this index."""
+        changed_identifiers = [
+            place_identifier
+            for place_identifier, place in map_data.items()
+            if self._places.get(place_identifier) != place
+        ]
+        removed_identifiers = [
+            place_identifier
+            for place_identifier in self._places
+            if place_identifier not in map_data
+        ]
+
+        new_index = MapIndex.__new__(MapIndex)
+        new_index._places = map_data
+        new_index._children_by_parent = dict(self._children_by_parent)
+        new_index._identifiers_by_type = dict(self._identifiers_by_type)
+        new_index._cardinal_connections = dict(self._cardinal_connections)
+        new_index._place_of_character = dict(self._place_of_character)
+        new_index._ancestors = dict(self._ancestors)
+
+        hierarchy_changed = bool(removed_identifiers)
+
+        # The places that keep their type and parent keep their position in
+        # the lists as well.
+        unmoved_identifiers = set()
+
+        for place_identifier in removed_identifiers + changed_identifiers:
+            old_place = self._places.get(place_identifier)
+
+            if old_place is None:
+                continue
+
+            new_place = map_data.get(place_identifier, {})
+
+            if self.get_parent_identifier(old_place) != self.get_parent_identifier(
+                new_place
+            ):
+                hierarchy_changed = True
+            elif place_identifier in map_data and old_place.get(
+                "type"
+            ) == new_place.get("type"):
+                unmoved_identifiers.add(place_identifier)
+
+            new_index._unindex_place(
+                place_identifier,
+                old_place,
+                unindex_position=place_identifier not in unmoved_identifiers,
+            )
+            new_index._ancestors.pop(place_identifier, None)
+
+        for place_identifier in changed_identifiers:
+            new_index._index_place(
+                place_identifier,
+                map_data[place_identifier],
+                copy_on_write=True,
+                index_position=place_identifier not in unmoved_identifiers,
+            )
+
+        if hierarchy_changed:
+            new_index._ancestors = {}
+            new_index._compute_ancestors(map_data.keys())
+        else:
+            new_index._compute_ancestors(
+                place_identifier
+                for place_identifier in changed_identifiers
+                if place_identifier not in new_index._ancestors
+            )
+
+        return new_index
+
+    def has_place(self, place_identifier: str) -> bool:
+        return place_identifier in self._places
+
+    def get_place(self, place_identifier: str) -> Optional[Dict[str, Any]]:
+        place = self._places.get(place_identifier)
+
+        return copy.deepcopy(place) if place is not None else None
+
+    def get_place_type(self, place_identifier: str) -> Optional[str]:
+        place = self._places.get(place_identifier)
+
+        return place.get("type") if place is not None else None
+
+    def get_place_identifiers_of_type(self, place_type: TemplateType) -> List[str]:
+        return list(self._identifiers_by_type.get(place_type.value, []))
+
+    def get_children_identifiers(
+        self, parent_identifier: str, child_type: Optional[TemplateType] = None
+    ) -> List[str]:
+        children = self._children_by_parent.get(parent_identifier, [])
+
+        if child_type is None:
+            return list(children)
+
+        return [
+            child_identifier
+            for child_identifier in children
+            if self._places[child_identifier].get("type") == child_type.value
+        ]
+
+    def get_ancestor_identifiers(self, place_identifier: str) -> List[str]:
+        """Returns the identifiers of the place's ancestors, from its direct parent
+        up to the world."""
+        if place_identifier not in self._ancestors:
+            raise ValueError(f"Place ID '{place_identifier}' not found.")
+
+        return list(self._ancestors[place_identifier])
+
+    @staticmethod
+    def _get_parent_key(place: Dict[str, Any]) -> Optional[str]:
+        try:
+            return PARENT_KEYS.get(TemplateType(place.get("type")))
+        except ValueError:
+            return None
+
+    def get_ancestor_identifier_of_type(
+        self, place_identifier: str, place_type: TemplateType
+    ) -> str:
+        """Returns the closest ancestor of the place that is of the given type.
+        If the chain of ancestors breaks before reaching one, raises a KeyError
+        with the parent key (or the place) missing from the map."""
+        if place_identifier not in self._places:
+            raise KeyError(place_identifier)
+
+        lineage = [place_identifier] + self._ancestors[place_identifier]
+
+        # The parent keys are named after the type of the parent.
+        for identifier, parent_identifier in zip(lineage, lineage[1:]):
+            if self._get_parent_key(self._places[identifier]) == place_type.value:
+                return parent_identifier
+
+        last_place = self._places.get(lineage[-1])
+
+        if last_place is None:
+            raise KeyError(lineage[-1])
+
+        parent_key = self._get_parent_key(last_place)
+
+        if not parent_key:
+            raise ValueError(
+                f"Place '{place_identifier}' has no ancestor of type '{place_type.value}'."
+            )
+
+        raise KeyError(parent_key)
+
+    def get_cardinal_connections(self, place_identifier: str) -> Dict[str, str]:
+        return dict(self._cardinal_connections.get(place_identifier, {}))
+
+    def get_place_identifier_of_character(
+        self, character_identifier: str
+    ) -> Optional[str]:
+        return self._place_of_character.get(character_identifier)
+
+    def get_characters_at_place(self, place_identifier: str) -> List[str]:
+        place = self._places.get(place_identifier) or {}
+
+        return list(place.get("characters", []))
@@ -1,32 +1,206 @@
-from typing import Optional, Dict
+import copy
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Tuple, List
+from weakref import WeakKeyDictionary
 
-from src.filesystem.file_operations import (
-    read_json_file,
-    write_json_file,
-    create_empty_json_file_if_not_exists,
+from src.base.enums import TemplateType
+from src.filesystem.document_storage import (
+    DocumentStorageRegistry,
+    SqliteDocumentStorage,
 )
+from src.filesystem.json_file_cache import JsonFileCache, FileSignature
 from src.filesystem.path_manager import PathManager
+from src.filesystem.unit_of_work import StagedWrite, UnitOfWork
+from src.maps.map_index import MapIndex
 
 
 class MapRepository:
+    # Map indexes are shared by every repository in the process, keyed by the
+    # path of the map file, and tagged with the signature of the file version
+    # they were built from.
+    _map_indexes: Dict[Path, Tuple[FileSignature, MapIndex]] = {}
+    _map_indexes_lock = threading.Lock()
+
+    # The indexes of the maps staged in each unit of work, tagged with the
+    # staged write they were built from. They go away along with their unit.
+    _staged_map_indexes: (
+        "WeakKeyDictionary[UnitOfWork, Dict[Path, Tuple[StagedWrite, MapIndex]]]"
+    ) = WeakKeyDictionary()
 
     def __init__(
-        self, playthrough_name: str, path_manager: Optional[PathManager] = None
+        self,
+        playthrough_name: str,
+        path_manager: Optional[PathManager] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
+        document_storage_registry: Optional[DocumentStorageRegistry] = None,
     ):
         self._playthrough_name = playthrough_name
 
         self._path_manager = path_manager or PathManager()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
+        self._document_storage_registry = (
+            document_storage_registry or DocumentStorageRegistry.get_shared_instance()
+        )
+
+    def _get_map_path(self) -> Path:
+        return self._path_manager.get_map_path(self._playthrough_name)
 
     def initialize_map_data(self) -> None:
-        map_path = self._path_manager.get_map_path(self._playthrough_name)
+        map_path = self._get_map_path()
 
-        create_empty_json_file_if_not_exists(map_path)
+        if not self._json_file_cache.exists(map_path):
+            self._json_file_cache.write(map_path, {})
 
     def load_map_data(self) -> Dict:
-        return read_json_file(self._path_manager.get_map_path(self._playthrough_name))
+        return self._json_file_cache.read(self._get_map_path())
+
+    def _get_staged_map_indexes(
+        self,
+    ) -> Dict[Path, Tuple[StagedWrite, MapIndex]]:
+        unit_of_work = UnitOfWork.get_active()
+
+        # The unit of work may have finished since the write was staged.
+        if unit_of_work is None:
+            return {}
+
+        return self._staged_map_indexes.setdefault(unit_of_work, {})
+
+    def _load_staged_map_index(
+        self, map_path: Path, staged_write: StagedWrite
+    ) -> MapIndex:
+        with self._map_indexes_lock:
+            staged_map_indexes = self._get_staged_map_indexes()
+
+            cached_index = staged_map_indexes.get(map_path)
+
+            if cached_index and cached_index[0] is staged_write:
+                return cached_index[1]
+
+            # The staged data is a private copy that nobody modifies.
+            map_index = MapIndex(staged_write.data)
+
+            staged_map_indexes[map_path] = (staged_write, map_index)
+
+            return map_index
+
+    def load_map_index(self) -> MapIndex:
+        map_path = self._get_map_path()
+
+        # The shared indexes only reflect what's on disk.
+        staged_write = self._json_file_cache.get_pending_write(map_path)
+
+        if staged_write is not None:
+            return self._load_staged_map_index(map_path, staged_write)
+
+        with self._map_indexes_lock:
+            signature = self._json_file_cache.get_signature(map_path)
+
+            cached_index = self._map_indexes.get(map_path)
+
+            if cached_index and cached_index[0] == signature:
+                return cached_index[1]
+
+            map_index = MapIndex(self._json_file_cache.read(map_path))
+
+            self._map_indexes[map_path] = (signature, map_index)
+
+            return map_index
+
+    def _get_indexed_storage(self) -> Optional[SqliteDocumentStorage]:
+        """Returns the database of the playthrough if it holds the current map,
+        which it indexes by type, parent and characters."""
+        map_path = self._get_map_path()
+
+        # The database doesn't know about the changes staged in a unit of work.
+        if self._json_file_cache.has_pending_write(map_path):
+            return None
+
+        storage = self._document_storage_registry.get_storage(map_path)
+
+        return storage if isinstance(storage, SqliteDocumentStorage) else None
+
+    def get_places_of_type(self, place_type: TemplateType) -> Dict[str, Dict]:
+        storage = self._get_indexed_storage()
+
+        if storage is not None:
+            return storage.read_places_of_type(place_type.value)
+
+        map_index = self.load_map_index()
+
+        return {
+            place_identifier: map_index.get_place(place_identifier)
+            for place_identifier in map_index.get_place_identifiers_of_type(place_type)
+        }
+
+    def get_child_places(
+        self, parent_identifier: str, child_type: Optional[TemplateType] = None
+    ) -> Dict[str, Dict]:
+        storage = self._get_indexed_storage()
+
+        if storage is not None:
+            return storage.read_child_places(
+                parent_identifier, child_type.value if child_type else None
+            )
+
+        map_index = self.load_map_index()
+
+        return {
+            place_identifier: map_index.get_place(place_identifier)
+            for place_identifier in map_index.get_children_identifiers(
+                parent_identifier, child_type
+            )
+        }
+
+    def get_characters_at_place(self, place_identifier: str) -> List[str]:
+        storage = self._get_indexed_storage()
+
+        if storage is not None:
+            return storage.read_characters_at_place(place_identifier)
+
+        return self.load_map_index().get_characters_at_place(place_identifier)
 
     def save_map_data(self, map_data: Dict):
-        write_json_file(
-            self._path_manager.get_map_path(self._playthrough_name),
-            map_data,
-        )
+        map_path = self._get_map_path()
+
+        with self._map_indexes_lock:
+            self._json_file_cache.write(map_path, map_data)
+
+            # Staged in the active unit of work, so it isn't on disk yet.
+            staged_write = self._json_file_cache.get_pending_write(map_path)
+
+            if staged_write is not None:
+                staged_map_indexes = self._get_staged_map_indexes()
+
+                # Derived from the previously staged version, if any.
+                cached_index = staged_map_indexes.get(map_path)
+
+                if cached_index is None:
+                    cached_index = self._map_indexes.get(map_path)
+
+                staged_map_indexes[map_path] = (
+                    staged_write,
+                    (
+                        cached_index[1].with_changes(staged_write.data)
+                        if cached_index
+                        else MapIndex(staged_write.data)
+                    ),
+                )
+                return
+
+            # The index owns its own copy, given that callers tend to keep
+            # mutating the map data they saved.
+            map_data = copy.deepcopy(map_data)
+
+            cached_index = self._map_indexes.get(map_path)
+
+            map_index = (
+                cached_index[1].with_changes(map_data)
+                if cached_index
+                else MapIndex(map_data)
+            )
+
+            self._map_indexes[map_path] = (
+                self._json_file_cache.get_signature(map_path),
+                map_index,
+            )
@@ -14,16 +14,17 @@ class NavigationManager:
         self._map_repository = map_repository
 
     def does_area_have_cardinal_connection(
-            self, area_identifier: str, cardinal_direction: CardinalDirection
+        self, area_identifier: str, cardinal_direction: CardinalDirection
     ) -> bool:
-        map_data = self._map_repository.load_map_data()
-        area_entry = map_data.get(area_identifier)
-        if not area_entry or area_entry.get("type") != TemplateType.AREA.value:
+        map_index = self._map_repository.load_map_index()
+        if map_index.get_place_type(area_identifier) != TemplateType.AREA.value:
             raise ValueError(f"'{area_identifier}' is not a valid area.")
-        return cardinal_direction.value in area_entry
+        return cardinal_direction.value in map_index.get_cardinal_connections(
+            area_identifier
+        )
 
     def get_cardinal_connections(
-            self, area_identifier: str
+        self, area_identifier: str
     ) -> Dict[str, Optional[Dict[str, str]]]:
         """
         Retrieve the cardinal connections for a given area.
@@ -36,19 +37,20 @@ class NavigationManager:
             ('north', 'south', 'east', 'west') and values as dictionaries containing 'identifier' and 'place_template'
             of the connected areas, or None if there is no connection in that direction.
         """
-        map_file = self._map_repository.load_map_data()
-        if area_identifier not in map_file:
+        map_index = self._map_repository.load_map_index()
+        if not map_index.has_place(area_identifier):
             raise ValueError(f"Area identifier '{area_identifier}' not found in map.")
-        area_entry = map_file[area_identifier]
-        if area_entry.get("type") != TemplateType.AREA.value:
+        area_type = map_index.get_place_type(area_identifier)
+        if area_type != TemplateType.AREA.value:
             raise ValueError(
-                f"The given identifier '{area_identifier}' is not an area, but a '{area_entry.get('type')}'."
+                f"The given identifier '{area_identifier}' is not an area, but a '{area_type}'."
             )
+        cardinal_connections = map_index.get_cardinal_connections(area_identifier)
         result = {}
         for direction in [d for d in CardinalDirection]:
-            connected_area_id = area_entry.get(direction.value)
+            connected_area_id = cardinal_connections.get(direction.value)
             if connected_area_id:
-                connected_area = map_file.get(connected_area_id)
+                connected_area = map_index.get_place(connected_area_id)
                 if not connected_area:
                     logger.warning(
                         f"Connected area '{connected_area_id}' not found in map."
@@ -69,10 +71,10 @@ class NavigationManager:
         return result
 
     def create_cardinal_connection(
-            self,
-            cardinal_direction: CardinalDirection,
-            origin_identifier: str,
-            destination_identifier: str,
+        self,
+        cardinal_direction: CardinalDirection,
+        origin_identifier: str,
+        destination_identifier: str,
     ):
         map_data = self._map_repository.load_map_data()
         if cardinal_direction.value in map_data[origin_identifier]:
@@ -84,7 +86,7 @@ class NavigationManager:
 
     @staticmethod
     def get_opposite_cardinal_direction(
-            cardinal_direction: CardinalDirection,
+        cardinal_direction: CardinalDirection,
     ) -> CardinalDirection:
         if cardinal_direction == CardinalDirection.NORTH:
             return CardinalDirection.SOUTH
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.base.enums import TemplateType
 from src.base.playthrough_manager import PlaythroughManager
@@ -25,8 +25,7 @@ class PlaceManager:
         )
 
     def get_place(self, place_identifier: str) -> Dict:
-        map_data = self._map_repository.load_map_data()
-        place = map_data.get(place_identifier)
+        place = self._map_repository.load_map_index().get_place(place_identifier)
         if not place:
             raise ValueError(f"Place ID '{place_identifier}' not found.")
         return place
@@ -42,9 +41,8 @@ class PlaceManager:
             )
         return template
 
-    def determine_place_type(self, place_identifier: str) -> TemplateType:
-        place = self.get_place(place_identifier)
-        place_type_str = place.get("type")
+    @staticmethod
+    def _to_place_type(place_identifier: str, place_type_str: str) -> TemplateType:
         try:
             return TemplateType(place_type_str)
         except ValueError:
@@ -52,6 +50,33 @@ class PlaceManager:
                 f"Unknown place type '{place_type_str}' for place ID '{place_identifier}'."
             )
 
+    def determine_place_type(self, place_identifier: str) -> TemplateType:
+        map_index = self._map_repository.load_map_index()
+        if not map_index.has_place(place_identifier):
+            raise ValueError(f"Place ID '{place_identifier}' not found.")
+        return self._to_place_type(
+            place_identifier, map_index.get_place_type(place_identifier)
+        )
+
+    def get_place_lineage(
+        self, place_identifier: str
+    ) -> List[Tuple[TemplateType, Dict]]:
+        """Returns the place and its ancestors, up to the world, along with
+        their types."""
+        map_index = self._map_repository.load_map_index()
+        if not map_index.has_place(place_identifier):
+            raise ValueError(f"Place ID '{place_identifier}' not found.")
+
+        lineage = []
+        for identifier in [place_identifier] + map_index.get_ancestor_identifiers(
+            place_identifier
+        ):
+            place = map_index.get_place(identifier)
+            if not place:
+                raise ValueError(f"Place ID '{identifier}' not found.")
+            lineage.append((self._to_place_type(identifier, place.get("type")), place))
+        return lineage
+
     def get_place_categories(
         self, place_template: str, place_type: TemplateType
     ) -> List[str]:
@@ -67,17 +92,13 @@ class PlaceManager:
         return [category for category in categories]
 
     def get_places_of_type(self, place_type: TemplateType) -> List[str]:
-        map_data = self._map_repository.load_map_data()
-
         return [
-            place_data.get("place_template")
-            for place_data in map_data.values()
-            if place_data.get("type") == place_type.value
+            place.get("place_template")
+            for place in self._map_repository.get_places_of_type(place_type).values()
         ]
 
     def is_visited(self, place_identifier: str):
-        map_file = self._map_repository.load_map_data()
-        return map_file[place_identifier]["visited"]
+        return self.get_place(place_identifier)["visited"]
 
     def set_as_visited(self, place_identifier: str):
         map_file = self._map_repository.load_map_data()
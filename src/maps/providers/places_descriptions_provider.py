@@ -1,10 +1,12 @@
 from typing import Optional
 
-from src.filesystem.file_operations import read_file
 from src.filesystem.path_manager import PathManager
 from src.maps.factories.place_descriptions_for_prompt_factory import (
     PlaceDescriptionsForPromptFactory,
 )
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
 
 
 class PlacesDescriptionsProvider:
@@ -13,18 +15,21 @@ class PlacesDescriptionsProvider:
         self,
         place_descriptions_for_prompt_factory: PlaceDescriptionsForPromptFactory,
         path_manager: Optional[PathManager] = None,
+        prompt_template_repository: Optional[PromptTemplateRepository] = None,
     ):
         self._place_descriptions_for_prompt_factory = (
             place_descriptions_for_prompt_factory
         )
 
         self._path_manager = path_manager or PathManager()
+        self._prompt_template_repository = (
+            prompt_template_repository or PromptTemplateRepository.get_shared_instance()
+        )
 
     def get_information(self) -> str:
-        places_descriptions = read_file(
+        places_descriptions = self._prompt_template_repository.get_template(
             self._path_manager.get_places_descriptions_path()
-        )
-        places_descriptions = places_descriptions.format(
+        ).format(
             **self._place_descriptions_for_prompt_factory.create_place_descriptions_for_prompt()
         )
         return places_descriptions
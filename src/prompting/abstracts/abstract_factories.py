@@ -10,6 +10,7 @@ from src.prompting.abstracts.factory_products import (
     LlmContentProduct,
     UserContentForCharacterGenerationProduct,
 )
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
 from src.prompting.abstracts.llm_client import LlmClient
 from src.prompting.abstracts.strategies import ProduceToolResponseStrategy
 from src.prompting.llm import Llm
@@ -27,6 +28,12 @@ class LlmContentProvider(ABC):
     def generate_content(self, response_model: Type[BaseModel]) -> LlmContentProduct:
         pass
 
+    @abstractmethod
+    async def generate_content_async(
+        self, response_model: Type[BaseModel]
+    ) -> LlmContentProduct:
+        pass
+
 
 class LlmClientFactory(ABC):
 
@@ -37,6 +44,15 @@ class LlmClientFactory(ABC):
         pass
 
 
+class AsyncLlmClientFactory(ABC):
+
+    @abstractmethod
+    def create_async_llm_client(
+        self, llm: Llm, response_model: Optional[Type[BaseModel]]
+    ) -> AsyncLlmClient:
+        pass
+
+
 class UserContentForCharacterGenerationFactory(Protocol):
 
     def create_user_content_for_character_generation(
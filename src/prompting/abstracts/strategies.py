@@ -11,3 +11,9 @@ class ProduceToolResponseStrategy(ABC):
         self, system_content: str, user_content: str, response_model: Type[BaseModel]
     ) -> Union[dict, BaseModel]:
         pass
+
+    @abstractmethod
+    async def produce_tool_response_async(
+        self, system_content: str, user_content: str, response_model: Type[BaseModel]
+    ) -> Union[dict, BaseModel]:
+        pass
@@ -0,0 +1,51 @@
+from typing import Type
+
+from pydantic import BaseModel
+
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
+from src.prompting.caching_llm_client import create_uncached_response_product
+from src.prompting.llm import Llm
+from src.prompting.llm_response_cache import LlmResponseCache
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+
+class AsyncCachingLlmClient(AsyncLlmClient):
+    """The async counterpart of CachingLlmClient."""
+
+    def __init__(
+        self,
+        async_llm_client: AsyncLlmClient,
+        response_model: Type[BaseModel],
+        llm_response_cache: LlmResponseCache,
+    ):
+        self._async_llm_client = async_llm_client
+        self._response_model = response_model
+        self._llm_response_cache = llm_response_cache
+
+    async def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        key = self._llm_response_cache.create_key(
+            model, messages_to_llm, self._response_model
+        )
+
+        cached_response = self._llm_response_cache.read(key, self._response_model)
+
+        if cached_response is not None:
+            return InstructorAiCompletionProduct(cached_response, is_valid=True)
+
+        if self._llm_response_cache.is_replaying():
+            return create_uncached_response_product()
+
+        ai_completion_product = await self._async_llm_client.generate_completion(
+            model, messages_to_llm
+        )
+
+        if ai_completion_product.is_valid():
+            self._llm_response_cache.write(key, model, ai_completion_product.get())
+
+        return ai_completion_product
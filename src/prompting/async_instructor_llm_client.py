@@ -0,0 +1,81 @@
+import logging
+from typing import Optional
+
+from instructor.exceptions import InstructorRetryException
+from openai import RateLimitError
+from pydantic import BaseModel
+from tenacity import (
+    AsyncRetrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from src.base.constants import (
+    LLM_RETRY_WAIT_INITIAL_SECONDS,
+    LLM_RETRY_WAIT_MAX_SECONDS,
+)
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
+from src.prompting.base_instructor_llm_client import (
+    BaseInstructorLlmClient,
+    VALIDATION_ERRORS,
+)
+from src.prompting.llm import Llm
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncInstructorLlmClient(BaseInstructorLlmClient, AsyncLlmClient):
+    """Instructor client that awaits its completions."""
+
+    def _create_retrying(self, max_retries: int) -> AsyncRetrying:
+        # Being rate limited is left to the rate limiter of the model, which
+        # knows how long to wait. The SDK doesn't retry on its own, so the
+        # other failures (dropped connections, server errors) back off here.
+        return AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
+            retry=retry_if_not_exception_type(RateLimitError),
+            wait=wait_exponential_jitter(
+                initial=LLM_RETRY_WAIT_INITIAL_SECONDS,
+                max=LLM_RETRY_WAIT_MAX_SECONDS,
+            ),
+        )
+
+    async def _stream_partial_responses(self, **kwargs) -> Optional[BaseModel]:
+        self._notify_new_attempt()
+
+        partial_response = None
+
+        async for partial_response in self._client.chat.completions.create_partial(
+            **kwargs
+        ):
+            self._notify_partial_response(partial_response)
+
+        return self._validate_last_partial_response(partial_response)
+
+    async def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        completion_kwargs = self._build_completion_kwargs(model, messages_to_llm)
+
+        try:
+            if self._partial_response_observer:
+                model_result = await self._stream_partial_responses(**completion_kwargs)
+
+                if model_result is None:
+                    return self._create_empty_content_product()
+            else:
+                model_result = await self._client.chat.completions.create(
+                    **completion_kwargs
+                )
+        except VALIDATION_ERRORS as e:
+            return self._create_product_from_validation_error(e)
+        except InstructorRetryException as e:
+            return self._create_product_from_retry_exception(e)
+
+        return InstructorAiCompletionProduct(model_result, is_valid=True)
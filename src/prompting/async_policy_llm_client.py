@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
+from src.prompting.llm import Llm, LlmRequestPolicy
+from src.prompting.llm_request_policy_recorder import LlmRequestPolicyRecorder
+from src.prompting.observers.first_partial_response_observer import (
+    FirstPartialResponseObserver,
+)
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPolicyLlmClient(AsyncLlmClient):
+    """Hedges and falls back requests as their request policy says."""
+
+    def __init__(
+        self,
+        async_llm_client: AsyncLlmClient,
+        request_policy: LlmRequestPolicy,
+        hedge_async_llm_client: Optional[AsyncLlmClient] = None,
+        fallback_async_llm_clients: Optional[List[AsyncLlmClient]] = None,
+        llm_request_policy_recorder: Optional[LlmRequestPolicyRecorder] = None,
+        first_partial_response_observer: Optional[FirstPartialResponseObserver] = None,
+        hedge_first_partial_response_observer: Optional[
+            FirstPartialResponseObserver
+        ] = None,
+    ):
+        self._async_llm_client = async_llm_client
+        self._request_policy = request_policy
+        self._hedge_async_llm_client = hedge_async_llm_client
+        self._fallback_async_llm_clients = fallback_async_llm_clients or []
+        self._llm_request_policy_recorder = (
+            llm_request_policy_recorder
+            or LlmRequestPolicyRecorder.get_shared_instance()
+        )
+        # Observe the partial responses of the assigned model and of the hedge,
+        # if streamed.
+        self._first_partial_response_observer = first_partial_response_observer
+        self._hedge_first_partial_response_observer = (
+            hedge_first_partial_response_observer
+        )
+
+    @staticmethod
+    async def _generate(
+        llm: Llm, async_llm_client: AsyncLlmClient, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        # A failing model shouldn't keep the others from answering.
+        try:
+            return await async_llm_client.generate_completion(llm, messages_to_llm)
+        except Exception as e:
+            logger.error("The request to '%s' failed: %s", llm.get_name(), e)
+
+            return InstructorAiCompletionProduct(None, is_valid=False, error=str(e))
+
+    @staticmethod
+    def _watch_streaming(
+        first_partial_response_observer: Optional[FirstPartialResponseObserver],
+    ) -> Optional[asyncio.Future]:
+        if first_partial_response_observer is None:
+            return None
+
+        return asyncio.ensure_future(first_partial_response_observer.arm().wait())
+
+    async def _race(
+        self,
+        model: Llm,
+        messages_to_llm: MessagesToLlm,
+    ) -> Tuple[AiCompletionProduct, Llm]:
+        primary_task = asyncio.ensure_future(
+            self._generate(model, self._async_llm_client, messages_to_llm)
+        )
+        tasks: Dict[asyncio.Future, Llm] = {primary_task: model}
+
+        # Once a model streams its response, the user is already watching it:
+        # the other could only replace it, and would be paid twice.
+        streaming_tasks: Dict[asyncio.Future, asyncio.Future] = {}
+
+        streaming_task = self._watch_streaming(self._first_partial_response_observer)
+
+        if streaming_task:
+            streaming_tasks[streaming_task] = primary_task
+
+        timeout = (
+            self._request_policy.hedge_delay_seconds
+            if self._hedge_async_llm_client
+            else None
+        )
+        ai_completion_product, winner = None, model
+
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    set(tasks) | set(streaming_tasks),
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    logger.info(
+                        "'%s' hasn't answered after %ss. Hedging with '%s'.",
+                        model.get_name(),
+                        timeout,
+                        self._request_policy.hedge_llm.get_name(),
+                    )
+
+                    streaming_task = self._watch_streaming(
+                        self._hedge_first_partial_response_observer
+                    )
+                    hedge_task = asyncio.ensure_future(
+                        self._generate(
+                            self._request_policy.hedge_llm,
+                            self._hedge_async_llm_client,
+                            messages_to_llm,
+                        )
+                    )
+                    tasks[hedge_task] = self._request_policy.hedge_llm
+
+                    if streaming_task:
+                        streaming_tasks[streaming_task] = hedge_task
+
+                    timeout = None
+                    continue
+
+                for task in done & set(tasks):
+                    ai_completion_product, winner = task.result(), tasks.pop(task)
+
+                    if ai_completion_product.is_valid():
+                        return ai_completion_product, winner
+
+                for streaming_task in done & set(streaming_tasks):
+                    streamed_task = streaming_tasks.pop(streaming_task)
+                    timeout = None
+
+                    if streamed_task not in tasks:
+                        continue
+
+                    for task in list(tasks):
+                        if task is not streamed_task:
+                            logger.info(
+                                "'%s' started streaming. Dropping '%s'.",
+                                tasks[streamed_task].get_name(),
+                                tasks[task].get_name(),
+                            )
+
+                            task.cancel()
+                            del tasks[task]
+
+                    for other_streaming_task in list(streaming_tasks):
+                        other_streaming_task.cancel()
+                        del streaming_tasks[other_streaming_task]
+
+                # The assigned model failed before the hedge delay: the
+                # fallbacks will take over.
+                timeout = None
+        finally:
+            for task in list(tasks) + list(streaming_tasks):
+                if not task.done():
+                    task.cancel()
+
+        return ai_completion_product, winner
+
+    async def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        start = time.monotonic()
+
+        ai_completion_product, winner = await self._race(model, messages_to_llm)
+
+        for fallback_llm, fallback_async_llm_client in zip(
+            self._request_policy.fallback_llms, self._fallback_async_llm_clients
+        ):
+            if ai_completion_product.is_valid():
+                break
+
+            logger.warning(
+                "No valid response from '%s'. Falling back to '%s'.",
+                winner.get_name(),
+                fallback_llm.get_name(),
+            )
+
+            ai_completion_product = await self._generate(
+                fallback_llm, fallback_async_llm_client, messages_to_llm
+            )
+            winner = fallback_llm
+
+        self._llm_request_policy_recorder.record(
+            model.get_action_type(),
+            winner.get_name() if ai_completion_product.is_valid() else None,
+            time.monotonic() - start,
+            self._request_policy.latency_slo_seconds,
+        )
+
+        return ai_completion_product
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from openai import RateLimitError
+
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
+from src.prompting.llm import Llm
+from src.prompting.llm_rate_limiter import LlmRateLimiter
+from src.prompting.rate_limited_llm_client import (
+    create_rate_limited_product,
+    estimate_prompt_tokens,
+    get_retry_after,
+    is_rate_limited,
+)
+
+
+class AsyncRateLimitedLlmClient(AsyncLlmClient):
+    """The async counterpart of RateLimitedLlmClient."""
+
+    def __init__(
+        self,
+        async_llm_client: AsyncLlmClient,
+        rate_limiter: LlmRateLimiter,
+        config_loader: Optional[ConfigLoader] = None,
+    ):
+        self._async_llm_client = async_llm_client
+        self._rate_limiter = rate_limiter
+        self._config_loader = config_loader or ConfigLoader()
+
+    async def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        tokens = estimate_prompt_tokens(self._rate_limiter, messages_to_llm)
+
+        for _ in range(self._config_loader.get_llm_rate_limit_max_retries() + 1):
+            await self._rate_limiter.acquire_async(tokens)
+
+            try:
+                ai_completion_product = (
+                    await self._async_llm_client.generate_completion(
+                        model, messages_to_llm
+                    )
+                )
+            except RateLimitError as e:
+                self._rate_limiter.release(True, get_retry_after(e))
+                continue
+            except BaseException:
+                # Including cancellations, which must give the slot back too.
+                self._rate_limiter.abandon()
+                raise
+
+            self._rate_limiter.release(is_rate_limited(ai_completion_product))
+
+            if not is_rate_limited(ai_completion_product):
+                return ai_completion_product
+
+        return create_rate_limited_product(model)
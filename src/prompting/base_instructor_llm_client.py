@@ -0,0 +1,196 @@
+import logging
+from typing import Any, Dict, Optional, Type, Union
+
+from instructor import AsyncInstructor, Instructor
+from instructor.exceptions import InstructorRetryException
+from openai.types.chat import (
+    ChatCompletionUserMessageParam,
+    ChatCompletionSystemMessageParam,
+)
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+from pydantic.v1 import ValidationError
+from tenacity import AsyncRetrying, Retrying
+
+from src.base.constants import (
+    TOO_MANY_REQUESTS_ERROR_NUMBER,
+    UNAUTHORIZED_ERROR_NUMBER,
+    PAYMENT_REQUIRED,
+    INVALID_SSL_CERTIFICATE,
+    MAXIMUM_CONTENT_LENGTH_REACHED,
+)
+from src.base.abstracts.observer import Observer
+from src.base.enums import AiCompletionErrorType
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.llm import Llm
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+logger = logging.getLogger(__name__)
+
+# The exceptions raised when the response doesn't fit the response model.
+VALIDATION_ERRORS = (ValidationError, PydanticValidationError)
+
+
+class BaseInstructorLlmClient:
+    """What the sync and the async instructor clients have in common."""
+
+    def __init__(
+        self,
+        client: Union[Instructor, AsyncInstructor],
+        response_model: Type[BaseModel],
+        config_loader: Optional[ConfigLoader] = None,
+        partial_response_observer: Optional[Observer] = None,
+    ):
+        if not client:
+            raise ValueError("client must not be empty.")
+
+        # Unless you supress logging messages lower than WARNING, the log file will get swamped with messages.
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        # The client is shared across the process (see LlmClientRegistry), which
+        # also takes care of hooking into its exceptions to log them.
+        self._client = client
+
+        self._response_model = response_model
+
+        self._config_loader = config_loader or ConfigLoader()
+
+        # If present, the response gets streamed, and the observer is notified
+        # of every partial response (as a dict) as the tokens arrive.
+        self._partial_response_observer = partial_response_observer
+
+    def _notify_new_attempt(self) -> None:
+        # An empty partial response starts every attempt, so that the observer
+        # drops whatever an earlier one (say, a response that didn't validate)
+        # streamed.
+        self._partial_response_observer.update({})
+
+    def _notify_partial_response(self, partial_response: BaseModel) -> None:
+        self._partial_response_observer.update(
+            partial_response.model_dump(exclude_none=True)
+        )
+
+    def _validate_last_partial_response(
+        self, partial_response: Optional[BaseModel]
+    ) -> Optional[BaseModel]:
+        if partial_response is None:
+            return None
+
+        # Partial models make every field optional, so the last one still needs
+        # to be validated against the actual response model.
+        return self._response_model.model_validate(partial_response.model_dump())
+
+    def _create_retrying(self, max_retries: int) -> Union[Retrying, AsyncRetrying]:
+        raise NotImplementedError("Should be implemented.")
+
+    def _build_completion_kwargs(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> Dict[str, Any]:
+        # Convert messages_to_llm.get() to the expected message types
+        messages = [
+            (
+                ChatCompletionUserMessageParam(**message)
+                if message["role"] == "user"
+                else ChatCompletionSystemMessageParam(**message)
+            )
+            for message in messages_to_llm.get()
+        ]
+
+        return {
+            "model": model.get_name(),
+            "max_retries": self._create_retrying(self._config_loader.get_max_retries()),
+            "messages": messages,
+            "response_model": self._response_model,
+            "temperature": model.get_temperature(),
+            "top_p": model.get_top_p(),
+            "frequency_penalty": model.get_frequency_penalty(),
+            "presence_penalty": model.get_presence_penalty(),
+        }
+
+    @staticmethod
+    def _create_empty_content_product() -> InstructorAiCompletionProduct:
+        return InstructorAiCompletionProduct(
+            None,
+            is_valid=False,
+            error=AiCompletionErrorType.EMPTY_CONTENT,
+        )
+
+    @staticmethod
+    def _create_product_from_validation_error(
+        e: Exception,
+    ) -> InstructorAiCompletionProduct:
+        error = f"Validation error: {str(e)}"
+        logger.error(error)
+
+        return InstructorAiCompletionProduct(
+            None,
+            is_valid=False,
+            error=error,
+        )
+
+    def _create_product_from_retry_exception(
+        self, e: InstructorRetryException
+    ) -> InstructorAiCompletionProduct:
+        logger.error("InstructorRetryException raised. Error: %s", str(e))
+        logger.error(
+            "Attempts: %s",
+            e.n_attempts,
+        )
+
+        # The attempts may have failed before any completion arrived.
+        if e.last_completion is None:
+            return InstructorAiCompletionProduct(
+                None,
+                is_valid=False,
+                error=str(e),
+            )
+
+        message = e.last_completion.choices[0].message
+
+        content = message.content or f"No valid content. Message\n{message}"
+
+        logger.error("Last content:\n%s", content)
+
+        try:
+            # If the content doesn't end with a closing brace, append one.
+            if not content.endswith("}"):
+                content += "}"
+
+            # Attempt to validate the JSON content against the response model.
+            parsed_result = self._response_model.model_validate_json(content)
+
+            # If successful, return a valid product early.
+            return InstructorAiCompletionProduct(parsed_result, is_valid=True)
+        except ValueError as parse_error:
+            logger.error("Parsing corrected content failed: %s", str(parse_error))
+            # If parsing still fails, continue with the existing error handling below.
+
+            error_correlation = {
+                TOO_MANY_REQUESTS_ERROR_NUMBER: AiCompletionErrorType.TOO_MANY_REQUESTS,
+                UNAUTHORIZED_ERROR_NUMBER: AiCompletionErrorType.UNAUTHORIZED,
+                PAYMENT_REQUIRED: AiCompletionErrorType.PAYMENT_REQUIRED,
+                INVALID_SSL_CERTIFICATE: AiCompletionErrorType.INVALID_SSL_CERTIFICATE,
+                MAXIMUM_CONTENT_LENGTH_REACHED: AiCompletionErrorType.MAXIMUM_CONTENT_LENGTH_REACHED,
+            }
+
+            error = (
+                content
+                if not hasattr(e.last_completion, "error")
+                else error_correlation.get(
+                    e.last_completion.error["code"], AiCompletionErrorType.UNHANDLED
+                )
+            )
+
+            return InstructorAiCompletionProduct(
+                None,
+                is_valid=False,
+                error=error,
+            )
+
+    def generate_image(self, prompt: str) -> str:
+        raise NotImplementedError(
+            "This LLM client is not meant to be used to generate images."
+        )
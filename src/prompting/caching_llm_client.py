@@ -0,0 +1,63 @@
+import logging
+from typing import Type
+
+from pydantic import BaseModel
+
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.llm_client import LlmClient
+from src.prompting.llm import Llm
+from src.prompting.llm_response_cache import LlmResponseCache
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_uncached_response_product() -> InstructorAiCompletionProduct:
+    error = "Replaying LLM responses, but this request wasn't recorded."
+    logger.error(error)
+
+    return InstructorAiCompletionProduct(None, is_valid=False, error=error)
+
+
+class CachingLlmClient(LlmClient):
+    """Puts the LLM response cache in front of another client."""
+
+    def __init__(
+        self,
+        llm_client: LlmClient,
+        response_model: Type[BaseModel],
+        llm_response_cache: LlmResponseCache,
+    ):
+        self._llm_client = llm_client
+        self._response_model = response_model
+        self._llm_response_cache = llm_response_cache
+
+    def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        key = self._llm_response_cache.create_key(
+            model, messages_to_llm, self._response_model
+        )
+
+        cached_response = self._llm_response_cache.read(key, self._response_model)
+
+        if cached_response is not None:
+            return InstructorAiCompletionProduct(cached_response, is_valid=True)
+
+        if self._llm_response_cache.is_replaying():
+            return create_uncached_response_product()
+
+        ai_completion_product = self._llm_client.generate_completion(
+            model, messages_to_llm
+        )
+
+        if ai_completion_product.is_valid():
+            self._llm_response_cache.write(key, model, ai_completion_product.get())
+
+        return ai_completion_product
+
+    def generate_image(self, prompt: str) -> str:
+        return self._llm_client.generate_image(prompt)
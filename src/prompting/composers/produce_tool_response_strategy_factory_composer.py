@@ -1,6 +1,12 @@
+from typing import Optional
+
+from src.base.abstracts.observer import Observer
 from src.prompting.abstracts.abstract_factories import (
     ProduceToolResponseStrategyFactory,
 )
+from src.prompting.factories.async_instructor_llm_client_factory import (
+    AsyncInstructorLlmClientFactory,
+)
 from src.prompting.factories.base_model_produce_tool_response_strategy_factory import (
     BaseModelProduceToolResponseStrategyFactory,
 )
@@ -17,13 +23,20 @@ class ProduceToolResponseStrategyFactoryComposer:
     def __init__(
         self,
         llm: Llm,
+        partial_response_observer: Optional[Observer] = None,
     ):
         self._llm = llm
+        self._partial_response_observer = partial_response_observer
 
     def compose_factory(self) -> ProduceToolResponseStrategyFactory:
         llm_content_provider_factory = LlmContentProviderFactory(
-            InstructorLlmClientFactory(),
+            InstructorLlmClientFactory(
+                partial_response_observer=self._partial_response_observer
+            ),
             self._llm,
+            AsyncInstructorLlmClientFactory(
+                partial_response_observer=self._partial_response_observer
+            ),
         )
 
         return BaseModelProduceToolResponseStrategyFactory(llm_content_provider_factory)
@@ -0,0 +1,125 @@
+import logging
+from typing import Optional, Type
+
+from instructor import Mode
+from pydantic import BaseModel
+
+from src.base.abstracts.observer import Observer
+from src.base.constants import OPENROUTER_API_URL
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.abstracts.abstract_factories import AsyncLlmClientFactory
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
+from src.prompting.async_caching_llm_client import AsyncCachingLlmClient
+from src.prompting.async_instructor_llm_client import AsyncInstructorLlmClient
+from src.prompting.async_policy_llm_client import AsyncPolicyLlmClient
+from src.prompting.llm import Llm
+from src.prompting.llm_client_registry import LlmClientRegistry
+from src.prompting.llm_rate_limiter_registry import LlmRateLimiterRegistry
+from src.prompting.llm_response_cache import LlmResponseCache
+from src.prompting.observers.first_partial_response_observer import (
+    FirstPartialResponseObserver,
+)
+from src.prompting.async_rate_limited_llm_client import AsyncRateLimitedLlmClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncInstructorLlmClientFactory(AsyncLlmClientFactory):
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        llm_client_registry: Optional[LlmClientRegistry] = None,
+        partial_response_observer: Optional[Observer] = None,
+        llm_response_cache: Optional[LlmResponseCache] = None,
+        llm_rate_limiter_registry: Optional[LlmRateLimiterRegistry] = None,
+    ):
+        self._config_loader = config_loader or ConfigLoader()
+        self._llm_client_registry = (
+            llm_client_registry or LlmClientRegistry.get_shared_instance()
+        )
+        self._partial_response_observer = partial_response_observer
+        self._llm_response_cache = (
+            llm_response_cache or LlmResponseCache.get_shared_instance()
+        )
+        self._llm_rate_limiter_registry = (
+            llm_rate_limiter_registry or LlmRateLimiterRegistry.get_shared_instance()
+        )
+
+    def _create_model_client(
+        self,
+        llm: Llm,
+        response_model: Optional[Type[BaseModel]],
+        partial_response_observer: Optional[Observer],
+    ) -> AsyncLlmClient:
+        # Same as the sync factory: Mode.TOOLS raises a NoneType exception.
+        async_llm_client = AsyncInstructorLlmClient(
+            self._llm_client_registry.get_async_instructor_client(
+                self._config_loader.load_openrouter_secret_key(),
+                OPENROUTER_API_URL,
+                Mode.JSON,
+            ),
+            response_model,
+            self._config_loader,
+            partial_response_observer,
+        )
+
+        # Cached responses don't spend the budgets of the model.
+        async_llm_client = AsyncRateLimitedLlmClient(
+            async_llm_client,
+            self._llm_rate_limiter_registry.get_rate_limiter(OPENROUTER_API_URL, llm),
+            self._config_loader,
+        )
+
+        if not self._llm_response_cache.applies_to(llm):
+            return async_llm_client
+
+        return AsyncCachingLlmClient(
+            async_llm_client, response_model, self._llm_response_cache
+        )
+
+    def create_async_llm_client(
+        self, llm: Llm, response_model: Optional[Type[BaseModel]]
+    ) -> AsyncLlmClient:
+        request_policy = llm.get_request_policy()
+
+        if not request_policy or not request_policy.has_alternatives():
+            return self._create_model_client(
+                llm, response_model, self._partial_response_observer
+            )
+
+        # Hedging stops once the assigned model or the hedge streams its first
+        # partial response, and only that one reaches the observer.
+        first_partial_response_observer = (
+            FirstPartialResponseObserver(self._partial_response_observer)
+            if self._partial_response_observer
+            else None
+        )
+        hedge_first_partial_response_observer = (
+            first_partial_response_observer.create_rival()
+            if first_partial_response_observer and request_policy.hedge_llm
+            else None
+        )
+
+        return AsyncPolicyLlmClient(
+            self._create_model_client(
+                llm, response_model, first_partial_response_observer
+            ),
+            request_policy,
+            (
+                self._create_model_client(
+                    request_policy.hedge_llm,
+                    response_model,
+                    hedge_first_partial_response_observer,
+                )
+                if request_policy.hedge_llm
+                else None
+            ),
+            [
+                self._create_model_client(
+                    fallback_llm, response_model, self._partial_response_observer
+                )
+                for fallback_llm in request_policy.fallback_llms
+            ],
+            first_partial_response_observer=first_partial_response_observer,
+            hedge_first_partial_response_observer=hedge_first_partial_response_observer,
+        )
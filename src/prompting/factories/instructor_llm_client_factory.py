@@ -1,39 +1,101 @@
 import logging
 from typing import Optional, Type
 
-import instructor
 from instructor import Mode
-from openai import OpenAI
 from pydantic import BaseModel
 
+from src.base.abstracts.observer import Observer
+from src.base.async_bridge import AsyncBridge
 from src.base.constants import OPENROUTER_API_URL
 from src.filesystem.config_loader import ConfigLoader
 from src.prompting.abstracts.abstract_factories import LlmClientFactory
 from src.prompting.abstracts.llm_client import LlmClient
+from src.prompting.caching_llm_client import CachingLlmClient
+from src.prompting.factories.async_instructor_llm_client_factory import (
+    AsyncInstructorLlmClientFactory,
+)
 from src.prompting.instructor_llm_client import InstructorLlmClient
 from src.prompting.llm import Llm
+from src.prompting.llm_client_registry import LlmClientRegistry
+from src.prompting.llm_rate_limiter_registry import LlmRateLimiterRegistry
+from src.prompting.llm_response_cache import LlmResponseCache
+from src.prompting.policy_llm_client import PolicyLlmClient
+from src.prompting.rate_limited_llm_client import RateLimitedLlmClient
 
 logger = logging.getLogger(__name__)
 
 
 class InstructorLlmClientFactory(LlmClientFactory):
-    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        llm_client_registry: Optional[LlmClientRegistry] = None,
+        partial_response_observer: Optional[Observer] = None,
+        llm_response_cache: Optional[LlmResponseCache] = None,
+        llm_rate_limiter_registry: Optional[LlmRateLimiterRegistry] = None,
+        async_llm_client_factory: Optional[AsyncInstructorLlmClientFactory] = None,
+        async_bridge: Optional[AsyncBridge] = None,
+    ):
         self._config_loader = config_loader or ConfigLoader()
+        self._llm_client_registry = (
+            llm_client_registry or LlmClientRegistry.get_shared_instance()
+        )
+        self._partial_response_observer = partial_response_observer
+        self._llm_response_cache = (
+            llm_response_cache or LlmResponseCache.get_shared_instance()
+        )
+        self._llm_rate_limiter_registry = (
+            llm_rate_limiter_registry or LlmRateLimiterRegistry.get_shared_instance()
+        )
+        # The requests under a policy race on the loop of the bridge.
+        self._async_llm_client_factory = (
+            async_llm_client_factory
+            or AsyncInstructorLlmClientFactory(
+                self._config_loader,
+                self._llm_client_registry,
+                partial_response_observer,
+                self._llm_response_cache,
+                self._llm_rate_limiter_registry,
+            )
+        )
+        self._async_bridge = async_bridge
 
     def create_llm_client(
         self, llm: Llm, response_model: Optional[Type[BaseModel]]
     ) -> LlmClient:
+        request_policy = llm.get_request_policy()
+
+        if request_policy and request_policy.has_alternatives():
+            return PolicyLlmClient(
+                self._async_llm_client_factory.create_async_llm_client(
+                    llm, response_model
+                ),
+                self._async_bridge,
+            )
+
         # Note: Mode.TOOLS doesn't work for some reason: it raises a NoneType exception.
         # The structure is done if in the future I want to delve into why this isn't working.
         mode = Mode.JSON if llm.supports_tools() else Mode.JSON
 
-        return InstructorLlmClient(
-            instructor.from_openai(
-                OpenAI(
-                    api_key=self._config_loader.load_openrouter_secret_key(),
-                    base_url=OPENROUTER_API_URL,
-                ),
-                mode=mode,
+        llm_client = InstructorLlmClient(
+            self._llm_client_registry.get_instructor_client(
+                self._config_loader.load_openrouter_secret_key(),
+                OPENROUTER_API_URL,
+                mode,
             ),
             response_model,
+            self._config_loader,
+            self._partial_response_observer,
+        )
+
+        # Cached responses don't spend the budgets of the model.
+        llm_client = RateLimitedLlmClient(
+            llm_client,
+            self._llm_rate_limiter_registry.get_rate_limiter(OPENROUTER_API_URL, llm),
+            self._config_loader,
         )
+
+        if not self._llm_response_cache.applies_to(llm):
+            return llm_client
+
+        return CachingLlmClient(llm_client, response_model, self._llm_response_cache)
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from src.dialogues.messages_to_llm import MessagesToLlm
 from src.prompting.abstracts.abstract_factories import (
     LlmContentProvider,
     LlmClientFactory,
+    AsyncLlmClientFactory,
 )
 from src.prompting.llm import Llm
 from src.prompting.providers.concrete_llm_content_provider import (
@@ -11,13 +14,22 @@ from src.prompting.providers.concrete_llm_content_provider import (
 
 class LlmContentProviderFactory:
 
-    def __init__(self, llm_client_factory: LlmClientFactory, llm: Llm):
+    def __init__(
+        self,
+        llm_client_factory: LlmClientFactory,
+        llm: Llm,
+        async_llm_client_factory: Optional[AsyncLlmClientFactory] = None,
+    ):
         self._llm_client_factory = llm_client_factory
         self._llm = llm
+        self._async_llm_client_factory = async_llm_client_factory
 
     def create_llm_content_provider(
         self, messages_to_llm: MessagesToLlm
     ) -> LlmContentProvider:
         return ConcreteLlmContentProvider(
-            self._llm, messages_to_llm, self._llm_client_factory
+            self._llm,
+            messages_to_llm,
+            self._llm_client_factory,
+            async_llm_client_factory=self._async_llm_client_factory,
         )
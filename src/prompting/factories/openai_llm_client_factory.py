@@ -1,19 +1,26 @@
 from typing import Type, Optional
 
-from openai import OpenAI
 from pydantic import BaseModel
 
 from src.filesystem.config_loader import ConfigLoader
 from src.prompting.abstracts.abstract_factories import LlmClientFactory
 from src.prompting.abstracts.llm_client import LlmClient
 from src.prompting.llm import Llm
+from src.prompting.llm_client_registry import LlmClientRegistry
 from src.prompting.open_ai_llm_client import OpenAiLlmClient
 
 
 class OpenAILlmClientFactory(LlmClientFactory):
 
-    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        llm_client_registry: Optional[LlmClientRegistry] = None,
+    ):
         self._config_loader = config_loader or ConfigLoader()
+        self._llm_client_registry = (
+            llm_client_registry or LlmClientRegistry.get_shared_instance()
+        )
 
     def create_llm_client(
         self,
@@ -21,8 +28,8 @@ class OpenAILlmClientFactory(LlmClientFactory):
         _response_model: Optional[Type[BaseModel]] = None,
     ) -> LlmClient:
         return OpenAiLlmClient(
-            OpenAI(
-                api_key=self._config_loader.load_openai_secret_key(),
+            self._llm_client_registry.get_openai_client(
+                self._config_loader.load_openai_secret_key(),
                 project=self._config_loader.load_openai_project_key(),
             )
         )
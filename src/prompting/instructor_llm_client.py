@@ -1,27 +1,27 @@
 import logging
-from typing import Type, Optional
+from typing import Optional
 
-from instructor import Instructor
 from instructor.exceptions import InstructorRetryException
-from openai.types.chat import (
-    ChatCompletionUserMessageParam,
-    ChatCompletionSystemMessageParam,
-)
+from openai import RateLimitError
 from pydantic import BaseModel
-from pydantic.v1 import ValidationError
+from tenacity import (
+    Retrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.base.constants import (
-    TOO_MANY_REQUESTS_ERROR_NUMBER,
-    UNAUTHORIZED_ERROR_NUMBER,
-    PAYMENT_REQUIRED,
-    INVALID_SSL_CERTIFICATE,
-    MAXIMUM_CONTENT_LENGTH_REACHED,
+    LLM_RETRY_WAIT_INITIAL_SECONDS,
+    LLM_RETRY_WAIT_MAX_SECONDS,
 )
-from src.base.enums import AiCompletionErrorType
 from src.dialogues.messages_to_llm import MessagesToLlm
-from src.filesystem.config_loader import ConfigLoader
 from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
 from src.prompting.abstracts.llm_client import LlmClient
+from src.prompting.base_instructor_llm_client import (
+    BaseInstructorLlmClient,
+    VALIDATION_ERRORS,
+)
 from src.prompting.llm import Llm
 from src.prompting.products.instructor_ai_completion_product import (
     InstructorAiCompletionProduct,
@@ -30,117 +30,47 @@ from src.prompting.products.instructor_ai_completion_product import (
 logger = logging.getLogger(__name__)
 
 
-class InstructorLlmClient(LlmClient):
-    def __init__(
-        self,
-        client: Instructor,
-        response_model: Type[BaseModel],
-        config_loader: Optional[ConfigLoader] = None,
-    ):
-        if not client:
-            raise ValueError("client must not be empty.")
-
-        # Unless you supress logging messages lower than WARNING, the log file will get swamped with messages.
-        logging.getLogger("httpx").setLevel(logging.WARNING)
-
-        self._client = client
+class InstructorLlmClient(BaseInstructorLlmClient, LlmClient):
 
-        # Hook into the exceptions of the client to log them.
+    def _create_retrying(self, max_retries: int) -> Retrying:
+        # Being rate limited is left to the rate limiter of the model, which
+        # knows how long to wait. The SDK doesn't retry on its own, so the
+        # other failures (dropped connections, server errors) back off here.
+        return Retrying(
+            stop=stop_after_attempt(max_retries),
+            retry=retry_if_not_exception_type(RateLimitError),
+            wait=wait_exponential_jitter(
+                initial=LLM_RETRY_WAIT_INITIAL_SECONDS,
+                max=LLM_RETRY_WAIT_MAX_SECONDS,
+            ),
+        )
 
-        def log_exception(exception: Exception):
-            print(f"An exception occurred: {str(exception)}")
+    def _stream_partial_responses(self, **kwargs) -> Optional[BaseModel]:
+        self._notify_new_attempt()
 
-        self._client.on("completion:error", log_exception)
+        partial_response = None
 
-        self._response_model = response_model
+        for partial_response in self._client.chat.completions.create_partial(**kwargs):
+            self._notify_partial_response(partial_response)
 
-        self._config_loader = config_loader or ConfigLoader()
+        return self._validate_last_partial_response(partial_response)
 
     def generate_completion(
         self, model: Llm, messages_to_llm: MessagesToLlm
     ) -> AiCompletionProduct:
-        # Convert messages_to_llm.get() to the expected message types
-        messages = [
-            (
-                ChatCompletionUserMessageParam(**message)
-                if message["role"] == "user"
-                else ChatCompletionSystemMessageParam(**message)
-            )
-            for message in messages_to_llm.get()
-        ]
+        completion_kwargs = self._build_completion_kwargs(model, messages_to_llm)
 
         try:
-            model_result = self._client.chat.completions.create(
-                model=model.get_name(),
-                max_retries=self._config_loader.get_max_retries(),
-                messages=messages,
-                response_model=self._response_model,
-                temperature=model.get_temperature(),
-                top_p=model.get_top_p(),
-                frequency_penalty=model.get_frequency_penalty(),
-                presence_penalty=model.get_presence_penalty(),
-            )
-        except ValidationError as e:
-            error = f"Validation error: {str(e)}"
-            logger.error(error)
-
-            return InstructorAiCompletionProduct(
-                None,
-                is_valid=False,
-                error=error,
-            )
+            if self._partial_response_observer:
+                model_result = self._stream_partial_responses(**completion_kwargs)
+
+                if model_result is None:
+                    return self._create_empty_content_product()
+            else:
+                model_result = self._client.chat.completions.create(**completion_kwargs)
+        except VALIDATION_ERRORS as e:
+            return self._create_product_from_validation_error(e)
         except InstructorRetryException as e:
-            logger.error("InstructorRetryException raised. Error: %s", str(e))
-            logger.error(
-                "Attempts: %s",
-                e.n_attempts,
-            )
-
-            message = e.last_completion.choices[0].message
-
-            content = message.content or f"No valid content. Message\n{message}"
-
-            logger.error("Last content:\n%s", content)
-
-            try:
-                # If the content doesn't end with a closing brace, append one.
-                if not content.endswith("}"):
-                    content += "}"
-
-                # Attempt to validate the JSON content against the response model.
-                parsed_result = self._response_model.model_validate_json(content)
-
-                # If successful, return a valid product early.
-                return InstructorAiCompletionProduct(parsed_result, is_valid=True)
-            except ValueError as parse_error:
-                logger.error("Parsing corrected content failed: %s", str(parse_error))
-                # If parsing still fails, continue with the existing error handling below.
-
-                error_correlation = {
-                    TOO_MANY_REQUESTS_ERROR_NUMBER: AiCompletionErrorType.TOO_MANY_REQUESTS,
-                    UNAUTHORIZED_ERROR_NUMBER: AiCompletionErrorType.UNAUTHORIZED,
-                    PAYMENT_REQUIRED: AiCompletionErrorType.PAYMENT_REQUIRED,
-                    INVALID_SSL_CERTIFICATE: AiCompletionErrorType.INVALID_SSL_CERTIFICATE,
-                    MAXIMUM_CONTENT_LENGTH_REACHED: AiCompletionErrorType.MAXIMUM_CONTENT_LENGTH_REACHED,
-                }
-
-                error = (
-                    content
-                    if not hasattr(e.last_completion, "error")
-                    else error_correlation.get(
-                        e.last_completion.error["code"], AiCompletionErrorType.UNHANDLED
-                    )
-                )
-
-                return InstructorAiCompletionProduct(
-                    None,
-                    is_valid=False,
-                    error=error,
-                )
+            return self._create_product_from_retry_exception(e)
 
         return InstructorAiCompletionProduct(model_result, is_valid=True)
-
-    def generate_image(self, prompt: str) -> str:
-        raise NotImplemented(
-            "This LLM client is not meant to be used to generate images."
-        )
@@ -1,5 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
 class Llm:
-    def __init__(self, model_data: dict):
+    def __init__(
+        self,
+        model_data: dict,
+        action_type: Optional[str] = None,
+        request_policy: Optional["LlmRequestPolicy"] = None,
+    ):
         # Define the required fields and their expected types
         required_fields = {
             "supports_tools": bool,
@@ -19,6 +28,17 @@ class Llm:
             )
         self._name = name
 
+        # The key in llms.json this model was assigned to, if any.
+        self._action_type = action_type
+        self._request_policy = request_policy
+
+        # Optional budgets of the provider for this model.
+        self._requests_per_minute: Optional[int] = model_data.get("requests_per_minute")
+        self._tokens_per_minute: Optional[int] = model_data.get("tokens_per_minute")
+        self._max_concurrent_requests: Optional[int] = model_data.get(
+            "max_concurrent_requests"
+        )
+
         # Iterate over the required fields to validate and assign them
         for key, expected_type in required_fields.items():
             if key not in model_data:
@@ -38,6 +58,12 @@ class Llm:
     def get_name(self) -> str:
         return self._name
 
+    def get_action_type(self) -> Optional[str]:
+        return self._action_type
+
+    def get_request_policy(self) -> Optional["LlmRequestPolicy"]:
+        return self._request_policy
+
     def get_temperature(self) -> float:
         return self._temperature  # noqa
 
@@ -50,5 +76,30 @@ class Llm:
     def get_presence_penalty(self) -> float:
         return self._presence_penalty  # noqa
 
+    def get_requests_per_minute(self) -> Optional[int]:
+        return self._requests_per_minute
+
+    def get_tokens_per_minute(self) -> Optional[int]:
+        return self._tokens_per_minute
+
+    def get_max_concurrent_requests(self) -> Optional[int]:
+        return self._max_concurrent_requests
+
     def supports_tools(self) -> bool:
         return self._supports_tools  # noqa
+
+
+@dataclass
+class LlmRequestPolicy:
+    """How the requests of an action type go beyond its assigned model. If the
+    model hasn't answered after the hedge delay, the same request goes to the
+    hedge model as well, and the first valid response wins. If there's still no
+    valid response, the fallback models get tried in order."""
+
+    hedge_delay_seconds: Optional[float] = None
+    hedge_llm: Optional[Llm] = None
+    fallback_llms: List[Llm] = field(default_factory=list)
+    latency_slo_seconds: Optional[float] = None
+
+    def has_alternatives(self) -> bool:
+        return self.hedge_llm is not None or bool(self.fallback_llms)
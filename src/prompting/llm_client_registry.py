@@ -0,0 +1,173 @@
+import atexit
+import logging
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+import httpx
+import instructor
+from instructor import AsyncInstructor, Instructor, Mode
+from openai import AsyncOpenAI, OpenAI
+
+from src.base.async_bridge import AsyncBridge
+from src.filesystem.config_loader import ConfigLoader
+
+logger = logging.getLogger(__name__)
+
+# (base url, api key, project)
+OpenAiClientKey = Tuple[Optional[str], str, Optional[str]]
+# (base url, api key, mode)
+InstructorClientKey = Tuple[Optional[str], str, Mode]
+
+
+class LlmClientRegistry:
+    """Process-wide registry of long-lived LLM API clients."""
+
+    _shared_instance: Optional["LlmClientRegistry"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+        self._config_loader = config_loader or ConfigLoader()
+
+        self._lock = threading.Lock()
+        self._http_client: Optional[httpx.Client] = None
+        self._openai_clients: Dict[OpenAiClientKey, OpenAI] = {}
+        self._instructor_clients: Dict[InstructorClientKey, Instructor] = {}
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._async_instructor_clients: Dict[InstructorClientKey, AsyncInstructor] = {}
+
+    @classmethod
+    def get_shared_instance(cls) -> "LlmClientRegistry":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+                atexit.register(cls._shared_instance.close)
+
+            return cls._shared_instance
+
+    def _get_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self._config_loader.get_llm_max_connections(),
+            max_keepalive_connections=self._config_loader.get_llm_max_keepalive_connections(),
+            keepalive_expiry=self._config_loader.get_llm_keepalive_expiry(),
+        )
+
+    def _get_http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                limits=self._get_limits(), follow_redirects=True
+            )
+
+        return self._http_client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                limits=self._get_limits(), follow_redirects=True
+            )
+
+        return self._async_http_client
+
+    @staticmethod
+    def _log_exceptions_of(client: Union[Instructor, AsyncInstructor]) -> None:
+        # Hook into the exceptions of the client to log them. Given that the
+        # client is shared, the hook must only be registered once.
+        def log_exception(exception: Exception):
+            logger.error(f"An exception occurred: {str(exception)}")
+
+        client.on("completion:error", log_exception)
+
+    def _get_openai_client_unlocked(
+        self, api_key: str, base_url: Optional[str], project: Optional[str]
+    ) -> OpenAI:
+        key = (base_url, api_key, project)
+
+        if key not in self._openai_clients:
+            logger.info(f"Creating pooled OpenAI client for '{base_url or 'OpenAI'}'.")
+
+            self._openai_clients[key] = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                project=project,
+                http_client=self._get_http_client(),
+            )
+
+        return self._openai_clients[key]
+
+    def get_openai_client(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> OpenAI:
+        with self._lock:
+            return self._get_openai_client_unlocked(api_key, base_url, project)
+
+    def get_instructor_client(
+        self, api_key: str, base_url: Optional[str], mode: Mode
+    ) -> Instructor:
+        with self._lock:
+            key = (base_url, api_key, mode)
+
+            if key not in self._instructor_clients:
+                # The SDK would retry rate-limited requests behind the back of
+                # the rate limiters; instructor retries everything else.
+                client = instructor.from_openai(
+                    self._get_openai_client_unlocked(
+                        api_key, base_url, None
+                    ).with_options(max_retries=0),
+                    mode=mode,
+                )
+
+                self._log_exceptions_of(client)
+
+                self._instructor_clients[key] = client
+
+            return self._instructor_clients[key]
+
+    def get_async_instructor_client(
+        self, api_key: str, base_url: Optional[str], mode: Mode
+    ) -> AsyncInstructor:
+        with self._lock:
+            key = (base_url, api_key, mode)
+
+            if key not in self._async_instructor_clients:
+                logger.info(
+                    f"Creating pooled async OpenAI client for '{base_url or 'OpenAI'}'."
+                )
+
+                client = instructor.from_openai(
+                    AsyncOpenAI(
+                        api_key=api_key,
+                        base_url=base_url,
+                        http_client=self._get_async_http_client(),
+                        max_retries=0,
+                    ),
+                    mode=mode,
+                )
+
+                self._log_exceptions_of(client)
+
+                self._async_instructor_clients[key] = client
+
+            return self._async_instructor_clients[key]
+
+    def close(self) -> None:
+        with self._lock:
+            self._instructor_clients.clear()
+
+            for client in self._openai_clients.values():
+                client.close()
+
+            self._openai_clients.clear()
+
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+            self._async_instructor_clients.clear()
+
+            if self._async_http_client is not None:
+                # Its connections belong to the event loop of the bridge.
+                AsyncBridge.get_shared_instance().run(self._async_http_client.aclose())
+                self._async_http_client = None
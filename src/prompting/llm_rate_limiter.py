@@ -0,0 +1,186 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from src.base.constants import (
+    LLM_CONCURRENCY_DECREASE_FACTOR,
+    LLM_RATE_LIMIT_BACKOFF_BASE_SECONDS,
+    LLM_RATE_LIMIT_BACKOFF_MAX_SECONDS,
+)
+
+# How long to wait before checking again for a free slot, when the limiter
+# can't be woken up by a release (the async waiters).
+CONCURRENCY_POLL_SECONDS = 0.05
+
+
+class TokenBucket:
+    """Allows up to 'capacity_per_minute' units per minute, with bursts."""
+
+    def __init__(self, capacity_per_minute: int, now: float):
+        if capacity_per_minute < 1:
+            raise ValueError("capacity_per_minute must be at least 1.")
+
+        self._capacity = float(capacity_per_minute)
+        self._refill_per_second = self._capacity / 60.0
+        self._level = self._capacity
+        self._updated_at = now
+
+    def _refill(self, now: float) -> None:
+        self._level = min(
+            self._capacity,
+            self._level + (now - self._updated_at) * self._refill_per_second,
+        )
+        self._updated_at = now
+
+    def get_wait_seconds(self, amount: float, now: float) -> float:
+        self._refill(now)
+
+        # A request bigger than the whole bucket would never fit otherwise.
+        amount = min(amount, self._capacity)
+
+        if self._level >= amount:
+            return 0.0
+
+        return (amount - self._level) / self._refill_per_second
+
+    def consume(self, amount: float) -> None:
+        self._level -= min(amount, self._capacity)
+
+
+class LlmRateLimiter:
+    """Limits the requests to a model, adapting the concurrency like TCP does."""
+
+    def __init__(
+        self,
+        max_concurrent_requests: int,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1.")
+
+        self._max_concurrent_requests = max_concurrent_requests
+        self._clock = clock
+
+        now = clock()
+
+        self._request_bucket = (
+            TokenBucket(requests_per_minute, now) if requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(tokens_per_minute, now) if tokens_per_minute else None
+        )
+
+        self._condition = threading.Condition()
+        self._concurrency_limit = float(max_concurrent_requests)
+        self._in_flight = 0
+        self._blocked_until = now
+        self._consecutive_rate_limits = 0
+
+    def has_token_budget(self) -> bool:
+        return self._token_bucket is not None
+
+    def get_concurrency_limit(self) -> int:
+        with self._condition:
+            return int(self._concurrency_limit)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Takes a slot and consumes the budgets if the request can go ahead.
+        Otherwise returns how long to wait before trying again."""
+        now = self._clock()
+
+        wait_seconds = self._blocked_until - now
+
+        if self._in_flight >= int(self._concurrency_limit):
+            wait_seconds = max(wait_seconds, CONCURRENCY_POLL_SECONDS)
+
+        if self._request_bucket:
+            wait_seconds = max(
+                wait_seconds, self._request_bucket.get_wait_seconds(1, now)
+            )
+
+        if self._token_bucket:
+            wait_seconds = max(
+                wait_seconds, self._token_bucket.get_wait_seconds(tokens, now)
+            )
+
+        if wait_seconds > 0:
+            return wait_seconds
+
+        if self._request_bucket:
+            self._request_bucket.consume(1)
+
+        if self._token_bucket:
+            self._token_bucket.consume(tokens)
+
+        self._in_flight += 1
+
+        return 0.0
+
+    def acquire(self, tokens: int = 0) -> None:
+        with self._condition:
+            while (wait_seconds := self._try_acquire(tokens)) > 0:
+                # Releases wake the waiters up early.
+                self._condition.wait(wait_seconds)
+
+    async def acquire_async(self, tokens: int = 0) -> None:
+        while True:
+            with self._condition:
+                wait_seconds = self._try_acquire(tokens)
+
+            if wait_seconds <= 0:
+                return
+
+            await asyncio.sleep(wait_seconds)
+
+    def _get_backoff_seconds(self) -> float:
+        backoff_seconds = min(
+            LLM_RATE_LIMIT_BACKOFF_MAX_SECONDS,
+            LLM_RATE_LIMIT_BACKOFF_BASE_SECONDS
+            # Bounded, so that the power can't overflow a float.
+            * 2 ** min(self._consecutive_rate_limits - 1, 32),
+        )
+
+        # Half fixed, half random, so that the waiting requests don't all
+        # return at once.
+        return backoff_seconds / 2 + random.uniform(0, backoff_seconds / 2)
+
+    def abandon(self) -> None:
+        """Frees the slot taken by 'acquire' for a request that didn't get an
+        answer, such as a cancelled one, which says nothing about the limits."""
+        with self._condition:
+            self._in_flight -= 1
+
+            self._condition.notify_all()
+
+    def release(self, rate_limited: bool, retry_after: Optional[float] = None) -> None:
+        """Frees the slot taken by 'acquire', and adapts to how the request
+        went."""
+        with self._condition:
+            self._in_flight -= 1
+
+            if rate_limited:
+                self._consecutive_rate_limits += 1
+                self._concurrency_limit = max(
+                    1.0, self._concurrency_limit * LLM_CONCURRENCY_DECREASE_FACTOR
+                )
+                self._blocked_until = max(
+                    self._blocked_until,
+                    self._clock()
+                    + (
+                        retry_after
+                        if retry_after is not None
+                        else self._get_backoff_seconds()
+                    ),
+                )
+            else:
+                self._consecutive_rate_limits = 0
+                self._concurrency_limit = min(
+                    float(self._max_concurrent_requests),
+                    self._concurrency_limit + 1 / self._concurrency_limit,
+                )
+
+            self._condition.notify_all()
@@ -0,0 +1,44 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.llm import Llm
+from src.prompting.llm_rate_limiter import LlmRateLimiter
+
+# (base url of the provider, name of the model)
+LlmRateLimiterKey = Tuple[str, str]
+
+
+class LlmRateLimiterRegistry:
+    """Process-wide registry of the rate limiters of every model."""
+
+    _shared_instance: Optional["LlmRateLimiterRegistry"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+        self._config_loader = config_loader or ConfigLoader()
+
+        self._lock = threading.Lock()
+        self._rate_limiters: Dict[LlmRateLimiterKey, LlmRateLimiter] = {}
+
+    @classmethod
+    def get_shared_instance(cls) -> "LlmRateLimiterRegistry":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def get_rate_limiter(self, base_url: str, llm: Llm) -> LlmRateLimiter:
+        key = (base_url, llm.get_name())
+
+        with self._lock:
+            if key not in self._rate_limiters:
+                self._rate_limiters[key] = LlmRateLimiter(
+                    llm.get_max_concurrent_requests()
+                    or self._config_loader.get_llm_max_concurrent_requests_per_model(),
+                    llm.get_requests_per_minute(),
+                    llm.get_tokens_per_minute(),
+                )
+
+            return self._rate_limiters[key]
@@ -0,0 +1,82 @@
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LlmRequestPolicyStatistics:
+    # How many requests each model won, by name. The requests that no model
+    # answered validly are counted under None.
+    wins: Counter = field(default_factory=Counter)
+    latency_slo_misses: int = 0
+
+    @property
+    def completions(self) -> int:
+        return sum(self.wins.values())
+
+
+class LlmRequestPolicyRecorder:
+    """Tracks which models win the requests sent under a request policy."""
+
+    _shared_instance: Optional["LlmRequestPolicyRecorder"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statistics: Dict[str, LlmRequestPolicyStatistics] = {}
+
+    @classmethod
+    def get_shared_instance(cls) -> "LlmRequestPolicyRecorder":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def record(
+        self,
+        action_type: str,
+        winning_model: Optional[str],
+        elapsed_seconds: float,
+        latency_slo_seconds: Optional[float],
+    ) -> None:
+        missed_slo = (
+            latency_slo_seconds is not None and elapsed_seconds > latency_slo_seconds
+        )
+
+        with self._lock:
+            statistics = self._statistics.setdefault(
+                action_type, LlmRequestPolicyStatistics()
+            )
+            statistics.wins[winning_model] += 1
+
+            if missed_slo:
+                statistics.latency_slo_misses += 1
+
+        if missed_slo:
+            logger.warning(
+                "'%s' took %.1fs, over its SLO of %.1fs. Won by '%s'.",
+                action_type,
+                elapsed_seconds,
+                latency_slo_seconds,
+                winning_model,
+            )
+        else:
+            logger.info(
+                "'%s' took %.1fs. Won by '%s'.",
+                action_type,
+                elapsed_seconds,
+                winning_model,
+            )
+
+    def get_statistics(self, action_type: str) -> LlmRequestPolicyStatistics:
+        with self._lock:
+            statistics = self._statistics.get(action_type, LlmRequestPolicyStatistics())
+
+            return LlmRequestPolicyStatistics(
+                Counter(statistics.wins), statistics.latency_slo_misses
+            )
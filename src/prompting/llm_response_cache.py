@@ -0,0 +1,198 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+from src.base.constants import SQLITE_BUSY_TIMEOUT_SECONDS
+from src.base.enums import LlmResponseCacheMode
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.path_manager import PathManager
+from src.prompting.llm import Llm
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    action_type TEXT,
+    model TEXT NOT NULL,
+    response BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_by_last_use ON responses (last_used_at);
+"""
+
+
+class LlmResponseCache:
+    """Stores the responses of the LLM on disk, for identical requests to reuse."""
+
+    _shared_instance: Optional["LlmResponseCache"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        path_manager: Optional[PathManager] = None,
+        database_path: Optional[Path] = None,
+    ):
+        config_loader = config_loader or ConfigLoader()
+        path_manager = path_manager or PathManager()
+
+        self._mode = config_loader.get_llm_response_cache_mode()
+        self._cached_action_types = set(config_loader.get_cached_llm_action_types())
+        self._max_bytes = config_loader.get_llm_response_cache_max_megabytes() * (
+            1024 * 1024
+        )
+        self._database_path = (
+            database_path or path_manager.get_llm_response_cache_database_path()
+        )
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def get_shared_instance(cls) -> "LlmResponseCache":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._database_path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._connection = sqlite3.connect(
+                self._database_path,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+        return self._connection
+
+    def applies_to(self, llm: Llm) -> bool:
+        if self._mode == LlmResponseCacheMode.OFF:
+            return False
+
+        if self._mode == LlmResponseCacheMode.ON:
+            return llm.get_action_type() in self._cached_action_types
+
+        return True
+
+    def is_replaying(self) -> bool:
+        return self._mode == LlmResponseCacheMode.REPLAY
+
+    @staticmethod
+    def create_key(
+        llm: Llm, messages_to_llm: MessagesToLlm, response_model: Type[BaseModel]
+    ) -> str:
+        request = {
+            "model": llm.get_name(),
+            "temperature": llm.get_temperature(),
+            "top_p": llm.get_top_p(),
+            "frequency_penalty": llm.get_frequency_penalty(),
+            "presence_penalty": llm.get_presence_penalty(),
+            "messages": hashlib.sha256(
+                json.dumps(messages_to_llm.get(), sort_keys=True).encode("utf-8")
+            ).hexdigest(),
+            "response_model": response_model.model_json_schema(),
+        }
+
+        return hashlib.sha256(
+            json.dumps(request, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def read(self, key: str, response_model: Type[BaseModel]) -> Optional[BaseModel]:
+        # Recording refreshes every response.
+        if self._mode == LlmResponseCacheMode.RECORD:
+            return None
+
+        with self._lock:
+            connection = self._get_connection()
+
+            row = connection.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE responses SET last_used_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        try:
+            return response_model.model_validate_json(zlib.decompress(row[0]))
+        except (zlib.error, ValueError) as e:
+            logger.warning("Couldn't load the cached response '%s': %s", key, e)
+            return None
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total_size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        if total_size <= self._max_bytes:
+            return
+
+        evicted_keys = []
+
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_used_at"
+        ).fetchall():
+            if total_size <= self._max_bytes:
+                break
+
+            evicted_keys.append((key,))
+            total_size -= size
+
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+
+        logger.info("Evicted %s cached LLM responses.", len(evicted_keys))
+
+    def write(self, key: str, llm: Llm, response: BaseModel) -> None:
+        compressed_response = zlib.compress(response.model_dump_json().encode("utf-8"))
+
+        with self._lock:
+            connection = self._get_connection()
+
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        llm.get_action_type(),
+                        llm.get_name(),
+                        compressed_response,
+                        len(compressed_response),
+                        time.time(),
+                    ),
+                )
+
+                self._evict(connection)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -3,7 +3,7 @@ from typing import Optional
 from src.filesystem.file_operations import read_json_file
 from src.filesystem.filesystem_manager import FilesystemManager
 from src.filesystem.path_manager import PathManager
-from src.prompting.llm import Llm
+from src.prompting.llm import Llm, LlmRequestPolicy
 
 
 class Llms:
@@ -20,77 +20,109 @@ class Llms:
 
         self._models = self._llms_file["models"]
 
+    def _create_request_policy(self, action_type: str) -> Optional[LlmRequestPolicy]:
+        policy_data = self._llms_file.get("policies", {}).get(action_type)
+
+        if not policy_data:
+            return None
+
+        def to_seconds(key: str) -> Optional[float]:
+            milliseconds = policy_data.get(key)
+
+            return milliseconds / 1000 if milliseconds is not None else None
+
+        hedge_model = policy_data.get("hedge_model")
+
+        return LlmRequestPolicy(
+            hedge_delay_seconds=to_seconds("hedge_after_milliseconds"),
+            hedge_llm=(
+                Llm(self._models[hedge_model], action_type) if hedge_model else None
+            ),
+            fallback_llms=[
+                Llm(self._models[fallback_model], action_type)
+                for fallback_model in policy_data.get("fallback_models", [])
+            ],
+            latency_slo_seconds=to_seconds("latency_slo_milliseconds"),
+        )
+
+    def _create_llm(self, action_type: str) -> Llm:
+        return Llm(
+            self._models[self._llms_file[action_type]],
+            action_type,
+            self._create_request_policy(action_type),
+        )
+
     def for_story_universe_generation(self) -> Llm:
-        return Llm(self._models[self._llms_file["story_universe_generation"]])
+        return self._create_llm("story_universe_generation")
 
     def for_place_generation(self) -> Llm:
-        return Llm(self._models[self._llms_file["place_generation"]])
+        return self._create_llm("place_generation")
 
     def for_place_description(self) -> Llm:
-        return Llm(self._models[self._llms_file["place_description"]])
+        return self._create_llm("place_description")
 
     def for_travel_narration(self) -> Llm:
-        return Llm(self._models[self._llms_file["travel_narration"]])
+        return self._create_llm("travel_narration")
 
     def for_speech_patterns_generation(self) -> Llm:
-        return Llm(self._models[self._llms_file["speech_patterns_generation"]])
+        return self._create_llm("speech_patterns_generation")
 
     def for_character_connection(self) -> Llm:
-        return Llm(self._models[self._llms_file["character_connection"]])
+        return self._create_llm("character_connection")
 
     def for_concept_generation(self) -> Llm:
-        return Llm(self._models[self._llms_file["concept_generation"]])
+        return self._create_llm("concept_generation")
 
     def for_ambient_narration(self) -> Llm:
-        return Llm(self._models[self._llms_file["ambient_narration"]])
+        return self._create_llm("ambient_narration")
 
     def for_narrative_beat(self) -> Llm:
-        return Llm(self._models[self._llms_file["narrative_beat"]])
+        return self._create_llm("narrative_beat")
 
     def for_confrontation_round(self) -> Llm:
-        return Llm(self._models[self._llms_file["confrontation_round"]])
+        return self._create_llm("confrontation_round")
 
     def for_grow_event(self) -> Llm:
-        return Llm(self._models[self._llms_file["grow_event"]])
+        return self._create_llm("grow_event")
 
     def for_brainstorm_events(self) -> Llm:
-        return Llm(self._models[self._llms_file["brainstorm_events"]])
+        return self._create_llm("brainstorm_events")
 
     def for_character_description(self) -> Llm:
-        return Llm(self._models[self._llms_file["character_description"]])
+        return self._create_llm("character_description")
 
     def for_base_character_data_generation(self) -> Llm:
-        return Llm(self._models[self._llms_file["base_character_data_generation"]])
+        return self._create_llm("base_character_data_generation")
 
     def for_speech_turn_choice(self) -> Llm:
-        return Llm(self._models[self._llms_file["speech_turn_choice"]])
+        return self._create_llm("speech_turn_choice")
 
     def for_speech_turn(self) -> Llm:
-        return Llm(self._models[self._llms_file["speech_turn"]])
+        return self._create_llm("speech_turn")
 
     def for_dialogue_summary(self) -> Llm:
-        return Llm(self._models[self._llms_file["dialogue_summary"]])
+        return self._create_llm("dialogue_summary")
 
     def for_self_reflection(self) -> Llm:
-        return Llm(self._models[self._llms_file["self-reflection"]])
+        return self._create_llm("self-reflection")
 
     def for_worldview(self) -> Llm:
-        return Llm(self._models[self._llms_file["worldview"]])
+        return self._create_llm("worldview")
 
     def for_action_resolution(self) -> Llm:
-        return Llm(self._models[self._llms_file["action_resolution"]])
+        return self._create_llm("action_resolution")
 
     def for_secrets_generation(self) -> Llm:
-        return Llm(self._models[self._llms_file["secrets"]])
+        return self._create_llm("secrets")
 
     def for_character_generation_guidelines(self) -> Llm:
-        return Llm(self._models[self._llms_file["character_generation_guidelines"]])
+        return self._create_llm("character_generation_guidelines")
 
     def for_writers_room(self) -> Llm:
-        return Llm(self._models[self._llms_file["writers_room"]])
+        return self._create_llm("writers_room")
 
     def for_interviewee_response(self) -> Llm:
-        return Llm(self._models[self._llms_file["interviewee_response"]])
+        return self._create_llm("interviewee_response")
 
     def for_place_facts(self) -> Llm:
-        return Llm(self._models[self._llms_file["place_facts"]])
+        return self._create_llm("place_facts")
@@ -0,0 +1,47 @@
+import asyncio
+from typing import List, Optional
+
+from src.base.abstracts.observer import Observer
+
+
+class FirstPartialResponseObserver(Observer):
+    """Forwards partial responses, signaling when the first one arrives."""
+
+    def __init__(
+        self,
+        observer: Observer,
+        racers: Optional[List["FirstPartialResponseObserver"]] = None,
+    ):
+        self._observer = observer
+
+        # The observers of the models racing for the same request, this one
+        # included. Only the first of them to stream reaches the observer.
+        self._racers = racers if racers is not None else []
+        self._racers.append(self)
+
+        self._arrived: Optional[asyncio.Event] = None
+
+    def create_rival(self) -> "FirstPartialResponseObserver":
+        """Returns an observer for another model racing for the same request."""
+        return FirstPartialResponseObserver(self._observer, self._racers)
+
+    def arm(self) -> asyncio.Event:
+        """Returns the event set by the first partial response from now on.
+        Must be called on the loop the client streams from."""
+        self._arrived = asyncio.Event()
+
+        return self._arrived
+
+    def has_arrived(self) -> bool:
+        return self._arrived is not None and self._arrived.is_set()
+
+    def update(self, message: dict) -> None:
+        # The rival is about to be cancelled, and its partial responses would
+        # get mixed with those the user is watching.
+        if any(racer.has_arrived() for racer in self._racers if racer is not self):
+            return
+
+        if message and self._arrived is not None:
+            self._arrived.set()
+
+        self._observer.update(message)
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from src.base.async_bridge import AsyncBridge
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.async_llm_client import AsyncLlmClient
+from src.prompting.abstracts.llm_client import LlmClient
+from src.prompting.llm import Llm
+
+
+class PolicyLlmClient(LlmClient):
+    """Sends a request under its request policy from sync code."""
+
+    def __init__(
+        self,
+        async_policy_llm_client: AsyncLlmClient,
+        async_bridge: Optional[AsyncBridge] = None,
+    ):
+        self._async_policy_llm_client = async_policy_llm_client
+        self._async_bridge = async_bridge or AsyncBridge.get_shared_instance()
+
+    def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        return self._async_bridge.run(
+            self._async_policy_llm_client.generate_completion(model, messages_to_llm)
+        )
+
+    def generate_image(self, prompt: str) -> str:
+        raise NotImplementedError("The request policies only apply to completions.")
@@ -5,12 +5,16 @@ from typing import Optional, Type
 
 from pydantic import BaseModel
 
-from src.filesystem.file_operations import read_file
 from src.filesystem.path_manager import PathManager
 from src.prompting.abstracts.abstract_factories import (
     ProduceToolResponseStrategyFactory,
 )
+from src.prompting.abstracts.strategies import ProduceToolResponseStrategy
 from src.prompting.algorithms.tokenize_algorithm import TokenizeAlgorithm
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
+from src.prompting.response_model_schemas import render_tool_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -24,21 +28,26 @@ class BaseToolResponseProvider:
         self,
         produce_tool_response_strategy_factory: ProduceToolResponseStrategyFactory,
         path_manager: Optional[PathManager] = None,
+        prompt_template_repository: Optional[PromptTemplateRepository] = None,
     ):
         self._produce_tool_response_strategy_factory = (
             produce_tool_response_strategy_factory
         )
 
         self._path_manager = path_manager or PathManager()
+        self._prompt_template_repository = (
+            prompt_template_repository or PromptTemplateRepository.get_shared_instance()
+        )
 
-    @staticmethod
-    def _read_prompt_file(prompt_file: Path) -> str:
-        """Reads a prompt file from the filesystem."""
-        return read_file(prompt_file)
+    def _read_prompt_file(self, prompt_file: Path) -> str:
+        """Reads a prompt file through the template cache."""
+        return self._prompt_template_repository.get_text(prompt_file)
 
     def _read_tool_instructions(self) -> str:
-        """Reads the tool instructions from the filesystem."""
-        return read_file(self._path_manager.get_tool_instructions_for_instructor_path())
+        """Reads the tool instructions through the template cache."""
+        return self._prompt_template_repository.get_text(
+            self._path_manager.get_tool_instructions_for_instructor_path()
+        )
 
     @staticmethod
     def _format_prompt(prompt_template: str, **kwargs) -> str:
@@ -55,18 +64,32 @@ class BaseToolResponseProvider:
         )
         return system_content
 
+    def _create_strategy(self) -> ProduceToolResponseStrategy:
+        return (
+            self._produce_tool_response_strategy_factory.create_produce_tool_response_strategy()
+        )
+
     def _produce_tool_response(
         self, system_content: str, user_content: str, response_model: Type[BaseModel]
     ):
         """Produces the tool response using the strategy factory."""
-        strategy = (
-            self._produce_tool_response_strategy_factory.create_produce_tool_response_strategy()
+        tool_response = self._create_strategy().produce_tool_response(
+            system_content, user_content, response_model
         )
 
-        tool_response = strategy.produce_tool_response(
+        return self._create_product_from_tool_response(tool_response)
+
+    async def _produce_tool_response_async(
+        self, system_content: str, user_content: str, response_model: Type[BaseModel]
+    ):
+        """Same as '_produce_tool_response', without blocking on the LLM."""
+        tool_response = await self._create_strategy().produce_tool_response_async(
             system_content, user_content, response_model
         )
 
+        return self._create_product_from_tool_response(tool_response)
+
+    def _create_product_from_tool_response(self, tool_response):
         if isinstance(tool_response, BaseModel):
             return self.create_product_from_base_model(tool_response)
         else:
@@ -77,29 +100,33 @@ class BaseToolResponseProvider:
     def peep_into_system_content(self, system_content: str):
         pass
 
-    @staticmethod
-    def _generate_tool_prompt(tool_data: dict, tool_instructions: str) -> str:
-        return f"{tool_instructions} {tool_data}"
-
-    def generate_product(self, response_model: Type[BaseModel]):
+    def _generate_system_content_for(self, response_model: Type[BaseModel]) -> str:
         formatted_prompt = self.get_formatted_prompt()
         if formatted_prompt is None:
             prompt_file = self.get_prompt_file()
             prompt_kwargs = self.get_prompt_kwargs()
             prompt_template = self._read_prompt_file(prompt_file)
             formatted_prompt = self._format_prompt(prompt_template, **prompt_kwargs)
-        tool_data = self._get_tool_data(response_model)
-        tool_instructions = self._read_tool_instructions()
-        tool_prompt = self._generate_tool_prompt(tool_data, tool_instructions)
+        tool_prompt = render_tool_prompt(response_model, self._read_tool_instructions())
         system_content = self._generate_system_content(formatted_prompt, tool_prompt)
         logger.info(system_content)
         self.peep_into_system_content(system_content)
+        return system_content
+
+    def generate_product(self, response_model: Type[BaseModel]):
+        system_content = self._generate_system_content_for(response_model)
         user_content = self.get_user_content()
         return self._produce_tool_response(system_content, user_content, response_model)
 
-    @staticmethod
-    def _get_tool_data(response_model: Type[BaseModel]) -> dict:
-        return response_model.model_json_schema()
+    async def generate_product_async(self, response_model: Type[BaseModel]):
+        """Generates the product without tying up a thread while the LLM
+        works, so that several of them can be awaited at once. Run it through
+        the AsyncBridge."""
+        system_content = self._generate_system_content_for(response_model)
+        user_content = self.get_user_content()
+        return await self._produce_tool_response_async(
+            system_content, user_content, response_model
+        )
 
     @abstractmethod
     def get_user_content(self) -> str:
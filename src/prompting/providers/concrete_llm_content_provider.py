@@ -14,7 +14,9 @@ from src.filesystem.path_manager import PathManager
 from src.prompting.abstracts.abstract_factories import (
     LlmContentProvider,
     LlmClientFactory,
+    AsyncLlmClientFactory,
 )
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
 from src.prompting.abstracts.factory_products import LlmContentProduct
 from src.prompting.llm import Llm
 from src.prompting.products.base_model_llm_content_product import (
@@ -35,10 +37,12 @@ class ConcreteLlmContentProvider(LlmContentProvider):
         messages_to_llm: MessagesToLlm,
         llm_client_factory: LlmClientFactory,
         path_manager: Optional[PathManager] = None,
+        async_llm_client_factory: Optional[AsyncLlmClientFactory] = None,
     ):
         self._llm = llm
         self._messages_to_llm = messages_to_llm
         self._llm_client_factory = llm_client_factory
+        self._async_llm_client_factory = async_llm_client_factory
 
         self._path_manager = path_manager or PathManager()
 
@@ -50,6 +54,30 @@ class ConcreteLlmContentProvider(LlmContentProvider):
             messages_to_llm=self._messages_to_llm,
         )
 
+        return self._create_content_product(ai_completion_product)
+
+    async def generate_content_async(
+        self, response_model: Type[BaseModel]
+    ) -> LlmContentProduct:
+        if not self._async_llm_client_factory:
+            raise ValueError(
+                "This content provider wasn't given a factory of async LLM clients."
+            )
+
+        ai_completion_product = (
+            await self._async_llm_client_factory.create_async_llm_client(
+                self._llm, response_model
+            ).generate_completion(
+                model=self._llm,
+                messages_to_llm=self._messages_to_llm,
+            )
+        )
+
+        return self._create_content_product(ai_completion_product)
+
+    def _create_content_product(
+        self, ai_completion_product: AiCompletionProduct
+    ) -> LlmContentProduct:
         if ai_completion_product.is_valid():
             content = ai_completion_product.get()
 
@@ -0,0 +1,94 @@
+import logging
+from typing import Optional
+
+from openai import RateLimitError
+
+from src.base.enums import AiCompletionErrorType
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.abstracts.ai_completion_product import AiCompletionProduct
+from src.prompting.abstracts.llm_client import LlmClient
+from src.prompting.algorithms.tokenize_algorithm import TokenizeAlgorithm
+from src.prompting.llm import Llm
+from src.prompting.llm_rate_limiter import LlmRateLimiter
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_prompt_tokens(
+    rate_limiter: LlmRateLimiter, messages_to_llm: MessagesToLlm
+) -> int:
+    # Tokenizing isn't free, so it's skipped unless there's a budget to spend.
+    if not rate_limiter.has_token_budget():
+        return 0
+
+    return TokenizeAlgorithm(
+        "\n".join(message["content"] for message in messages_to_llm.get())
+    ).do_algorithm()
+
+
+def get_retry_after(e: RateLimitError) -> Optional[float]:
+    try:
+        return float(e.response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+def is_rate_limited(ai_completion_product: AiCompletionProduct) -> bool:
+    # OpenRouter may also report being rate limited in the body of a response.
+    return ai_completion_product.get_error() == AiCompletionErrorType.TOO_MANY_REQUESTS
+
+
+def create_rate_limited_product(model: Llm) -> InstructorAiCompletionProduct:
+    logger.error("Gave up on '%s' after being rate limited.", model.get_name())
+
+    return InstructorAiCompletionProduct(
+        None, is_valid=False, error=AiCompletionErrorType.TOO_MANY_REQUESTS
+    )
+
+
+class RateLimitedLlmClient(LlmClient):
+    """Sends the completions of another client through the model's rate limiter."""
+
+    def __init__(
+        self,
+        llm_client: LlmClient,
+        rate_limiter: LlmRateLimiter,
+        config_loader: Optional[ConfigLoader] = None,
+    ):
+        self._llm_client = llm_client
+        self._rate_limiter = rate_limiter
+        self._config_loader = config_loader or ConfigLoader()
+
+    def generate_completion(
+        self, model: Llm, messages_to_llm: MessagesToLlm
+    ) -> AiCompletionProduct:
+        tokens = estimate_prompt_tokens(self._rate_limiter, messages_to_llm)
+
+        for _ in range(self._config_loader.get_llm_rate_limit_max_retries() + 1):
+            self._rate_limiter.acquire(tokens)
+
+            try:
+                ai_completion_product = self._llm_client.generate_completion(
+                    model, messages_to_llm
+                )
+            except RateLimitError as e:
+                self._rate_limiter.release(True, get_retry_after(e))
+                continue
+            except BaseException:
+                # Including cancellations, which must give the slot back too.
+                self._rate_limiter.abandon()
+                raise
+
+            self._rate_limiter.release(is_rate_limited(ai_completion_product))
+
+            if not is_rate_limited(ai_completion_product):
+                return ai_completion_product
+
+        return create_rate_limited_product(model)
+
+    def generate_image(self, prompt: str) -> str:
+        return self._llm_client.generate_image(prompt)
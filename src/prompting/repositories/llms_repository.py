@@ -19,8 +19,13 @@ class LlmsRepository:
         return self._load_llms_data()[action_type]
 
     def get_action_types(self) -> List[str]:
-        """Get the list of action types (keys in llms_data excluding 'models')"""
-        return [key for key in self._load_llms_data().keys() if key != "models"]
+        """Get the list of action types (keys in llms_data excluding 'models'
+        and 'policies')"""
+        return [
+            key
+            for key in self._load_llms_data().keys()
+            if key not in ("models", "policies")
+        ]
 
     @staticmethod
     def get_action_type_category(action_type: str) -> str:
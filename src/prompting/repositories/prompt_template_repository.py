@@ -0,0 +1,135 @@
+import logging
+import os
+import string
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.base.exceptions import PromptTemplateError
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.file_operations import read_file
+from src.filesystem.json_file_cache import FileSignature
+from src.filesystem.path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    file_path: Path
+    text: str
+    field_names: Tuple[str, ...]
+    signature: FileSignature
+
+    def format(self, **kwargs) -> str:
+        missing_field_names = [
+            field_name for field_name in self.field_names if field_name not in kwargs
+        ]
+
+        if missing_field_names:
+            raise PromptTemplateError(
+                f"Template '{self.file_path.name}' is missing values for: {', '.join(missing_field_names)}."
+            )
+
+        return self.text.format(**kwargs)
+
+
+class PromptTemplateRepository:
+    """Process-wide repository of the prompt templates under data/prompting."""
+
+    _shared_instance: Optional["PromptTemplateRepository"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path_manager: Optional[PathManager] = None,
+        config_loader: Optional[ConfigLoader] = None,
+    ):
+        self._path_manager = path_manager or PathManager()
+        self._config_loader = config_loader or ConfigLoader()
+
+        self._lock = threading.Lock()
+        self._templates: Dict[Path, PromptTemplate] = {}
+
+    @classmethod
+    def get_shared_instance(cls) -> "PromptTemplateRepository":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    @staticmethod
+    def _get_signature(file_path: Path) -> FileSignature:
+        stat_result = os.stat(file_path)
+
+        return stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_size
+
+    @staticmethod
+    def _parse_field_names(file_path: Path, text: str) -> Tuple[str, ...]:
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError as exception:
+            raise PromptTemplateError(
+                f"Template '{file_path}' couldn't be parsed: {exception}"
+            ) from exception
+
+        field_names = []
+
+        for _, field_name, _, _ in parsed:
+            if field_name is None:
+                continue
+
+            if not field_name.isidentifier():
+                raise PromptTemplateError(
+                    f"Template '{file_path}' has an invalid placeholder '{{{field_name}}}'."
+                )
+
+            if field_name not in field_names:
+                field_names.append(field_name)
+
+        return tuple(field_names)
+
+    def _load_template(self, file_path: Path) -> PromptTemplate:
+        signature = self._get_signature(file_path)
+        text = read_file(file_path)
+
+        return PromptTemplate(
+            file_path, text, self._parse_field_names(file_path, text), signature
+        )
+
+    def load_all(self) -> int:
+        """Loads and validates every template under the prompting directory.
+        Returns how many templates were loaded."""
+        templates = {
+            file_path: self._load_template(file_path)
+            for file_path in sorted(self._path_manager.PROMPTING_DIR.rglob("*.txt"))
+        }
+
+        with self._lock:
+            self._templates.update(templates)
+
+        logger.info(f"Loaded {len(templates)} prompt templates.")
+
+        return len(templates)
+
+    def get_template(self, file_path: Path) -> PromptTemplate:
+        with self._lock:
+            template = self._templates.get(file_path)
+
+        if template is not None and not (
+            self._config_loader.get_hot_reload_prompt_templates()
+            and self._get_signature(file_path) != template.signature
+        ):
+            return template
+
+        template = self._load_template(file_path)
+
+        with self._lock:
+            self._templates[file_path] = template
+
+        return template
+
+    def get_text(self, file_path: Path) -> str:
+        return self.get_template(file_path).text
@@ -0,0 +1,17 @@
+import functools
+from typing import Type
+
+from pydantic import BaseModel
+
+from src.base.constants import MAX_CACHED_RESPONSE_MODEL_SCHEMAS
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_RESPONSE_MODEL_SCHEMAS)
+def _get_cached_json_schema(response_model: Type[BaseModel]) -> dict:
+    return response_model.model_json_schema()
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_RESPONSE_MODEL_SCHEMAS)
+def render_tool_prompt(response_model: Type[BaseModel], tool_instructions: str) -> str:
+    """Renders the tool prompt that tells the LLM which schema to answer with."""
+    return f"{tool_instructions} {_get_cached_json_schema(response_model)}"
@@ -3,6 +3,7 @@ from typing import Type
 from pydantic import BaseModel
 
 from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.abstracts.factory_products import LlmContentProduct
 from src.prompting.abstracts.strategies import ProduceToolResponseStrategy
 from src.prompting.factories.llm_content_provider_factory import (
     LlmContentProviderFactory,
@@ -17,19 +18,18 @@ class BaseModelProduceToolResponseStrategy(ProduceToolResponseStrategy):
     ):
         self._llm_content_provider_factory = llm_content_provider_factory
 
-    def produce_tool_response(
-        self, system_content: str, user_content: str, response_model: Type[BaseModel]
-    ) -> BaseModel:
+    @staticmethod
+    def _create_messages_to_llm(
+        system_content: str, user_content: str
+    ) -> MessagesToLlm:
         messages_to_llm = MessagesToLlm()
         messages_to_llm.add_message("system", system_content)
         messages_to_llm.add_message("user", user_content)
 
-        llm_content_product = (
-            self._llm_content_provider_factory.create_llm_content_provider(
-                messages_to_llm
-            ).generate_content(response_model)
-        )
+        return messages_to_llm
 
+    @staticmethod
+    def _get_base_model(llm_content_product: LlmContentProduct) -> BaseModel:
         if not llm_content_product.is_valid():
             raise ValueError(
                 f"Failed to receive content from LLM: {llm_content_product.get_error()}"
@@ -43,3 +43,25 @@ class BaseModelProduceToolResponseStrategy(ProduceToolResponseStrategy):
             )
 
         return product
+
+    def produce_tool_response(
+        self, system_content: str, user_content: str, response_model: Type[BaseModel]
+    ) -> BaseModel:
+        llm_content_product = (
+            self._llm_content_provider_factory.create_llm_content_provider(
+                self._create_messages_to_llm(system_content, user_content)
+            ).generate_content(response_model)
+        )
+
+        return self._get_base_model(llm_content_product)
+
+    async def produce_tool_response_async(
+        self, system_content: str, user_content: str, response_model: Type[BaseModel]
+    ) -> BaseModel:
+        llm_content_product = (
+            await self._llm_content_provider_factory.create_llm_content_provider(
+                self._create_messages_to_llm(system_content, user_content)
+            ).generate_content_async(response_model)
+        )
+
+        return self._get_base_model(llm_content_product)
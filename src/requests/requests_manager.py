@@ -1,13 +1,12 @@
 import logging
-import time
 from typing import Optional, Any
 
 import requests
-import runpod
 
 from src.filesystem.config_loader import ConfigLoader
-from src.filesystem.file_operations import read_json_file
 from src.filesystem.path_manager import PathManager
+from src.requests.xtts_endpoint_resolver import XttsEndpointResolver
+from src.requests.xtts_session_registry import XttsSessionRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -16,71 +15,33 @@ class RequestsManager:
 
     def __init__(
         self,
-        max_retries: int = 5,
-        retry_delay: float = 2.0,
         config_loader: Optional[ConfigLoader] = None,
         path_manager: Optional[PathManager] = None,
+        xtts_endpoint_resolver: Optional[XttsEndpointResolver] = None,
+        xtts_session_registry: Optional[XttsSessionRegistry] = None,
     ):
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-
         self._config_loader = config_loader or ConfigLoader()
         self._path_manager = path_manager or PathManager()
 
-        self._xtts_data = read_json_file(self._path_manager.get_xtts_config_path())
-
-    def _get_pod_url(self) -> Optional[str]:
-        runpod.api_key = self._config_loader.load_runpod_secret_key()
-        try:
-            pods = runpod.get_pods()
-        except Exception as e:
-            logger.error(f"Failed to fetch pods: {e}")
-            return None
-        if not pods:
-            return None
-        for pod in pods:
-            pod_id = pod.get("id")
-            desired_status = pod.get("desiredStatus", "").lower()
-            if pod_id and desired_status == "running":
-                endpoint_url = f"https://{pod_id}-8020.proxy.runpod.net"
-                return endpoint_url
-            else:
-                logger.warning(f"Pod {pod_id} is not running: {pod}")
-        logger.warning("No running pods found.")
-        return None
-
-    def _is_pod_ready(self) -> bool:
-        pod_url = self._get_pod_url()
-        if not pod_url:
-            return False
-        xtts_set_tts_settings = f"{pod_url}/set_tts_settings"
-        try:
-            response = requests.post(xtts_set_tts_settings, json=self._xtts_data)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as err:
-            logger.error("Couldn't set TTS settings. %s", err)
-            if "Connection aborted" in err.__str__():
-                return False
-        return True
-
-    def _wait_for_pod_ready(self) -> bool:
-        for attempt in range(1, self.max_retries + 1):
-            if self._is_pod_ready():
-                return True
-            logger.info(
-                f"Retrying health check ({attempt}/{self.max_retries}) after {self.retry_delay} seconds..."
-            )
-            time.sleep(self.retry_delay)
-        logger.error("Pod did not become ready in time.")
-        return False
+        # The resolver keeps the pod url (and whether it's ready) across
+        # requests, so it only gets rediscovered once stale or unreachable.
+        self._xtts_endpoint_resolver = xtts_endpoint_resolver or (
+            XttsEndpointResolver.get_shared_instance()
+        )
+        self._xtts_session_registry = (
+            xtts_session_registry or XttsSessionRegistry.get_shared_instance()
+        )
 
     def get_available_speakers(self) -> dict[str, Any]:
         try:
-            if not self._wait_for_pod_ready():
+            base_url = self._xtts_endpoint_resolver.get_base_url()
+            if not base_url:
                 logger.error("Pod is not ready to handle requests.")
                 return {}
-            speakers_endpoint = f"{self._get_pod_url()}/speakers_list"
-            response_speakers = requests.get(speakers_endpoint)
+            speakers_endpoint = f"{base_url}/speakers_list"
+            response_speakers = self._xtts_session_registry.get_session().get(
+                speakers_endpoint
+            )
             if response_speakers.status_code == 200:
                 all_speakers = response_speakers.json()
                 current_language_speakers = all_speakers.get("en", {}).get(
@@ -94,6 +55,7 @@ class RequestsManager:
                 return {}
         except requests.exceptions.ConnectionError as e:
             logger.warning(f"Connection error while fetching speakers: {e}")
+            self._xtts_endpoint_resolver.invalidate()
             return {}
         except Exception as e:
             logger.error(f"Unexpected error in get_available_speakers: {e}")
@@ -101,11 +63,11 @@ class RequestsManager:
 
     def get_xtts_endpoint(self) -> Optional[str]:
         try:
-            if not self._wait_for_pod_ready():
+            base_url = self._xtts_endpoint_resolver.get_base_url()
+            if not base_url:
                 logger.error("Pod is not ready to handle TTS requests.")
                 return None
-            tts_endpoint = f"{self._get_pod_url()}/tts_to_audio/"
-            return tts_endpoint
+            return f"{base_url}/tts_to_audio/"
         except Exception as e:
             logger.error(f"Unexpected error in get_xtts_endpoint: {e}")
             return None
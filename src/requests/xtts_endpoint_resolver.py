@@ -0,0 +1,186 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+import runpod
+
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.file_operations import read_json_file
+from src.filesystem.path_manager import PathManager
+from src.requests.xtts_session_registry import XttsSessionRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class XttsEndpointState:
+    base_url: str
+    settings_applied: bool
+    resolved_at: float
+
+
+class XttsEndpointResolver:
+    """Process-wide resolver of the base url of the XTTS server."""
+
+    _shared_instance: Optional["XttsEndpointResolver"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        retry_delay: float = 2.0,
+        config_loader: Optional[ConfigLoader] = None,
+        path_manager: Optional[PathManager] = None,
+        xtts_session_registry: Optional[XttsSessionRegistry] = None,
+    ):
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+
+        self._config_loader = config_loader or ConfigLoader()
+        self._path_manager = path_manager or PathManager()
+        self._xtts_session_registry = (
+            xtts_session_registry or XttsSessionRegistry.get_shared_instance()
+        )
+
+        self._lock = threading.Lock()
+        self._resolve_lock = threading.Lock()
+        self._state: Optional[XttsEndpointState] = None
+        self._is_refreshing = False
+
+    @classmethod
+    def get_shared_instance(cls) -> "XttsEndpointResolver":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+            return cls._shared_instance
+
+    def _get_pod_url(self) -> Optional[str]:
+        runpod.api_key = self._config_loader.load_runpod_secret_key()
+        try:
+            pods = runpod.get_pods()
+        except Exception as e:
+            logger.error(f"Failed to fetch pods: {e}")
+            return None
+        if not pods:
+            return None
+        for pod in pods:
+            pod_id = pod.get("id")
+            desired_status = pod.get("desiredStatus", "").lower()
+            if pod_id and desired_status == "running":
+                return f"https://{pod_id}-8020.proxy.runpod.net"
+            else:
+                logger.warning(f"Pod {pod_id} is not running: {pod}")
+        logger.warning("No running pods found.")
+        return None
+
+    def _apply_tts_settings(self, base_url: str) -> Optional[bool]:
+        """Returns whether the settings got applied, or None if the server
+        couldn't be reached at all."""
+        try:
+            response = self._xtts_session_registry.get_session().post(
+                f"{base_url}/set_tts_settings",
+                json=read_json_file(self._path_manager.get_xtts_config_path()),
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as err:
+            logger.error("Couldn't set TTS settings. %s", err)
+            if "Connection aborted" in err.__str__():
+                return None
+            return False
+        return True
+
+    def _discover(self) -> Optional[XttsEndpointState]:
+        static_endpoint = self._config_loader.get_xtts_static_endpoint()
+
+        for attempt in range(1, self._max_retries + 1):
+            base_url = static_endpoint.rstrip("/") or self._get_pod_url()
+
+            if base_url:
+                settings_applied = self._apply_tts_settings(base_url)
+
+                if settings_applied is not None:
+                    return XttsEndpointState(
+                        base_url, settings_applied, time.monotonic()
+                    )
+
+            logger.info(
+                f"Retrying health check ({attempt}/{self._max_retries}) after {self._retry_delay} seconds..."
+            )
+            time.sleep(self._retry_delay)
+
+        logger.error("Pod did not become ready in time.")
+        return None
+
+    def _resolve(self) -> Optional[XttsEndpointState]:
+        # Only one thread discovers at a time; the rest reuse what it found.
+        with self._resolve_lock:
+            with self._lock:
+                state = self._state
+
+            if state is not None and not self._is_stale(state):
+                return state
+
+            state = self._discover()
+
+            with self._lock:
+                self._state = state
+
+            return state
+
+    def _is_stale(self, state: XttsEndpointState) -> bool:
+        return (
+            time.monotonic() - state.resolved_at
+            > self._config_loader.get_xtts_endpoint_ttl_seconds()
+        )
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._is_refreshing:
+                return
+            self._is_refreshing = True
+
+        def refresh():
+            try:
+                state = self._discover()
+
+                # A failed refresh doesn't discard a state that may still work;
+                # a connection error would invalidate it anyway.
+                if state is not None:
+                    with self._lock:
+                        self._state = state
+            finally:
+                with self._lock:
+                    self._is_refreshing = False
+
+        threading.Thread(
+            target=refresh, name="xtts-endpoint-refresh", daemon=True
+        ).start()
+
+    def get_state(self) -> Optional[XttsEndpointState]:
+        with self._lock:
+            state = self._state
+
+        if state is None:
+            return self._resolve()
+
+        if self._is_stale(state):
+            self._refresh_in_background()
+
+        return state
+
+    def get_base_url(self) -> Optional[str]:
+        state = self.get_state()
+
+        return state.base_url if state else None
+
+    def invalidate(self) -> None:
+        """Forgets the resolved endpoint, for example after a connection error."""
+        with self._lock:
+            if self._state is not None:
+                logger.info(f"Invalidated XTTS endpoint '{self._state.base_url}'.")
+
+            self._state = None
@@ -0,0 +1,74 @@
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.filesystem.config_loader import ConfigLoader
+
+
+class XttsSessionRegistry:
+    """Process-wide keep-alive session for the requests sent to XTTS servers."""
+
+    _shared_instance: Optional["XttsSessionRegistry"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+        self._config_loader = config_loader or ConfigLoader()
+
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    @classmethod
+    def get_shared_instance(cls) -> "XttsSessionRegistry":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+                atexit.register(cls._shared_instance.close)
+
+            return cls._shared_instance
+
+    def get_max_in_flight_requests(self) -> int:
+        return self._config_loader.get_xtts_max_in_flight_requests()
+
+    def get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                pool_size = self.get_max_in_flight_requests()
+
+                session = requests.Session()
+
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                self._session = session
+
+            return self._session
+
+    @contextmanager
+    def limit_in_flight_requests(self, url: str) -> Iterator[None]:
+        """Blocks until the server behind the url accepts one more request."""
+        server = urlparse(url).netloc
+
+        with self._lock:
+            if server not in self._semaphores:
+                self._semaphores[server] = threading.BoundedSemaphore(
+                    self.get_max_in_flight_requests()
+                )
+
+            semaphore = self._semaphores[server]
+
+        with semaphore:
+            yield
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -3,6 +3,7 @@ from typing import List, Dict, Optional
 
 from flask import session, url_for
 
+from src.base.abstracts.observer import Observer
 from src.base.playthrough_manager import PlaythroughManager
 from src.base.products.texts_product import TextsProduct
 from src.base.validators import validate_non_empty_string
@@ -347,7 +348,10 @@ class DialogueService:
         return product
 
     def process_user_input(
-        self, user_input, other_characters_identifiers: List[str]
+        self,
+        user_input,
+        other_characters_identifiers: List[str],
+        partial_response_observer: Optional[Observer] = None,
     ) -> (List[Dict], bool):
         participants = Participants()
 
@@ -378,6 +382,7 @@ class DialogueService:
             purpose,
             web_dialogue_observer,
             web_player_input_factory,
+            partial_response_observer,
         ).compose_command()
 
         produce_dialogue_command.execute()
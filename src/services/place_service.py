@@ -61,9 +61,7 @@ from src.prompting.llms import Llms
 from src.prompting.providers.place_generation_tool_response_provider import (
     PlaceGenerationToolResponseProvider,
 )
-from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
-    DirectVoiceLineGenerationAlgorithmFactory,
-)
+from src.voices.voice_line_job_queue import VoiceLineJobQueue
 
 
 class PlaceService:
@@ -72,14 +70,14 @@ class PlaceService:
         self._llms = llms or Llms()
 
     @staticmethod
-    def _generate_place_description_voice_line(playthrough_name, description_text):
+    def _enqueue_place_description_voice_line(playthrough_name, description_text):
         player = Character(
             playthrough_name,
             PlaythroughManager(playthrough_name).get_player_identifier(),
         )
-        return DirectVoiceLineGenerationAlgorithmFactory.create_algorithm(
+        return VoiceLineJobQueue.get_shared_instance().enqueue(
             player.name, description_text, player.voice_model
-        ).direct_voice_line_generation()
+        )
 
     def run_generate_place_command(
         self, father_place_name: str, template_type: TemplateType, notion: str
@@ -164,10 +162,10 @@ class PlaceService:
         else:
             return description_product.get_error(), None
 
-        voice_line_file_name = self._generate_place_description_voice_line(
+        voice_line_job_id = self._enqueue_place_description_voice_line(
             playthrough_name, description
         )
-        return description, voice_line_file_name
+        return description, voice_line_job_id
 
     @staticmethod
     def create_cardinal_connection(
@@ -1,27 +1,31 @@
+import json
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 
 from flask import url_for
 
-from src.characters.character import Character
-
 
 class WebService:
 
-    @staticmethod
-    def format_image_urls_of_characters(characters: List[Character]):
-        for character in characters:
-            character.update_data(
-                {"image_url": url_for("static", filename=character.image_url)}
-            )
-
     @staticmethod
     def get_file_url(folder: Path, file_name: Optional[Path]):
         if not file_name:
             file_name = "NONE"
         return url_for("static", filename=f"{folder}/" + os.path.basename(file_name))
 
+    @staticmethod
+    def get_voice_line_job_url(job_id: Optional[str]):
+        """The audio of a queued voice line gets resolved through the status of
+        its job, once the job is done."""
+        if not job_id:
+            return WebService.get_file_url(Path("voice_lines"), None)
+        return url_for("voice-lines", job_id=job_id)
+
+    @staticmethod
+    def format_server_sent_event(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
     @staticmethod
     def create_method_name(action: str):
         if not action:
@@ -40,9 +40,6 @@ from src.prompting.composers.produce_tool_response_strategy_factory_composer imp
     ProduceToolResponseStrategyFactoryComposer,
 )
 from src.prompting.llms import Llms
-from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
-    DirectVoiceLineGenerationAlgorithmFactory,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -133,9 +130,7 @@ def action_view(action_name, action_icon, action_endpoint, prompt_file):
                 playthrough_name, participants, store_character_memory_command_factory
             )
             produce_voice_lines_for_action_resolution_algorithm = (
-                ProduceVoiceLinesForActionResolutionAlgorithm(
-                    DirectVoiceLineGenerationAlgorithmFactory()
-                )
+                ProduceVoiceLinesForActionResolutionAlgorithm()
             )
             action_resolution_algorithm = ProduceActionResolutionAlgorithm(
                 playthrough_name,
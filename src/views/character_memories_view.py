@@ -111,11 +111,21 @@ class CharacterMemoriesView(MethodView):
 
                 logger.info("Memories to add: %s", new_memories)
 
-                [
-                    database.insert_memory(character_identifier, memory, memory_id)
-                    for memory in new_memories
-                    if memory
-                ]
+                if memory_id:
+                    # Editing an existing memory keeps its identifier.
+                    [
+                        database.insert_memory(character_identifier, memory, memory_id)
+                        for memory in new_memories
+                        if memory
+                    ]
+                else:
+                    database.insert_memories(
+                        [
+                            (character_identifier, memory)
+                            for memory in new_memories
+                            if memory
+                        ]
+                    )
 
                 response = {
                     "success": True,
@@ -0,0 +1,93 @@
+import logging
+import threading
+
+from flask import (
+    Response,
+    copy_current_request_context,
+    jsonify,
+    request,
+    session,
+    stream_with_context,
+)
+from flask.views import MethodView
+
+from src.base.tools import capture_traceback
+from src.dialogues.observers.streaming_speech_turn_observer import (
+    StreamingSpeechTurnObserver,
+)
+from src.dialogues.products.concrete_player_input_product import (
+    ConcretePlayerInputProduct,
+)
+from src.services.dialogue_service import DialogueService
+from src.views.chat_view import ChatView
+
+logger = logging.getLogger(__name__)
+
+
+class ChatStreamView(MethodView):
+    """Streams a speech turn to the chat as server-sent events."""
+
+    @staticmethod
+    def post():
+        playthrough_name, dialogue_participants = session.get(
+            "playthrough_name"
+        ), session.get("participants")
+        if not playthrough_name or not dialogue_participants:
+            return ChatView.handle_session_expired()
+
+        if request.form.get("submit_action") == "Stay Silent":
+            user_input = "silent"
+        else:
+            user_input = request.form.get("user_input")
+
+        if not user_input:
+            return jsonify({"success": False, "error": "Please enter a message."}), 400
+
+        # Ending the dialogue changes the session, which can't be done once the
+        # response has started streaming.
+        if ConcretePlayerInputProduct(user_input).is_goodbye():
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "Goodbyes can't be streamed.",
+                    }
+                ),
+                400,
+            )
+
+        observer = StreamingSpeechTurnObserver()
+
+        @copy_current_request_context
+        def produce_speech_turn():
+            try:
+                messages, _ = ChatView.handle_send(
+                    playthrough_name,
+                    DialogueService(),
+                    user_input,
+                    dialogue_participants,
+                    observer,
+                )
+
+                observer.finish(
+                    "speech_turn_messages",
+                    {
+                        "success": True,
+                        "messages": ChatView.format_messages_data(messages),
+                        "goodbye": False,
+                    },
+                )
+            except Exception as e:
+                capture_traceback()
+                logger.error("Failed to stream the speech turn: %s", e)
+                observer.finish("error", {"success": False, "error": f"Error: {e}"})
+
+        threading.Thread(
+            target=produce_speech_turn, name="speech-turn-stream", daemon=True
+        ).start()
+
+        return Response(
+            stream_with_context(observer.stream()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -4,6 +4,7 @@ from typing import List, Optional
 from flask import redirect, session, render_template, url_for, flash, request, jsonify
 from flask.views import MethodView
 
+from src.base.abstracts.observer import Observer
 from src.base.playthrough_manager import PlaythroughManager
 from src.base.tools import capture_traceback
 from src.dialogues.algorithms.extract_identifiers_from_participants_data_algorithm import (
@@ -25,9 +26,9 @@ from src.dialogues.enums import HandleDialogueStateAlgorithmResultType
 from src.dialogues.repositories.ongoing_dialogue_repository import (
     OngoingDialogueRepository,
 )
+from src.filesystem.config_loader import ConfigLoader
 from src.maps.factories.map_manager_factory import MapManagerFactory
 from src.services.dialogue_service import DialogueService
-from src.services.web_service import WebService
 from src.time.time_manager import TimeManager
 
 logger = logging.getLogger(__name__)
@@ -111,13 +112,11 @@ class ChatView(MethodView):
         available_characters = GetAvailableCharactersAlgorithm(
             playthrough_name, dialogue_participants
         ).do_algorithm()
-        WebService().format_image_urls_of_characters(available_characters)
 
         # Get participant characters
         participant_characters = GetParticipantCharactersOtherThanPlayerAlgorithm(
             playthrough_name, dialogue_participants
         ).do_algorithm()
-        WebService().format_image_urls_of_characters(participant_characters)
 
         return render_template(
             "chat.html",
@@ -128,24 +127,29 @@ class ChatView(MethodView):
             .get_current_place_template(),
             available_characters=available_characters,
             participant_characters=participant_characters,
+            stream_speech_turns=ConfigLoader().get_stream_speech_turns(),
         )
 
+    @staticmethod
+    def format_messages_data(messages) -> List[dict]:
+        return [
+            {
+                "alignment": msg["alignment"],
+                "message_text": msg["message_text"],
+                "thoughts": msg.get("thoughts", ""),
+                "desired_action": msg.get("desired_action", ""),
+                "message_type": msg.get("message_type", ""),
+                "sender_name": msg.get("sender_name", ""),
+                "sender_photo_url": msg.get("sender_photo_url", ""),
+                "file_url": msg.get("file_url", ""),
+            }
+            for msg in messages
+        ]
+
     @staticmethod
     def respond_with_messages(messages, is_goodbye):
         if request.headers.get("X-Requested-With") == "XMLHttpRequest":
-            messages_data = [
-                {
-                    "alignment": msg["alignment"],
-                    "message_text": msg["message_text"],
-                    "thoughts": msg.get("thoughts", ""),
-                    "desired_action": msg.get("desired_action", ""),
-                    "message_type": msg.get("message_type", ""),
-                    "sender_name": msg.get("sender_name", ""),
-                    "sender_photo_url": msg.get("sender_photo_url", ""),
-                    "file_url": msg.get("file_url", ""),
-                }
-                for msg in messages
-            ]
+            messages_data = ChatView.format_messages_data(messages)
 
             # If it's goodbye, then we must clear out the session.
             if is_goodbye:
@@ -223,13 +227,17 @@ class ChatView(MethodView):
 
     @staticmethod
     def handle_send(
-        playthrough_name: str, dialogue_service, user_input, dialogue_participants
+        playthrough_name: str,
+        dialogue_service,
+        user_input,
+        dialogue_participants,
+        partial_response_observer: Optional[Observer] = None,
     ):
         if not user_input:
             raise ValueError("Please enter a message.")
 
         messages, is_goodbye = dialogue_service.process_user_input(
-            user_input, dialogue_participants
+            user_input, dialogue_participants, partial_response_observer
         )
 
         if not is_goodbye:
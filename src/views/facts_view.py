@@ -48,7 +48,7 @@ class FactsView(MethodView):
 
                 logger.info("Facts to add: %s", facts)
 
-                [database.insert_fact(fact) for fact in facts if fact]
+                database.insert_facts([fact for fact in facts if fact])
 
                 response = {
                     "success": True,
@@ -1,5 +1,4 @@
 import logging
-from pathlib import Path
 from typing import Optional
 
 from flask import (
@@ -82,7 +81,6 @@ class LocationHubView(MethodView):
         current_place = map_manager.get_current_place_template()
         current_place_type = place_manager.get_current_place_type()
         characters_manager = CharactersManager(playthrough_name)
-        web_service = WebService()
 
         return (
             place_manager,
@@ -90,7 +88,6 @@ class LocationHubView(MethodView):
             current_place,
             current_place_type,
             characters_manager,
-            web_service,
         )
 
     def get(self):
@@ -104,15 +101,12 @@ class LocationHubView(MethodView):
             current_place,
             current_place_type,
             characters_manager,
-            web_service,
         ) = self.initialize_managers(playthrough_name)
 
         characters_at_current_place = (
-            characters_manager.get_characters_at_current_place()
+            characters_manager.get_character_view_models_at_current_place()
         )
-        web_service.format_image_urls_of_characters(characters_at_current_place)
-        followers = characters_manager.get_followers()
-        web_service.format_image_urls_of_characters(followers)
+        followers = characters_manager.get_follower_view_models()
 
         areas = GetAllPlaceTypesInMapAlgorithm(
             playthrough_name, TemplateType.AREA
@@ -234,12 +228,10 @@ class LocationHubView(MethodView):
     @staticmethod
     def handle_describe_place(playthrough_name):
         try:
-            description, voice_line_file_name = PlaceService().describe_place(
+            description, voice_line_job_id = PlaceService().describe_place(
                 playthrough_name
             )
-            voice_line_url = WebService.get_file_url(
-                Path("voice_lines"), voice_line_file_name
-            )
+            voice_line_url = WebService.get_voice_line_job_url(voice_line_job_id)
             PlaythroughManager(playthrough_name).add_to_adventure("\n" + description)
             session["place_description"] = description
             session["place_description_voice_line_url"] = voice_line_url
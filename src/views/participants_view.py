@@ -5,23 +5,24 @@ from flask import request, session, redirect, url_for, render_template
 from flask.views import MethodView
 
 from src.base.playthrough_manager import PlaythroughManager
-from src.characters.character import Character
+from src.characters.character_view_model import CharacterViewModel
 from src.characters.characters_manager import CharactersManager
-from src.services.web_service import WebService
 
 logger = logging.getLogger(__name__)
 
 
 class ParticipantsView(MethodView):
     @staticmethod
-    def _get_possible_characters_for_chat(playthrough_name: str) -> List[Character]:
+    def _get_possible_characters_for_chat(
+        playthrough_name: str,
+    ) -> List[CharacterViewModel]:
         characters_manager = CharactersManager(playthrough_name)
         characters = characters_manager.get_all_characters()
 
         # Must cull the player character from the possible participants.
         player_identifier = PlaythroughManager(playthrough_name).get_player_identifier()
 
-        characters = characters_manager.get_characters(
+        return characters_manager.get_character_view_models(
             [
                 entry["identifier"]
                 for entry in characters
@@ -29,10 +30,6 @@ class ParticipantsView(MethodView):
             ]
         )
 
-        WebService().format_image_urls_of_characters(characters)
-
-        return characters
-
     def get(self):
         playthrough_name = session.get("playthrough_name")
         if not playthrough_name:
@@ -0,0 +1,90 @@
+import logging
+import threading
+
+from flask import (
+    Response,
+    copy_current_request_context,
+    jsonify,
+    redirect,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
+from flask.views import MethodView
+
+from src.base.tools import capture_traceback
+from src.concepts.algorithms.generate_concepts_batch_algorithm import (
+    GenerateConceptsBatchAlgorithm,
+)
+from src.concepts.composers.concept_factories_composer import (
+    ConceptFactoriesComposer,
+)
+from src.concepts.enums import ConceptType
+from src.concepts.observers.streaming_concepts_progress_observer import (
+    StreamingConceptsProgressObserver,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StoryHubBatchView(MethodView):
+    """Generates concepts of several types, streaming their progress."""
+
+    @staticmethod
+    def post():
+        playthrough_name = session.get("playthrough_name")
+        if not playthrough_name:
+            return redirect(url_for("index"))
+
+        try:
+            concept_types = list(
+                dict.fromkeys(
+                    ConceptType(concept_type)
+                    for concept_type in request.form.getlist("concept_types")
+                )
+            ) or list(ConceptType)
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"Error: {e}"}), 400
+
+        observer = StreamingConceptsProgressObserver()
+
+        @copy_current_request_context
+        def generate_concepts():
+            try:
+                concept_factories_composer = ConceptFactoriesComposer(playthrough_name)
+
+                get_concepts_prompt_data_algorithm = (
+                    concept_factories_composer.compose_get_concepts_prompt_data_algorithm()
+                )
+
+                generated_concepts = GenerateConceptsBatchAlgorithm(
+                    playthrough_name,
+                    concept_factories_composer.compose_factories(
+                        get_concepts_prompt_data_algorithm
+                    ),
+                    get_concepts_prompt_data_algorithm,
+                    observer,
+                ).do_algorithm(concept_types)
+
+                observer.finish(
+                    "concepts_batch_finished",
+                    {
+                        "success": bool(generated_concepts),
+                        "message": f"Generated {len(generated_concepts)} of {len(concept_types)} concept types.",
+                    },
+                )
+            except Exception as e:
+                capture_traceback()
+                logger.error("Failed to generate the batch of concepts: %s", e)
+                observer.finish("error", {"success": False, "error": f"Error: {e}"})
+
+        threading.Thread(
+            target=generate_concepts, name="concepts-batch-stream", daemon=True
+        ).start()
+
+        return Response(
+            stream_with_context(observer.stream()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
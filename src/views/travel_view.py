@@ -1,5 +1,3 @@
-from pathlib import Path
-
 from flask import redirect, url_for, session, render_template, request, jsonify
 from flask.views import MethodView
 
@@ -35,9 +33,7 @@ from src.prompting.llms import Llms
 from src.services.place_service import PlaceService
 from src.services.web_service import WebService
 from src.time.time_manager import TimeManager
-from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
-    DirectVoiceLineGenerationAlgorithmFactory,
-)
+from src.voices.voice_line_job_queue import VoiceLineJobQueue
 
 
 class TravelView(MethodView):
@@ -182,54 +178,35 @@ class TravelView(MethodView):
 
         destination_area_name = destination_place_data["area_data"]["name"]
 
-        # Generate voice lines in parallel using threading
-        direct_voice_line_generation_algorithm_factory = (
-            DirectVoiceLineGenerationAlgorithmFactory
-        )
-
         player_character = Character(
             playthrough_name, playthrough_manager.get_player_identifier()
         )
 
-        result_dict = {
-            "narrative_voice_line_url": (
-                direct_voice_line_generation_algorithm_factory.create_algorithm(
-                    player_character.name,
-                    product.get_narrative(),
-                    player_character.voice_model,
-                ).direct_voice_line_generation()
-            ),
-            "outcome_voice_line_url": (
-                direct_voice_line_generation_algorithm_factory.create_algorithm(
-                    player_character.name,
-                    product.get_outcome(),
-                    player_character.voice_model,
-                ).direct_voice_line_generation()
-            ),
-        }
+        # The voice lines get synthesized in the background, so the narration
+        # can be shown right away.
+        voice_line_job_queue = VoiceLineJobQueue.get_shared_instance()
 
-        narrative_voice_line_url = result_dict.get("narrative_voice_line_url")
-        outcome_voice_line_url = result_dict.get("outcome_voice_line_url")
-
-        if not isinstance(narrative_voice_line_url, Path):
-            raise TypeError(
-                f"Expected 'narrative_voice_line' to be a Path, but was '{type(narrative_voice_line_url)}'."
-            )
-        if not isinstance(outcome_voice_line_url, Path):
-            raise TypeError(
-                f"Expected 'outcome_voice_line_url' to be a Path, but was '{type(outcome_voice_line_url)}'."
-            )
+        narrative_voice_line_job_id = voice_line_job_queue.enqueue(
+            player_character.name,
+            product.get_narrative(),
+            player_character.voice_model,
+        )
+        outcome_voice_line_job_id = voice_line_job_queue.enqueue(
+            player_character.name,
+            product.get_outcome(),
+            player_character.voice_model,
+        )
 
         return jsonify(
             {
                 "success": True,
                 "narrative": narrative,
                 "outcome": outcome,
-                "narrative_voice_line_url": WebService.get_file_url(
-                    Path("voice_lines"), narrative_voice_line_url
+                "narrative_voice_line_url": WebService.get_voice_line_job_url(
+                    narrative_voice_line_job_id
                 ),
-                "outcome_voice_line_url": WebService.get_file_url(
-                    Path("voice_lines"), outcome_voice_line_url
+                "outcome_voice_line_url": WebService.get_voice_line_job_url(
+                    outcome_voice_line_job_id
                 ),
                 "destination_name": destination_area_name,
                 "destination_identifier": destination_identifier,
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from flask import jsonify
+from flask.views import MethodView
+
+from src.services.web_service import WebService
+from src.voices.voice_line_job_queue import VoiceLineJobQueue, VoiceLineJobStatus
+
+
+class VoiceLineJobView(MethodView):
+
+    @staticmethod
+    def get(job_id: str):
+        job = VoiceLineJobQueue.get_shared_instance().get_job(job_id)
+
+        if job is None:
+            return (
+                jsonify(success=False, error=f"Unknown voice line job '{job_id}'."),
+                404,
+            )
+
+        return jsonify(
+            {
+                "success": True,
+                "job_id": job.job_id,
+                "status": job.status.value,
+                "file_url": (
+                    WebService.get_file_url(Path("voice_lines"), Path(job.file_name))
+                    if job.status == VoiceLineJobStatus.DONE
+                    else None
+                ),
+                "error": job.error,
+            }
+        )
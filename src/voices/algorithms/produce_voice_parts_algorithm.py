@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -6,6 +7,7 @@ from src.base.exceptions import VoiceLineGenerationError
 from src.filesystem.file_operations import create_directories
 from src.filesystem.path_manager import PathManager
 from src.requests.requests_manager import RequestsManager
+from src.requests.xtts_session_registry import XttsSessionRegistry
 from src.voices.configs.voice_part_provider_config import VoicePartProviderConfig
 from src.voices.factories.voice_part_provider_factory import VoicePartProviderFactory
 
@@ -20,6 +22,7 @@ class ProduceVoicePartsAlgorithm:
         voice_part_provider_factory: VoicePartProviderFactory,
         requests_manager: Optional[RequestsManager] = None,
         path_manager: Optional[PathManager] = None,
+        xtts_session_registry: Optional[XttsSessionRegistry] = None,
     ):
         self._text_parts = text_parts
         self._timestamp = timestamp
@@ -27,6 +30,9 @@ class ProduceVoicePartsAlgorithm:
 
         self._requests_manager = requests_manager or RequestsManager()
         self._path_manager = path_manager or PathManager()
+        self._xtts_session_registry = (
+            xtts_session_registry or XttsSessionRegistry.get_shared_instance()
+        )
 
     def _generate_voice_part(
         self, part: str, index: int, xtts_endpoint: str, temp_dir: Path
@@ -61,12 +67,27 @@ class ProduceVoicePartsAlgorithm:
 
         temp_dir = self._path_manager.get_temp_voice_lines_path(self._timestamp)
 
-        # Initialize a list to hold the results, maintaining the order
-        temp_file_paths: List[Path | None] = [None] * len(self._text_parts)
+        if not self._text_parts:
+            return []
+
+        # The parts get synthesized concurrently. The registry additionally caps
+        # the requests in flight against the server across all voice lines.
+        max_workers = min(
+            len(self._text_parts),
+            self._xtts_session_registry.get_max_in_flight_requests(),
+        )
 
-        for index, part in enumerate(self._text_parts):
-            temp_file_paths[index] = self._generate_voice_part(
-                part, index, xtts_endpoint, temp_dir
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="voice-parts"
+        ) as executor:
+            # Map keeps the results in the order of the parts.
+            temp_file_paths: List[Path | None] = list(
+                executor.map(
+                    lambda indexed_part: self._generate_voice_part(
+                        indexed_part[1], indexed_part[0], xtts_endpoint, temp_dir
+                    ),
+                    enumerate(self._text_parts),
+                )
             )
 
         # Filter out any None values in case some voice parts failed to generate
@@ -1,7 +1,12 @@
 import io
 import logging
 import time
+from typing import Optional
+
 import requests
+
+from src.requests.xtts_endpoint_resolver import XttsEndpointResolver
+from src.requests.xtts_session_registry import XttsSessionRegistry
 from src.voices.products.voice_line_product import VoiceLineProduct
 
 logger = logging.getLogger(__name__)
@@ -9,7 +14,14 @@ logger = logging.getLogger(__name__)
 
 class VoiceLineFactory:
 
-    def __init__(self, text: str, voice_model: str, xtts_url: str):
+    def __init__(
+        self,
+        text: str,
+        voice_model: str,
+        xtts_url: str,
+        xtts_session_registry: Optional[XttsSessionRegistry] = None,
+        xtts_endpoint_resolver: Optional[XttsEndpointResolver] = None,
+    ):
         if not text:
             raise ValueError("text can't be empty.")
         if not voice_model:
@@ -20,6 +32,13 @@ class VoiceLineFactory:
         self._voice_model = voice_model
         self._xtts_url = xtts_url
 
+        self._xtts_session_registry = (
+            xtts_session_registry or XttsSessionRegistry.get_shared_instance()
+        )
+        self._xtts_endpoint_resolver = (
+            xtts_endpoint_resolver or XttsEndpointResolver.get_shared_instance()
+        )
+
     def create_voice_line(self) -> VoiceLineProduct:
         payload = {
             "text": self._text,
@@ -28,7 +47,20 @@ class VoiceLineFactory:
             "accent": "en",
         }
         start_time = time.time()
-        response = requests.post(self._xtts_url, json=payload)
+        try:
+            with self._xtts_session_registry.limit_in_flight_requests(self._xtts_url):
+                response = self._xtts_session_registry.get_session().post(
+                    self._xtts_url, json=payload
+                )
+        except requests.exceptions.ConnectionError as e:
+            # The pod may have been stopped or replaced, so the next voice line
+            # should look for it again.
+            self._xtts_endpoint_resolver.invalidate()
+            return VoiceLineProduct(
+                None,
+                False,
+                f"Failed with '{self._voice_model}'. Connection error: {e}",
+            )
         if response and response.status_code == 200:
             audio_data = VoiceLineProduct(io.BytesIO(response.content), is_valid=True)
             logging.info(
@@ -0,0 +1,246 @@
+import atexit
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.base.constants import FINISHED_VOICE_LINE_JOB_RETENTION_SECONDS
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.file_operations import (
+    create_directories,
+    read_json_file,
+    remove_file,
+    write_json_file,
+)
+from src.filesystem.path_manager import PathManager
+from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
+    DirectVoiceLineGenerationAlgorithmFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceLineJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class VoiceLineJob:
+    job_id: str
+    character_name: str
+    text: str
+    voice_model: str
+    status: VoiceLineJobStatus = VoiceLineJobStatus.PENDING
+    file_name: Optional[str] = None
+    error: Optional[str] = None
+    updated_at: float = 0.0
+
+    def is_finished(self) -> bool:
+        return self.status in (VoiceLineJobStatus.DONE, VoiceLineJobStatus.FAILED)
+
+
+class VoiceLineJobQueue:
+    """Process-wide queue that synthesizes voice lines in the background."""
+
+    _shared_instance: Optional["VoiceLineJobQueue"] = None
+    _shared_instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        direct_voice_line_generation_algorithm_factory: Optional[
+            DirectVoiceLineGenerationAlgorithmFactory
+        ] = None,
+        config_loader: Optional[ConfigLoader] = None,
+        path_manager: Optional[PathManager] = None,
+    ):
+        self._direct_voice_line_generation_algorithm_factory = (
+            direct_voice_line_generation_algorithm_factory
+            or DirectVoiceLineGenerationAlgorithmFactory()
+        )
+
+        self._config_loader = config_loader or ConfigLoader()
+        self._path_manager = path_manager or PathManager()
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, VoiceLineJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def get_shared_instance(cls) -> "VoiceLineJobQueue":
+        with cls._shared_instance_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+
+                atexit.register(cls._shared_instance.close)
+
+            return cls._shared_instance
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._config_loader.get_voice_line_job_workers(),
+                    thread_name_prefix="voice-lines",
+                )
+
+            return self._executor
+
+    def _get_job_path(self, job_id: str) -> Path:
+        return self._path_manager.get_voice_line_jobs_path() / f"{job_id}.json"
+
+    def _forget_finished_jobs(self, now: float) -> None:
+        # Must be called with the lock held. Their status requests fall back to
+        # the files of the jobs.
+        for job_id, job in list(self._jobs.items()):
+            if (
+                job.is_finished()
+                and now - job.updated_at > FINISHED_VOICE_LINE_JOB_RETENTION_SECONDS
+            ):
+                del self._jobs[job_id]
+
+    def _save(self, job: VoiceLineJob) -> None:
+        job = replace(job, updated_at=time.time())
+
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._forget_finished_jobs(job.updated_at)
+
+        directory = self._path_manager.get_voice_line_jobs_path()
+        create_directories(directory)
+
+        # Write to a temporary file first, so that a status request never reads
+        # a half-written job.
+        temporary_path = directory / f"{job.job_id}.{threading.get_ident()}.tmp"
+        write_json_file(temporary_path, asdict(job))
+        os.replace(temporary_path, self._get_job_path(job.job_id))
+
+    @staticmethod
+    def _load(job_path: Path) -> Optional[VoiceLineJob]:
+        try:
+            data = read_json_file(job_path)
+            data["status"] = VoiceLineJobStatus(data["status"])
+
+            return VoiceLineJob(**data)
+        except (OSError, ValueError, KeyError, TypeError) as exception:
+            logger.warning(f"Couldn't load voice line job '{job_path}': {exception}")
+            return None
+
+    def _run(self, job: VoiceLineJob) -> None:
+        job = replace(job, status=VoiceLineJobStatus.RUNNING)
+        self._save(job)
+
+        try:
+            file_name = (
+                self._direct_voice_line_generation_algorithm_factory.create_algorithm(
+                    job.character_name, job.text, job.voice_model
+                ).direct_voice_line_generation()
+            )
+        except Exception as exception:
+            logger.error(f"Voice line job '{job.job_id}' failed: {exception}")
+            self._save(
+                replace(job, status=VoiceLineJobStatus.FAILED, error=str(exception))
+            )
+            return
+
+        if file_name:
+            self._save(
+                replace(
+                    job,
+                    status=VoiceLineJobStatus.DONE,
+                    file_name=os.path.basename(file_name),
+                )
+            )
+        else:
+            self._save(
+                replace(
+                    job,
+                    status=VoiceLineJobStatus.FAILED,
+                    error="No voice line was produced.",
+                )
+            )
+
+    def enqueue(
+        self, character_name: str, text: str, voice_model: str
+    ) -> Optional[str]:
+        """Queues the synthesis of a voice line, and returns the identifier of
+        the job. Returns None if voice lines aren't produced at all."""
+        if not self._config_loader.get_produce_voice_lines() or not text:
+            return None
+
+        job = VoiceLineJob(uuid.uuid4().hex, character_name, text, voice_model)
+        self._save(job)
+
+        self._get_executor().submit(self._run, job)
+
+        return job.job_id
+
+    def get_job(self, job_id: str) -> Optional[VoiceLineJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+        if job is not None:
+            return job
+
+        # The job may have been queued before a restart.
+        job_path = self._get_job_path(job_id)
+
+        if not job_id.isalnum() or not job_path.exists():
+            return None
+
+        return self._load(job_path)
+
+    def _is_still_referenced(self, job: VoiceLineJob) -> bool:
+        # The messages of the dialogues keep the url of the job instead of the
+        # one of the audio, so a done job must live as long as its audio does.
+        return (
+            job.status == VoiceLineJobStatus.DONE
+            and job.file_name is not None
+            and (self._path_manager.get_voice_lines_path() / job.file_name).exists()
+        )
+
+    def resume_pending_jobs(self) -> int:
+        """Requeues the jobs that a previous run didn't finish, and removes the
+        files of jobs finished long ago whose audio is gone (or never came).
+        Returns how many jobs were requeued."""
+        directory = self._path_manager.get_voice_line_jobs_path()
+
+        if not directory.exists():
+            return 0
+
+        resumed = 0
+
+        for job_path in sorted(directory.glob("*.json")):
+            job = self._load(job_path)
+
+            if job is None:
+                continue
+
+            if not job.is_finished():
+                self._save(replace(job, status=VoiceLineJobStatus.PENDING))
+                self._get_executor().submit(self._run, job)
+                resumed += 1
+            elif (
+                time.time() - job.updated_at > FINISHED_VOICE_LINE_JOB_RETENTION_SECONDS
+                and not self._is_still_referenced(job)
+            ):
+                remove_file(job_path)
+
+        if resumed:
+            logger.info(f"Resumed {resumed} pending voice line jobs.")
+
+        return resumed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
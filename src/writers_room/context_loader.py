@@ -4,7 +4,8 @@ from src.base.validators import validate_non_empty_string
 from src.concepts.enums import ConceptType
 from src.databases.abstracts.database import Database
 from src.filesystem.config_loader import ConfigLoader
-from src.filesystem.file_operations import read_file, read_json_file
+from src.filesystem.file_operations import read_file
+from src.filesystem.json_file_cache import JsonFileCache
 from src.filesystem.path_manager import PathManager
 from src.maps.composers.places_descriptions_provider_composer import (
     PlacesDescriptionsProviderComposer,
@@ -19,6 +20,7 @@ class ContextLoader:
         database: Database,
         path_manager: Optional[PathManager] = None,
         config_loader: Optional[ConfigLoader] = None,
+        json_file_cache: Optional[JsonFileCache] = None,
     ):
         validate_non_empty_string(playthrough_name, "playthrough_name")
         validate_non_empty_string(user_message, "user_message")
@@ -29,12 +31,13 @@ class ContextLoader:
 
         self._path_manager = path_manager or PathManager()
         self._config_loader = config_loader or ConfigLoader()
+        self._json_file_cache = json_file_cache or JsonFileCache.get_shared_instance()
 
     def load_context_variables(self) -> Dict[str, str]:
         context_file = read_file(
             self._path_manager.get_writers_room_context_path(self._playthrough_name)
         )
-        characters_file = read_json_file(
+        characters_file = self._json_file_cache.read(
             self._path_manager.get_characters_file_path(self._playthrough_name)
         )
 
@@ -44,7 +47,7 @@ class ContextLoader:
             .get_information()
         )
 
-        concepts_file = read_json_file(
+        concepts_file = self._json_file_cache.read(
             self._path_manager.get_concepts_file_path(self._playthrough_name)
         )
 
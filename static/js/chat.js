@@ -169,10 +169,117 @@ function scrollToBottom() {
     chatWindow.scrollTop = chatWindow.scrollHeight;
 }
 
+// Shows the speech turn as the LLM writes it, until the stored messages arrive.
+function renderStreamingSpeechTurn(speechTurn) {
+    let bubble = document.getElementById('streaming-speech-turn');
+
+    if (!bubble) {
+        bubble = document.createElement('div');
+        bubble.id = 'streaming-speech-turn';
+        bubble.className = 'chat-bubble left';
+        bubble.innerHTML = `
+            <div class="message-content">
+                <div class="sender-label"></div>
+                <div class="message-text"><span class="narration"></span><span class="speech"></span></div>
+                <div class="thoughts"></div>
+            </div>`;
+        $('#chat-window').append(bubble);
+    }
+
+    bubble.querySelector('.sender-label').textContent = speechTurn.name || '';
+    bubble.querySelector('.narration').textContent = speechTurn.narration_text ? speechTurn.narration_text + ' ' : '';
+    bubble.querySelector('.speech').textContent = speechTurn.speech || '';
+    bubble.querySelector('.thoughts').textContent = speechTurn.thoughts || '';
+
+    scrollToBottom();
+}
+
+function removeStreamingSpeechTurn() {
+    $('#streaming-speech-turn').remove();
+}
+
+function handleSpeechTurnEvent(eventName, data) {
+    if (eventName === 'speech_turn_partial') {
+        renderStreamingSpeechTurn(data);
+    } else if (eventName === 'speech_turn_reset') {
+        removeStreamingSpeechTurn();
+    } else if (eventName === 'speech_turn_messages') {
+        removeStreamingSpeechTurn();
+        chatSuccessHandler(data);
+    } else if (eventName === 'error') {
+        removeStreamingSpeechTurn();
+        showToast(data.error || 'error', 'error');
+    }
+}
+
+function streamSpeechTurn(form) {
+    const submitButtons = form.querySelectorAll('button[type="submit"]');
+    const originalButtonHTMLs = Array.from(submitButtons).map(button => button.innerHTML);
+
+    submitButtons.forEach(button => disable_button_and_add_spinner(button));
+
+    const formData = new FormData(form);
+    formData.append('submit_action', submitActionValue);
+
+    fetch(form.dataset.streamUrl, {
+        method: 'POST',
+        body: formData,
+        headers: {
+            'X-Requested-With': 'XMLHttpRequest',
+        },
+    })
+        .then((response) => {
+            // Errors before the stream starts come back as regular JSON.
+            if (!(response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+                return response.json().then(chatSuccessHandler);
+            }
+
+            return readServerSentEvents(response, handleSpeechTurnEvent);
+        })
+        .catch((error) => {
+            removeStreamingSpeechTurn();
+            chatErrorHandler(error);
+        })
+        .finally(() => {
+            submitButtons.forEach((button, index) => {
+                button.disabled = false;
+                button.innerHTML = originalButtonHTMLs[index];
+            });
+        });
+}
+
+// Speech turns produced by 'Send' and 'Stay Silent' get streamed, if the chat
+// form provides a stream url. Goodbyes go through the regular form submission.
+function initSpeechTurnStreaming() {
+    const form = document.querySelector('form.chat-form[data-stream-url]');
+
+    if (!form) {
+        return;
+    }
+
+    // Registered for the capture phase, so that it runs before the regular
+    // AJAX submission handler, which it then skips.
+    form.addEventListener('submit', function (event) {
+        const userInput = ($('#user-input').val() || '').trim();
+
+        if (submitActionValue === 'Goodbye' ||
+            (submitActionValue === 'Send' && (!userInput || userInput.toLowerCase() === 'goodbye'))) {
+            return;
+        }
+
+        event.preventDefault();
+        event.stopImmediatePropagation();
+
+        streamSpeechTurn(form);
+    }, true);
+}
+
 function pageInit(){
     // Call scrollToBottom after the page loads
     scrollToBottom();
 
     // Existing code for message text formatting on page load
     formatMessageTexts();
+
+    initSpeechTurnStreaming();
 }
@@ -2,12 +2,49 @@
 
 let currentAudio = null; // Global variable to keep track of the current playing audio
 
+const VOICE_LINE_JOB_POLL_INTERVAL = 1000; // Milliseconds between checks on a queued voice line
+const VOICE_LINE_JOB_MAX_POLLS = 180;
+
+// Voice lines get synthesized in the background; until they are done, the
+// elements point to the status of their job instead of to the audio file.
+function resolveVoiceLineJob(jobUrl, element, remainingPolls = VOICE_LINE_JOB_MAX_POLLS) {
+    if (element.resolvingVoiceLine && remainingPolls === VOICE_LINE_JOB_MAX_POLLS) {
+        return;
+    }
+    element.resolvingVoiceLine = true;
+
+    fetch(jobUrl)
+        .then(response => response.json())
+        .then(data => {
+            if (data.success && data.status === 'done' && data.file_url) {
+                element.resolvingVoiceLine = false;
+                element.setAttribute('data-file-url', data.file_url);
+                playAudio(data.file_url, element);
+            } else if (data.success && data.status !== 'failed' && remainingPolls > 0) {
+                setTimeout(() => resolveVoiceLineJob(jobUrl, element, remainingPolls - 1), VOICE_LINE_JOB_POLL_INTERVAL);
+            } else {
+                element.resolvingVoiceLine = false;
+                showToast('The audio file could not be generated.', 'error');
+            }
+        })
+        .catch(error => {
+            element.resolvingVoiceLine = false;
+            console.error('Error occurred while checking the voice line:', error);
+            showToast('The audio file is not available.', 'error');
+        });
+}
+
 function playAudio(fileUrl, element) {
     if (!fileUrl || fileUrl === 'None' || fileUrl === 'null') {
         showToast('The audio file is not available.', 'error');
         return;
     }
 
+    if (fileUrl.startsWith('/voice-lines/')) {
+        resolveVoiceLineJob(fileUrl, element);
+        return;
+    }
+
     // Reset the Audio object if the source has changed
     if (element.audio) {
         if (element.audio.src !== new URL(fileUrl, window.location.origin).href) {
@@ -263,6 +300,50 @@ function handleAjaxFormSubmit(form, options = {}) {
     });
 }
 
+// Reads the server-sent events of a fetch response, calling onEvent with the
+// name and the parsed data of each.
+function readServerSentEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    function read() {
+        return reader.read().then(({ done, value }) => {
+            if (done) {
+                return;
+            }
+
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const rawEvent = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                let eventName = 'message';
+                const dataLines = [];
+
+                rawEvent.split('\n').forEach(line => {
+                    if (line.startsWith('event:')) {
+                        eventName = line.slice(6).trim();
+                    } else if (line.startsWith('data:')) {
+                        dataLines.push(line.slice(5).trim());
+                    }
+                });
+
+                // Lines starting with ':' are keep-alive comments.
+                if (dataLines.length) {
+                    onEvent(eventName, JSON.parse(dataLines.join('\n')));
+                }
+            }
+
+            return read();
+        });
+    }
+
+    return read();
+}
+
 function initCollapsibles(){
     // Collapsible sections
     const collapsibles = document.querySelectorAll('.collapsible');
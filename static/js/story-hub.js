@@ -145,6 +145,98 @@ function generateItemsSuccess(data, context) {
 }
 
 
+// The buttons of the concept types being generated in a batch, along with
+// their original contents.
+const batchGenerationButtons = {};
+
+function findConceptForm(conceptType) {
+    const itemType = Object.keys(itemTypeConfigs).find(key => itemTypeConfigs[key].itemsKey === conceptType);
+
+    return itemType ? document.querySelector(`form.ajax-form[data-item-type="${itemType}"]`) : null;
+}
+
+function restoreBatchGenerationButton(conceptType) {
+    const entry = batchGenerationButtons[conceptType];
+
+    if (entry) {
+        entry.button.disabled = false;
+        entry.button.innerHTML = entry.originalHTML;
+        delete batchGenerationButtons[conceptType];
+    }
+}
+
+function handleConceptsBatchEvent(eventName, data) {
+    if (eventName === 'concept_progress') {
+        const form = findConceptForm(data.concept_type);
+
+        if (!form) {
+            return;
+        }
+
+        if (data.status === 'generating') {
+            const button = document.getElementById(`generate-${data.concept_type}-button`);
+
+            if (button && !batchGenerationButtons[data.concept_type]) {
+                batchGenerationButtons[data.concept_type] = { button, originalHTML: button.innerHTML };
+                disable_button_and_add_spinner(button);
+            }
+        } else if (data.status === 'generated') {
+            restoreBatchGenerationButton(data.concept_type);
+            generateItemsSuccess({ success: true, [data.concept_type]: data.items }, { form });
+        } else if (data.status === 'failed') {
+            restoreBatchGenerationButton(data.concept_type);
+            showToast(`Failed to generate ${data.concept_type.replace(/_/g, ' ')}. Error: ${data.error}`, 'error');
+        }
+    } else if (eventName === 'concepts_batch_finished') {
+        showToast(data.message, data.success ? 'success' : 'error');
+    } else if (eventName === 'error') {
+        showToast(data.error || 'An error occurred', 'error');
+    }
+}
+
+// Generates every concept type at once, updating each section as its concepts
+// arrive.
+function initBatchGeneration() {
+    const form = document.querySelector('form.batch-generation-form');
+
+    if (!form) {
+        return;
+    }
+
+    form.addEventListener('submit', (event) => {
+        event.preventDefault();
+
+        const button = form.querySelector('button[type="submit"]');
+        const originalButtonHTML = button.innerHTML;
+        disable_button_and_add_spinner(button);
+
+        fetch(form.dataset.streamUrl, {
+            method: 'POST',
+            body: new FormData(form),
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+            },
+        })
+            .then((response) => {
+                // Errors before the stream starts come back as regular JSON.
+                if (!(response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+                    return response.json().then(data => handleConceptsBatchEvent('error', data));
+                }
+
+                return readServerSentEvents(response, handleConceptsBatchEvent);
+            })
+            .catch((error) => {
+                console.error('Error:', error);
+                showToast('An unexpected error occurred.', 'error');
+            })
+            .finally(() => {
+                Object.keys(batchGenerationButtons).forEach(restoreBatchGenerationButton);
+                button.disabled = false;
+                button.innerHTML = originalButtonHTML;
+            });
+    });
+}
+
 function openModal(index, conceptType) {
     document.getElementById(`modal-${conceptType}-${index}`).style.display = "block";
 }
@@ -272,4 +364,6 @@ document.addEventListener('DOMContentLoaded', () => {
             onError: errorHandler
         });
     });
+
+    initBatchGeneration();
 });
\ No newline at end of file
@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.base.async_bridge import AsyncBridge
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.json_file_cache import JsonFileCache
+from src.prompting.llm import Llm
+
+
+@pytest.fixture
+def mock_llm():
+    llm = Mock(spec=Llm)
+    llm.get_name.return_value = "model"
+    llm.get_temperature.return_value = 1.0
+    llm.get_top_p.return_value = 1.0
+    llm.get_frequency_penalty.return_value = 0.0
+    llm.get_presence_penalty.return_value = 0.0
+    return llm
+
+
+@pytest.fixture
+def messages_to_llm():
+    messages = MessagesToLlm()
+    messages.add_message("system", "System.")
+    messages.add_message("user", "User.")
+    return messages
+
+
+@pytest.fixture
+def mock_config_loader():
+    config_loader = Mock(spec=ConfigLoader)
+    config_loader.get_max_retries.return_value = 1
+    return config_loader
+
+
+@pytest.fixture
+def async_bridge():
+    bridge = AsyncBridge()
+    yield bridge
+    bridge.close()
+
+
+@pytest.fixture
+def json_file_cache():
+    return JsonFileCache()
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.base.async_bridge import AsyncBridge, gather_with_concurrency_limit
+
+
+def test_gather_keeps_order_and_respects_the_limit():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def complete(index):
+        nonlocal in_flight, max_in_flight
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+
+        # Later completions finish first.
+        await asyncio.sleep(0.01 * (5 - index))
+
+        in_flight -= 1
+
+        return index
+
+    bridge = AsyncBridge()
+
+    results = bridge.run(
+        gather_with_concurrency_limit([complete(index) for index in range(5)], 2)
+    )
+
+    bridge.close()
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max_in_flight == 2
+
+
+def test_coroutines_of_every_caller_run_on_the_same_loop():
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    bridge = AsyncBridge()
+    loops = []
+
+    threads = [
+        threading.Thread(target=lambda: loops.append(bridge.run(get_loop())))
+        for _ in range(3)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(set(loops)) == 1
+    assert not loops[0].is_closed()
+
+    bridge.close()
+
+    assert loops[0].is_closed()
+
+
+def test_exceptions_reach_the_caller():
+    async def fail():
+        raise ValueError("The completion failed.")
+
+    bridge = AsyncBridge()
+
+    with pytest.raises(ValueError, match="The completion failed."):
+        bridge.run(gather_with_concurrency_limit([fail()], 1))
+
+    bridge.close()
+
+
+def test_the_bridge_refuses_to_wait_for_itself():
+    bridge = AsyncBridge()
+
+    async def wait_for_itself():
+        async def nothing():
+            return None
+
+        bridge.run(nothing())
+
+    with pytest.raises(RuntimeError):
+        bridge.run(wait_for_itself())
+
+    bridge.close()
@@ -0,0 +1,92 @@
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+
+from pydantic import BaseModel
+
+from src.base.abstracts.observer import Observer
+from src.base.async_bridge import gather_with_concurrency_limit
+from src.prompting.async_instructor_llm_client import AsyncInstructorLlmClient
+
+
+class Speech(BaseModel):
+    name: str
+    speech: str
+
+
+class PartialSpeech(BaseModel):
+    name: Optional[str] = None
+    speech: Optional[str] = None
+
+
+def test_completions_are_awaited(
+    mock_config_loader, mock_llm, messages_to_llm, async_bridge
+):
+    client = Mock()
+    client.chat.completions.create = AsyncMock(
+        side_effect=[Speech(name="Aria", speech="Hi."), Speech(name="Bo", speech="Yo.")]
+    )
+
+    llm_client = AsyncInstructorLlmClient(client, Speech, mock_config_loader)
+
+    products = async_bridge.run(
+        gather_with_concurrency_limit(
+            [
+                llm_client.generate_completion(mock_llm, messages_to_llm)
+                for _ in range(2)
+            ],
+            2,
+        )
+    )
+
+    assert [product.get() for product in products] == [
+        Speech(name="Aria", speech="Hi."),
+        Speech(name="Bo", speech="Yo."),
+    ]
+    assert client.chat.completions.create.await_count == 2
+
+
+def test_partial_responses_are_streamed_to_the_observer(
+    mock_config_loader, mock_llm, messages_to_llm, async_bridge
+):
+    async def stream_partial_responses(**kwargs):
+        for partial_response in (
+            PartialSpeech(name="Aria"),
+            PartialSpeech(name="Aria", speech="Hello."),
+        ):
+            yield partial_response
+
+    client = Mock()
+    client.chat.completions.create_partial = stream_partial_responses
+
+    observer = Mock(spec=Observer)
+
+    product = async_bridge.run(
+        AsyncInstructorLlmClient(
+            client, Speech, mock_config_loader, observer
+        ).generate_completion(mock_llm, messages_to_llm)
+    )
+
+    assert product.get() == Speech(name="Aria", speech="Hello.")
+    assert [call.args[0] for call in observer.update.call_args_list] == [
+        {},
+        {"name": "Aria"},
+        {"name": "Aria", "speech": "Hello."},
+    ]
+
+
+def test_response_that_does_not_validate_is_invalid(
+    mock_config_loader, mock_llm, messages_to_llm, async_bridge
+):
+    async def stream_partial_responses(**kwargs):
+        yield PartialSpeech(name="Aria")
+
+    client = Mock()
+    client.chat.completions.create_partial = stream_partial_responses
+
+    product = async_bridge.run(
+        AsyncInstructorLlmClient(
+            client, Speech, mock_config_loader, Mock(spec=Observer)
+        ).generate_completion(mock_llm, messages_to_llm)
+    )
+
+    assert not product.is_valid()
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from src.databases.cached_embedding_function import CachedEmbeddingFunction
+
+
+class CountingEmbeddingFunction:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input):  # noqa
+        self.calls.append(list(input))
+
+        return [np.array([len(text), 1.0], dtype=np.float32) for text in input]
+
+
+def test_repeated_texts_get_embedded_once():
+    embedding_function = CountingEmbeddingFunction()
+    cached_embedding_function = CachedEmbeddingFunction(
+        embedding_function, "counting-model", 8
+    )
+
+    first = cached_embedding_function(["a long query", "other", "a long query"])
+    second = cached_embedding_function(["a long query"])
+
+    assert embedding_function.calls == [["a long query", "other"]]
+    assert np.array_equal(first[0], second[0])
+    assert np.array_equal(first[0], first[2])
+
+    statistics = cached_embedding_function.get_statistics()
+    assert statistics.hits == 1
+    assert statistics.misses == 2
+    assert statistics.hit_rate == pytest.approx(1 / 3)
+
+
+def test_least_recently_used_embeddings_get_evicted():
+    embedding_function = CountingEmbeddingFunction()
+    cached_embedding_function = CachedEmbeddingFunction(
+        embedding_function, "counting-model", 2
+    )
+
+    cached_embedding_function(["one"])
+    cached_embedding_function(["two"])
+    cached_embedding_function(["one"])
+    cached_embedding_function(["three"])
+    cached_embedding_function(["one", "two"])
+
+    assert embedding_function.calls == [["one"], ["two"], ["three"], ["two"]]
+
+
+def test_returned_embeddings_are_copies():
+    cached_embedding_function = CachedEmbeddingFunction(
+        CountingEmbeddingFunction(), "counting-model", 8
+    )
+
+    cached_embedding_function(["text"])[0][0] = 100.0
+
+    assert cached_embedding_function(["text"])[0][0] == 4.0
+
+
+def test_embeddings_survive_restarts_on_disk(tmp_path):
+    CachedEmbeddingFunction(
+        CountingEmbeddingFunction(), "counting-model", 8, tmp_path, 1024
+    )(["persisted"])
+
+    embedding_function = CountingEmbeddingFunction()
+    cached_embedding_function = CachedEmbeddingFunction(
+        embedding_function, "counting-model", 8, tmp_path, 1024
+    )
+
+    assert cached_embedding_function(["persisted"])[0][0] == 9.0
+    assert embedding_function.calls == []
+    assert cached_embedding_function.get_statistics().disk_hits == 1
+
+
+def test_least_recently_used_embeddings_get_evicted_from_disk(tmp_path):
+    # Each embedding takes 136 bytes on disk: room for two of them.
+    cached_embedding_function = CachedEmbeddingFunction(
+        CountingEmbeddingFunction(), "counting-model", 0, tmp_path, 300
+    )
+
+    cached_embedding_function(["one"])
+    cached_embedding_function(["two"])
+    cached_embedding_function(["one"])
+    cached_embedding_function(["three"])
+
+    embedding_function = CountingEmbeddingFunction()
+    restarted_embedding_function = CachedEmbeddingFunction(
+        embedding_function, "counting-model", 0, tmp_path, 300
+    )
+
+    restarted_embedding_function(["one", "two", "three"])
+
+    assert embedding_function.calls == [["two"]]
+    assert len(list(tmp_path.glob("*/*/*.npy"))) == 2
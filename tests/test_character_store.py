@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.characters.character import Character
+from src.characters.character_store import CharacterStore
+from src.filesystem.file_operations import write_json_file
+from src.filesystem.path_manager import PathManager
+
+
+@pytest.fixture
+def store(tmp_path, json_file_cache):
+    characters_file_path = tmp_path / "characters.json"
+
+    write_json_file(
+        characters_file_path,
+        {
+            str(index): {attribute: "" for attribute in Character.REQUIRED_ATTRIBUTES}
+            | {"name": f"NPC {index}"}
+            for index in range(1, 101)
+        },
+    )
+
+    path_manager = Mock(spec=PathManager)
+    path_manager.get_characters_file_path.return_value = characters_file_path
+
+    return CharacterStore(
+        "playthrough", path_manager=path_manager, json_file_cache=json_file_cache
+    )
+
+
+def test_get_many_parses_the_characters_file_once(json_file_cache, store):
+    characters = store.get_many(["3", "1", "2"])
+    character = store.get("50")
+
+    assert [character.name for character in characters] == ["NPC 3", "NPC 1", "NPC 2"]
+    assert character.identifier == "50"
+    assert json_file_cache.get_statistics().disk_reads == 1
+
+
+def test_characters_do_not_share_their_data(store):
+    first, second = store.get_many(["1", "1"])
+    first.update_data({"health": "Wounded"})
+
+    assert second.health == ""
+    assert store.get("1").health == "Wounded"
+
+
+def test_unknown_character_raises(store):
+    with pytest.raises(KeyError):
+        store.get_many(["1", "101"])
@@ -0,0 +1,77 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.base.playthrough_manager import PlaythroughManager
+from src.characters.character_view_model import CharacterViewModel
+from src.characters.characters_manager import CharactersManager
+from src.filesystem.file_operations import write_json_file
+from src.filesystem.path_manager import PathManager
+from src.maps.map_repository import MapRepository
+
+
+@pytest.fixture
+def characters_manager(tmp_path, json_file_cache):
+    characters_path = tmp_path / "characters"
+    characters_path.mkdir()
+
+    write_json_file(
+        characters_path / "characters.json",
+        {
+            "1": {"name": "Aldous", "description": "A tired knight."},
+            "2": {"name": "Bea", "description": "A curious scholar."},
+        },
+    )
+
+    path_manager = Mock(spec=PathManager)
+    path_manager.get_characters_path.return_value = characters_path
+    path_manager.get_characters_file_path.return_value = (
+        characters_path / "characters.json"
+    )
+
+    playthrough_manager = Mock(spec=PlaythroughManager)
+    playthrough_manager.get_followers.return_value = ["2"]
+
+    return CharactersManager(
+        "playthrough",
+        playthrough_manager=playthrough_manager,
+        map_repository=Mock(spec=MapRepository),
+        path_manager=path_manager,
+        json_file_cache=json_file_cache,
+    )
+
+
+def test_view_models_are_projected_from_a_single_read(
+    json_file_cache, characters_manager
+):
+    view_models = characters_manager.get_character_view_models(["1", "2"])
+
+    assert view_models == [
+        CharacterViewModel(
+            "1",
+            "Aldous",
+            "A tired knight.",
+            "playthroughs/playthrough/images/1.png",
+        ),
+        CharacterViewModel(
+            "2",
+            "Bea",
+            "A curious scholar.",
+            "playthroughs/playthrough/images/2.png",
+        ),
+    ]
+
+    statistics = json_file_cache.get_statistics()
+    assert statistics.disk_reads == 1
+    assert statistics.writes == 0
+
+
+def test_follower_view_models(characters_manager):
+    assert [
+        view_model.name for view_model in characters_manager.get_follower_view_models()
+    ] == ["Bea"]
+
+
+def test_unknown_character_raises(characters_manager):
+    with pytest.raises(KeyError):
+        characters_manager.get_character_view_models(["3"])
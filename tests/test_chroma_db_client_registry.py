@@ -0,0 +1,86 @@
+import shutil
+from unittest.mock import Mock
+
+import pytest
+
+from src.databases import chroma_db_client_registry
+from src.databases.chroma_db_client_registry import ChromaDbClientRegistry
+from src.filesystem.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def create_registry():
+    def create(max_databases: int):
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_max_cached_playthrough_databases.return_value = max_databases
+        config_loader.get_max_cached_embeddings.return_value = 16
+        config_loader.get_store_embeddings_on_disk.return_value = False
+
+        return ChromaDbClientRegistry(config_loader)
+
+    return create
+
+
+def test_get_handle_reuses_handle_per_database(tmp_path, create_registry):
+    registry = create_registry(2)
+
+    handle = registry.get_handle(tmp_path / "database")
+
+    assert registry.get_handle(tmp_path / "database") is handle
+    assert handle.collection.name == ChromaDbClientRegistry.COLLECTION_NAME
+
+    registry.close(tmp_path / "database")
+
+
+def test_closed_databases_can_be_deleted(tmp_path, create_registry):
+    registry = create_registry(2)
+
+    handle = registry.get_handle(tmp_path / "database")
+    handle.collection.add(ids=["0"], documents=["Text."], embeddings=[[0.1, 0.2]])
+
+    registry.close(tmp_path / "database")
+    shutil.rmtree(tmp_path / "database")
+
+    assert registry.get_handle(tmp_path / "database").collection.count() == 0
+
+    registry.close(tmp_path / "database")
+
+
+def test_idle_databases_get_evicted(tmp_path, monkeypatch, create_registry):
+    monkeypatch.setattr(
+        chroma_db_client_registry, "MINIMUM_IDLE_SECONDS_BEFORE_DATABASE_EVICTION", 0
+    )
+
+    registry = create_registry(1)
+
+    first_handle = registry.get_handle(tmp_path / "first")
+    registry.get_handle(tmp_path / "second")
+
+    assert registry.get_handle(tmp_path / "first") is not first_handle
+
+    registry.close(tmp_path / "first")
+    registry.close(tmp_path / "second")
+
+
+def test_recently_used_databases_are_kept(tmp_path, monkeypatch, create_registry):
+    monkeypatch.setattr(
+        chroma_db_client_registry,
+        "MINIMUM_IDLE_SECONDS_BEFORE_DATABASE_EVICTION",
+        3600,
+    )
+
+    registry = create_registry(1)
+
+    first_handle = registry.get_handle(tmp_path / "first")
+    registry.get_handle(tmp_path / "second")
+
+    assert registry.get_handle(tmp_path / "first") is first_handle
+
+    registry.close(tmp_path / "first")
+    registry.close(tmp_path / "second")
+
+
+def test_embedding_function_is_shared(create_registry):
+    registry = create_registry(1)
+
+    assert registry.get_embedding_function() is registry.get_embedding_function()
@@ -0,0 +1,108 @@
+from unittest.mock import Mock
+
+import chromadb
+import pytest
+from chromadb.config import Settings
+
+from src.databases.chroma_db_client_registry import (
+    ChromaDbClientRegistry,
+    ChromaDbHandle,
+)
+from src.databases.chroma_db_database import ChromaDbDatabase
+from src.filesystem.path_manager import PathManager
+
+
+class FakeEmbeddingFunction:
+    """Embeds texts as letter frequencies, and records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+
+        return [
+            [
+                text.lower().count(letter) + 0.01
+                for letter in "abcdefghijklmnopqrstuvwxyz"
+            ]
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def database(tmp_path):
+    client = chromadb.PersistentClient(
+        path=(tmp_path / "database").as_posix(),
+        settings=Settings(anonymized_telemetry=False, allow_reset=True),
+    )
+
+    registry = Mock(spec=ChromaDbClientRegistry)
+    registry.get_handle.return_value = ChromaDbHandle(
+        client, client.get_or_create_collection(name="playthrough_data"), 0
+    )
+    registry.get_embedding_function.return_value = FakeEmbeddingFunction()
+
+    path_manager = Mock(spec=PathManager)
+    path_manager.get_database_path.return_value = tmp_path / "database"
+
+    yield ChromaDbDatabase("test_playthrough", path_manager, registry)
+
+    client.reset()
+
+
+def test_batch_embeds_each_distinct_query_text_once(database):
+    database.insert_fact("The tower is old.")
+    database.insert_memory("1", "I climbed the tower.", "memory_1")
+    database.insert_memory("2", "I saw a dragon.", "memory_2")
+
+    embedding_function = database._embedding_function  # noqa
+    embedding_function.calls.clear()
+
+    result = database.retrieve_facts_and_memories_batch(
+        "tower", "tower", ["1", "2"], facts_top_k=5, memories_top_k=5
+    )
+
+    assert embedding_function.calls == [["tower"]]
+    assert [fact["document"] for fact in result.facts] == ["The tower is old."]
+    assert [memory["document"] for memory in result.memories["1"]] == [
+        "I climbed the tower."
+    ]
+    assert [memory["document"] for memory in result.memories["2"]] == [
+        "I saw a dragon."
+    ]
+
+
+def test_batch_keeps_per_character_top_k(database):
+    for index in range(4):
+        database.insert_memory("1", f"Tower memory {index}.", f"memory_1_{index}")
+
+    database.insert_memory("2", "Something unrelated.", "memory_2_0")
+
+    result = database.retrieve_facts_and_memories_batch(
+        None, "Tower memory", ["1", "2"], memories_top_k=2
+    )
+
+    assert len(result.memories["1"]) == 2
+    assert [memory["document"] for memory in result.memories["2"]] == [
+        "Something unrelated."
+    ]
+    assert result.facts == []
+
+
+def test_bulk_insert_embeds_once_with_unique_identifiers(database):
+    database.insert_memory("1", "An edited memory.", "7")
+
+    embedding_function = database._embedding_function  # noqa
+    embedding_function.calls.clear()
+
+    database.insert_memories(
+        [("1", "I lost my sword."), ("2", "I found a sword."), ("2", "I hid it.")]
+    )
+    database.insert_facts(["Swords are rare.", "The river is cold."])
+
+    assert len(embedding_function.calls) == 2
+
+    identifiers = database._collection.get(include=[])["ids"]  # noqa
+
+    assert sorted(identifiers, key=int) == ["7", "8", "9", "10", "11", "12"]
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from src.base.context_assembler import ContextAssembler, ContextTask
+
+
+def test_dependencies_receive_the_values_of_their_tasks():
+    assembler = ContextAssembler(max_workers=4)
+
+    assembly = assembler.assemble(
+        [
+            ContextTask("places", lambda: "Tavern"),
+            ContextTask("transcription", lambda: "Mira: Hello."),
+            ContextTask(
+                "known_facts",
+                lambda places, transcription: f"Facts about {places} / {transcription}",
+                ("places", "transcription"),
+            ),
+        ]
+    )
+
+    assert assembly.values == {
+        "places": "Tavern",
+        "transcription": "Mira: Hello.",
+        "known_facts": "Facts about Tavern / Mira: Hello.",
+    }
+    assert set(assembly.timings) == {"places", "transcription", "known_facts"}
+
+    assembler.close()
+
+
+def test_independent_tasks_run_concurrently():
+    assembler = ContextAssembler(max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    # Each task can only finish once the other one has started as well.
+    assembly = assembler.assemble(
+        [
+            ContextTask("first", lambda: barrier.wait() is not None),
+            ContextTask("second", lambda: barrier.wait() is not None),
+        ]
+    )
+
+    assert assembly.values == {"first": True, "second": True}
+
+    assembler.close()
+
+
+def test_nested_assemblies_run_inline():
+    assembler = ContextAssembler(max_workers=2)
+
+    def nested():
+        return assembler.assemble(
+            [
+                ContextTask("inner", lambda: threading.current_thread().name),
+                ContextTask("other", lambda: threading.current_thread().name),
+            ]
+        ).values
+
+    assembly = assembler.assemble(
+        [
+            ContextTask("first", nested),
+            ContextTask("second", nested),
+        ]
+    )
+
+    # Both workers were busy with the outer tasks, so the inner ones ran on them.
+    for values in assembly.values.values():
+        assert values["inner"] == values["other"]
+
+    assembler.close()
+
+
+def test_task_errors_propagate():
+    assembler = ContextAssembler(max_workers=2)
+
+    def fail():
+        raise RuntimeError("Database is down.")
+
+    with pytest.raises(RuntimeError, match="Database is down."):
+        assembler.assemble(
+            [
+                ContextTask("failing", fail),
+                ContextTask("dependent", lambda failing: failing, ("failing",)),
+            ]
+        )
+
+    assembler.close()
+
+
+def test_invalid_dependencies_are_rejected():
+    assembler = ContextAssembler(max_workers=2)
+
+    with pytest.raises(ValueError):
+        assembler.assemble([ContextTask("facts", lambda places: places, ("places",))])
+
+    with pytest.raises(ValueError):
+        assembler.assemble(
+            [
+                ContextTask("a", lambda b: b, ("b",)),
+                ContextTask("b", lambda a: a, ("a",)),
+            ]
+        )
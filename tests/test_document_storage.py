@@ -0,0 +1,259 @@
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from src.base.enums import StorageBackend, TemplateType
+from src.base.exceptions import PlaythroughStorageMigrationError
+from src.filesystem.document_storage import (
+    DocumentStorageRegistry,
+    JsonFileDocumentStorage,
+    SqliteDocumentStorage,
+)
+from src.filesystem.file_operations import read_json_file, write_json_file
+from src.filesystem.json_file_cache import JsonFileCache
+from src.filesystem.json_journal import JsonJournalRegistry
+from src.filesystem.path_manager import PathManager
+from src.filesystem.playthrough_storage_migrator import PlaythroughStorageMigrator
+from src.maps.map_repository import MapRepository
+
+
+@pytest.fixture
+def path_manager(tmp_path):
+    playthroughs_path = tmp_path / "playthroughs"
+
+    def get_playthrough_path(playthrough_name):
+        return playthroughs_path / playthrough_name
+
+    path_manager = Mock(spec=PathManager)
+    path_manager.get_playthroughs_path.return_value = playthroughs_path
+    path_manager.get_playthrough_path.side_effect = get_playthrough_path
+    path_manager.get_playthrough_documents_database_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "documents.sqlite3"
+    )
+    path_manager.get_playthrough_metadata_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "playthrough_metadata.json"
+    )
+    path_manager.get_map_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "map.json"
+    )
+    path_manager.get_characters_file_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "characters" / "characters.json"
+    )
+    path_manager.get_concepts_file_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "concepts" / "concepts.json"
+    )
+    path_manager.get_ongoing_dialogue_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "ongoing_dialogue.json"
+    )
+    path_manager.get_ongoing_dialogue_journal_path.side_effect = (
+        lambda name: get_playthrough_path(name) / "ongoing_dialogue.journal.jsonl"
+    )
+
+    get_playthrough_path("playthrough").mkdir(parents=True)
+
+    return path_manager
+
+
+@pytest.fixture
+def map_data():
+    return {
+        "1": {"type": "world", "place_template": "Aria"},
+        "2": {"type": "region", "world": "1", "place_template": "Coast"},
+        "3": {"type": "area", "region": "2", "characters": ["1", "2"]},
+    }
+
+
+@pytest.fixture
+def query(path_manager):
+    def run_query(sql):
+        with sqlite3.connect(
+            path_manager.get_playthrough_documents_database_path("playthrough")
+        ) as connection:
+            return connection.execute(sql).fetchall()
+
+    return run_query
+
+
+def test_documents_of_playthroughs_with_a_database_are_stored_in_it(
+    map_data, path_manager
+):
+    registry = DocumentStorageRegistry(path_manager)
+    registry.create_database("playthrough")
+
+    cache = JsonFileCache(registry)
+    map_path = path_manager.get_map_path("playthrough")
+    metadata_path = path_manager.get_playthrough_metadata_path("playthrough")
+
+    assert not cache.exists(map_path)
+
+    cache.write(map_path, map_data)
+    cache.write(metadata_path, {"current_place": "3"})
+
+    assert not map_path.exists()
+    assert not metadata_path.exists()
+
+    # Another process would read it from the database.
+    other_cache = JsonFileCache(DocumentStorageRegistry(path_manager))
+
+    assert other_cache.read(map_path) == map_data
+    assert other_cache.read(metadata_path) == {"current_place": "3"}
+
+    registry.clear()
+
+
+def test_only_changed_places_are_rewritten(query, map_data, path_manager):
+    registry = DocumentStorageRegistry(path_manager)
+    registry.create_database("playthrough")
+
+    cache = JsonFileCache(registry)
+    map_path = path_manager.get_map_path("playthrough")
+
+    cache.write(map_path, map_data)
+
+    storage = registry.get_storage(map_path)
+    connection = storage._get_connection()
+    changes_before = connection.total_changes
+
+    changed_map_data = cache.read(map_path)
+    changed_map_data["3"]["characters"] = ["2"]
+    del changed_map_data["2"]
+    cache.write(map_path, changed_map_data)
+
+    # Deleting a place, replacing another along with its two characters, and
+    # bumping the version of the map. The first place isn't touched.
+    assert connection.total_changes - changes_before == 6
+    assert cache.read(map_path) == changed_map_data
+
+    assert query(
+        "SELECT place_identifier FROM place_characters WHERE character_identifier = '2'"
+    ) == [("3",)]
+    assert query("SELECT identifier FROM places WHERE type = 'area'") == [("3",)]
+
+    registry.clear()
+
+
+def test_places_are_indexed_by_type_parent_and_characters(
+    query, map_data, path_manager
+):
+    storage = SqliteDocumentStorage("playthrough", path_manager)
+
+    storage.write(path_manager.get_map_path("playthrough"), map_data)
+
+    assert query("SELECT identifier, parent FROM places") == [
+        ("1", None),
+        ("2", "1"),
+        ("3", "2"),
+    ]
+    assert {row[1] for row in query("PRAGMA index_list(places)")} >= {
+        "places_by_type",
+        "places_by_parent",
+    }
+    assert query("PRAGMA journal_mode") == [("wal",)]
+
+    storage.close()
+
+
+def test_map_lookups_query_the_indexes(map_data, path_manager):
+    registry = DocumentStorageRegistry(path_manager)
+    registry.create_database("playthrough")
+
+    cache = JsonFileCache(registry)
+    cache.write(path_manager.get_map_path("playthrough"), map_data)
+    cache.clear()
+
+    map_repository = MapRepository("playthrough", path_manager, cache, registry)
+
+    assert map_repository.get_places_of_type(TemplateType.REGION) == {
+        "2": map_data["2"]
+    }
+    assert map_repository.get_child_places("2") == {"3": map_data["3"]}
+    assert map_repository.get_child_places("2", TemplateType.LOCATION) == {}
+    assert map_repository.get_characters_at_place("3") == ["1", "2"]
+
+    # None of them had to read the whole map.
+    assert cache.get_statistics().disk_reads == 0
+
+    registry.clear()
+
+
+def test_journals_are_stored_as_rows(query, path_manager):
+    registry = DocumentStorageRegistry(path_manager)
+    registry.create_database("playthrough")
+
+    journal = JsonJournalRegistry(
+        compaction_threshold=2, document_storage_registry=registry
+    ).get_journal(
+        path_manager.get_ongoing_dialogue_path("playthrough"),
+        path_manager.get_ongoing_dialogue_journal_path("playthrough"),
+        lambda data, event_type, payload: data.setdefault(event_type, []).append(
+            payload
+        ),
+    )
+
+    for message in ("One.", "Two.", "Three."):
+        journal.append([("messages", message)])
+
+    assert query("SELECT COUNT(*) FROM journal_lines") == [(1,)]
+    assert not path_manager.get_ongoing_dialogue_path("playthrough").exists()
+
+    other_journal = JsonJournalRegistry(
+        document_storage_registry=DocumentStorageRegistry(path_manager)
+    ).get_journal(
+        path_manager.get_ongoing_dialogue_path("playthrough"),
+        path_manager.get_ongoing_dialogue_journal_path("playthrough"),
+        lambda data, event_type, payload: data.setdefault(event_type, []).append(
+            payload
+        ),
+    )
+
+    assert other_journal.get("messages") == ["One.", "Two.", "Three."]
+
+    registry.clear()
+
+
+def test_playthroughs_are_migrated_both_ways(map_data, path_manager):
+
+    write_json_file(
+        path_manager.get_playthrough_metadata_path("playthrough"), {"hour": 8}
+    )
+    write_json_file(path_manager.get_map_path("playthrough"), map_data)
+    JsonFileDocumentStorage().write(
+        path_manager.get_characters_file_path("playthrough"), {"1": {"name": "Bea"}}
+    )
+    JsonFileDocumentStorage().append_lines(
+        path_manager.get_ongoing_dialogue_journal_path("playthrough"),
+        ['{"sequence": 1, "type": "purpose_set", "data": "Trade."}'],
+    )
+
+    migrator = PlaythroughStorageMigrator(path_manager)
+    migrator.migrate("playthrough", StorageBackend.SQLITE)
+
+    assert not path_manager.get_map_path("playthrough").exists()
+    assert not path_manager.get_ongoing_dialogue_journal_path("playthrough").exists()
+
+    cache = JsonFileCache(DocumentStorageRegistry(path_manager))
+
+    assert cache.read(path_manager.get_map_path("playthrough")) == map_data
+    assert cache.read_entries(
+        path_manager.get_characters_file_path("playthrough"), ["1"]
+    ) == {"1": {"name": "Bea"}}
+
+    with pytest.raises(PlaythroughStorageMigrationError):
+        migrator.migrate_to_sqlite("playthrough")
+
+    migrator.migrate("playthrough", StorageBackend.JSON)
+
+    assert not path_manager.get_playthrough_documents_database_path(
+        "playthrough"
+    ).exists()
+    assert read_json_file(path_manager.get_map_path("playthrough")) == map_data
+    assert read_json_file(
+        path_manager.get_playthrough_metadata_path("playthrough")
+    ) == {"hour": 8}
+    assert not path_manager.get_concepts_file_path("playthrough").exists()
+    assert (
+        path_manager.get_ongoing_dialogue_journal_path("playthrough")
+        .read_text(encoding="utf-8")
+        .startswith('{"sequence": 1')
+    )
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.concepts.algorithms.generate_concepts_batch_algorithm import (
+    GenerateConceptsBatchAlgorithm,
+)
+from src.concepts.algorithms.get_concepts_prompt_data_algorithm import (
+    GetConceptsPromptDataAlgorithm,
+)
+from src.concepts.enums import ConceptType
+from src.concepts.factories.base_concept_factory import BaseConceptFactory
+from src.concepts.models.goals import Goals
+from src.concepts.repositories.concepts_repository import ConceptsRepository
+from src.filesystem.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def create_factory():
+    def create(items=None, error=None, delay=0.0):
+        async def generate_product_async(_response_model):
+            await asyncio.sleep(delay)
+
+            product = Mock()
+            product.is_valid.return_value = error is None
+            product.get_error.return_value = error
+            product.get.return_value = items
+
+            return product
+
+        factory = Mock(spec=BaseConceptFactory)
+        factory.generate_product_async = AsyncMock(side_effect=generate_product_async)
+
+        return factory
+
+    return create
+
+
+@pytest.fixture
+def create_algorithm(async_bridge):
+    def create(concept_factories, progress_observer=None):
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_max_concurrent_concept_generations.return_value = 5
+
+        get_concepts_prompt_data_algorithm = Mock(spec=GetConceptsPromptDataAlgorithm)
+        concepts_repository = Mock(spec=ConceptsRepository)
+
+        algorithm = GenerateConceptsBatchAlgorithm(
+            "playthrough",
+            concept_factories,
+            get_concepts_prompt_data_algorithm,
+            progress_observer,
+            concepts_repository,
+            config_loader,
+            async_bridge,
+        )
+
+        return algorithm, get_concepts_prompt_data_algorithm, concepts_repository
+
+    return create
+
+
+def test_concepts_are_generated_concurrently_and_saved_once(
+    create_algorithm, create_factory
+):
+    goals_factory = create_factory(["Find the key."], delay=0.2)
+    dilemmas_factory = create_factory(["Save one of them."], delay=0.2)
+
+    algorithm, get_concepts_prompt_data_algorithm, concepts_repository = (
+        create_algorithm(
+            {
+                ConceptType.GOALS: goals_factory,
+                ConceptType.DILEMMAS: dilemmas_factory,
+            },
+        )
+    )
+
+    start = time.monotonic()
+    generated_concepts = algorithm.do_algorithm(
+        [ConceptType.GOALS, ConceptType.DILEMMAS]
+    )
+
+    assert time.monotonic() - start < 0.4
+    assert generated_concepts == {
+        ConceptType.GOALS: ["Find the key."],
+        ConceptType.DILEMMAS: ["Save one of them."],
+    }
+    goals_factory.generate_product_async.assert_awaited_once_with(Goals)
+    get_concepts_prompt_data_algorithm.do_algorithm.assert_called_once()
+    concepts_repository.add_concepts_by_key.assert_called_once_with(
+        {"goals": ["Find the key."], "dilemmas": ["Save one of them."]}
+    )
+
+
+def test_a_failed_concept_type_doesnt_discard_the_others(
+    create_algorithm, create_factory
+):
+    progress_observer = Mock()
+
+    algorithm, _, concepts_repository = create_algorithm(
+        {
+            ConceptType.GOALS: create_factory(["Find the key."]),
+            ConceptType.MYSTERIES: create_factory(error="Timed out."),
+        },
+        progress_observer,
+    )
+
+    generated_concepts = algorithm.do_algorithm(
+        [ConceptType.GOALS, ConceptType.MYSTERIES]
+    )
+
+    assert generated_concepts == {ConceptType.GOALS: ["Find the key."]}
+    concepts_repository.add_concepts_by_key.assert_called_once_with(
+        {"goals": ["Find the key."]}
+    )
+
+    messages = [call.args[0] for call in progress_observer.update.call_args_list]
+
+    assert {"concept_type": "goals", "status": "generating"} in messages
+    assert {
+        "concept_type": "goals",
+        "status": "generated",
+        "items": ["Find the key."],
+    } in messages
+    assert any(
+        message["concept_type"] == "mysteries"
+        and message["status"] == "failed"
+        and "Timed out." in message["error"]
+        for message in messages
+    )
+
+
+def test_nothing_gets_saved_if_every_concept_type_fails(
+    create_algorithm, create_factory
+):
+    algorithm, _, concepts_repository = create_algorithm(
+        {ConceptType.GOALS: create_factory(items=[])}
+    )
+
+    assert algorithm.do_algorithm([ConceptType.GOALS]) == {}
+    concepts_repository.add_concepts_by_key.assert_not_called()
+
+
+def test_concept_types_without_a_factory_are_rejected(create_algorithm, create_factory):
+    algorithm, _, _ = create_algorithm(
+        {ConceptType.GOALS: create_factory(["Find the key."])}
+    )
+
+    with pytest.raises(NotImplementedError):
+        algorithm.do_algorithm([ConceptType.ARTIFACTS])
+
+    with pytest.raises(ValueError):
+        algorithm.do_algorithm([])
+
+
+def test_the_prompt_data_is_assembled_once():
+    places_descriptions_provider = Mock()
+    places_descriptions_provider.get_information.return_value = "A harbor."
+    format_known_facts_algorithm = Mock()
+    format_known_facts_algorithm.do_algorithm.return_value = "The tide is high."
+    player_and_followers_information_factory = Mock()
+    player_and_followers_information_factory.get_information.return_value = "Bea."
+
+    algorithm = GetConceptsPromptDataAlgorithm(
+        "playthrough",
+        format_known_facts_algorithm,
+        places_descriptions_provider,
+        player_and_followers_information_factory,
+    )
+
+    prompt_data = algorithm.do_algorithm()
+    prompt_data["known_facts"] = "Changed by a caller."
+
+    assert algorithm.do_algorithm() == {
+        "places_descriptions": "A harbor.",
+        "player_and_followers_information": "Bea.",
+        "known_facts": "The tide is high.",
+    }
+    places_descriptions_provider.get_information.assert_called_once()
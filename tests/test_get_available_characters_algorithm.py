@@ -37,7 +37,7 @@ def character3():
 @pytest.fixture
 def mock_characters_manager(character1, character2, character3):
     manager = Mock(spec=CharactersManager)
-    manager.get_characters_at_current_place_plus_followers.return_value = [
+    manager.get_character_view_models_at_current_place_plus_followers.return_value = [
         character1,
         character2,
         character3,
@@ -119,7 +119,7 @@ def test_do_algorithm_filters_characters(
 
     # Should exclude character2
     assert available_characters == [character1, character3]
-    mock_characters_manager.get_characters_at_current_place_plus_followers.assert_called_once()
+    mock_characters_manager.get_character_view_models_at_current_place_plus_followers.assert_called_once()
 
 
 # Test do_algorithm without providing CharactersManager, ensuring it instantiates CharactersManager
@@ -128,7 +128,7 @@ def test_do_algorithm_without_characters_manager(
     mock_char_manager_class, character1, character2
 ):
     mock_char_manager = Mock(spec=CharactersManager)
-    mock_char_manager.get_characters_at_current_place_plus_followers.return_value = [
+    mock_char_manager.get_character_view_models_at_current_place_plus_followers.return_value = [
         character1,
         character2,
     ]
@@ -146,7 +146,7 @@ def test_do_algorithm_without_characters_manager(
     # Should exclude character2
     assert available_characters == [character1]
     mock_char_manager_class.assert_called_once_with(playthrough_name)
-    mock_char_manager.get_characters_at_current_place_plus_followers.assert_called_once()
+    mock_char_manager.get_character_view_models_at_current_place_plus_followers.assert_called_once()
 
 
 # Test do_algorithm when all characters are excluded
@@ -187,7 +187,7 @@ def test_do_algorithm_no_characters_excluded(
 
 # Test do_algorithm with empty list of all_characters
 def test_do_algorithm_empty_all_characters(mock_characters_manager):
-    mock_characters_manager.get_characters_at_current_place_plus_followers.return_value = (
+    mock_characters_manager.get_character_view_models_at_current_place_plus_followers.return_value = (
         []
     )
 
@@ -228,7 +228,7 @@ def test_do_algorithm_mixed_exclusions(
 def test_do_algorithm_characters_manager_returns_duplicates(
     mock_characters_manager, character1
 ):
-    mock_characters_manager.get_characters_at_current_place_plus_followers.return_value = [
+    mock_characters_manager.get_character_view_models_at_current_place_plus_followers.return_value = [
         character1,
         character1,  # Duplicate
     ]
@@ -259,7 +259,7 @@ def test_do_algorithm_large_number_of_characters(mock_characters_manager):
         char.identifier = f"char_{i}"
         mock_characters.append(char)
 
-    mock_characters_manager.get_characters_at_current_place_plus_followers.return_value = (
+    mock_characters_manager.get_character_view_models_at_current_place_plus_followers.return_value = (
         mock_characters
     )
 
@@ -281,7 +281,7 @@ def test_do_algorithm_character_without_identifier(mock_characters_manager):
     char_without_id = Mock(spec=Character)
     del char_without_id.identifier  # Remove identifier
 
-    mock_characters_manager.get_characters_at_current_place_plus_followers.return_value = [
+    mock_characters_manager.get_character_view_models_at_current_place_plus_followers.return_value = [
         char_without_id
     ]
 
@@ -7,6 +7,7 @@ from src.base.enums import TemplateType
 from src.base.playthrough_manager import PlaythroughManager
 from src.maps.algorithms.get_current_area_algorithm import GetCurrentAreaAlgorithm
 from src.maps.factories.place_manager_factory import PlaceManagerFactory
+from src.maps.map_index import MapIndex
 from src.maps.map_repository import MapRepository
 
 
@@ -34,9 +35,9 @@ def valid_playthrough_name():
 @pytest.fixture
 def default_map_file():
     return {
-        "area_1": {"name": "Area 1"},
-        "location_1": {"name": "Location 1", "area": "area_1"},
-        "room_1": {"name": "Room 1", "location": "location_1"},
+        "area_1": {"type": "area", "name": "Area 1"},
+        "location_1": {"type": "location", "name": "Location 1", "area": "area_1"},
+        "room_1": {"type": "room", "name": "Room 1", "location": "location_1"},
     }
 
 
@@ -92,7 +93,7 @@ def test_do_algorithm_area(
     default_map_file,
 ):
     # Setup mocks
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.AREA
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -109,7 +110,7 @@ def test_do_algorithm_area(
     result = algo.do_algorithm()
 
     assert result == default_map_file["area_1"]
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
     mock_place_manager_factory.create_place_manager.assert_called_once()
     mock_place_manager.get_current_place_type.assert_called_once()
     mock_playthrough_manager.get_current_place_identifier.assert_called_once()
@@ -124,7 +125,7 @@ def test_do_algorithm_location(
     default_map_file,
 ):
     # Setup mocks
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.LOCATION
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -141,7 +142,7 @@ def test_do_algorithm_location(
     result = algo.do_algorithm()
 
     assert result == default_map_file["area_1"]
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
     mock_place_manager_factory.create_place_manager.assert_called_once()
     mock_place_manager.get_current_place_type.assert_called_once()
     mock_playthrough_manager.get_current_place_identifier.assert_called_once()
@@ -156,7 +157,7 @@ def test_do_algorithm_room(
     default_map_file,
 ):
     # Setup mocks
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.ROOM
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -173,7 +174,7 @@ def test_do_algorithm_room(
     result = algo.do_algorithm()
 
     assert result == default_map_file["area_1"]
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
     mock_place_manager_factory.create_place_manager.assert_called_once()
     mock_place_manager.get_current_place_type.assert_called_once()
     mock_playthrough_manager.get_current_place_identifier.assert_called_once()
@@ -188,7 +189,7 @@ def test_do_algorithm_unsupported_template_type(
     default_map_file,
 ):
     # Setup mocks
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = (
         TemplateType.WORLD
@@ -208,7 +209,7 @@ def test_do_algorithm_unsupported_template_type(
         algo.do_algorithm()
 
     assert "Not handled for current place type" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
     mock_place_manager_factory.create_place_manager.assert_called_once()
     mock_place_manager.get_current_place_type.assert_called_once()
     mock_playthrough_manager.get_current_place_identifier.assert_called_once()
@@ -222,7 +223,7 @@ def test_do_algorithm_area_missing_key(
     valid_playthrough_name,
 ):
     # Setup mocks
-    mock_map_repository.load_map_data.return_value = {}
+    mock_map_repository.load_map_index.return_value = MapIndex({})
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.AREA
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -240,7 +241,7 @@ def test_do_algorithm_area_missing_key(
         algo.do_algorithm()
 
     assert "area_1" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 # Edge Case Tests: Missing parent key for LOCATION
@@ -253,10 +254,10 @@ def test_do_algorithm_location_missing_parent_key(
 ):
     # Modify map_file to remove parent key for location
     modified_map_file = {
-        "location_1": {"name": "Location 1"},  # Missing 'area'
+        "location_1": {"type": "location", "name": "Location 1"},  # Missing 'area'
     }
 
-    mock_map_repository.load_map_data.return_value = modified_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(modified_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.LOCATION
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -274,7 +275,7 @@ def test_do_algorithm_location_missing_parent_key(
         algo.do_algorithm()
 
     assert "area" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 # Edge Case Tests: Missing parent key for ROOM
@@ -287,10 +288,10 @@ def test_do_algorithm_room_missing_parent_keys(
 ):
     # Modify map_file to remove parent keys
     modified_map_file = {
-        "room_1": {"name": "Room 1"},  # Missing 'location'
+        "room_1": {"type": "room", "name": "Room 1"},  # Missing 'location'
     }
 
-    mock_map_repository.load_map_data.return_value = modified_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(modified_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.ROOM
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -308,7 +309,7 @@ def test_do_algorithm_room_missing_parent_keys(
         algo.do_algorithm()
 
     assert "location" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 # Edge Case Tests: Deeply nested missing area for ROOM
@@ -320,11 +321,11 @@ def test_do_algorithm_room_missing_area_key(
 ):
     # Setup map_file where room points to location, but location lacks area
     map_file = {
-        "room_1": {"name": "Room 1", "location": "location_1"},
-        "location_1": {"name": "Location 1"},  # Missing 'area'
+        "room_1": {"type": "room", "name": "Room 1", "location": "location_1"},
+        "location_1": {"type": "location", "name": "Location 1"},  # Missing 'area'
     }
 
-    mock_map_repository.load_map_data.return_value = map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.ROOM
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -342,7 +343,7 @@ def test_do_algorithm_room_missing_area_key(
         algo.do_algorithm()
 
     assert "area" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 # Dependency Tests: Ensure PlaythroughManager and MapRepository are instantiated correctly
@@ -370,7 +371,7 @@ def test_place_manager_creation(
     valid_playthrough_name,
     default_map_file,
 ):
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = TemplateType.AREA
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -388,14 +389,14 @@ def test_place_manager_creation(
     mock_place_manager_factory.create_place_manager.assert_called_once()
 
 
-# Error Handling Tests: MapRepository.load_map_data raises exception
+# Error Handling Tests: MapRepository.load_map_index raises exception
 def test_do_algorithm_map_repository_exception(
     mock_place_manager_factory,
     mock_playthrough_manager,
     mock_map_repository,
     valid_playthrough_name,
 ):
-    mock_map_repository.load_map_data.side_effect = Exception("Load error")
+    mock_map_repository.load_map_index.side_effect = Exception("Load error")
     mock_place_manager = Mock()
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
     mock_place_manager.get_current_place_type.return_value = TemplateType.AREA
@@ -412,7 +413,7 @@ def test_do_algorithm_map_repository_exception(
         algo.do_algorithm()
 
     assert "Load error" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 # Error Handling Tests: PlaceManager.get_current_place_type raises exception
@@ -423,7 +424,7 @@ def test_do_algorithm_place_manager_exception(
     valid_playthrough_name,
     default_map_file,
 ):
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.side_effect = Exception(
         "Place type error"
@@ -442,7 +443,7 @@ def test_do_algorithm_place_manager_exception(
         algo.do_algorithm()
 
     assert "Place type error" in str(exc_info.value)
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
     mock_place_manager_factory.create_place_manager.assert_called_once()
     mock_place_manager.get_current_place_type.assert_called_once()
 
@@ -466,7 +467,7 @@ def test_do_algorithm_parameterized(
     expected_result_key,
 ):
     # Setup mocks
-    mock_map_repository.load_map_data.return_value = default_map_file
+    mock_map_repository.load_map_index.return_value = MapIndex(default_map_file)
     mock_place_manager = Mock()
     mock_place_manager.get_current_place_type.return_value = template_type
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -490,7 +491,7 @@ def test_do_algorithm_parameterized(
     result = algo.do_algorithm()
 
     assert result == default_map_file[expected_result_key]
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
     mock_place_manager_factory.create_place_manager.assert_called_once()
     mock_place_manager.get_current_place_type.assert_called_once()
     mock_playthrough_manager.get_current_place_identifier.assert_called_once()
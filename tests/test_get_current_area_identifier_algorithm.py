@@ -8,6 +8,7 @@ from src.maps.algorithms.get_current_area_identifier_algorithm import (
     GetCurrentAreaIdentifierAlgorithm,
 )
 from src.maps.factories.place_manager_factory import PlaceManagerFactory
+from src.maps.map_index import MapIndex
 from src.maps.map_repository import MapRepository
 
 
@@ -104,7 +105,7 @@ def test_do_algorithm_area(
     result = algorithm.do_algorithm()
 
     assert result == expected_identifier
-    mock_map_repository.load_map_data.assert_not_called()
+    mock_map_repository.load_map_index.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -113,7 +114,7 @@ def test_do_algorithm_area(
         (
             TemplateType.LOCATION,
             "location_456",
-            {"location_456": {"area": "area_123"}},
+            {"location_456": {"type": "location", "area": "area_123"}},
             "area_123",
         ),
     ],
@@ -136,7 +137,7 @@ def test_do_algorithm_location(
     mock_playthrough_manager.get_current_place_identifier.return_value = (
         current_place_identifier
     )
-    mock_map_repository.load_map_data.return_value = map_data
+    mock_map_repository.load_map_index.return_value = MapIndex(map_data)
 
     # Initialize algorithm
     algorithm = GetCurrentAreaIdentifierAlgorithm(
@@ -149,7 +150,7 @@ def test_do_algorithm_location(
     result = algorithm.do_algorithm()
 
     assert result == expected_identifier
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 @pytest.mark.parametrize(
@@ -159,8 +160,8 @@ def test_do_algorithm_location(
             TemplateType.ROOM,
             "room_789",
             {
-                "room_789": {"location": "location_456"},
-                "location_456": {"area": "area_123"},
+                "room_789": {"type": "room", "location": "location_456"},
+                "location_456": {"type": "location", "area": "area_123"},
             },
             "area_123",
         ),
@@ -184,7 +185,7 @@ def test_do_algorithm_room(
     mock_playthrough_manager.get_current_place_identifier.return_value = (
         current_place_identifier
     )
-    mock_map_repository.load_map_data.return_value = map_data
+    mock_map_repository.load_map_index.return_value = MapIndex(map_data)
 
     # Initialize algorithm
     algorithm = GetCurrentAreaIdentifierAlgorithm(
@@ -197,8 +198,7 @@ def test_do_algorithm_room(
     result = algorithm.do_algorithm()
 
     assert result == expected_identifier
-    # load_map_data should be called twice in ROOM case
-    assert mock_map_repository.load_map_data.call_count == 2
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 def test_do_algorithm_unsupported_type(
@@ -233,7 +233,7 @@ def test_do_algorithm_unsupported_type(
         str(exc_info.value)
         == f"Not handled for current place type '{unsupported_type}'."
     )
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.load_map_index.assert_called_once()
 
 
 def test_do_algorithm_location_missing_parent_key(
@@ -245,7 +245,9 @@ def test_do_algorithm_location_missing_parent_key(
     playthrough_name = "test_playthrough"
     current_place_type = TemplateType.LOCATION
     current_place_identifier = "location_456"
-    map_data = {"location_456": {"invalid_key": "area_123"}}  # Missing 'area' key
+    map_data = {
+        "location_456": {"type": "location", "invalid_key": "area_123"}
+    }  # Missing 'area' key
 
     # Setup mocks
     mock_place_manager_factory.create_place_manager.return_value = mock_place_manager
@@ -253,7 +255,7 @@ def test_do_algorithm_location_missing_parent_key(
     mock_playthrough_manager.get_current_place_identifier.return_value = (
         current_place_identifier
     )
-    mock_map_repository.load_map_data.return_value = map_data
+    mock_map_repository.load_map_index.return_value = MapIndex(map_data)
 
     # Initialize algorithm
     algorithm = GetCurrentAreaIdentifierAlgorithm(
@@ -279,8 +281,11 @@ def test_do_algorithm_room_missing_location_key(
     current_place_type = TemplateType.ROOM
     current_place_identifier = "room_789"
     map_data = {
-        "room_789": {"invalid_key": "location_456"},  # Missing 'location' key
-        "location_456": {"area": "area_123"},
+        "room_789": {
+            "type": "room",
+            "invalid_key": "location_456",
+        },  # Missing 'location' key
+        "location_456": {"type": "location", "area": "area_123"},
     }
 
     # Setup mocks
@@ -289,7 +294,7 @@ def test_do_algorithm_room_missing_location_key(
     mock_playthrough_manager.get_current_place_identifier.return_value = (
         current_place_identifier
     )
-    mock_map_repository.load_map_data.return_value = map_data
+    mock_map_repository.load_map_index.return_value = MapIndex(map_data)
 
     # Initialize algorithm
     algorithm = GetCurrentAreaIdentifierAlgorithm(
@@ -315,8 +320,11 @@ def test_do_algorithm_room_missing_area_key(
     current_place_type = TemplateType.ROOM
     current_place_identifier = "room_789"
     map_data = {
-        "room_789": {"location": "location_456"},
-        "location_456": {"invalid_key": "area_123"},  # Missing 'area' key
+        "room_789": {"type": "room", "location": "location_456"},
+        "location_456": {
+            "type": "location",
+            "invalid_key": "area_123",
+        },  # Missing 'area' key
     }
 
     # Setup mocks
@@ -325,7 +333,7 @@ def test_do_algorithm_room_missing_area_key(
     mock_playthrough_manager.get_current_place_identifier.return_value = (
         current_place_identifier
     )
-    mock_map_repository.load_map_data.return_value = map_data
+    mock_map_repository.load_map_index.return_value = MapIndex(map_data)
 
     # Initialize algorithm
     algorithm = GetCurrentAreaIdentifierAlgorithm(
@@ -34,7 +34,7 @@ def mock_playthrough_manager():
 @pytest.fixture
 def mock_characters_manager():
     mock = Mock(spec=CharactersManager)
-    mock.get_characters.return_value = [
+    mock.get_character_view_models.return_value = [
         Mock(spec=Character, identifier="participant1"),
         Mock(spec=Character, identifier="participant2"),
     ]
@@ -161,8 +161,10 @@ def test_do_algorithm_excludes_player(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(expected_identifiers)
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
+        expected_identifiers
+    )
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm When All Participants Are Player
@@ -184,8 +186,8 @@ def test_do_algorithm_all_participants_are_player(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with([])
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with([])
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm with Empty Dialogue Participants
@@ -207,8 +209,8 @@ def test_do_algorithm_empty_dialogue_participants(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with([])
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with([])
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm When PlaythroughManager Raises Exception
@@ -234,7 +236,7 @@ def test_do_algorithm_playthrough_manager_exception(
 
     assert "Playthrough error" in str(exc_info.value)
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_not_called()
+    mock_characters_manager.get_character_view_models.assert_not_called()
 
 
 # Test do_algorithm When CharactersManager Raises Exception
@@ -245,7 +247,9 @@ def test_do_algorithm_characters_manager_exception(
     mock_characters_manager,
 ):
     mock_playthrough_manager.get_player_identifier.return_value = "player1"
-    mock_characters_manager.get_characters.side_effect = Exception("Characters error")
+    mock_characters_manager.get_character_view_models.side_effect = Exception(
+        "Characters error"
+    )
     dialogue_participants = ["player1", "participant1", "participant2"]
 
     algorithm = GetParticipantCharactersOtherThanPlayerAlgorithm(
@@ -260,7 +264,7 @@ def test_do_algorithm_characters_manager_exception(
 
     assert "Characters error" in str(exc_info.value)
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
         ["participant1", "participant2"]
     )
 
@@ -286,8 +290,10 @@ def test_do_algorithm_with_duplicate_participants(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(expected_identifiers)
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
+        expected_identifiers
+    )
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm Case Sensitivity in Excluding Player
@@ -310,8 +316,10 @@ def test_do_algorithm_case_sensitivity(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(expected_identifiers)
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
+        expected_identifiers
+    )
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm When Dialogue Participants Contain Only Player Identifier
@@ -333,8 +341,8 @@ def test_do_algorithm_only_player_identifier(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with([])
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with([])
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm with Large Number of Participants
@@ -357,8 +365,10 @@ def test_do_algorithm_large_number_of_participants(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(expected_identifiers)
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
+        expected_identifiers
+    )
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Additional Tests for Edge Cases
@@ -394,8 +404,10 @@ def test_do_algorithm_non_unique_participants(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(expected_identifiers)
-    assert result == mock_characters_manager.get_characters.return_value
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
+        expected_identifiers
+    )
+    assert result == mock_characters_manager.get_character_view_models.return_value
 
 
 # Test do_algorithm when dialogue_participants contains player identifier multiple times
@@ -417,7 +429,7 @@ def test_do_algorithm_multiple_player_identifiers(
     result = algorithm.do_algorithm()
 
     mock_playthrough_manager.get_player_identifier.assert_called_once()
-    mock_characters_manager.get_characters.assert_called_once_with(
+    mock_characters_manager.get_character_view_models.assert_called_once_with(
         ["participant1", "participant2"]
     )
-    assert result == mock_characters_manager.get_characters.return_value
+    assert result == mock_characters_manager.get_character_view_models.return_value
@@ -43,7 +43,7 @@ def test_initialization_empty_playthrough_name(mock_validate_non_empty_string):
 
 # Test do_algorithm with matching contained places
 def test_do_algorithm_with_matches(mock_map_repository):
-    mock_map_repository.load_map_data.return_value = {
+    mock_map_repository.get_places_of_type.return_value = {
         "Place1": {
             "room": "Place123",
             "type": "location",
@@ -82,7 +82,7 @@ def test_do_algorithm_with_matches(mock_map_repository):
     ]
 
     assert result == expected
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
 
 
 # Test do_algorithm with different TemplateTypes
@@ -128,7 +128,7 @@ def test_do_algorithm_with_matches(mock_map_repository):
 def test_do_algorithm_various_template_types(
     mock_map_repository, containing_type, contained_type, map_data, expected
 ):
-    mock_map_repository.load_map_data.return_value = map_data
+    mock_map_repository.get_places_of_type.return_value = map_data
 
     algorithm = GetPlacesInPlaceAlgorithm(
         playthrough_name="TestPlaythrough",
@@ -143,7 +143,7 @@ def test_do_algorithm_various_template_types(
     result = algorithm.do_algorithm()
 
     assert result == expected
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
 
 
 # Test using default MapRepository when none is provided
@@ -152,7 +152,7 @@ def test_do_algorithm_default_map_repository(mock_validate_non_empty_string):
         "src.maps.algorithms.get_places_in_place_algorithm.MapRepository"
     ) as MockMapRepo:
         instance = MockMapRepo.return_value
-        instance.load_map_data.return_value = {
+        instance.get_places_of_type.return_value = {
             "Place1": {
                 "room": "Place123",
                 "type": "location",
@@ -172,12 +172,14 @@ def test_do_algorithm_default_map_repository(mock_validate_non_empty_string):
         expected = [{"identifier": "Place1", "place_template": "TemplateA"}]
         assert result == expected
         MockMapRepo.assert_called_once_with("DefaultRepoPlaythrough")
-        instance.load_map_data.assert_called_once()
+        instance.get_places_of_type.assert_called_once()
 
 
 # Test do_algorithm when load_map_data raises an exception
 def test_do_algorithm_load_map_data_exception(mock_map_repository, caplog):
-    mock_map_repository.load_map_data.side_effect = Exception("Failed to load map data")
+    mock_map_repository.get_places_of_type.side_effect = Exception(
+        "Failed to load map data"
+    )
 
     algorithm = GetPlacesInPlaceAlgorithm(
         playthrough_name="TestPlaythrough",
@@ -191,12 +193,12 @@ def test_do_algorithm_load_map_data_exception(mock_map_repository, caplog):
         algorithm.do_algorithm()
 
     assert str(exc_info.value) == "Failed to load map data"
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
 
 
 # Test logging when matches are found (no warning should be logged)
 def test_do_algorithm_with_matches_no_warning(mock_map_repository, caplog):
-    mock_map_repository.load_map_data.return_value = {
+    mock_map_repository.get_places_of_type.return_value = {
         "Place1": {
             "room": "Place123",
             "type": "location",
@@ -216,7 +218,7 @@ def test_do_algorithm_with_matches_no_warning(mock_map_repository, caplog):
         result = algorithm.do_algorithm()
 
     assert result == [{"identifier": "Place1", "place_template": "TemplateA"}]
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
     # Ensure no warnings were logged
     warnings = [
         record for record in caplog.records if record.levelno == logging.WARNING
@@ -226,7 +228,7 @@ def test_do_algorithm_with_matches_no_warning(mock_map_repository, caplog):
 
 # Test that place_template can be None
 def test_do_algorithm_place_template_none(mock_map_repository):
-    mock_map_repository.load_map_data.return_value = {
+    mock_map_repository.get_places_of_type.return_value = {
         "Place1": {
             "room": "Place123",
             "type": "location",
@@ -246,12 +248,12 @@ def test_do_algorithm_place_template_none(mock_map_repository):
 
     expected = [{"identifier": "Place1", "place_template": None}]
     assert result == expected
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
 
 
 # Test with multiple contained_place_types
 def test_do_algorithm_multiple_contained_types(mock_map_repository):
-    mock_map_repository.load_map_data.return_value = {
+    mock_map_repository.get_places_of_type.return_value = {
         "Place1": {
             "room": "Place123",
             "type": "location",
@@ -286,12 +288,12 @@ def test_do_algorithm_multiple_contained_types(mock_map_repository):
     ]
 
     assert result == expected
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
 
 
 # Test with additional irrelevant data in map entries
 def test_do_algorithm_irrelevant_data(mock_map_repository):
-    mock_map_repository.load_map_data.return_value = {
+    mock_map_repository.get_places_of_type.return_value = {
         "Place1": {
             "room": "Place123",
             "type": "location",
@@ -322,7 +324,7 @@ def test_do_algorithm_irrelevant_data(mock_map_repository):
     ]
 
     assert result == expected
-    mock_map_repository.load_map_data.assert_called_once()
+    mock_map_repository.get_places_of_type.assert_called_once()
 
 
 # Test with various containing_place_types and contained_place_types
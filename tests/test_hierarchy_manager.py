@@ -2,6 +2,7 @@ from typing import cast
 
 import pytest
 
+from src.base.constants import PARENT_KEYS
 from src.base.enums import TemplateType
 from src.maps.hierarchy_manager import HierarchyManager
 from src.maps.place_manager import PlaceManager
@@ -20,6 +21,20 @@ class MockPlaceManager:
     def determine_place_type(self, place_identifier: str):
         return self.place_types.get(place_identifier)
 
+    def get_place_lineage(self, place_identifier: str):
+        lineage = []
+        current_place_id = place_identifier
+
+        while current_place_id in self.places_data:
+            place_type = self.place_types.get(current_place_id)
+            place = self.places_data[current_place_id]
+            lineage.append((place_type, place))
+
+            parent_key = PARENT_KEYS.get(place_type)
+            current_place_id = place.get(parent_key) if parent_key else None
+
+        return lineage
+
     def get_place_template(self, place):
         return self.templates_data.get(place["id"])
 
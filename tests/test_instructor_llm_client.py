@@ -0,0 +1,100 @@
+from typing import Optional
+from unittest.mock import Mock
+
+from pydantic import BaseModel
+
+from src.base.abstracts.observer import Observer
+from src.base.enums import AiCompletionErrorType
+from src.prompting.instructor_llm_client import InstructorLlmClient
+
+
+class Speech(BaseModel):
+    name: str
+    speech: str
+
+
+class PartialSpeech(BaseModel):
+    name: Optional[str] = None
+    speech: Optional[str] = None
+
+
+def test_partial_responses_are_streamed_to_the_observer(
+    mock_config_loader, mock_llm, messages_to_llm
+):
+    client = Mock()
+    client.chat.completions.create_partial.return_value = iter(
+        [
+            PartialSpeech(name="Aria"),
+            PartialSpeech(name="Aria", speech="Hel"),
+            PartialSpeech(name="Aria", speech="Hello."),
+        ]
+    )
+
+    observer = Mock(spec=Observer)
+
+    product = InstructorLlmClient(
+        client, Speech, mock_config_loader, observer
+    ).generate_completion(mock_llm, messages_to_llm)
+
+    assert product.is_valid()
+    assert product.get() == Speech(name="Aria", speech="Hello.")
+    assert [call.args[0] for call in observer.update.call_args_list] == [
+        {},
+        {"name": "Aria"},
+        {"name": "Aria", "speech": "Hel"},
+        {"name": "Aria", "speech": "Hello."},
+    ]
+    client.chat.completions.create.assert_not_called()
+
+
+def test_incomplete_streamed_response_is_invalid(
+    mock_config_loader, mock_llm, messages_to_llm
+):
+    client = Mock()
+    client.chat.completions.create_partial.return_value = iter(
+        [PartialSpeech(name="Aria")]
+    )
+
+    product = InstructorLlmClient(
+        client, Speech, mock_config_loader, Mock(spec=Observer)
+    ).generate_completion(mock_llm, messages_to_llm)
+
+    assert not product.is_valid()
+
+
+def test_empty_stream_is_reported_as_empty_content(
+    mock_config_loader, mock_llm, messages_to_llm
+):
+    client = Mock()
+    client.chat.completions.create_partial.return_value = iter([])
+
+    product = InstructorLlmClient(
+        client, Speech, mock_config_loader, Mock(spec=Observer)
+    ).generate_completion(mock_llm, messages_to_llm)
+
+    assert not product.is_valid()
+    assert product.get_error() == AiCompletionErrorType.EMPTY_CONTENT
+
+
+def test_without_observer_the_response_is_not_streamed(
+    mock_config_loader, mock_llm, messages_to_llm
+):
+    client = Mock()
+    client.chat.completions.create.return_value = Speech(name="Aria", speech="Hi.")
+
+    product = InstructorLlmClient(
+        client, Speech, mock_config_loader
+    ).generate_completion(mock_llm, messages_to_llm)
+
+    assert product.get() == Speech(name="Aria", speech="Hi.")
+    client.chat.completions.create_partial.assert_not_called()
+
+
+def test_failed_requests_back_off_before_being_retried(mock_config_loader):
+    retrying = InstructorLlmClient(Mock(), Speech, mock_config_loader)._create_retrying(
+        3
+    )
+
+    retry_state = Mock(attempt_number=1)
+
+    assert retrying.wait(retry_state) > 0
@@ -11,6 +11,7 @@ from src.characters.algorithms.join_characters_memories_algorithm import (
 from src.characters.factories.retrieve_memories_algorithm_factory import (
     RetrieveMemoriesAlgorithmFactory,
 )
+from src.databases.abstracts.database import FactsAndMemories
 
 
 # Assuming validate_non_empty_string raises ValueError for invalid inputs
@@ -245,3 +246,32 @@ def test_do_algorithm_with_large_number_of_characters():
     assert len(result) == 100
     assert result == [f"memory{i+1}" for i in range(100)]
     assert mock_factory.create_algorithm.call_count == 100
+
+
+def test_do_algorithm_with_database_retrieves_memories_in_batch():
+    mock_factory = Mock(spec=RetrieveMemoriesAlgorithmFactory)
+    mock_database = Mock()
+    mock_database.retrieve_facts_and_memories_batch.return_value = FactsAndMemories(
+        memories={
+            "char2": [{"id": "2", "document": "memory2"}],
+            "char1": [{"id": "1", "document": "memory1"}],
+        }
+    )
+    mock_config_loader = Mock()
+    mock_config_loader.get_memories_to_retrieve_from_database.return_value = 7
+
+    algo = JoinCharactersMemoriesAlgorithm(
+        character_identifiers=["char1", "char2", "char1"],
+        query_text="Retrieve memories",
+        retrieve_memories_algorithm_factories=mock_factory,
+        database=mock_database,
+        config_loader=mock_config_loader,
+    )
+
+    result = algo.do_algorithm()
+
+    assert result == ["memory1", "memory2"]
+    mock_database.retrieve_facts_and_memories_batch.assert_called_once_with(
+        None, "Retrieve memories", ["char1", "char2"], memories_top_k=7
+    )
+    mock_factory.create_algorithm.assert_not_called()
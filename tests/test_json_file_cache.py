@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.filesystem.document_storage import (
+    DocumentStorageRegistry,
+    JsonFileDocumentStorage,
+)
+from src.filesystem.json_file_cache import JsonFileCache
+
+
+@pytest.fixture
+def write_raw_json():
+    def write(file_path, data):
+        with file_path.open("w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    return write
+
+
+def test_read_parses_file_once_while_unchanged(tmp_path, write_raw_json):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_raw_json(file_path, {"time": {"hour": 8}})
+
+    cache = JsonFileCache()
+
+    assert cache.read(file_path) == {"time": {"hour": 8}}
+    assert cache.read(file_path) == {"time": {"hour": 8}}
+    assert cache.read(file_path) == {"time": {"hour": 8}}
+
+    statistics = cache.get_statistics()
+    assert statistics.disk_reads == 1
+    assert statistics.reads_avoided == 2
+
+
+def test_read_returns_private_copies(tmp_path, write_raw_json):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_raw_json(file_path, {"followers": []})
+
+    cache = JsonFileCache()
+
+    data = cache.read(file_path)
+    data["followers"].append("1")
+
+    assert cache.read(file_path) == {"followers": []}
+
+
+def test_write_through_updates_file_and_cache(tmp_path, write_raw_json):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_raw_json(file_path, {"current_place": "1"})
+
+    cache = JsonFileCache()
+    cache.read(file_path)
+
+    cache.write(file_path, {"current_place": "2"})
+
+    with file_path.open("r", encoding="utf-8") as file:
+        assert json.load(file) == {"current_place": "2"}
+
+    assert cache.read(file_path) == {"current_place": "2"}
+    assert cache.get_statistics().disk_reads == 1
+    assert cache.get_statistics().writes == 1
+
+
+def test_read_picks_up_outside_edits(tmp_path, write_raw_json):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_raw_json(file_path, {"current_place": "1"})
+
+    cache = JsonFileCache()
+    cache.read(file_path)
+
+    write_raw_json(file_path, {"current_place": "22"})
+    stat_result = os.stat(file_path)
+    os.utime(
+        file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000)
+    )
+
+    assert cache.read(file_path) == {"current_place": "22"}
+    assert cache.get_statistics().disk_reads == 2
+
+
+def test_invalidate_forces_reload(tmp_path, write_raw_json):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_raw_json(file_path, {"hour": 1})
+
+    cache = JsonFileCache()
+    cache.read(file_path)
+    cache.invalidate(file_path)
+    cache.read(file_path)
+
+    assert cache.get_statistics().disk_reads == 2
+    assert cache.get_statistics().reads_avoided == 0
+
+
+def test_slow_read_does_not_block_readers_of_other_files(tmp_path, write_raw_json):
+    slow_path = tmp_path / "map.json"
+    other_path = tmp_path / "playthrough_metadata.json"
+    write_raw_json(slow_path, {"1": {}})
+    write_raw_json(other_path, {"current_place": "1"})
+
+    storage = JsonFileDocumentStorage()
+    slow_read_started = threading.Event()
+    slow_read_released = threading.Event()
+
+    def read(file_path):
+        if file_path == slow_path.resolve():
+            slow_read_started.set()
+            slow_read_released.wait(10)
+
+        return JsonFileDocumentStorage.read(storage, file_path)
+
+    storage.read = read
+
+    registry = Mock(spec=DocumentStorageRegistry)
+    registry.get_storage.return_value = storage
+
+    cache = JsonFileCache(registry)
+
+    slow_reader = threading.Thread(target=cache.read, args=(slow_path,))
+    slow_reader.start()
+    assert slow_read_started.wait(5)
+
+    other_reader = threading.Thread(target=cache.read, args=(other_path,))
+    other_reader.start()
+    other_reader.join(5)
+    other_read_finished = not other_reader.is_alive()
+
+    slow_read_released.set()
+    slow_reader.join()
+    other_reader.join()
+
+    assert other_read_finished
+    assert cache.read(slow_path) == {"1": {}}
+
+
+def test_shared_instance_is_unique():
+    assert JsonFileCache.get_shared_instance() is JsonFileCache.get_shared_instance()
@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+import pytest
+from instructor import Mode
+
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.llm_client_registry import LlmClientRegistry
+
+
+@pytest.fixture
+def registry():
+    config_loader = Mock(spec=ConfigLoader)
+    config_loader.get_llm_max_connections.return_value = 5
+    config_loader.get_llm_max_keepalive_connections.return_value = 2
+    config_loader.get_llm_keepalive_expiry.return_value = 30
+
+    return LlmClientRegistry(config_loader)
+
+
+def test_get_openai_client_reuses_clients_per_key(registry):
+    client = registry.get_openai_client("key", "https://example.com/v1")
+
+    assert registry.get_openai_client("key", "https://example.com/v1") is client
+    assert registry.get_openai_client("other_key", "https://example.com/v1") is not (
+        client
+    )
+
+    registry.close()
+
+
+def test_clients_share_a_single_connection_pool(registry):
+    first_client = registry.get_openai_client("key", "https://example.com/v1")
+    second_client = registry.get_openai_client("key", "https://other.com/v1")
+
+    assert first_client._client is second_client._client  # noqa
+
+    registry.close()
+
+
+def test_get_instructor_client_reuses_clients_per_mode(registry):
+    client = registry.get_instructor_client("key", "https://example.com/v1", Mode.JSON)
+
+    assert (
+        registry.get_instructor_client("key", "https://example.com/v1", Mode.JSON)
+        is client
+    )
+    assert (
+        registry.get_instructor_client("key", "https://example.com/v1", Mode.TOOLS)
+        is not client
+    )
+
+    registry.close()
+
+
+def test_close_releases_clients(registry):
+    client = registry.get_openai_client("key", "https://example.com/v1")
+
+    registry.close()
+
+    assert registry.get_openai_client("key", "https://example.com/v1") is not client
+
+    registry.close()
@@ -0,0 +1,141 @@
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from openai import RateLimitError
+from pydantic import BaseModel
+
+from src.base.enums import AiCompletionErrorType
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.prompting.llm import Llm
+from src.prompting.llm_rate_limiter import LlmRateLimiter
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+from src.prompting.rate_limited_llm_client import RateLimitedLlmClient
+
+
+class Description(BaseModel):
+    description: str
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def rate_limit_error():
+    return RateLimitError(
+        "Rate limit exceeded.",
+        response=httpx.Response(
+            429,
+            headers={"retry-after": "0"},
+            request=httpx.Request("POST", "https://openrouter.ai/api/v1"),
+        ),
+        body=None,
+    )
+
+
+def test_requests_wait_for_the_budgets_to_refill():
+    clock = FakeClock()
+    rate_limiter = LlmRateLimiter(
+        10, requests_per_minute=2, tokens_per_minute=300, clock=clock
+    )
+
+    assert rate_limiter._try_acquire(100) == 0.0
+    assert rate_limiter._try_acquire(100) == 0.0
+
+    # The request bucket is empty, and refills one request every 30 seconds.
+    assert rate_limiter._try_acquire(100) == 30.0
+
+    clock.now = 30.0
+
+    # 250 tokens after refilling 150, so the missing 50 take 10 seconds.
+    assert rate_limiter._try_acquire(300) == 10.0
+
+
+def test_concurrency_halves_when_rate_limited_and_recovers_gradually():
+    clock = FakeClock()
+    rate_limiter = LlmRateLimiter(8, clock=clock)
+
+    for _ in range(2):
+        rate_limiter._try_acquire(0)
+        rate_limiter.release(rate_limited=True, retry_after=5.0)
+
+    assert rate_limiter.get_concurrency_limit() == 2
+
+    # Every request is held back until the provider said to retry.
+    assert rate_limiter._try_acquire(0) == 5.0
+
+    clock.now = 5.0
+
+    for _ in range(3):
+        rate_limiter._try_acquire(0)
+        rate_limiter.release(rate_limited=False)
+
+    assert rate_limiter.get_concurrency_limit() == 3
+
+
+def test_requests_wait_for_a_free_slot():
+    rate_limiter = LlmRateLimiter(1, clock=FakeClock())
+
+    assert rate_limiter._try_acquire(0) == 0.0
+    assert rate_limiter._try_acquire(0) > 0.0
+
+    rate_limiter.release(rate_limited=False)
+
+    assert rate_limiter._try_acquire(0) == 0.0
+
+
+def test_abandoned_requests_free_their_slot_without_adapting():
+    rate_limiter = LlmRateLimiter(4, clock=FakeClock())
+
+    rate_limiter._try_acquire(0)
+    rate_limiter.release(rate_limited=True, retry_after=0.0)
+    rate_limiter._try_acquire(0)
+    rate_limiter.abandon()
+
+    assert rate_limiter.get_concurrency_limit() == 2
+    assert rate_limiter._consecutive_rate_limits == 1
+    assert rate_limiter._in_flight == 0
+
+
+def test_rate_limited_completions_are_retried(rate_limit_error, mock_config_loader):
+    product = InstructorAiCompletionProduct(
+        Description(description="A busy harbor."), is_valid=True
+    )
+    llm_client = Mock()
+    llm_client.generate_completion.side_effect = [rate_limit_error, product]
+    rate_limiter = LlmRateLimiter(4)
+    mock_config_loader.get_llm_rate_limit_max_retries.return_value = 2
+
+    assert (
+        RateLimitedLlmClient(
+            llm_client, rate_limiter, mock_config_loader
+        ).generate_completion(Mock(spec=Llm), MessagesToLlm())
+        is product
+    )
+    assert llm_client.generate_completion.call_count == 2
+    assert rate_limiter.get_concurrency_limit() == 2
+
+
+def test_rate_limited_completions_are_given_up_on_eventually(mock_config_loader):
+    llm_client = Mock()
+    llm_client.generate_completion.return_value = InstructorAiCompletionProduct(
+        None, is_valid=False, error=AiCompletionErrorType.TOO_MANY_REQUESTS
+    )
+    llm = Mock(spec=Llm)
+    llm.get_name.return_value = "some/model"
+    mock_config_loader.get_llm_rate_limit_max_retries.return_value = 1
+
+    # Without a retry-after to follow, the backoff of a single retry is short.
+    product = RateLimitedLlmClient(
+        llm_client, LlmRateLimiter(4), mock_config_loader
+    ).generate_completion(llm, MessagesToLlm())
+
+    assert product.get_error() == AiCompletionErrorType.TOO_MANY_REQUESTS
+    assert llm_client.generate_completion.call_count == 2
@@ -0,0 +1,313 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.path_manager import PathManager
+from src.prompting.async_policy_llm_client import AsyncPolicyLlmClient
+from src.prompting.llm import Llm, LlmRequestPolicy
+from src.prompting.llm_request_policy_recorder import LlmRequestPolicyRecorder
+from src.prompting.llms import Llms
+from src.prompting.observers.first_partial_response_observer import (
+    FirstPartialResponseObserver,
+)
+from src.prompting.policy_llm_client import PolicyLlmClient
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+
+class SpeechTurn(BaseModel):
+    speech: str
+
+
+@pytest.fixture
+def create_model_data():
+    def create(name):
+        return {
+            "name": name,
+            "supports_tools": False,
+            "temperature": 0.7,
+            "top_p": 1.0,
+            "frequency_penalty": 0.0,
+            "presence_penalty": 0.0,
+        }
+
+    return create
+
+
+@pytest.fixture
+def create_llm(create_model_data):
+    def create(name):
+        return Llm(create_model_data(name), "speech_turn")
+
+    return create
+
+
+class FakeAsyncLlmClient:
+    def __init__(
+        self, speech=None, delay=0.0, partial_response_observer=None, stream_after=0.0
+    ):
+        self._speech = speech
+        self._delay = delay
+        self._partial_response_observer = partial_response_observer
+        self._stream_after = stream_after
+        self.started = False
+        self.cancelled = False
+
+    async def generate_completion(self, model, messages_to_llm):
+        self.started = True
+
+        try:
+            if self._partial_response_observer:
+                await asyncio.sleep(self._stream_after)
+                self._partial_response_observer.update({"speech": "Slow"})
+
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        if self._speech is None:
+            return InstructorAiCompletionProduct(None, is_valid=False, error="Bad.")
+
+        return InstructorAiCompletionProduct(
+            SpeechTurn(speech=self._speech), is_valid=True
+        )
+
+
+@pytest.fixture
+def create_policy_llm_client(async_bridge):
+    def create(request_policy, primary, hedge, fallbacks, recorder):
+        return PolicyLlmClient(
+            AsyncPolicyLlmClient(primary, request_policy, hedge, fallbacks, recorder),
+            async_bridge,
+        )
+
+    return create
+
+
+def test_a_slow_model_gets_hedged_and_the_loser_cancelled(
+    create_policy_llm_client, create_llm
+):
+    request_policy = LlmRequestPolicy(
+        hedge_delay_seconds=0.01, hedge_llm=create_llm("fast/model")
+    )
+    primary = FakeAsyncLlmClient("Slow words.", delay=5.0)
+    hedge = FakeAsyncLlmClient("Fast words.")
+    recorder = LlmRequestPolicyRecorder()
+
+    product = create_policy_llm_client(
+        request_policy, primary, hedge, [], recorder
+    ).generate_completion(create_llm("slow/model"), MessagesToLlm())
+
+    assert product.get().speech == "Fast words."
+    assert primary.cancelled
+    assert recorder.get_statistics("speech_turn").wins == {"fast/model": 1}
+
+
+def test_a_quick_model_doesnt_get_hedged(create_policy_llm_client, create_llm):
+    request_policy = LlmRequestPolicy(
+        hedge_delay_seconds=1.0, hedge_llm=create_llm("fast/model")
+    )
+    primary = FakeAsyncLlmClient("Quick words.")
+    hedge = FakeAsyncLlmClient("Fast words.")
+    recorder = LlmRequestPolicyRecorder()
+
+    product = create_policy_llm_client(
+        request_policy, primary, hedge, [], recorder
+    ).generate_completion(create_llm("quick/model"), MessagesToLlm())
+
+    assert product.get().speech == "Quick words."
+    assert not hedge.started
+    assert recorder.get_statistics("speech_turn").wins == {"quick/model": 1}
+
+
+def test_a_streaming_model_doesnt_get_hedged(async_bridge, create_llm):
+    request_policy = LlmRequestPolicy(
+        hedge_delay_seconds=0.05, hedge_llm=create_llm("fast/model")
+    )
+    partial_response_observer = FirstPartialResponseObserver(Mock())
+    primary = FakeAsyncLlmClient(
+        "Slow words.", delay=0.1, partial_response_observer=partial_response_observer
+    )
+    hedge = FakeAsyncLlmClient("Fast words.")
+
+    product = PolicyLlmClient(
+        AsyncPolicyLlmClient(
+            primary,
+            request_policy,
+            hedge,
+            llm_request_policy_recorder=LlmRequestPolicyRecorder(),
+            first_partial_response_observer=partial_response_observer,
+        ),
+        async_bridge,
+    ).generate_completion(create_llm("slow/model"), MessagesToLlm())
+
+    assert product.get().speech == "Slow words."
+    assert not hedge.started
+
+
+def test_the_hedge_gets_dropped_once_the_model_starts_streaming(
+    async_bridge, create_llm
+):
+    request_policy = LlmRequestPolicy(
+        hedge_delay_seconds=0.01, hedge_llm=create_llm("fast/model")
+    )
+    partial_response_observer = FirstPartialResponseObserver(Mock())
+    primary = FakeAsyncLlmClient(
+        "Slow words.",
+        delay=0.05,
+        partial_response_observer=partial_response_observer,
+        stream_after=0.05,
+    )
+    hedge = FakeAsyncLlmClient("Fast words.", delay=5.0)
+
+    product = PolicyLlmClient(
+        AsyncPolicyLlmClient(
+            primary,
+            request_policy,
+            hedge,
+            llm_request_policy_recorder=LlmRequestPolicyRecorder(),
+            first_partial_response_observer=partial_response_observer,
+        ),
+        async_bridge,
+    ).generate_completion(create_llm("slow/model"), MessagesToLlm())
+
+    assert product.get().speech == "Slow words."
+    assert hedge.started
+    assert hedge.cancelled
+
+
+def test_the_model_gets_dropped_once_the_hedge_starts_streaming(
+    async_bridge, create_llm
+):
+    request_policy = LlmRequestPolicy(
+        hedge_delay_seconds=0.01, hedge_llm=create_llm("fast/model")
+    )
+    observer = Mock()
+    partial_response_observer = FirstPartialResponseObserver(observer)
+    hedge_partial_response_observer = partial_response_observer.create_rival()
+    primary = FakeAsyncLlmClient(
+        "Slow words.",
+        delay=5.0,
+        partial_response_observer=partial_response_observer,
+        stream_after=5.0,
+    )
+    hedge = FakeAsyncLlmClient(
+        "Fast words.",
+        delay=0.05,
+        partial_response_observer=hedge_partial_response_observer,
+    )
+
+    product = PolicyLlmClient(
+        AsyncPolicyLlmClient(
+            primary,
+            request_policy,
+            hedge,
+            llm_request_policy_recorder=LlmRequestPolicyRecorder(),
+            first_partial_response_observer=partial_response_observer,
+            hedge_first_partial_response_observer=hedge_partial_response_observer,
+        ),
+        async_bridge,
+    ).generate_completion(create_llm("slow/model"), MessagesToLlm())
+
+    assert product.get().speech == "Fast words."
+    assert primary.cancelled
+    observer.update.assert_called_once_with({"speech": "Slow"})
+
+
+def test_only_the_first_racer_to_stream_reaches_the_observer():
+    observer = Mock()
+    partial_response_observer = FirstPartialResponseObserver(observer)
+    hedge_partial_response_observer = partial_response_observer.create_rival()
+    partial_response_observer.arm()
+    hedge_partial_response_observer.arm()
+
+    hedge_partial_response_observer.update({"speech": "Fast"})
+    partial_response_observer.update({"speech": "Slow"})
+    hedge_partial_response_observer.update({"speech": "Fast words."})
+
+    assert [call.args[0] for call in observer.update.call_args_list] == [
+        {"speech": "Fast"},
+        {"speech": "Fast words."},
+    ]
+
+
+def test_invalid_responses_fall_back_in_order(create_policy_llm_client, create_llm):
+    request_policy = LlmRequestPolicy(
+        fallback_llms=[create_llm("first/fallback"), create_llm("second/fallback")]
+    )
+    failing_llm_client = Mock()
+    failing_llm_client.generate_completion.side_effect = RuntimeError("Down.")
+    first_fallback = FakeAsyncLlmClient()
+    second_fallback = FakeAsyncLlmClient("Fallback words.")
+    recorder = LlmRequestPolicyRecorder()
+
+    product = create_policy_llm_client(
+        request_policy,
+        failing_llm_client,
+        None,
+        [first_fallback, second_fallback],
+        recorder,
+    ).generate_completion(create_llm("primary/model"), MessagesToLlm())
+
+    assert product.get().speech == "Fallback words."
+    assert first_fallback.started
+    assert recorder.get_statistics("speech_turn").wins == {"second/fallback": 1}
+
+
+def test_requests_over_the_latency_slo_are_counted():
+    recorder = LlmRequestPolicyRecorder()
+
+    recorder.record("speech_turn", "some/model", 2.0, 5.0)
+    recorder.record("speech_turn", "some/model", 6.0, 5.0)
+    recorder.record("speech_turn", None, 7.0, 5.0)
+
+    statistics = recorder.get_statistics("speech_turn")
+
+    assert statistics.completions == 3
+    assert statistics.wins == {"some/model": 2, None: 1}
+    assert statistics.latency_slo_misses == 2
+
+
+def test_llms_read_the_policies_of_the_action_types(tmp_path, create_model_data):
+    llms_path = tmp_path / "llms.json"
+    llms_path.write_text(
+        json.dumps(
+            {
+                "models": {
+                    "primary": create_model_data("primary/model"),
+                    "hedge": create_model_data("hedge/model"),
+                    "fallback": create_model_data("fallback/model"),
+                },
+                "policies": {
+                    "speech_turn": {
+                        "hedge_after_milliseconds": 2500,
+                        "hedge_model": "hedge",
+                        "fallback_models": ["fallback"],
+                        "latency_slo_milliseconds": 10000,
+                    }
+                },
+                "speech_turn": "primary",
+                "place_description": "primary",
+            }
+        )
+    )
+    path_manager = Mock(spec=PathManager)
+    path_manager.get_llms_path.return_value = llms_path
+
+    llms = Llms(Mock(), path_manager)
+
+    request_policy = llms.for_speech_turn().get_request_policy()
+
+    assert request_policy.hedge_delay_seconds == 2.5
+    assert request_policy.hedge_llm.get_name() == "hedge/model"
+    assert [llm.get_name() for llm in request_policy.fallback_llms] == [
+        "fallback/model"
+    ]
+    assert request_policy.latency_slo_seconds == 10.0
+    assert llms.for_place_description().get_request_policy() is None
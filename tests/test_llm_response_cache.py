@@ -0,0 +1,184 @@
+import zlib
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from src.base.enums import LlmResponseCacheMode
+from src.dialogues.messages_to_llm import MessagesToLlm
+from src.filesystem.config_loader import ConfigLoader
+from src.prompting.caching_llm_client import CachingLlmClient
+from src.prompting.llm import Llm
+from src.prompting.llm_response_cache import LlmResponseCache
+from src.prompting.products.instructor_ai_completion_product import (
+    InstructorAiCompletionProduct,
+)
+
+
+class Description(BaseModel):
+    description: str
+
+
+class Summary(BaseModel):
+    summary: str
+
+
+@pytest.fixture
+def create_llm():
+    def create(action_type="place_description", temperature=0.7):
+        return Llm(
+            {
+                "name": "some/model",
+                "supports_tools": False,
+                "temperature": temperature,
+                "top_p": 1.0,
+                "frequency_penalty": 0.0,
+                "presence_penalty": 0.0,
+            },
+            action_type,
+        )
+
+    return create
+
+
+@pytest.fixture
+def create_messages():
+    def create(content="Describe the harbor."):
+        messages_to_llm = MessagesToLlm()
+        messages_to_llm.add_message("user", content)
+
+        return messages_to_llm
+
+    return create
+
+
+@pytest.fixture
+def create_cache(tmp_path):
+    def create(mode, max_megabytes=1):
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_llm_response_cache_mode.return_value = mode
+        config_loader.get_cached_llm_action_types.return_value = ["place_description"]
+        config_loader.get_llm_response_cache_max_megabytes.return_value = max_megabytes
+
+        return LlmResponseCache(
+            config_loader, database_path=tmp_path / "responses.sqlite3"
+        )
+
+    return create
+
+
+@pytest.fixture
+def create_llm_client():
+    def create(description="A busy harbor."):
+        llm_client = Mock()
+        llm_client.generate_completion.return_value = InstructorAiCompletionProduct(
+            Description(description=description), is_valid=True
+        )
+
+        return llm_client
+
+    return create
+
+
+def test_keys_change_with_anything_that_changes_the_response(
+    create_llm, create_messages
+):
+    key = LlmResponseCache.create_key(create_llm(), create_messages(), Description)
+
+    assert key == LlmResponseCache.create_key(
+        create_llm(), create_messages(), Description
+    )
+    assert key != LlmResponseCache.create_key(
+        create_llm(temperature=0.9), create_messages(), Description
+    )
+    assert key != LlmResponseCache.create_key(
+        create_llm(), create_messages("Describe the docks."), Description
+    )
+    assert key != LlmResponseCache.create_key(create_llm(), create_messages(), Summary)
+
+
+def test_only_the_listed_action_types_are_cached_when_on(create_cache, create_llm):
+    cache = create_cache(LlmResponseCacheMode.ON)
+
+    assert cache.applies_to(create_llm("place_description"))
+    assert not cache.applies_to(create_llm("speech_turn"))
+    assert not create_cache(LlmResponseCacheMode.OFF).applies_to(
+        create_llm("place_description")
+    )
+    assert create_cache(LlmResponseCacheMode.RECORD).applies_to(
+        create_llm("speech_turn")
+    )
+
+
+def test_identical_requests_reuse_the_response(
+    create_cache, create_llm_client, create_llm, create_messages
+):
+    cache = create_cache(LlmResponseCacheMode.ON)
+    llm_client = create_llm_client()
+    caching_llm_client = CachingLlmClient(llm_client, Description, cache)
+
+    first = caching_llm_client.generate_completion(create_llm(), create_messages())
+    second = caching_llm_client.generate_completion(create_llm(), create_messages())
+
+    assert first.get() == second.get() == Description(description="A busy harbor.")
+    llm_client.generate_completion.assert_called_once()
+
+    cache.close()
+
+
+def test_recorded_responses_are_replayed_without_the_llm(
+    create_cache, create_llm_client, create_llm, create_messages
+):
+    recording_cache = create_cache(LlmResponseCacheMode.RECORD)
+    CachingLlmClient(
+        create_llm_client(), Description, recording_cache
+    ).generate_completion(create_llm("speech_turn"), create_messages())
+    recording_cache.close()
+
+    replaying_cache = create_cache(LlmResponseCacheMode.REPLAY)
+    llm_client = create_llm_client()
+    caching_llm_client = CachingLlmClient(llm_client, Description, replaying_cache)
+
+    replayed = caching_llm_client.generate_completion(
+        create_llm("speech_turn"), create_messages()
+    )
+    unrecorded = caching_llm_client.generate_completion(
+        create_llm("speech_turn"), create_messages("Say goodbye.")
+    )
+
+    assert replayed.get() == Description(description="A busy harbor.")
+    assert not unrecorded.is_valid()
+    llm_client.generate_completion.assert_not_called()
+
+    replaying_cache.close()
+
+
+def test_the_least_recently_used_responses_get_evicted(create_cache, create_llm):
+    responses = {
+        key: Description(description=f"The {key} harbor.")
+        for key in ("first", "second", "third")
+    }
+    response_size = max(
+        len(zlib.compress(response.model_dump_json().encode("utf-8")))
+        for response in responses.values()
+    )
+
+    # Room for two responses.
+    cache = create_cache(
+        LlmResponseCacheMode.ON,
+        max_megabytes=(2 * response_size + 1) / (1024 * 1024),
+    )
+    llm = create_llm()
+
+    cache.write("first", llm, responses["first"])
+    cache.write("second", llm, responses["second"])
+
+    assert cache.read("first", Description) == responses["first"]
+
+    cache.write("third", llm, responses["third"])
+
+    assert cache.read("second", Description) is None
+    assert cache.read("first", Description) == responses["first"]
+    assert cache.read("third", Description) == responses["third"]
+
+    cache.close()
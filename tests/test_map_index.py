@@ -0,0 +1,190 @@
+import pytest
+
+from src.base.enums import TemplateType
+from src.filesystem.json_file_cache import JsonFileCache
+from src.filesystem.unit_of_work import UnitOfWork
+from src.maps.map_index import MapIndex
+from src.maps.map_repository import MapRepository
+
+
+@pytest.fixture
+def create_map_data():
+    def create():
+        return {
+            "1": {"type": "world", "place_template": "World"},
+            "2": {"type": "region", "place_template": "Region", "world": "1"},
+            "3": {
+                "type": "area",
+                "place_template": "Area",
+                "region": "2",
+                "north": "4",
+                "characters": ["10"],
+            },
+            "4": {"type": "area", "place_template": "Other Area", "region": "2"},
+            "5": {
+                "type": "location",
+                "place_template": "Tavern",
+                "area": "3",
+                "characters": ["11", "12"],
+            },
+            "6": {"type": "room", "place_template": "Cellar", "location": "5"},
+        }
+
+    return create
+
+
+def test_get_place_returns_copy(create_map_data):
+    map_index = MapIndex(create_map_data())
+
+    place = map_index.get_place("5")
+    place["characters"].append("99")
+
+    assert map_index.get_place("5")["characters"] == ["11", "12"]
+    assert map_index.get_place("missing") is None
+
+
+def test_children_and_type_indexes(create_map_data):
+    map_index = MapIndex(create_map_data())
+
+    assert map_index.get_children_identifiers("2") == ["3", "4"]
+    assert map_index.get_children_identifiers("3", TemplateType.LOCATION) == ["5"]
+    assert map_index.get_children_identifiers("3", TemplateType.ROOM) == []
+    assert map_index.get_place_identifiers_of_type(TemplateType.AREA) == ["3", "4"]
+
+
+def test_ancestor_chain(create_map_data):
+    map_index = MapIndex(create_map_data())
+
+    assert map_index.get_ancestor_identifiers("6") == ["5", "3", "2", "1"]
+    assert map_index.get_ancestor_identifiers("1") == []
+
+    with pytest.raises(ValueError):
+        map_index.get_ancestor_identifiers("missing")
+
+
+def test_cardinal_connections_and_characters(create_map_data):
+    map_index = MapIndex(create_map_data())
+
+    assert map_index.get_cardinal_connections("3") == {"north": "4"}
+    assert map_index.get_cardinal_connections("4") == {}
+    assert map_index.get_place_identifier_of_character("11") == "5"
+    assert map_index.get_place_identifier_of_character("99") is None
+    assert map_index.get_characters_at_place("3") == ["10"]
+
+
+def test_with_changes_reindexes_only_changes(create_map_data):
+    map_data = create_map_data()
+    map_index = MapIndex(map_data)
+
+    new_map_data = create_map_data()
+    new_map_data["3"]["characters"] = []
+    new_map_data["5"]["characters"].append("10")
+    new_map_data["7"] = {"type": "location", "place_template": "Shop", "area": "4"}
+    del new_map_data["6"]
+
+    new_index = map_index.with_changes(new_map_data)
+
+    assert new_index.get_place_identifier_of_character("10") == "5"
+    assert new_index.get_children_identifiers("4") == ["7"]
+    assert new_index.get_ancestor_identifiers("7") == ["4", "2", "1"]
+    assert not new_index.has_place("6")
+    assert new_index.get_children_identifiers("5") == []
+
+    # The original index must be left untouched.
+    assert map_index.get_place_identifier_of_character("10") == "3"
+    assert map_index.get_children_identifiers("4") == []
+    assert map_index.has_place("6")
+
+
+def test_with_changes_keeps_the_order_of_unmoved_places(create_map_data):
+    map_index = MapIndex(create_map_data())
+
+    new_map_data = create_map_data()
+    new_map_data["3"]["visited"] = True
+
+    new_index = map_index.with_changes(new_map_data)
+
+    assert new_index.get_children_identifiers("2") == ["3", "4"]
+    assert new_index.get_place_identifiers_of_type(TemplateType.AREA) == ["3", "4"]
+
+
+def test_ancestor_of_type(create_map_data):
+    map_index = MapIndex(create_map_data())
+
+    assert map_index.get_ancestor_identifier_of_type("6", TemplateType.AREA) == "3"
+    assert map_index.get_ancestor_identifier_of_type("5", TemplateType.AREA) == "3"
+
+    with pytest.raises(ValueError):
+        map_index.get_ancestor_identifier_of_type("3", TemplateType.LOCATION)
+
+
+def test_places_without_data_are_left_out(create_map_data, caplog):
+    map_data = create_map_data()
+    map_data["7"] = {}
+
+    map_index = MapIndex(map_data)
+
+    assert "7" not in map_index.get_children_identifiers("5")
+    assert map_index.get_place_identifiers_of_type(TemplateType.AREA) == ["3", "4"]
+    assert "Found no data for place identifier '7'" in caplog.text
+
+
+def test_map_repository_reuses_index_until_map_changes(tmp_path, create_map_data):
+    class TestPathManager:
+        @staticmethod
+        def get_map_path(_playthrough_name):
+            return tmp_path / "map.json"
+
+    map_repository = MapRepository(
+        "test_playthrough", TestPathManager(), JsonFileCache()  # noqa
+    )
+    map_repository.save_map_data(create_map_data())
+
+    map_index = map_repository.load_map_index()
+
+    assert map_repository.load_map_index() is map_index
+
+    map_data = map_repository.load_map_data()
+    map_data["4"]["characters"] = ["20"]
+    map_repository.save_map_data(map_data)
+
+    # Mutating the saved map data must not affect the index.
+    map_data["4"]["characters"].append("21")
+
+    new_index = map_repository.load_map_index()
+
+    assert new_index is not map_index
+    assert new_index.get_characters_at_place("4") == ["20"]
+
+
+def test_map_repository_reuses_index_of_staged_map(tmp_path, create_map_data):
+    class TestPathManager:
+        @staticmethod
+        def get_map_path(_playthrough_name):
+            return tmp_path / "map.json"
+
+    map_repository = MapRepository(
+        "test_playthrough", TestPathManager(), JsonFileCache()  # noqa
+    )
+    map_repository.save_map_data(create_map_data())
+
+    with UnitOfWork():
+        map_data = map_repository.load_map_data()
+        map_data["6"]["visited"] = True
+        map_repository.save_map_data(map_data)
+
+        staged_index = map_repository.load_map_index()
+
+        assert map_repository.load_map_index() is staged_index
+        assert staged_index.get_place("6")["visited"]
+
+        map_data["4"]["characters"] = ["20"]
+        map_repository.save_map_data(map_data)
+
+        new_staged_index = map_repository.load_map_index()
+
+        assert new_staged_index is not staged_index
+        assert new_staged_index.get_characters_at_place("4") == ["20"]
+        assert not staged_index.get_characters_at_place("4")
+
+    assert map_repository.load_map_index().get_characters_at_place("4") == ["20"]
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.maps.enums import CardinalDirection
+from src.maps.map_index import MapIndex
 from src.maps.map_repository import MapRepository
 from src.maps.navigation_manager import NavigationManager
 
@@ -10,7 +11,7 @@ from src.maps.navigation_manager import NavigationManager
 def test_does_area_have_cardinal_connection_true():
     map_data = {"area1": {"type": "area", "north": "area2"}, "area2": {"type": "area"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     cardinal_direction = CardinalDirection.NORTH
@@ -23,7 +24,7 @@ def test_does_area_have_cardinal_connection_true():
 def test_does_area_have_cardinal_connection_false():
     map_data = {"area1": {"type": "area"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     cardinal_direction = CardinalDirection.SOUTH
@@ -36,7 +37,7 @@ def test_does_area_have_cardinal_connection_false():
 def test_does_area_have_cardinal_connection_invalid_area():
     map_data = {"area1": {"type": "area"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "invalid_area"
     cardinal_direction = CardinalDirection.NORTH
@@ -49,7 +50,7 @@ def test_does_area_have_cardinal_connection_invalid_area():
 def test_does_area_have_cardinal_connection_invalid_type():
     map_data = {"area1": {"type": "location"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     cardinal_direction = CardinalDirection.EAST
@@ -66,7 +67,7 @@ def test_get_cardinal_connections_success():
         "area3": {"type": "area"},
     }
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     with pytest.raises(
@@ -78,7 +79,7 @@ def test_get_cardinal_connections_success():
 def test_get_cardinal_connections_area_not_found():
     map_data = {}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     with pytest.raises(ValueError, match="Area identifier 'area1' not found in map."):
@@ -88,7 +89,7 @@ def test_get_cardinal_connections_area_not_found():
 def test_get_cardinal_connections_invalid_type():
     map_data = {"area1": {"type": "location"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     with pytest.raises(
@@ -101,7 +102,7 @@ def test_get_cardinal_connections_invalid_type():
 def test_get_cardinal_connections_missing_connected_area():
     map_data = {"area1": {"type": "area", "north": "area2"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     result = nav_manager.get_cardinal_connections(area_identifier)
@@ -114,7 +115,7 @@ def test_get_cardinal_connections_missing_connected_area():
 def test_get_cardinal_connections_missing_place_template():
     map_data = {"area1": {"type": "area", "north": "area2"}, "area2": {"type": "area"}}
     map_repository = MagicMock(spec=MapRepository)
-    map_repository.load_map_data.return_value = map_data
+    map_repository.load_map_index.return_value = MapIndex(map_data)
     nav_manager = NavigationManager(map_repository)
     area_identifier = "area1"
     with pytest.raises(
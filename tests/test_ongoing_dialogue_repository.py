@@ -0,0 +1,218 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.dialogues.repositories.ongoing_dialogue_repository import (
+    OngoingDialogueRepository,
+)
+from src.filesystem.file_operations import read_json_file, write_json_file
+from src.filesystem.json_journal import JsonJournalRegistry
+from src.filesystem.path_manager import PathManager
+
+
+@pytest.fixture
+def path_manager(tmp_path):
+    path_manager = Mock(spec=PathManager)
+    path_manager.get_ongoing_dialogue_path.return_value = (
+        tmp_path / "ongoing_dialogue.json"
+    )
+    path_manager.get_ongoing_dialogue_journal_path.return_value = (
+        tmp_path / "ongoing_dialogue.journal.jsonl"
+    )
+
+    return path_manager
+
+
+@pytest.fixture
+def create_repository(path_manager):
+    def create(json_journal_registry=None):
+        return OngoingDialogueRepository(
+            "playthrough",
+            path_manager,
+            json_journal_registry or JsonJournalRegistry(),
+        )
+
+    return create
+
+
+@pytest.fixture
+def read_journal_events(tmp_path):
+    def read():
+        with (tmp_path / "ongoing_dialogue.journal.jsonl").open(
+            encoding="utf-8"
+        ) as file:
+            return [json.loads(line) for line in file]
+
+    return read
+
+
+def test_changes_are_appended_to_the_journal(
+    tmp_path, create_repository, read_journal_events
+):
+    repository = create_repository()
+
+    repository.add_messages([{"sender_name": "Aldous", "message": "Hello."}])
+    repository.set_latest_thoughts("1", "He seems nervous.")
+    repository.set_latest_desired_action("1", "Leave.")
+
+    assert not (tmp_path / "ongoing_dialogue.json").exists()
+    assert [event["type"] for event in read_journal_events()] == [
+        "messages_added",
+        "latest_thoughts_set",
+        "latest_desired_action_set",
+    ]
+
+    assert repository.dialogue_exists()
+    assert repository.get_messages() == [{"sender_name": "Aldous", "message": "Hello."}]
+    assert repository.get_latest_thoughts("1") == "He seems nervous."
+    assert repository.get_latest_desired_action("1") == "Leave."
+
+
+def test_dialogue_is_replayed_from_the_journal_in_a_new_process(create_repository):
+    repository = create_repository()
+
+    repository.set_participants({"1": {"name": "Aldous"}, "2": {"name": "Bea"}})
+    repository.set_purpose("Trade.")
+    repository.add_messages([{"message": "One."}])
+    repository.add_messages([{"message": "Two."}])
+    repository.remove_participants(["2"])
+
+    other_repository = create_repository(JsonJournalRegistry())
+
+    assert other_repository.get_participants() == {"1": {"name": "Aldous"}}
+    assert other_repository.get_purpose() == "Trade."
+    assert other_repository.get_messages() == [
+        {"message": "One."},
+        {"message": "Two."},
+    ]
+
+
+def test_repositories_share_the_materialized_dialogue(create_repository):
+    registry = JsonJournalRegistry()
+
+    create_repository(registry).add_messages([{"message": "One."}])
+
+    assert create_repository(registry).get_messages() == [{"message": "One."}]
+
+
+def test_unchanged_entries_and_existing_transcription_lines_are_not_journaled(
+    create_repository, read_journal_events
+):
+    repository = create_repository()
+
+    for transcription in (["Aldous: Hi."], ["Aldous: Hi.", "Bea: Hello."]):
+        repository.set_participants({"1": {"name": "Aldous"}})
+        repository.set_purpose("Trade.")
+        repository.set_transcription(transcription)
+
+    events = read_journal_events()
+
+    assert [event["type"] for event in events] == [
+        "participants_set",
+        "purpose_set",
+        "transcription_set",
+        "transcription_lines_added",
+    ]
+    assert events[-1]["data"] == ["Bea: Hello."]
+    assert repository.get_transcription() == ["Aldous: Hi.", "Bea: Hello."]
+
+
+def test_journal_is_compacted_into_a_snapshot(
+    tmp_path, create_repository, read_journal_events
+):
+    repository = create_repository(JsonJournalRegistry(compaction_threshold=3))
+
+    for index in range(4):
+        repository.add_messages([{"message": str(index)}])
+
+    snapshot = read_json_file(tmp_path / "ongoing_dialogue.json")
+
+    assert snapshot["messages"] == [{"message": str(index)} for index in range(3)]
+    assert [event["data"] for event in read_journal_events()] == [[{"message": "3"}]]
+    assert create_repository().get_messages() == [
+        {"message": str(index)} for index in range(4)
+    ]
+
+
+def test_events_already_in_the_snapshot_are_not_applied_twice(
+    tmp_path, create_repository
+):
+    repository = create_repository()
+
+    repository.add_messages([{"message": "One."}])
+
+    # As if the process died after writing the snapshot, but before truncating
+    # the journal.
+    write_json_file(
+        tmp_path / "ongoing_dialogue.json",
+        {"messages": [{"message": "One."}], "journal_sequence": 1},
+    )
+
+    assert create_repository().get_messages() == [{"message": "One."}]
+
+
+def test_dialogue_stored_as_a_single_file_is_still_loaded(tmp_path, create_repository):
+    write_json_file(
+        tmp_path / "ongoing_dialogue.json",
+        {"participants": {"1": {}}, "purpose": "", "messages": [{"message": "Old."}]},
+    )
+
+    repository = create_repository()
+    repository.add_messages([{"message": "New."}])
+
+    assert repository.get_messages() == [{"message": "Old."}, {"message": "New."}]
+
+
+def test_reading_a_dialogue_doesnt_start_one(tmp_path, create_repository):
+    repository = create_repository()
+
+    assert repository.get_messages() == []
+    assert not repository.has_participants()
+
+    assert not repository.dialogue_exists()
+    assert not (tmp_path / "ongoing_dialogue.json").exists()
+
+
+def test_malformed_dialogue_is_removed(create_repository):
+    repository = create_repository()
+
+    repository.add_messages([{"message": "One."}])
+    repository.validate_dialogue_is_not_malformed()
+
+    assert not repository.dialogue_exists()
+    assert repository.get_messages() == []
+
+
+def test_registry_keeps_only_the_latest_journals(tmp_path):
+    json_journal_registry = JsonJournalRegistry(max_journals=2)
+
+    def get_journal(name):
+        return json_journal_registry.get_journal(
+            tmp_path / f"{name}.json",
+            tmp_path / f"{name}.journal.jsonl",
+            OngoingDialogueRepository._apply_event,
+        )
+
+    first_journal = get_journal("first")
+    second_journal = get_journal("second")
+
+    assert get_journal("first") is first_journal
+
+    get_journal("third")
+
+    assert get_journal("first") is first_journal
+    assert get_journal("second") is not second_journal
+
+
+def test_remove_dialogue_removes_snapshot_and_journal(tmp_path, create_repository):
+    repository = create_repository(JsonJournalRegistry(compaction_threshold=1))
+
+    repository.set_purpose("Trade.")
+    repository.add_messages([{"message": "One."}])
+
+    repository.remove_dialogue()
+
+    assert not (tmp_path / "ongoing_dialogue.json").exists()
+    assert not (tmp_path / "ongoing_dialogue.journal.jsonl").exists()
+    assert not repository.dialogue_exists()
@@ -0,0 +1,103 @@
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.filesystem.path_manager import PathManager
+from src.requests.requests_manager import RequestsManager
+from src.requests.xtts_session_registry import XttsSessionRegistry
+from src.voices.algorithms.produce_voice_parts_algorithm import (
+    ProduceVoicePartsAlgorithm,
+)
+from src.voices.factories.voice_part_provider_factory import VoicePartProviderFactory
+
+
+@pytest.fixture
+def create_algorithm(tmp_path):
+    def create(text_parts, create_provider, max_in_flight):
+        voice_part_provider_factory = Mock(spec=VoicePartProviderFactory)
+        voice_part_provider_factory.create_provider.side_effect = create_provider
+
+        requests_manager = Mock(spec=RequestsManager)
+        requests_manager.get_xtts_endpoint.return_value = "http://xtts/tts_to_audio/"
+
+        path_manager = Mock(spec=PathManager)
+        path_manager.get_temp_voice_lines_path.return_value = tmp_path
+
+        xtts_session_registry = Mock(spec=XttsSessionRegistry)
+        xtts_session_registry.get_max_in_flight_requests.return_value = max_in_flight
+
+        return ProduceVoicePartsAlgorithm(
+            text_parts,
+            "20240101",
+            voice_part_provider_factory,
+            requests_manager,
+            path_manager,
+            xtts_session_registry,
+        )
+
+    return create
+
+
+def test_parts_are_synthesized_concurrently_and_returned_in_order(create_algorithm):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def create_provider(config):
+        provider = Mock()
+
+        def create_voice_part():
+            # Every part waits for the others, so they must all be in flight.
+            barrier.wait()
+            return Path(f"{config.index}.wav")
+
+        provider.create_voice_part.side_effect = create_voice_part
+
+        return provider
+
+    algorithm = create_algorithm(
+        ["*He nods.*", "Hello.", "*He leaves.*"], create_provider, 3
+    )
+
+    assert algorithm.do_algorithm() == [Path("0.wav"), Path("1.wav"), Path("2.wav")]
+
+
+def test_parts_without_audio_are_skipped(create_algorithm):
+    def create_provider(config):
+        provider = Mock()
+        provider.create_voice_part.return_value = (
+            None if config.index == 1 else Path(f"{config.index}.wav")
+        )
+
+        return provider
+
+    algorithm = create_algorithm(["One.", "**", "Three."], create_provider, 2)
+
+    assert algorithm.do_algorithm() == [Path("0.wav"), Path("2.wav")]
+
+
+def test_in_flight_requests_are_limited_per_server():
+    config_loader = Mock()
+    config_loader.get_xtts_max_in_flight_requests.return_value = 1
+
+    registry = XttsSessionRegistry(config_loader)
+
+    with registry.limit_in_flight_requests("http://xtts:8020/tts_to_audio/"):
+        # Another server isn't affected by the busy one.
+        with registry.limit_in_flight_requests("http://other:8020/tts_to_audio/"):
+            pass
+
+        acquired = threading.Event()
+
+        def request_same_server():
+            with registry.limit_in_flight_requests("http://xtts:8020/speakers"):
+                acquired.set()
+
+        thread = threading.Thread(target=request_same_server)
+        thread.start()
+
+        assert not acquired.wait(0.1)
+
+    thread.join(5)
+
+    assert acquired.is_set()
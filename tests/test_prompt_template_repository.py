@@ -0,0 +1,80 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.base.exceptions import PromptTemplateError
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.path_manager import PathManager
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
+
+
+@pytest.fixture
+def create_repository(tmp_path):
+    def create(hot_reload=False):
+        path_manager = Mock(spec=PathManager)
+        path_manager.PROMPTING_DIR = tmp_path
+
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_hot_reload_prompt_templates.return_value = hot_reload
+
+        return PromptTemplateRepository(path_manager, config_loader)
+
+    return create
+
+
+def test_load_all_parses_every_template(tmp_path, create_repository):
+    (tmp_path / "blocks").mkdir()
+    (tmp_path / "blocks" / "local_information.txt").write_text(
+        "It's {hour} o'clock. {weather}. Again {hour}."
+    )
+    (tmp_path / "tool_instructions.txt").write_text("Use the tool.")
+
+    repository = create_repository()
+
+    assert repository.load_all() == 2
+
+    template = repository.get_template(tmp_path / "blocks" / "local_information.txt")
+
+    assert template.field_names == ("hour", "weather")
+    assert template.format(hour=8, weather="Sunny") == (
+        "It's 8 o'clock. Sunny. Again 8."
+    )
+
+
+def test_invalid_placeholders_fail_at_load(tmp_path, create_repository):
+    (tmp_path / "broken.txt").write_text("Describe {place.name}.")
+
+    with pytest.raises(PromptTemplateError):
+        create_repository().load_all()
+
+
+def test_missing_values_get_reported_by_name(tmp_path, create_repository):
+    (tmp_path / "prompt.txt").write_text("{name} is in {place}.")
+
+    template = create_repository().get_template(tmp_path / "prompt.txt")
+
+    with pytest.raises(PromptTemplateError, match="place"):
+        template.format(name="Mira")
+
+
+def test_templates_only_reload_when_hot_reloading(tmp_path, create_repository):
+    file_path = tmp_path / "prompt.txt"
+    file_path.write_text("First version.")
+
+    repository = create_repository()
+    hot_reloading_repository = create_repository(hot_reload=True)
+
+    repository.get_text(file_path)
+    hot_reloading_repository.get_text(file_path)
+
+    file_path.write_text("Second, longer version.")
+    stat_result = os.stat(file_path)
+    os.utime(
+        file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000)
+    )
+
+    assert repository.get_text(file_path) == "First version."
+    assert hot_reloading_repository.get_text(file_path) == "Second, longer version."
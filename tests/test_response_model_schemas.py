@@ -0,0 +1,19 @@
+from src.dialogues.models.speech_turn import get_custom_speech_turn_class
+from src.dialogues.models.speech_turn_choice import SpeechTurnChoice
+from src.prompting.response_model_schemas import render_tool_prompt
+
+
+def test_speech_turn_classes_are_reused_per_speaker():
+    assert get_custom_speech_turn_class("Mira") is get_custom_speech_turn_class("Mira")
+    assert get_custom_speech_turn_class("Mira") is not (
+        get_custom_speech_turn_class("Aldous")
+    )
+
+
+def test_tool_prompt_matches_uncached_rendering():
+    assert render_tool_prompt(SpeechTurnChoice, "Use the tool.") == (
+        f"Use the tool. {SpeechTurnChoice.model_json_schema()}"
+    )
+    assert render_tool_prompt(SpeechTurnChoice, "Use the tool.") is (
+        render_tool_prompt(SpeechTurnChoice, "Use the tool.")
+    )
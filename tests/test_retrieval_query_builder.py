@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.databases.retrieval_query_builder import (
+    RetrievalQueryBuilder,
+    estimate_token_count,
+    fuse_with_reciprocal_rank,
+)
+from src.filesystem.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def create_builder():
+    def create(token_budget: int, max_sub_queries: int):
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_retrieval_query_token_budget.return_value = token_budget
+        config_loader.get_max_retrieval_sub_queries.return_value = max_sub_queries
+
+        return RetrievalQueryBuilder(config_loader)
+
+    return create
+
+
+@pytest.fixture
+def build_transcription():
+    def build(turns: int):
+        return "\n".join(
+            f"Aldous: the weather is fine on day number {turn} of the journey"
+            for turn in range(turns)
+        )
+
+    return build
+
+
+def test_short_query_text_is_left_alone(create_builder):
+    builder = create_builder(256, 2)
+
+    assert builder.build_queries("Aldous greets Mira.") == ["Aldous greets Mira."]
+
+
+def test_queries_fit_the_budget_and_keep_the_latest_turns(
+    create_builder, build_transcription
+):
+    builder = create_builder(64, 2)
+
+    queries = builder.build_queries(build_transcription(40))
+
+    assert len(queries) == 3
+    assert all(estimate_token_count(query) <= 64 for query in queries)
+    assert queries[0].startswith("Aldous")
+    assert queries[0].endswith("day number 39 of the journey")
+
+
+def test_query_count_stays_flat_as_the_text_grows(create_builder, build_transcription):
+    builder = create_builder(64, 2)
+
+    assert len(builder.build_queries(build_transcription(400))) == 3
+
+    assert builder.build_queries(build_transcription(400))[1:] != (
+        builder.build_queries(build_transcription(40))[1:]
+    )
+
+
+def test_sub_queries_can_be_disabled(create_builder, build_transcription):
+    builder = create_builder(64, 0)
+
+    assert len(builder.build_queries(build_transcription(40))) == 1
+
+
+def test_reciprocal_rank_fusion_favors_entries_ranked_by_several_queries():
+    fused = fuse_with_reciprocal_rank(
+        [
+            [{"id": "1", "document": "a"}, {"id": "2", "document": "b"}],
+            [{"id": "3", "document": "c"}, {"id": "2", "document": "b"}],
+        ],
+        2,
+    )
+
+    assert [entry["id"] for entry in fused] == ["2", "1"]
@@ -15,6 +15,9 @@ from src.prompting.abstracts.abstract_factories import (
 from src.prompting.providers.speech_turn_tool_response_provider import (
     SpeechTurnChoiceToolResponseProvider,
 )
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
 
 
 def test_init_with_valid_parameters():
@@ -74,7 +77,7 @@ def test_init_with_empty_player_identifier_raises_error():
     assert "player_identifier" in str(exc_info.value)
 
 
-def test_get_tool_data_returns_correct_schema():
+def test_tool_prompt_includes_the_schema_of_the_response_model():
     # Arrange
     provider = SpeechTurnChoiceToolResponseProvider(
         player_identifier="1",
@@ -88,10 +91,19 @@ def test_get_tool_data_returns_correct_schema():
     )
 
     # Act
-    tool_data = provider._get_tool_data(SpeechTurnChoice)
+    with patch.object(
+        provider, "get_formatted_prompt", return_value="Prompt."
+    ), patch.object(
+        provider, "_read_tool_instructions", return_value="Use the tool."
+    ), patch.object(
+        provider, "_generate_system_content"
+    ) as mock_generate_system_content:
+        provider._generate_system_content_for(SpeechTurnChoice)
 
     # Assert
-    assert tool_data == SpeechTurnChoice.model_json_schema()
+    mock_generate_system_content.assert_called_once_with(
+        "Prompt.", f"Use the tool. {SpeechTurnChoice.model_json_schema()}"
+    )
 
 
 def test_get_user_content_returns_expected_string():
@@ -208,10 +220,10 @@ def test_get_prompt_kwargs_with_player_identifier():
     assert prompt_kwargs["dialogue"] == transcription.get_prettified_transcription()
 
 
-@patch("src.prompting.providers.base_tool_response_provider.read_file")
-def test_generate_product_calls_produce_tool_response(mock_read_file):
+@patch.object(PromptTemplateRepository, "get_text")
+def test_generate_product_calls_produce_tool_response(mock_get_text):
     # Arrange
-    mock_read_file.return_value = "Prompt content"
+    mock_get_text.return_value = "Prompt content"
     produce_tool_response_strategy_factory = MagicMock(
         spec=ProduceToolResponseStrategyFactory
     )
@@ -299,10 +311,10 @@ def test_peep_into_system_content_does_nothing():
     assert result is None  # Method does nothing
 
 
-@patch("src.prompting.providers.base_tool_response_provider.read_file")
-def test_generate_product_with_invalid_tool_response(mock_read_file):
+@patch.object(PromptTemplateRepository, "get_text")
+def test_generate_product_with_invalid_tool_response(mock_get_text):
     # Arrange
-    mock_read_file.return_value = "Prompt content"
+    mock_get_text.return_value = "Prompt content"
     produce_tool_response_strategy_factory = MagicMock(
         spec=ProduceToolResponseStrategyFactory
     )
@@ -348,11 +360,11 @@ def test_get_formatted_prompt_returns_none():
     assert result is None  # Should return None as per implementation
 
 
-@patch("src.prompting.providers.base_tool_response_provider.read_file")
-def test_generate_system_content_calls_format_prompt_correctly(mock_read_file):
+@patch.object(PromptTemplateRepository, "get_text")
+def test_generate_system_content_calls_format_prompt_correctly(mock_get_text):
     # Arrange
     prompt_content = "Prompt template with {placeholder}"
-    mock_read_file.return_value = prompt_content
+    mock_get_text.return_value = prompt_content
     provider = SpeechTurnChoiceToolResponseProvider(
         player_identifier="1",
         participants=Participants(),
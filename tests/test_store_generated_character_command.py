@@ -1,10 +1,11 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from src.characters.commands.store_generated_character_command import (
     StoreGeneratedCharacterCommand,
 )
+from src.filesystem.json_file_cache import JsonFileCache
 from src.voices.voice_attributes import VoiceAttributes
 
 
@@ -163,46 +164,43 @@ def test_store_generated_character_command_execute():
 
     expected_characters_file = {"character_1": expected_modified_character_data}
 
-    with patch(
-        "src.characters.commands.store_generated_character_command.read_json_file",
-        return_value={},
-    ) as mock_read_json_file:
-        with patch(
-            "src.characters.commands.store_generated_character_command.write_json_file"
-        ) as mock_write_json_file:
-            command = StoreGeneratedCharacterCommand(
-                playthrough_name,
-                character_data,
-                match_voice_data_to_voice_model_algorithm,
-                produce_and_update_next_identifier_algorithm,
-                path_manager=path_manager,
-            )
-            command.execute()
-
-            mock_read_json_file.assert_called_once_with("path/to/characters_file.json")
-
-            expected_voice_attributes = VoiceAttributes(
-                "Male",
-                "Adult",
-                "Neutral",
-                "Normal",
-                "Medium",
-                "Smooth",
-                "Calm",
-                "Standard",
-                "Professional",
-                "None",
-            )
-            match_voice_data_to_voice_model_algorithm.match.assert_called_once_with(
-                expected_voice_attributes
-            )
-
-            produce_and_update_next_identifier_algorithm.do_algorithm.assert_called_once()
-
-            mock_write_json_file.assert_called_once_with(
-                "path/to/characters_file.json",
-                expected_characters_file,
-            )
+    json_file_cache = Mock(spec=JsonFileCache)
+    json_file_cache.read.return_value = {}
+
+    command = StoreGeneratedCharacterCommand(
+        playthrough_name,
+        character_data,
+        match_voice_data_to_voice_model_algorithm,
+        produce_and_update_next_identifier_algorithm,
+        path_manager=path_manager,
+        json_file_cache=json_file_cache,
+    )
+    command.execute()
+
+    json_file_cache.read.assert_called_once_with("path/to/characters_file.json")
+
+    expected_voice_attributes = VoiceAttributes(
+        "Male",
+        "Adult",
+        "Neutral",
+        "Normal",
+        "Medium",
+        "Smooth",
+        "Calm",
+        "Standard",
+        "Professional",
+        "None",
+    )
+    match_voice_data_to_voice_model_algorithm.match.assert_called_once_with(
+        expected_voice_attributes
+    )
+
+    produce_and_update_next_identifier_algorithm.do_algorithm.assert_called_once()
+
+    json_file_cache.write.assert_called_once_with(
+        "path/to/characters_file.json",
+        expected_characters_file,
+    )
 
 
 def test_store_generated_character_command_compose_speech_patterns():
@@ -278,26 +276,23 @@ def test_store_generated_character_command_execute_with_existing_characters():
     expected_characters_file = existing_characters.copy()
     expected_characters_file["character_1"] = expected_modified_character_data
 
-    with patch(
-        "src.characters.commands.store_generated_character_command.read_json_file",
-        return_value=existing_characters,
-    ):
-        with patch(
-            "src.characters.commands.store_generated_character_command.write_json_file"
-        ) as mock_write_json_file:
-            command = StoreGeneratedCharacterCommand(
-                playthrough_name,
-                character_data,
-                match_voice_data_to_voice_model_algorithm,
-                produce_and_update_next_identifier_algorithm,
-                path_manager=path_manager,
-            )
-            command.execute()
-
-            mock_write_json_file.assert_called_once_with(
-                "path/to/characters_file.json",
-                expected_characters_file,
-            )
+    json_file_cache = Mock(spec=JsonFileCache)
+    json_file_cache.read.return_value = existing_characters
+
+    command = StoreGeneratedCharacterCommand(
+        playthrough_name,
+        character_data,
+        match_voice_data_to_voice_model_algorithm,
+        produce_and_update_next_identifier_algorithm,
+        path_manager=path_manager,
+        json_file_cache=json_file_cache,
+    )
+    command.execute()
+
+    json_file_cache.write.assert_called_once_with(
+        "path/to/characters_file.json",
+        expected_characters_file,
+    )
 
 
 def test_store_generated_character_command_execute_read_json_file_exception():
@@ -315,23 +310,20 @@ def test_store_generated_character_command_execute_read_json_file_exception():
     path_manager = Mock()
     path_manager.get_characters_path.return_value = "path/to/characters_file.json"
 
-    with patch(
-        "src.characters.commands.store_generated_character_command.read_json_file",
-        side_effect=FileNotFoundError,
-    ):
-        with patch(
-            "src.characters.commands.store_generated_character_command.write_json_file"
-        ):
-            command = StoreGeneratedCharacterCommand(
-                playthrough_name,
-                character_data,
-                match_voice_data_to_voice_model_algorithm,
-                produce_and_update_next_identifier_algorithm,
-                path_manager=path_manager,
-            )
-
-            with pytest.raises(FileNotFoundError):
-                command.execute()
+    json_file_cache = Mock(spec=JsonFileCache)
+    json_file_cache.read.side_effect = FileNotFoundError
+
+    command = StoreGeneratedCharacterCommand(
+        playthrough_name,
+        character_data,
+        match_voice_data_to_voice_model_algorithm,
+        produce_and_update_next_identifier_algorithm,
+        path_manager=path_manager,
+        json_file_cache=json_file_cache,
+    )
+
+    with pytest.raises(FileNotFoundError):
+        command.execute()
 
 
 def test_store_generated_character_command_execute_match_voice_algorithm_exception():
@@ -351,24 +343,21 @@ def test_store_generated_character_command_execute_match_voice_algorithm_excepti
     path_manager = Mock()
     path_manager.get_characters_path.return_value = "path/to/characters_file.json"
 
-    with patch(
-        "src.characters.commands.store_generated_character_command.read_json_file",
-        return_value={},
-    ):
-        with patch(
-            "src.characters.commands.store_generated_character_command.write_json_file"
-        ):
-            command = StoreGeneratedCharacterCommand(
-                playthrough_name,
-                character_data,
-                match_voice_data_to_voice_model_algorithm,
-                produce_and_update_next_identifier_algorithm,
-                path_manager=path_manager,
-            )
-
-            with pytest.raises(Exception) as excinfo:
-                command.execute()
-            assert "Match algorithm error" in str(excinfo.value)
+    json_file_cache = Mock(spec=JsonFileCache)
+    json_file_cache.read.return_value = {}
+
+    command = StoreGeneratedCharacterCommand(
+        playthrough_name,
+        character_data,
+        match_voice_data_to_voice_model_algorithm,
+        produce_and_update_next_identifier_algorithm,
+        path_manager=path_manager,
+        json_file_cache=json_file_cache,
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        command.execute()
+    assert "Match algorithm error" in str(excinfo.value)
 
 
 def test_store_generated_character_command_execute_produce_identifier_exception():
@@ -386,21 +375,18 @@ def test_store_generated_character_command_execute_produce_identifier_exception(
     path_manager = Mock()
     path_manager.get_characters_path.return_value = "path/to/characters_file.json"
 
-    with patch(
-        "src.characters.commands.store_generated_character_command.read_json_file",
-        return_value={},
-    ):
-        with patch(
-            "src.characters.commands.store_generated_character_command.write_json_file"
-        ):
-            command = StoreGeneratedCharacterCommand(
-                playthrough_name,
-                character_data,
-                match_voice_data_to_voice_model_algorithm,
-                produce_and_update_next_identifier_algorithm,
-                path_manager=path_manager,
-            )
-
-            with pytest.raises(Exception) as excinfo:
-                command.execute()
-            assert "Identifier algorithm error" in str(excinfo.value)
+    json_file_cache = Mock(spec=JsonFileCache)
+    json_file_cache.read.return_value = {}
+
+    command = StoreGeneratedCharacterCommand(
+        playthrough_name,
+        character_data,
+        match_voice_data_to_voice_model_algorithm,
+        produce_and_update_next_identifier_algorithm,
+        path_manager=path_manager,
+        json_file_cache=json_file_cache,
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        command.execute()
+    assert "Identifier algorithm error" in str(excinfo.value)
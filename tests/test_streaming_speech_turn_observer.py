@@ -0,0 +1,78 @@
+import json
+import threading
+
+import pytest
+
+from src.dialogues.observers.streaming_speech_turn_observer import (
+    StreamingSpeechTurnObserver,
+)
+
+
+@pytest.fixture
+def parse_events():
+    def parse(stream):
+        events = []
+
+        for chunk in stream:
+            if chunk.startswith(":"):
+                continue
+
+            event_line, data_line = chunk.strip().split("\n")
+
+            events.append(
+                (
+                    event_line.removeprefix("event: "),
+                    json.loads(data_line.removeprefix("data: ")),
+                )
+            )
+
+        return events
+
+    return parse
+
+
+def test_partial_speech_turns_are_streamed_until_finished(parse_events):
+    observer = StreamingSpeechTurnObserver()
+
+    observer.update({"name": "Aria"})
+    observer.update({"name": "Aria", "speech": "Hel", "desired_action": "Leave"})
+    observer.update({"name": "Aria", "speech": "Hel", "desired_action": "Leave now"})
+    observer.update({"name": "Aria", "speech": "Hello", "thoughts": "Hm"})
+    observer.finish("speech_turn_messages", {"success": True, "messages": []})
+
+    assert parse_events(observer.stream()) == [
+        ("speech_turn_partial", {"name": "Aria"}),
+        ("speech_turn_partial", {"name": "Aria", "speech": "Hel"}),
+        ("speech_turn_partial", {"name": "Aria", "speech": "Hello", "thoughts": "Hm"}),
+        ("speech_turn_messages", {"success": True, "messages": []}),
+    ]
+
+
+def test_partial_speech_turns_of_a_failed_attempt_are_reset(parse_events):
+    observer = StreamingSpeechTurnObserver()
+
+    observer.update({})
+    observer.update({"name": "Aria", "speech": "Hel"})
+    observer.update({})
+    observer.update({})
+    observer.update({"name": "Aria", "speech": "Good"})
+    observer.finish("speech_turn_messages", {"success": True, "messages": []})
+
+    assert parse_events(observer.stream()) == [
+        ("speech_turn_partial", {"name": "Aria", "speech": "Hel"}),
+        ("speech_turn_reset", {}),
+        ("speech_turn_partial", {"name": "Aria", "speech": "Good"}),
+        ("speech_turn_messages", {"success": True, "messages": []}),
+    ]
+
+
+def test_stream_sends_keep_alive_comments_while_waiting(parse_events):
+    observer = StreamingSpeechTurnObserver(keep_alive_seconds=0.01)
+
+    stream = observer.stream()
+
+    assert next(stream) == ": keep-alive\n\n"
+
+    threading.Thread(target=observer.finish, args=("error", {"success": False})).start()
+
+    assert parse_events(stream) == [("error", {"success": False})]
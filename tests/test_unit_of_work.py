@@ -0,0 +1,149 @@
+import pytest
+
+from src.base.context_assembler import ContextAssembler, ContextTask
+from src.filesystem.file_operations import read_json_file, write_json_file
+from src.filesystem.json_file_cache import JsonFileCache
+from src.filesystem.json_journal import JsonJournal
+from src.filesystem.unit_of_work import UnitOfWork
+
+
+@pytest.fixture
+def apply_event():
+    def apply(data, event_type, payload):
+        data.setdefault(event_type, []).append(payload)
+
+    return apply
+
+
+def test_writes_are_flushed_once_on_commit(tmp_path):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_json_file(file_path, {"hour": 8})
+
+    cache = JsonFileCache()
+
+    with UnitOfWork():
+        for hour in (9, 10, 11):
+            data = cache.read(file_path)
+            data["hour"] = hour
+            cache.write(file_path, data)
+
+        assert cache.read(file_path) == {"hour": 11}
+        assert read_json_file(file_path) == {"hour": 8}
+
+    assert read_json_file(file_path) == {"hour": 11}
+    assert cache.get_statistics().writes == 1
+
+
+def test_writes_are_discarded_if_the_work_fails(tmp_path):
+    file_path = tmp_path / "map.json"
+    write_json_file(file_path, {"1": {"visited": False}})
+
+    cache = JsonFileCache()
+
+    try:
+        with UnitOfWork():
+            cache.write(file_path, {"1": {"visited": True}})
+            raise RuntimeError("The travel failed.")
+    except RuntimeError:
+        pass
+
+    assert read_json_file(file_path) == {"1": {"visited": False}}
+    assert cache.read(file_path) == {"1": {"visited": False}}
+
+
+def test_no_document_is_replaced_if_one_fails_to_be_written(tmp_path):
+    map_path = tmp_path / "map.json"
+    metadata_path = tmp_path / "playthrough_metadata.json"
+    write_json_file(map_path, {"1": {"visited": False}})
+    write_json_file(metadata_path, {"hour": 8})
+
+    cache = JsonFileCache()
+
+    with pytest.raises(TypeError):
+        with UnitOfWork():
+            cache.write(map_path, {"1": {"visited": True}})
+            # Can't be serialized, so writing it fails halfway.
+            cache.write(metadata_path, {"hour": 9, "weather": {"rain"}})
+
+    assert read_json_file(map_path) == {"1": {"visited": False}}
+    assert read_json_file(metadata_path) == {"hour": 8}
+    assert cache.read(map_path) == {"1": {"visited": False}}
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "map.json",
+        "playthrough_metadata.json",
+    ]
+    assert UnitOfWork.get_active() is None
+
+
+def test_writes_go_to_disk_once_the_work_is_finished(tmp_path):
+    file_path = tmp_path / "characters.json"
+    cache = JsonFileCache()
+
+    unit_of_work = UnitOfWork.begin()
+    unit_of_work.commit()
+
+    cache.write(file_path, {"1": {"name": "Aldous"}})
+
+    assert read_json_file(file_path) == {"1": {"name": "Aldous"}}
+
+    unit_of_work.close()
+
+    assert UnitOfWork.get_active() is None
+
+
+def test_journal_events_are_appended_together_on_commit(tmp_path, apply_event):
+    journal_path = tmp_path / "ongoing_dialogue.journal.jsonl"
+    journal = JsonJournal(tmp_path / "ongoing_dialogue.json", journal_path, apply_event)
+
+    journal.append([("messages", "One.")])
+
+    with UnitOfWork():
+        journal.append([("messages", "Two.")])
+        journal.append([("thoughts", "Hm.")])
+
+        assert journal.get("messages") == ["One.", "Two."]
+        assert len(journal_path.read_text().splitlines()) == 1
+
+    assert len(journal_path.read_text().splitlines()) == 3
+    assert journal.read() == {"messages": ["One.", "Two."], "thoughts": ["Hm."]}
+
+
+def test_removing_a_journal_is_staged(tmp_path, apply_event):
+    journal = JsonJournal(
+        tmp_path / "ongoing_dialogue.json",
+        tmp_path / "ongoing_dialogue.journal.jsonl",
+        apply_event,
+    )
+
+    journal.append([("messages", "One.")])
+
+    with UnitOfWork():
+        journal.remove()
+
+        assert not journal.exists()
+        assert journal.read() == {}
+        assert (tmp_path / "ongoing_dialogue.journal.jsonl").exists()
+
+    assert not journal.exists()
+
+
+def test_context_tasks_see_the_unit_of_work_of_their_caller(tmp_path):
+    file_path = tmp_path / "playthrough_metadata.json"
+    write_json_file(file_path, {"hour": 8})
+
+    cache = JsonFileCache()
+    assembler = ContextAssembler(max_workers=2)
+
+    with UnitOfWork():
+        cache.write(file_path, {"hour": 9})
+
+        assembly = assembler.assemble(
+            [
+                ContextTask("first", lambda: cache.read(file_path)["hour"]),
+                ContextTask("second", lambda: cache.read(file_path)["hour"]),
+            ]
+        )
+
+    assembler.close()
+
+    assert assembly.values == {"first": 9, "second": 9}
@@ -0,0 +1,214 @@
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.base.constants import FINISHED_VOICE_LINE_JOB_RETENTION_SECONDS
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.file_operations import read_json_file, write_json_file
+from src.filesystem.path_manager import PathManager
+from src.voices.factories.direct_voice_line_generation_algorithm_factory import (
+    DirectVoiceLineGenerationAlgorithmFactory,
+)
+from src.voices.voice_line_job_queue import (
+    VoiceLineJobQueue,
+    VoiceLineJobStatus,
+)
+
+
+@pytest.fixture
+def create_queue(tmp_path):
+    def create(direct_voice_line_generation, produce_voice_lines=True):
+        factory = Mock(spec=DirectVoiceLineGenerationAlgorithmFactory)
+        factory.create_algorithm.return_value.direct_voice_line_generation.side_effect = (
+            direct_voice_line_generation
+        )
+
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_produce_voice_lines.return_value = produce_voice_lines
+        config_loader.get_voice_line_job_workers.return_value = 2
+
+        path_manager = Mock(spec=PathManager)
+        path_manager.get_voice_line_jobs_path.return_value = tmp_path / "jobs"
+        path_manager.get_voice_lines_path.return_value = tmp_path / "voice_lines"
+
+        return VoiceLineJobQueue(factory, config_loader, path_manager), factory
+
+    return create
+
+
+@pytest.fixture
+def wait_until_finished():
+    def wait(queue, job_id):
+        for _ in range(500):
+            job = queue.get_job(job_id)
+
+            if job.is_finished():
+                return job
+
+            time.sleep(0.01)
+
+        raise AssertionError(f"Job '{job_id}' didn't finish.")
+
+    return wait
+
+
+def test_enqueue_returns_before_the_voice_line_is_synthesized(
+    create_queue, wait_until_finished
+):
+    release = threading.Event()
+
+    def direct_voice_line_generation():
+        release.wait(timeout=5)
+        return Path("/static/voice_lines/narrator_line.wav")
+
+    queue, factory = create_queue(direct_voice_line_generation)
+
+    job_id = queue.enqueue("narrator", "The wind howls.", "voice.wav")
+
+    assert queue.get_job(job_id).status in (
+        VoiceLineJobStatus.PENDING,
+        VoiceLineJobStatus.RUNNING,
+    )
+
+    release.set()
+
+    job = wait_until_finished(queue, job_id)
+
+    assert job.status == VoiceLineJobStatus.DONE
+    assert job.file_name == "narrator_line.wav"
+    factory.create_algorithm.assert_called_once_with(
+        "narrator", "The wind howls.", "voice.wav"
+    )
+
+    queue.close()
+
+
+def test_job_status_survives_a_new_queue(create_queue, wait_until_finished):
+    queue, _ = create_queue(lambda: Path("line.wav"))
+
+    job_id = queue.enqueue("narrator", "Text.", "voice.wav")
+    wait_until_finished(queue, job_id)
+    queue.close()
+
+    other_queue, _ = create_queue(lambda: None)
+
+    job = other_queue.get_job(job_id)
+
+    assert job.status == VoiceLineJobStatus.DONE
+    assert job.file_name == "line.wav"
+
+
+def test_old_finished_jobs_are_only_kept_on_disk(
+    monkeypatch, create_queue, wait_until_finished
+):
+    queue, _ = create_queue(lambda: Path("line.wav"))
+
+    job_id = queue.enqueue("narrator", "Text.", "voice.wav")
+    wait_until_finished(queue, job_id)
+
+    now = time.time() + FINISHED_VOICE_LINE_JOB_RETENTION_SECONDS + 1
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    other_job_id = queue.enqueue("narrator", "Other text.", "voice.wav")
+    wait_until_finished(queue, other_job_id)
+
+    assert job_id not in queue._jobs
+    assert other_job_id in queue._jobs
+    assert queue.get_job(job_id).file_name == "line.wav"
+
+    queue.close()
+
+
+def test_failed_synthesis_marks_job_as_failed(create_queue, wait_until_finished):
+    def direct_voice_line_generation():
+        raise RuntimeError("XTTS is down")
+
+    queue, _ = create_queue(direct_voice_line_generation)
+
+    job = wait_until_finished(queue, queue.enqueue("narrator", "Text.", "voice.wav"))
+
+    assert job.status == VoiceLineJobStatus.FAILED
+    assert job.error == "XTTS is down"
+
+    queue.close()
+
+
+def test_no_job_is_queued_when_voice_lines_are_disabled(create_queue):
+    queue, factory = create_queue(lambda: None, produce_voice_lines=False)
+
+    assert queue.enqueue("narrator", "Text.", "voice.wav") is None
+    factory.create_algorithm.assert_not_called()
+
+
+def test_unfinished_jobs_are_resumed_and_old_finished_jobs_removed(
+    tmp_path, create_queue, wait_until_finished
+):
+    jobs_path = tmp_path / "jobs"
+    jobs_path.mkdir()
+
+    write_json_file(
+        jobs_path / "pending.json",
+        {
+            "job_id": "pending",
+            "character_name": "narrator",
+            "text": "Text.",
+            "voice_model": "voice.wav",
+            "status": "running",
+            "file_name": None,
+            "error": None,
+            "updated_at": time.time(),
+        },
+    )
+    write_json_file(
+        jobs_path / "old.json",
+        {
+            "job_id": "old",
+            "character_name": "narrator",
+            "text": "Text.",
+            "voice_model": "voice.wav",
+            "status": "done",
+            "file_name": "old.wav",
+            "error": None,
+            "updated_at": 0.0,
+        },
+    )
+
+    write_json_file(
+        jobs_path / "played.json",
+        {
+            "job_id": "played",
+            "character_name": "narrator",
+            "text": "Text.",
+            "voice_model": "voice.wav",
+            "status": "done",
+            "file_name": "played.wav",
+            "error": None,
+            "updated_at": 0.0,
+        },
+    )
+    # The audio of old jobs can still be replayed from the dialogues.
+    (tmp_path / "voice_lines").mkdir()
+    (tmp_path / "voice_lines" / "played.wav").write_bytes(b"RIFF")
+
+    queue, _ = create_queue(lambda: Path("resumed.wav"))
+
+    assert queue.resume_pending_jobs() == 1
+
+    job = wait_until_finished(queue, "pending")
+
+    assert job.file_name == "resumed.wav"
+    assert read_json_file(jobs_path / "pending.json")["status"] == "done"
+    assert not (jobs_path / "old.json").exists()
+    assert queue.get_job("played").file_name == "played.wav"
+
+    queue.close()
+
+
+def test_unknown_job_is_none(create_queue):
+    queue, _ = create_queue(lambda: None)
+
+    assert queue.get_job("missing") is None
+    assert queue.get_job("../config") is None
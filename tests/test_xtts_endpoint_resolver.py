@@ -0,0 +1,152 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.filesystem.config_loader import ConfigLoader
+from src.filesystem.path_manager import PathManager
+from src.requests.xtts_endpoint_resolver import XttsEndpointResolver
+from src.requests.xtts_session_registry import XttsSessionRegistry
+from src.voices.factories.voice_line_factory import VoiceLineFactory
+
+
+@pytest.fixture
+def create_resolver():
+    def create(ttl_seconds=300, static_endpoint=""):
+        config_loader = Mock(spec=ConfigLoader)
+        config_loader.get_xtts_endpoint_ttl_seconds.return_value = ttl_seconds
+        config_loader.get_xtts_static_endpoint.return_value = static_endpoint
+        config_loader.load_runpod_secret_key.return_value = "secret"
+
+        path_manager = Mock(spec=PathManager)
+
+        session = Mock()
+        session.post.return_value = Mock(raise_for_status=Mock())
+
+        xtts_session_registry = Mock(spec=XttsSessionRegistry)
+        xtts_session_registry.get_session.return_value = session
+
+        resolver = XttsEndpointResolver(
+            max_retries=2,
+            retry_delay=0,
+            config_loader=config_loader,
+            path_manager=path_manager,
+            xtts_session_registry=xtts_session_registry,
+        )
+
+        return resolver, session
+
+    return create
+
+
+@patch("src.requests.xtts_endpoint_resolver.read_json_file", return_value={})
+@patch("src.requests.xtts_endpoint_resolver.runpod")
+def test_endpoint_is_resolved_once_while_fresh(mock_runpod, _, create_resolver):
+    mock_runpod.get_pods.return_value = [{"id": "pod1", "desiredStatus": "RUNNING"}]
+
+    resolver, session = create_resolver()
+
+    assert resolver.get_base_url() == "https://pod1-8020.proxy.runpod.net"
+    assert resolver.get_base_url() == "https://pod1-8020.proxy.runpod.net"
+
+    mock_runpod.get_pods.assert_called_once()
+    session.post.assert_called_once_with(
+        "https://pod1-8020.proxy.runpod.net/set_tts_settings", json={}
+    )
+
+
+@patch("src.requests.xtts_endpoint_resolver.read_json_file", return_value={})
+@patch("src.requests.xtts_endpoint_resolver.runpod")
+def test_invalidation_forces_rediscovery(mock_runpod, _, create_resolver):
+    mock_runpod.get_pods.side_effect = [
+        [{"id": "pod1", "desiredStatus": "RUNNING"}],
+        [{"id": "pod2", "desiredStatus": "RUNNING"}],
+    ]
+
+    resolver, _ = create_resolver()
+
+    assert resolver.get_base_url() == "https://pod1-8020.proxy.runpod.net"
+
+    resolver.invalidate()
+
+    assert resolver.get_base_url() == "https://pod2-8020.proxy.runpod.net"
+
+
+@patch("src.requests.xtts_endpoint_resolver.read_json_file", return_value={})
+@patch("src.requests.xtts_endpoint_resolver.runpod")
+def test_stale_endpoint_is_served_while_refreshing_in_background(
+    mock_runpod, _, create_resolver
+):
+    refreshed = threading.Event()
+
+    def get_pods():
+        if mock_runpod.get_pods.call_count == 1:
+            return [{"id": "pod1", "desiredStatus": "RUNNING"}]
+
+        refreshed.set()
+
+        return [{"id": "pod2", "desiredStatus": "RUNNING"}]
+
+    mock_runpod.get_pods.side_effect = get_pods
+
+    resolver, _ = create_resolver(ttl_seconds=-1)
+
+    assert resolver.get_base_url() == "https://pod1-8020.proxy.runpod.net"
+    assert resolver.get_base_url() == "https://pod1-8020.proxy.runpod.net"
+
+    assert refreshed.wait(timeout=5)
+
+    for _ in range(100):
+        if resolver.get_state().base_url.startswith("https://pod2"):
+            break
+        time.sleep(0.01)
+
+    assert resolver.get_state().base_url == "https://pod2-8020.proxy.runpod.net"
+
+
+@patch("src.requests.xtts_endpoint_resolver.read_json_file", return_value={})
+@patch("src.requests.xtts_endpoint_resolver.runpod")
+def test_static_endpoint_skips_pod_discovery(mock_runpod, _, create_resolver):
+    resolver, session = create_resolver(static_endpoint="http://localhost:8020/")
+
+    assert resolver.get_base_url() == "http://localhost:8020"
+
+    mock_runpod.get_pods.assert_not_called()
+    session.post.assert_called_once_with(
+        "http://localhost:8020/set_tts_settings", json={}
+    )
+
+
+@patch("src.requests.xtts_endpoint_resolver.read_json_file", return_value={})
+@patch("src.requests.xtts_endpoint_resolver.runpod")
+def test_no_running_pod_resolves_to_none(mock_runpod, _, create_resolver):
+    mock_runpod.get_pods.return_value = [{"id": "pod1", "desiredStatus": "EXITED"}]
+
+    resolver, _ = create_resolver()
+
+    assert resolver.get_base_url() is None
+    assert mock_runpod.get_pods.call_count == 2
+
+
+def test_connection_error_while_creating_voice_line_invalidates_endpoint():
+    session = Mock()
+    session.post.side_effect = requests.exceptions.ConnectionError("refused")
+
+    xtts_session_registry = XttsSessionRegistry(Mock(spec=ConfigLoader))
+    xtts_session_registry.get_max_in_flight_requests = Mock(return_value=1)
+    xtts_session_registry.get_session = Mock(return_value=session)
+
+    resolver = Mock(spec=XttsEndpointResolver)
+
+    voice_line = VoiceLineFactory(
+        "Hello.",
+        "voice.wav",
+        "https://pod1-8020.proxy.runpod.net/tts_to_audio/",
+        xtts_session_registry,
+        resolver,
+    ).create_voice_line()
+
+    assert not voice_line.is_valid()
+    resolver.invalidate.assert_called_once()
@@ -1,12 +1,16 @@
 import logging.config
 import re
 
-from flask import Flask
+from flask import Flask, g
 from markupsafe import Markup
 from waitress import serve
 
 from src.filesystem.file_operations import read_json_file
 from src.filesystem.path_manager import PathManager
+from src.filesystem.unit_of_work import UnitOfWork
+from src.prompting.repositories.prompt_template_repository import (
+    PromptTemplateRepository,
+)
 from src.views.action_view import action_view
 from src.views.actions_view import ActionsView
 from src.views.add_participants_view import AddParticipantsView
@@ -18,6 +22,7 @@ from src.views.character_purpose_view import CharacterPurposeView
 from src.views.character_secrets_view import CharacterSecretsView
 from src.views.character_voice_view import CharacterVoiceView
 from src.views.characters_hub_view import CharactersHubView
+from src.views.chat_stream_view import ChatStreamView
 from src.views.chat_view import ChatView
 from src.views.connections_view import ConnectionsView
 from src.views.facts_view import FactsView
@@ -27,12 +32,21 @@ from src.views.location_hub_view import LocationHubView
 from src.views.participants_view import ParticipantsView
 from src.views.places_view import PlacesView
 from src.views.remove_participants_view import RemoveParticipantsView
+from src.views.story_hub_batch_view import StoryHubBatchView
 from src.views.story_hub_view import StoryHubView
 from src.views.travel_view import TravelView
+from src.views.voice_line_job_view import VoiceLineJobView
 from src.views.writers_room_view import WritersRoomView
+from src.voices.voice_line_job_queue import VoiceLineJobQueue
 
 logging.config.dictConfig(read_json_file(PathManager().get_logging_config()))
 
+# Broken prompt templates should prevent the server from starting, rather than
+# failing in the middle of a dialogue.
+PromptTemplateRepository.get_shared_instance().load_all()
+
+VoiceLineJobQueue.get_shared_instance().resume_pending_jobs()
+
 app = Flask(__name__)
 app.secret_key = b"neural-narrative"
 
@@ -53,9 +67,38 @@ app.jinja_env.filters["bold_text"] = bold_text
 
 logger = logging.getLogger(__name__)
 
+
+@app.before_request
+def begin_unit_of_work():
+    # Every document the request changes gets written once, when it's done.
+    g.unit_of_work = UnitOfWork.begin()
+
+
+@app.after_request
+def commit_unit_of_work(response):
+    unit_of_work = g.get("unit_of_work")
+
+    if unit_of_work is not None and response.status_code < 500:
+        unit_of_work.commit()
+
+    return response
+
+
+@app.teardown_request
+def end_unit_of_work(_exception):
+    unit_of_work = g.pop("unit_of_work", None)
+
+    if unit_of_work is not None:
+        unit_of_work.close()
+
+
 app.add_url_rule("/", view_func=IndexView.as_view("index"))
 app.add_url_rule("/places", view_func=PlacesView.as_view("places"))
 app.add_url_rule("/story-hub", view_func=StoryHubView.as_view("story-hub"))
+app.add_url_rule(
+    "/story-hub/generate-batch",
+    view_func=StoryHubBatchView.as_view("story-hub-generate-batch"),
+)
 app.add_url_rule("/facts", view_func=FactsView.as_view("facts"))
 app.add_url_rule("/writers-room", view_func=WritersRoomView.as_view("writers-room"))
 app.add_url_rule(
@@ -66,6 +109,7 @@ app.add_url_rule("/attach-places", view_func=AttachPlacesView.as_view("attach-pl
 app.add_url_rule("/travel", view_func=TravelView.as_view("travel"))
 app.add_url_rule("/participants", view_func=ParticipantsView.as_view("participants"))
 app.add_url_rule("/chat", view_func=ChatView.as_view("chat"))
+app.add_url_rule("/chat/stream", view_func=ChatStreamView.as_view("chat-stream"))
 app.add_url_rule(
     "/add_participants", view_func=AddParticipantsView.as_view("add_participants")
 )
@@ -97,6 +141,9 @@ app.add_url_rule(
 app.add_url_rule("/actions", view_func=ActionsView.as_view("actions"))
 app.add_url_rule("/connections", view_func=ConnectionsView.as_view("connections"))
 app.add_url_rule("/interview", view_func=InterviewView.as_view("interview"))
+app.add_url_rule(
+    "/voice-lines/<job_id>", view_func=VoiceLineJobView.as_view("voice-lines")
+)
 
 
 @app.route("/research", methods=["GET", "POST"])